@@ -1,13 +1,22 @@
+import os
+import sys
 import logging
 import requests
 import xml.etree.ElementTree as ET
 import time
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Generator
+from urllib.parse import urlparse
 
 from .models import Paper, Citation
 from .db_operations import save_papers_to_db # 논문 저장 함수 임포트
 from sqlalchemy.orm import Session
+# 재시도/서킷 브레이커와 HTTP 세션을 daily_crawler_app 과 같은 crawler_src 모듈(같은 싱글턴)로 공유
+crawler_app_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'daily_crawler_app'))
+if crawler_app_dir not in sys.path:
+    sys.path.append(crawler_app_dir)
+from crawler_src.http_retry import get_resilient_http, RetriesExhausted, CircuitOpenError # 재시도/서킷 브레이커 공유
+from crawler_src.http_sessions import get_http_session # keep-alive 커넥션 풀/압축 전송 공유
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +63,8 @@ class ArxivCrawler:
         # full_url = f"{self.base_url}?" + "&".join([f"{k}={v}" for k, v in params.items()]) # 기존 코드, params를 직접 전달
         logger.debug(f"Requesting arXiv API - query: {query}, start={start}, max={max_results}")
         
-        response = requests.get(self.base_url, params=params)
+        response = get_resilient_http().call(urlparse(self.base_url).hostname, lambda: get_http_session().get(self.base_url, params=params),
+                                             retry_exceptions=(requests.exceptions.RequestException,))
         self.last_request_time = time.time()
         
         logger.debug(f"API response status: {response.status_code}, length={len(response.text)}")
@@ -191,13 +201,16 @@ class SemanticScholarCrawler:
         url = f"{self.base_url}/{endpoint}"
         logger.debug(f"Requesting Semantic Scholar API - URL: {url}, Params: {params}")
         
+        response = None
         try:
-            response = requests.get(url, params=params)
+            # 429/5xx 는 Retry-After 또는 지수 백오프로 재시도하고, 계속 실패하면 서킷 브레이커가 잠시 요청을 막음
+            response = get_resilient_http().call(urlparse(url).hostname, lambda: get_http_session().get(url, params=params),
+                                                 retry_exceptions=(requests.exceptions.RequestException,))
             self.last_request_time = time.time()
             response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
             logger.debug(f"Semantic Scholar API response status: {response.status_code}, length={len(response.text)}")
             return response.json()
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, RetriesExhausted, CircuitOpenError) as e:
             logger.error(f"Semantic Scholar API 요청 중 오류 발생: {e}", exc_info=True)
             if response is not None:
                 logger.error(f"Semantic Scholar API 응답 본문: {response.text}")
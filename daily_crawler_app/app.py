@@ -1,15 +1,15 @@
 import os
 import sys
+import json
 from datetime import datetime, timedelta
 import logging
 
 # 모든 로거의 레벨을 DEBUG로 설정
 logging.basicConfig(level=logging.DEBUG)
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify, url_for
 from flask_cors import CORS
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import func
 
 # 현재 스크립트의 디렉토리를 sys.path에 추가하여 상대 경로 임포트 문제 해결
 # if __name__ == '__main__': 일 때만 필요
@@ -17,46 +17,106 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.append(current_dir)
 
-from crawler_src.models import Paper, Base # 이제 절대 경로로 임포트
+from crawler_src.models import Paper, PaperFullText, Base # 이제 절대 경로로 임포트
 from crawler_src.multi_platform_crawler import multi_platform_crawl, save_papers_to_db # 이제 절대 경로로 임포트
 from crawler_src.config import Config # Config 클래스 임포트
+from crawler_src.queries import paper_list_columns, paginate_papers, paper_fulltext_text
+from crawler_src.connection import create_db_and_tables, get_scoped_session, get_pool_status # 공용 엔진/세션 풀
+from crawler_src.crawl_jobs import get_crawl_job_manager, FINISHED_STATES
+from crawler_src.crawl_scheduler import get_crawl_scheduler, start_crawl_scheduler, recent_crawl_runs
+from crawler_src.http_retry import http_metrics
+from crawler_src.fulltext import search_fulltext, submit_fulltext_fetch
 
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 CORS(app)
 
-DATABASE_URL = "sqlite:///papers.db"
+# 애플리케이션 전역 엔진을 공유하는 요청별 세션 (요청 종료 시 풀로 반환)
+db_session = get_scoped_session()
+
+@app.teardown_appcontext
+def shutdown_session(exception=None):
+    db_session.remove()
 
 def init_db():
     logger.debug("init_db 함수 진입")
-    engine = create_engine(DATABASE_URL)
-    Base.metadata.create_all(engine)
+    create_db_and_tables()
     logger.debug("데이터베이스 초기화 완료")
     logger.debug("init_db 함수 종료")
 
+@app.route('/health')
+def health():
+    return jsonify({"status": "ok", "db_pool": get_pool_status()})
+
 @app.route('/')
 def index():
     logger.debug("index 함수 진입")
-    engine = create_engine(DATABASE_URL)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    
-    papers = session.query(Paper).order_by(Paper.published_date.desc()).all()
-    
-    # 가장 최근에 크롤링된 날짜를 가져와서 템플릿으로 전달
-    latest_crawled_paper = session.query(Paper).order_by(Paper.crawled_date.desc()).first()
-    latest_crawled_date = latest_crawled_paper.crawled_date.isoformat() if latest_crawled_paper and latest_crawled_paper.crawled_date else None
-
-    session.close()
+    # 전체 테이블 대신 한 페이지만, 임베딩 등 큰 컬럼은 제외하고 읽습니다 (?cursor=...&page_size=...)
+    try:
+        papers, next_cursor = paginate_papers(db_session.query(*paper_list_columns()),
+                                              page_size=request.args.get('page_size', type=int),
+                                              cursor=request.args.get('cursor'))
+    except ValueError as e:
+        logger.debug(f"잘못된 커서: {e}")
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    # 가장 최근에 크롤링된 날짜를 가져와서 템플릿으로 전달 (ix_papers_crawled_date 인덱스로 조회)
+    latest_crawled = db_session.query(func.max(Paper.crawled_date)).scalar()
+    latest_crawled_date = latest_crawled.isoformat() if latest_crawled else None
+
     logger.debug("index 함수 종료")
     return render_template('index.html',
                            papers=papers,
-                           latest_crawled_date=latest_crawled_date
+                           latest_crawled_date=latest_crawled_date,
+                           next_cursor=next_cursor,
+                           page_size=request.args.get('page_size', type=int)
                           )
 
+def run_crawl_job(job):
+    """크롤링 워커 스레드에서 실행되는 /crawl 작업 (crawl_jobs.CrawlJobManager 의 runner)"""
+    logger.debug(f"run_crawl_job 함수 진입 - job_id: {job.id}")
+    params = job.params
+    start_date_obj = datetime.strptime(params['start_date'], '%Y-%m-%d')
+    end_date_obj = datetime.strptime(params['end_date'], '%Y-%m-%d').replace(hour=23, minute=59, second=59) # 종료일의 끝 시간으로 설정
+    max_papers = params['max_papers']
+
+    is_initial_crawl = params['is_initial_crawl']
+    if is_initial_crawl:
+        # 기존 데이터는 크롤링이 끝난 뒤 저장과 같은 트랜잭션에서 지움 (취소/실패 시 DB 가 비지 않음).
+        # 작업 관리자가 초기화 작업을 다른 작업과 겹치지 않게 실행하며, 지울 논문도 다시 받아야 하므로 Bloom 필터는 쓰지 않음
+        logger.debug(f"{params['start_date']}부터 {params['end_date']}까지의 데이터 크롤링 시작 (초기화)")
+    else:
+        logger.debug(f"{params['start_date']}부터 {params['end_date']}까지의 데이터 추가 크롤링 시작")
+
+    logger.debug(f"multi_platform_crawl 함수 호출 직전 (날짜 범위: {start_date_obj.date()} ~ {end_date_obj.date()}, 최대 논문 수: {max_papers})")
+    crawled_papers = multi_platform_crawl(
+        query="research",
+        platforms=Config.SUPPORTED_CRAWLER_PLATFORMS, # 모든 플랫폼 사용
+        start_date=start_date_obj,
+        end_date=end_date_obj,
+        max_results=max_papers if max_papers > 0 else Config.DEFAULT_CRAWLER_MAX_RESULTS, # max_papers가 0보다 크면 그 값을 사용, 아니면 config 값 사용
+        progress_callback=job.report_progress,
+        cancel_check=job.check_cancelled,
+        skip_known=False if is_initial_crawl else None,
+    )
+    logger.debug(f"크롤링된 논문 수 (날짜 범위: {start_date_obj.date()} ~ {end_date_obj.date()}): {len(crawled_papers)}")
+    job.check_cancelled() # 저장 직전에 취소되었으면 저장하지 않음
+    if is_initial_crawl:
+        if not crawled_papers:
+            raise RuntimeError("크롤링된 논문이 없어 기존 데이터를 유지합니다 (초기화하지 않음).")
+        job.saved = save_papers_to_db(crawled_papers, replace_all=True, raise_errors=True)
+    else:
+        job.saved = save_papers_to_db(crawled_papers)
+    logger.debug(f"{params['start_date']}부터 {params['end_date']}까지의 데이터 크롤링 및 저장 완료")
+    return f"{params['start_date']}부터 {params['end_date']}까지 데이터 크롤링 및 저장 완료. 총 {len(crawled_papers)}개의 논문 중 {job.saved}개가 새로 추가되었습니다."
+
+def crawl_jobs():
+    return get_crawl_job_manager(run_crawl_job) # 첫 요청 시 워커 시작
+
 @app.route('/crawl', methods=['POST'])
 def crawl_data():
+    """크롤링 작업을 대기열에 등록하고 바로 작업 ID 를 반환합니다 (진행 상황은 /crawl/jobs/<job_id>[/events])."""
     logger.debug("crawl_data 함수 진입")
 
     request_data = request.json
@@ -73,49 +133,111 @@ def crawl_data():
 
     try:
         start_date_obj = datetime.strptime(start_date_str, '%Y-%m-%d')
-        end_date_obj = datetime.strptime(end_date_str, '%Y-%m-%d').replace(hour=23, minute=59, second=59) # 종료일의 끝 시간으로 설정
+        end_date_obj = datetime.strptime(end_date_str, '%Y-%m-%d')
         logger.debug(f"대상 날짜 범위: {start_date_obj.date()} ~ {end_date_obj.date()}")
     except ValueError:
         logger.debug("잘못된 날짜 형식입니다.")
         return jsonify({"status": "error", "message": "잘못된 날짜 형식입니다. YYYY-MM-DD 형식이어야 합니다."})
 
-    engine = create_engine(DATABASE_URL)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-
-    if is_initial_crawl:
-        logger.debug(f"{start_date_str}부터 {end_date_str}까지의 데이터 크롤링 시작 (초기화)")
-        # 기존 데이터 삭제 (초기화 요청 시)
-        session.query(Paper).delete()
-        session.commit()
-        session.close() # 세션을 닫고 다시 열어 초기화된 DB를 반영
-        session = Session() # 새 세션 시작
-
-    else:
-        logger.debug(f"{start_date_str}부터 {end_date_str}까지의 데이터 추가 크롤링 시작")
-
-    try:
-        logger.debug(f"multi_platform_crawl 함수 호출 직전 (날짜 범위: {start_date_obj.date()} ~ {end_date_obj.date()}, 최대 논문 수: {max_papers})")
-        crawled_papers_generator = multi_platform_crawl(
-            query="research",
-            platforms=Config.SUPPORTED_CRAWLER_PLATFORMS, # 모든 플랫폼 사용
-            start_date=start_date_obj,
-            end_date=end_date_obj,
-            max_results=max_papers if max_papers > 0 else Config.DEFAULT_CRAWLER_MAX_RESULTS # max_papers가 0보다 크면 그 값을 사용, 아니면 config 값 사용
-        )
-        logger.debug(f"multi_platform_crawl 함수 호출 직후 (날짜 범위: {start_date_obj.date()} ~ {end_date_obj.date()})")
-        crawled_papers = list(crawled_papers_generator)
-        logger.debug(f"크롤링된 논문 수 (날짜 범위: {start_date_obj.date()} ~ {end_date_obj.date()}): {len(crawled_papers)}")
-        save_papers_to_db(crawled_papers)
-        logger.debug(f"{start_date_str}부터 {end_date_str}까지의 데이터 크롤링 및 저장 완료")
-        return jsonify({"status": "success", "message": f"{start_date_str}부터 {end_date_str}까지 데이터 크롤링 및 저장 완료. 총 {len(crawled_papers)}개의 논문이 추가되었습니다."})
-    except Exception as e:
-        session.rollback() # 오류 발생 시 롤백
-        logger.error(f"크롤링 중 오류 발생 ({start_date_str} ~ {end_date_str}): {e}", exc_info=True)
-        return jsonify({"status": "error", "message": f"데이터 크롤링 중 오류 발생: {str(e)}"})
+    job = crawl_jobs().submit("initial" if is_initial_crawl else "incremental", {
+        "start_date": start_date_str, "end_date": end_date_str,
+        "is_initial_crawl": bool(is_initial_crawl), "max_papers": int(max_papers or 0),
+    }, exclusive=bool(is_initial_crawl)) # 초기화 크롤링은 다른 작업이 저장하는 중에 데이터를 지우지 않도록 단독 실행
+    return jsonify({
+        "status": "queued",
+        "job_id": job.id,
+        "message": f"{start_date_str}부터 {end_date_str}까지 크롤링 작업이 등록되었습니다.",
+        "status_url": url_for('crawl_job_status', job_id=job.id),
+        "events_url": url_for('crawl_job_events', job_id=job.id),
+    }), 202
+
+@app.route('/crawl/jobs')
+def list_crawl_jobs():
+    return jsonify([job.to_dict() for job in crawl_jobs().list_jobs()])
+
+@app.route('/crawl/jobs/<job_id>')
+def crawl_job_status(job_id):
+    job = crawl_jobs().get(job_id)
+    if job is None:
+        return jsonify({"status": "error", "message": "크롤링 작업을 찾을 수 없습니다."}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/crawl/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_crawl_job(job_id):
+    if not crawl_jobs().cancel(job_id):
+        return jsonify({"status": "error", "message": "취소할 수 없는 작업입니다 (없거나 이미 종료됨)."}), 409
+    return jsonify(crawl_jobs().get(job_id).to_dict())
+
+@app.route('/crawl/jobs/<job_id>/events')
+def crawl_job_events(job_id):
+    """Server-Sent Events 로 작업 진행 상황을 전송합니다. 작업이 끝나면 마지막 상태를 보내고 스트림을 닫습니다."""
+    job = crawl_jobs().get(job_id)
+    if job is None:
+        return jsonify({"status": "error", "message": "크롤링 작업을 찾을 수 없습니다."}), 404
+
+    def stream():
+        version = -1
+        while True:
+            current = job.wait_for_change(version, Config.CRAWL_JOB_SSE_HEARTBEAT)
+            if current == version:
+                yield ": heartbeat\n\n" # 프록시가 연결을 끊지 않도록 주석 이벤트 전송
+                continue
+            version = current
+            snapshot = job.to_dict()
+            yield f"event: progress\ndata: {json.dumps(snapshot, ensure_ascii=False)}\n\n"
+            if snapshot["status"] in FINISHED_STATES:
+                return
+
+    return Response(stream(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/crawl/schedule')
+def crawl_schedule():
+    """예약 크롤링 상태 (다음 실행 시각, 실행 중인 플랫폼) 와 최근 실행 기록 (소요 시간, 수집/신규 수, 수율)"""
+    scheduler = get_crawl_scheduler()
+    return jsonify({
+        "enabled": scheduler is not None and scheduler.is_alive(),
+        "scheduler": scheduler.status() if scheduler is not None else None,
+        "runs": recent_crawl_runs(db_session, request.args.get('platform'), request.args.get('limit', 20, type=int)),
+    })
+
+@app.route('/crawl/http')
+def crawl_http_metrics():
+    """크롤러 HTTP 재시도 지표 (호스트별 요청/재시도/실패/차단 수, 응답 코드, 백오프 시간) 와 서킷 브레이커 상태"""
+    return jsonify(http_metrics())
+
+@app.route('/papers/search')
+def search_papers():
+    """PDF 본문/제목 전문 검색 (?q=...&limit=20). 본문이 색인된 논문만 검색됩니다 (POST /papers/fulltext)."""
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({"status": "error", "message": "검색어(q)를 입력해야 합니다."}), 400
+    limit = min(max(request.args.get('limit', 20, type=int), 1), Config.PAPER_MAX_PAGE_SIZE)
+    return jsonify({"query": query, "results": search_fulltext(db_session, query, limit)})
+
+@app.route('/papers/fulltext', methods=['POST'])
+def fetch_fulltext():
+    """선택한 논문 ({"paper_ids": [...]}) 또는 색인되지 않은 최신 논문 ({"limit": N}) 의 PDF 수집을 백그라운드로 시작합니다."""
+    request_data = request.get_json(silent=True) or {}
+    paper_ids = request_data.get('paper_ids')
+    limit = request_data.get('limit')
+    if paper_ids is None and not limit:
+        return jsonify({"status": "error", "message": "paper_ids 또는 limit 을 지정해야 합니다."}), 400
+    submit_fulltext_fetch(paper_ids=paper_ids, limit=limit)
+    return jsonify({"status": "queued", "paper_ids": paper_ids, "limit": limit}), 202
+
+@app.route('/papers/<paper_id>/fulltext')
+def paper_fulltext(paper_id):
+    """논문의 PDF 수집 상태와 (색인되었으면) 추출한 본문"""
+    row = db_session.get(PaperFullText, paper_id)
+    if row is None:
+        return jsonify({"status": "error", "message": "PDF 수집 기록이 없습니다."}), 404
+    return jsonify({**row.to_dict(), "text": paper_fulltext_text(db_session, paper_id)})
 
 if __name__ == '__main__':
     logger.debug("애플리케이션 시작")
     init_db()
+    # 디버그 리로더의 감시 프로세스가 아니라 실제 서버 프로세스에서만 스케줄러 시작
+    if Config.CRAWL_SCHEDULER_ENABLED and os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_crawl_scheduler()
     app.run(debug=True)
     logger.debug("애플리케이션 종료") 
\ No newline at end of file
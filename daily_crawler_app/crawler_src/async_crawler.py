@@ -0,0 +1,263 @@
+import abc
+import json
+import time
+import asyncio
+import threading
+import logging
+import importlib.util
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import urlparse
+import requests
+from .config import Config
+from .http_retry import ResilientHttp, get_resilient_http
+from .http_sessions import get_http_session, pool_size_for
+
+try:
+    import httpx
+except ImportError: # httpx 가 없으면 requests 를 스레드 풀에서 실행 (HTTP/1.1)
+    httpx = None
+
+# 재시도할 전송 오류 (연결 실패, 타임아웃)
+TRANSPORT_ERRORS = (requests.RequestException,) + ((httpx.TransportError,) if httpx is not None else ())
+
+logger = logging.getLogger(__name__)
+
+# 비동기 크롤러 공용 기반. 모든 AsyncCrawler 는 프로세스당 하나의 이벤트 루프 스레드와 HTTP 클라이언트를 공유하므로
+# 여러 플랫폼/작업 스레드에서 동시에 크롤링해도 호스트별 동시 요청 수와 요청 간격이 함께 지켜집니다.
+# 기존 호출자(multi_platform_crawl, 스케줄러)는 get_crawler 가 돌려주는 SyncCrawler 로 지금처럼 동기 제너레이터를 사용합니다.
+
+class HttpError(Exception):
+    """4xx/5xx 응답"""
+    def __init__(self, response: "HttpResponse"):
+        super().__init__(f"HTTP {response.status_code}: {response.url}")
+        self.status_code = response.status_code
+        self.response = response
+
+class HttpResponse:
+    """전송 방식(httpx / requests)과 무관하게 본문을 모두 읽은 응답"""
+    def __init__(self, status_code: int, headers, content: bytes, url: str, encoding: str = None):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise HttpError(self)
+
+class HostRateLimiter:
+    """호스트별 요청 시작 간격을 지키는 공유 rate limiter (스레드/코루틴 모두에서 사용).
+
+    호출마다 다음 요청 시각을 예약하므로 동시에 기다리는 요청들은 간격만큼씩 차례로 시작됩니다.
+    """
+    def __init__(self, intervals: dict = None):
+        self.intervals = intervals if intervals is not None else Config.HTTP_HOST_MIN_INTERVAL
+        self._next_slot = {} # host -> 다음 요청을 시작할 수 있는 시각
+        self._lock = threading.Lock()
+
+    def reserve(self, host: str, interval: float = None) -> float:
+        """요청 시각을 예약하고 그때까지 기다려야 할 시간(초)을 반환합니다."""
+        interval = self.intervals.get(host, 0.0) if interval is None else interval
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = start + interval
+        return start - now
+
+    def wait(self, host: str, interval: float = None):
+        delay = self.reserve(host, interval)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire(self, host: str, interval: float = None):
+        delay = self.reserve(host, interval)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+class AsyncHttpClient:
+    """공용 비동기 HTTP 클라이언트. 호스트별 세마포어로 동시 요청 수를 제한하고, 시도마다 rate limiter 를 거치며,
+    429/5xx/전송 오류는 공용 재시도 계층(http_retry)이 백오프 후 다시 보냅니다."""
+    def __init__(self, max_connections: int = None, max_per_host: int = None, timeout: float = None, rate_limiter: HostRateLimiter = None,
+                 resilience: ResilientHttp = None):
+        self.max_connections = max_connections or Config.HTTP_MAX_CONNECTIONS
+        self.max_per_host = max_per_host # None 이면 호스트별 커넥션 풀 크기 (Config.HTTP_POOL_SIZES)
+        self.timeout = timeout or Config.HTTP_TIMEOUT
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.resilience = resilience or get_resilient_http()
+        self.http2 = httpx is not None and importlib.util.find_spec("h2") is not None
+        self.headers = {"User-Agent": Config.HTTP_USER_AGENT}
+        self._host_semaphores = {} # host -> asyncio.Semaphore (공용 이벤트 루프에서만 사용)
+        self._client = None
+        self._session = None
+        self._executor = None
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_per_host or pool_size_for(host))
+        return self._host_semaphores[host]
+
+    async def _send(self, url: str, params: dict, headers: dict, timeout: float) -> HttpResponse:
+        if httpx is not None:
+            if self._client is None:
+                # httpx 는 설치된 디코더에 맞춰 Accept-Encoding (gzip/deflate/br/zstd) 을 보냄
+                self._client = httpx.AsyncClient(http2=self.http2, headers=self.headers, timeout=self.timeout, follow_redirects=True,
+                                                 limits=httpx.Limits(max_connections=self.max_connections,
+                                                                     max_keepalive_connections=self.max_connections))
+                logger.info(f"공용 HTTP 클라이언트 생성 - httpx, HTTP/2: {self.http2}")
+            response = await self._client.get(url, params=params, headers=headers, timeout=timeout)
+            return HttpResponse(response.status_code, response.headers, response.content, str(response.url), response.encoding)
+        if self._session is None:
+            self._session = get_http_session() # 동기 크롤러와 같은 커넥션 풀 (압축 전송, 호스트별 풀 크기)
+            self._executor = ThreadPoolExecutor(max_workers=self.max_connections, thread_name_prefix="crawler-http")
+            logger.info("공용 HTTP 클라이언트 생성 - requests 스레드 풀 (httpx 미설치)")
+        response = await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(self._session.get, url, params=params, headers=headers, timeout=timeout or self.timeout))
+        return HttpResponse(response.status_code, response.headers, response.content, response.url, response.encoding)
+
+    async def get(self, url: str, params: dict = None, headers: dict = None, timeout: float = None, min_interval: float = None) -> HttpResponse:
+        """GET 요청. min_interval 을 주면 이 호스트의 Config.HTTP_HOST_MIN_INTERVAL 대신 사용합니다."""
+        host = urlparse(url).hostname
+
+        async def attempt():
+            await self.rate_limiter.acquire(host, min_interval)
+            logger.debug(f"HTTP GET {url} params={params}")
+            return await self._send(url, params, headers, timeout)
+
+        async with self._semaphore(host): # 백오프 대기 중에도 자리를 차지해 실패 중인 호스트로의 동시 요청을 줄임
+            return await self.resilience.call_async(host, attempt, retry_exceptions=TRANSPORT_ERRORS)
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._session is not None:
+            self._executor.shutdown(wait=False) # 공용 세션은 http_sessions.close_http_sessions() 가 닫음
+            self._session = None
+
+_loop = None
+_http_client = None
+_rate_limiter = None
+_shared_lock = threading.Lock()
+
+def get_rate_limiter() -> HostRateLimiter:
+    global _rate_limiter
+    with _shared_lock:
+        if _rate_limiter is None:
+            _rate_limiter = HostRateLimiter()
+    return _rate_limiter
+
+def get_crawler_loop() -> asyncio.AbstractEventLoop:
+    """모든 비동기 크롤러가 공유하는 이벤트 루프 (전용 데몬 스레드에서 실행)."""
+    global _loop
+    with _shared_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="crawler-event-loop", daemon=True).start()
+    return _loop
+
+def get_http_client() -> AsyncHttpClient:
+    global _http_client
+    if _http_client is None:
+        client = AsyncHttpClient()
+        with _shared_lock:
+            if _http_client is None:
+                _http_client = client
+    return _http_client
+
+async def run_blocking(func, *args):
+    """CPU/블로킹 작업(파싱, 임베딩 계산) 을 기본 스레드 풀에서 실행해 공용 이벤트 루프의 다른 요청이 멈추지 않게 합니다."""
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+def run_sync(coroutine):
+    """공용 이벤트 루프에서 coroutine 을 실행하고 결과를 기다립니다 (이벤트 루프 스레드 밖에서 호출)."""
+    return asyncio.run_coroutine_threadsafe(coroutine, get_crawler_loop()).result()
+
+def iterate_sync(async_iterator):
+    """비동기 제너레이터를 공용 이벤트 루프에서 한 항목씩 진행시키는 동기 제너레이터.
+
+    호출자가 중간에 멈추면 (break / close) 비동기 제너레이터도 닫혀 남은 요청이 취소됩니다.
+    """
+    try:
+        while True:
+            try:
+                yield run_sync(async_iterator.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        run_sync(async_iterator.aclose())
+
+_END = object() # ordered_map 입력 끝 표시
+
+async def ordered_map(func, items, window: int = None):
+    """items 마다 func(item) 을 시작하고 (동시 요청 수는 호스트별 세마포어가 제한) 입력 순서대로 결과를 내보냅니다.
+
+    끝나지 않았거나 아직 소비되지 않은 작업은 최대 window 개 (기본 Config.CRAWL_PIPELINE_WINDOW) 이므로
+    소비(임베딩/저장)가 느리면 요청과 파싱도 그만큼만 앞서 나갑니다.
+    """
+    window = window or Config.CRAWL_PIPELINE_WINDOW
+    items = iter(items)
+    tasks = deque()
+
+    def fill():
+        while len(tasks) < window:
+            item = next(items, _END)
+            if item is _END:
+                return
+            tasks.append(asyncio.ensure_future(func(item)))
+
+    try:
+        fill()
+        while tasks:
+            result = await tasks[0]
+            tasks.popleft()
+            fill()
+            yield result
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception() # 소비하지 않은 결과의 예외도 확인된 것으로 표시
+
+class AsyncCrawler(abc.ABC):
+    """비동기 크롤러 기반 클래스.
+
+    하위 클래스는 `async def crawl_papers(query, start_date, end_date, limit)` 비동기 제너레이터를 구현하고
+    요청은 self.http (공용 AsyncHttpClient) 로 보냅니다.
+    """
+    def __init__(self, http: AsyncHttpClient = None):
+        self.http = http or get_http_client()
+        self.known_ids = None # 이미 저장된 paper_id 필터 (None 이면 모두 파싱)
+        self.skipped_known = 0
+
+    @abc.abstractmethod
+    async def crawl_papers(self, query: str, start_date=None, end_date=None, limit=None):
+        """query 로 검색한 논문을 Paper 객체로 하나씩 yield 하는 비동기 제너레이터"""
+        yield
+
+class SyncCrawler:
+    """AsyncCrawler 를 기존 동기 인터페이스 (crawl_papers 가 일반 제너레이터) 로 감쌉니다.
+
+    known_ids / skipped_known 등 속성 읽기/쓰기는 감싼 크롤러로 전달됩니다.
+    """
+    def __init__(self, crawler: AsyncCrawler):
+        object.__setattr__(self, "crawler", crawler)
+
+    def __getattr__(self, name):
+        return getattr(self.crawler, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.crawler, name, value)
+
+    def crawl_papers(self, *args, **kwargs):
+        return iterate_sync(self.crawler.crawl_papers(*args, **kwargs))
@@ -0,0 +1,53 @@
+import os
+import hashlib
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 내용 주소(SHA-256) 로컬 blob 저장소. 같은 내용의 파일은 URL/논문이 달라도 한 번만 저장되고,
+# 파일 이름이 곧 내용의 해시이므로 한 번 쓰인 blob 은 바뀌지 않습니다.
+# 받는 중인 파일은 partial/ 아래에 URL 별로 두어, 전송이 끊기면 Range 요청으로 이어 받을 수 있습니다.
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PDF_BLOB_DIR = os.getenv("PDF_BLOB_DIR", os.path.join(_APP_DIR, 'pdf_blobs'))
+
+def sha256_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class BlobStore:
+    def __init__(self, directory: str = None, suffix: str = ".pdf"):
+        self.directory = directory or PDF_BLOB_DIR
+        self.suffix = suffix
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(self.directory, "partial"), exist_ok=True)
+
+    def path_for(self, sha256: str) -> str:
+        # 디렉토리 하나에 파일이 너무 많아지지 않도록 해시 앞 두 글자로 나눔
+        return os.path.join(self.directory, sha256[:2], f"{sha256}{self.suffix}")
+
+    def exists(self, sha256: str) -> bool:
+        return bool(sha256) and os.path.exists(self.path_for(sha256))
+
+    def partial_path(self, url: str) -> str:
+        """url 을 받는 중인 임시 파일 경로 (다음 시도에서 이어 받기 위해 같은 경로를 사용)"""
+        return os.path.join(self.directory, "partial", hashlib.sha1(url.encode("utf-8")).hexdigest() + ".part")
+
+    def put_file(self, source_path: str) -> str:
+        """source_path 를 해시해 저장소로 옮기고 sha256 을 반환합니다. 이미 같은 blob 이 있으면 source_path 만 지웁니다."""
+        sha256 = sha256_file(source_path)
+        path = self.path_for(sha256)
+        with self._lock:
+            if os.path.exists(path):
+                os.remove(source_path)
+                logger.debug(f"이미 저장된 blob - sha256: {sha256}")
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(source_path, path) # 같은 파일 시스템 안의 원자적 이동
+        return sha256
+
+    def size(self, sha256: str) -> int:
+        return os.path.getsize(self.path_for(sha256))
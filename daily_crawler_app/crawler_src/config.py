@@ -10,6 +10,7 @@ class Config:
     CORE_API_BASE_URL = "https://api.core.ac.uk/v3"
     CORE_API_KEY = "YOUR_CORE_API_KEY" # Replace with your actual CORE API key
     ARXIV_RSS_BASE_URL = "https://export.arxiv.org/rss"
+    ARXIV_OAI_BASE_URL = "https://oaipmh.arxiv.org/oai"
     
     DEFAULT_DELAY = 1.0 # 초 단위, 모든 크롤러에 적용될 기본 딜레이
     DEFAULT_CRAWLER_MAX_RESULTS = 50 # 모든 크롤러에 대한 기본 최대 결과 수
@@ -18,4 +19,145 @@ class Config:
     ARXIV_MAX_RESULTS = 50 # max per request
     ARXIV_DEFAULT_LIMIT = 50 # default limit for arXiv crawler
 
+    # papers.db 공용 엔진/커넥션 풀 설정
+    DB_POOL_SIZE = 5 # 풀에 유지할 커넥션 수
+    DB_MAX_OVERFLOW = 10 # 풀이 가득 찼을 때 추가로 허용할 커넥션 수
+    DB_POOL_TIMEOUT = 30 # 커넥션을 얻기 위해 기다릴 최대 시간 (초)
+    DB_POOL_RECYCLE = 1800 # 커넥션 재생성 주기 (초)
+    DB_BUSY_TIMEOUT_MS = 5000 # SQLite 잠금 대기 시간 (밀리초)
+
+    # SQLite 성능 프로파일 (sqlite_profile.py)
+    SQLITE_CACHE_SIZE_KB = 65536 # 커넥션당 페이지 캐시 (64MB)
+    SQLITE_MMAP_SIZE = 268435456 # 메모리 맵 I/O 크기 (256MB)
+    SQLITE_CHECKPOINT_INTERVAL = 300 # wal_checkpoint 주기 (초), 0이면 비활성화
+    SQLITE_OPTIMIZE_EVERY = 12 # 체크포인트 N회마다 PRAGMA optimize 실행, 0이면 실행하지 않음
+
+    # 논문 목록 (index(), /api/papers) 커서 페이지네이션
+    PAPER_PAGE_SIZE = 50 # 한 페이지에 반환할 기본 논문 수
+    PAPER_MAX_PAGE_SIZE = 500 # page_size 요청 파라미터의 상한
+
+    # 백그라운드 LLM 요약 작업 큐 (summary_queue.py)
+    SUMMARY_WORKERS = 2 # 요약 워커 스레드 수, 0이면 워커를 시작하지 않음
+    SUMMARY_POLL_INTERVAL = 5.0 # 대기 작업이 없을 때 큐를 다시 확인하는 주기 (초)
+    SUMMARY_MAX_ATTEMPTS = 3 # 실패한 작업을 failed 로 표시하기 전 최대 시도 횟수
+    SUMMARY_STALE_AFTER = 600 # running 상태로 이 시간(초) 이상 멈춘 작업은 다시 가져감 (워커 프로세스 종료 대비)
+
+    # LM Studio (OpenAI 호환) 공용 LLM 클라이언트 (llm_client.py)
+    LLM_API_URL = "http://127.0.0.1:1234/v1/chat/completions"
+    LLM_MODEL = "lgai-exaone.exaone-3.5-7.8b-instruct"
+    LLM_TIMEOUT = 30 # 요청당 타임아웃 (초)
+    LLM_MAX_CONCURRENCY = 4 # 동시에 진행할 최대 요청 수 (= keep-alive 커넥션 풀 크기)
+    LLM_BATCH_SIZE = 8 # 배치 프롬프트 하나에 묶을 최대 논문 수
+
+    # LLM 응답 캐시 (llm_cache.py)
+    LLM_CACHE_ENABLED = True
+    LLM_CACHE_TTL = 60 * 60 * 24 * 30 # 캐시 항목 유효 기간 (초), 0이면 만료 없음
+    LLM_CACHE_MAX_ENTRIES = 100000 # 이 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거 (LRU), 0이면 무제한
+    LLM_CACHE_EVICT_EVERY = 500 # 새 항목을 이만큼 쓸 때마다 만료/LRU 정리 실행
+
+    # 페르소나 보고서의 임베딩 1차 필터 (similarity.py), 통과한 논문만 LLM 으로 중요도 판단
+    # 논문 임베딩과 같은 차원의 실제 임베딩 모델이 있을 때만 켜세요 (더미 임베딩이면 켜도 적용되지 않음)
+    PERSONA_PREFILTER_ENABLED = False
+    PERSONA_PREFILTER_THRESHOLD = 0.2 # 페르소나와의 코사인 유사도가 이 값 미만이면 LLM 에 보내지 않음
+    PERSONA_PREFILTER_MAX_CANDIDATES = 50 # LLM 에 보낼 최대 후보 수 (유사도 상위), 0이면 무제한
+
+    # 보고서 top_n 관련도 점수 가중치 (ranking.py), 합이 1일 필요는 없음
+    RANKING_WEIGHT_CENTRALITY = 0.4 # 그날 논문 임베딩 중심과의 유사도
+    RANKING_WEIGHT_PERSONA = 0.3 # 페르소나 임베딩과의 유사도 (페르소나가 있을 때만)
+    RANKING_WEIGHT_CITATIONS = 0.2 # 피인용 수 (log 스케일)
+    RANKING_WEIGHT_RECENCY = 0.1 # 출판일 최신성
+    RANKING_RECENCY_HALF_LIFE_DAYS = 30 # 최신성 점수가 절반이 되는 기간 (일)
+
+    # 생성된 PDF 보고서 캐시 (report_cache.py)
+    REPORT_CACHE_ENABLED = True # False 이면 보고서를 디스크에 저장하지 않고 매번 메모리에서 렌더링해 전송
+    REPORT_CACHE_MAX_BYTES = 500 * 1024 * 1024 # 캐시 디렉토리 최대 크기, 넘으면 오래 사용되지 않은 파일부터 제거 (0이면 무제한)
+
+    # /crawl 비동기 작업 (crawl_jobs.py)
+    CRAWL_JOB_WORKERS = 2 # 동시에 실행할 크롤링 작업 수 (나머지는 대기열에서 순서대로 실행)
+    CRAWL_JOB_HISTORY = 50 # 메모리에 보관할 완료된 작업 수
+    CRAWL_JOB_SSE_HEARTBEAT = 15 # SSE 연결 유지를 위한 하트비트 주기 (초)
+
+    # 예약 크롤링 (crawl_scheduler.py). app.py 프로세스 안에서 실행하거나 `python -m crawler_src.crawl_scheduler` 로 따로 실행
+    CRAWL_SCHEDULER_ENABLED = False # True 이면 app.py 실행 시 스케줄러 스레드도 시작
+    CRAWL_SCHEDULES = { # 플랫폼별 cron 식 (분 시 일 월 요일), 없는 플랫폼은 예약 크롤링하지 않음
+        "arxiv": "0 3 * * *",
+        "arxiv_rss": "0 3 * * *",
+        "biorxiv": "0 3 * * *",
+        "pmc": "0 4 * * *",
+        "plos": "0 4 * * *",
+        "doaj": "0 4 * * *",
+    }
+    CRAWL_SCHEDULE_HOST_STAGGER = 300 # 같은 호스트를 쓰는 플랫폼끼리 시작 시각을 벌리는 간격 (초)
+    CRAWL_SCHEDULE_MAX_RESULTS = 200 # 예약 실행 한 번에 플랫폼별 최대 수집 수
+    CRAWL_SCHEDULE_INITIAL_LOOKBACK_DAYS = 1 # 이전 성공 실행이 없을 때 크롤링할 기간 (일)
+    CRAWL_SCHEDULE_STALE_AFTER = 6 * 60 * 60 # running 상태로 이 시간(초) 이상 남은 실행은 중단된 것으로 간주
+    CRAWL_SCHEDULER_WORKERS = 3 # 동시에 실행할 예약 크롤링 수
+
+    # 플랫폼 간 중복 논문 탐지 (dedup.py). NUM_PERM / LSH_BANDS / SHINGLE_SIZE 를 바꾸면 `python -m crawler_src.dedup --rebuild` 필요
+    DEDUP_ENABLED = True
+    DEDUP_NUM_PERM = 128 # MinHash 해시 함수 수
+    DEDUP_LSH_BANDS = 16 # LSH 밴드 수 (밴드당 행 수 = NUM_PERM / LSH_BANDS), 유사도 약 0.7 이상이 후보가 됨
+    DEDUP_SHINGLE_SIZE = 3 # 단어 n-gram 크기
+    DEDUP_SIMILARITY_THRESHOLD = 0.8 # 후보의 추정 Jaccard 유사도가 이 값 이상이면 같은 논문으로 연결
+
+    # 이미 저장된 논문 ID 의 Bloom 필터 (known_ids.py), 크롤러가 파싱/임베딩 전에 확인해 건너뜀
+    KNOWN_IDS_FILTER_ENABLED = True
+    KNOWN_IDS_CAPACITY = 1000000 # 필터 용량 (논문 수가 넘으면 두 배로 다시 만듦)
+    KNOWN_IDS_ERROR_RATE = 1e-6 # 새 논문을 이미 있는 것으로 잘못 판단할 확률 (약 3.6 bytes/ID)
+
+    # 비동기 크롤러 공용 HTTP 클라이언트 (async_crawler.py). httpx 가 설치되어 있으면 사용하고 (h2 가 있으면 HTTP/2), 없으면 requests 를 스레드 풀에서 실행
+    HTTP_MAX_CONNECTIONS = 50 # 전체 동시 요청 수
+    HTTP_MAX_CONNECTIONS_PER_HOST = 8 # 호스트별 동시 요청 수 (= 커넥션 풀 크기) 기본값
+    HTTP_TIMEOUT = 60 # 요청 제한 시간 (초)
+    HTTP_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    HTTP_POOL_HOSTS = 20 # 커넥션 풀을 유지할 호스트 수 (http_sessions.py)
+    HTTP_POOL_SIZES = { # 호스트별 커넥션 풀 크기 = 동시 요청 수, 없는 호스트는 HTTP_MAX_CONNECTIONS_PER_HOST
+        "eutils.ncbi.nlm.nih.gov": 10, # PMC efetch 동시 요청
+        "api.biorxiv.org": 2, # biorxiv / medrxiv 서버
+        "export.arxiv.org": 2, # 요청 간격이 길어 동시 커넥션이 거의 필요 없음
+        "oaipmh.arxiv.org": 1, # resumptionToken 으로 순차 수확
+        "api.semanticscholar.org": 2,
+    }
+    HTTP_HOST_MIN_INTERVAL = { # 호스트별 요청 시작 간격 (초, 모든 크롤러가 공유). 없는 호스트는 간격 없음
+        "export.arxiv.org": 3.0, # arXiv API/RSS 이용 정책: 3초에 1회
+        "eutils.ncbi.nlm.nih.gov": 0.34, # NCBI E-utilities: API 키 없이 초당 3회
+        "api.biorxiv.org": 1.0,
+        "arxiv.org": 1.0, # PDF 다운로드 (fulltext.py)
+    }
+    # 재시도/서킷 브레이커 (http_retry.py), 모든 크롤러 HTTP 요청에 공통 적용
+    HTTP_MAX_RETRIES = 4 # 요청당 최대 재시도 횟수
+    HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504) # 재시도할 응답 코드 (연결 오류/타임아웃도 재시도)
+    HTTP_BACKOFF_BASE = 1.0 # 지수 백오프 기준 (초), n번째 재시도는 0 ~ BASE * 2^n 사이에서 무작위
+    HTTP_BACKOFF_MAX = 60.0 # 백오프 최대 대기 (초)
+    HTTP_MAX_RETRY_AFTER = 300.0 # Retry-After 를 따를 최대 대기 (초)
+    HTTP_BREAKER_FAILURE_THRESHOLD = 5 # 호스트별 연속 실패가 이 횟수면 서킷을 엶
+    HTTP_BREAKER_RESET_TIMEOUT = 60.0 # 서킷이 열린 뒤 회복 확인 요청을 보내기까지 (초)
+
+    # arXiv OAI-PMH 수확 (platform "arxiv_oai", 대량 백필은 `python -m crawler_src.oai_harvest`)
+    ARXIV_OAI_METADATA_PREFIX = "arXiv" # "arXiv" 또는 "arXivRaw" (버전별 제출일 포함)
+    ARXIV_OAI_DELAY = 3.0 # 요청 간 최소 간격 (초)
+    ARXIV_OAI_TIMEOUT = 120 # 응답 한 페이지(약 1000건)를 받는 제한 시간 (초)
+    ARXIV_OAI_HARVEST_BATCH_SIZE = 500 # 백필 시 한 번에 DB 에 저장할 논문 수
+
+    # 응답 파싱 프로세스 풀 (parse_pool.py). 동시 요청이 많아 XML/RSS 파싱이 CPU 병목일 때 켬
+    PARSE_POOL_ENABLED = False
+    PARSE_POOL_WORKERS = None # 워커 프로세스 수 (None 이면 CPU 수)
+    PARSE_POOL_MAX_PENDING = 32 # 동시에 파싱 중/대기 중인 응답 수 상한
+    CRAWL_PIPELINE_WINDOW = 32 # ordered_map 이 앞서 시작해 두는 요청 수 (소비가 느리면 그만큼만 미리 받음)
+
+    # PDF 본문 수집 (fulltext.py, `python -m crawler_src.fulltext`). 파일은 blob_store.PDF_BLOB_DIR, 추출에는 pypdf 또는 poppler 의 pdftotext 가 필요
+    PDF_DOWNLOAD_WORKERS = 8 # 동시에 진행하는 다운로드 수 (전체)
+    PDF_MAX_PER_HOST = 2 # 호스트별 동시 다운로드 수 기본값
+    PDF_HOST_CONCURRENCY = { # 호스트별 동시 다운로드 수
+        "arxiv.org": 1, # arXiv 는 대량 PDF 다운로드를 순차로 하도록 요청
+        "export.arxiv.org": 1,
+    }
+    PDF_MAX_BYTES = 50 * 1024 * 1024 # 이보다 큰 PDF 는 받지 않음
+    PDF_RESUME_ATTEMPTS = 3 # 전송이 중간에 끊겼을 때 Range 요청으로 이어 받는 횟수
+    PDF_MAX_ATTEMPTS = 3 # 논문별 최대 수집 시도 횟수 (넘으면 다시 시도하지 않음)
+    PDF_EXTRACT_WORKERS = None # 본문 추출 프로세스 수 (None 이면 CPU 수)
+    PDF_EXTRACT_MAX_CHARS = 500000 # 저장/색인할 본문 최대 길이
+    SUMMARY_USE_FULLTEXT = True # 본문이 있으면 요약 입력에 초록과 함께 본문 앞부분을 넣음
+    SUMMARY_FULLTEXT_CHARS = 6000 # 요약 입력에 넣을 본문 길이
+
     SUPPORTED_CRAWLER_PLATFORMS = ["arxiv", "biorxiv", "pmc", "plos", "doaj", "arxiv_rss"] # supported platforms 
\ No newline at end of file
@@ -1,22 +1,58 @@
+import os
+import threading
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.pool import QueuePool
 from .models import Base
+from .config import Config
+from .sqlite_profile import apply_sqlite_profile, start_sqlite_maintenance
+from .migrations import run_migrations
 import logging
 
 logger = logging.getLogger(__name__)
 
-# 더미 데이터베이스 연결을 위한 설정 (실제 사용 시에는 적절히 구성해야 합니다)
-DATABASE_URL = "sqlite:///./papers.db" # 테스트용 SQLite 인메모리 데이터베이스, 이름 변경
+# daily_crawler_app/papers.db 를 모든 앱(크롤러, 보고서 생성기, 논문 관리 앱)이 공유합니다.
+# 실행 위치(cwd)에 따라 다른 파일을 열지 않도록 절대 경로를 사용하고, 환경 변수로 덮어쓸 수 있습니다.
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATABASE_URL = os.getenv("PAPERS_DATABASE_URL", f"sqlite:///{os.path.join(_APP_DIR, 'papers.db')}")
 
 engine = None
 SessionLocal = None
+ScopedSession = None
+_engine_lock = threading.RLock()
+
+def create_papers_engine(database_url: str = DATABASE_URL):
+    """papers.db 용 엔진을 튜닝된 커넥션 풀 설정으로 생성합니다."""
+    logger.debug(f"create_papers_engine 함수 시작 - database_url: {database_url}")
+    engine_kwargs = {
+        "poolclass": QueuePool,
+        "pool_size": Config.DB_POOL_SIZE,
+        "max_overflow": Config.DB_MAX_OVERFLOW,
+        "pool_timeout": Config.DB_POOL_TIMEOUT,
+        "pool_recycle": Config.DB_POOL_RECYCLE,
+    }
+    if database_url.startswith("sqlite"):
+        # Flask 워커 스레드 간에 풀링된 커넥션을 재사용할 수 있도록 허용
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+    new_engine = create_engine(database_url, **engine_kwargs)
+    apply_sqlite_profile(new_engine) # WAL, synchronous=NORMAL, 캐시/mmap, busy_timeout
+    logger.debug("create_papers_engine 함수 종료")
+    return new_engine
 
 def get_engine():
     logger.debug("get_engine 함수 시작")
     global engine
     if engine is None:
-        engine = create_engine(DATABASE_URL)
-        logger.debug(f"새로운 데이터베이스 엔진 생성: {DATABASE_URL}")
+        with _engine_lock:
+            if engine is None:
+                engine = create_papers_engine(DATABASE_URL)
+                logger.debug(f"새로운 데이터베이스 엔진 생성: {DATABASE_URL}")
+                try:
+                    run_migrations(engine) # 기존 papers.db 에 누락된 컬럼/인덱스 적용
+                except Exception as e:
+                    logger.warning(f"스키마 마이그레이션 실패: {e}")
+                if Config.SQLITE_CHECKPOINT_INTERVAL > 0:
+                    start_sqlite_maintenance(engine)
     logger.debug("get_engine 함수 종료")
     return engine
 
@@ -24,15 +60,51 @@ def get_session_local():
     logger.debug("get_session_local 함수 시작")
     global SessionLocal
     if SessionLocal is None:
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
-        logger.debug("새로운 SessionLocal 팩토리 생성")
+        with _engine_lock:
+            if SessionLocal is None:
+                SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+                logger.debug("새로운 SessionLocal 팩토리 생성")
     logger.debug("get_session_local 함수 종료")
     return SessionLocal
 
+def get_scoped_session():
+    """스레드(요청)별 세션을 돌려주는 scoped_session 레지스트리를 반환합니다.
+
+    웹 앱은 요청이 끝날 때 ``remove()`` 를 호출해 커넥션을 풀에 돌려줘야 합니다.
+    """
+    logger.debug("get_scoped_session 함수 시작")
+    global ScopedSession
+    if ScopedSession is None:
+        session_factory = get_session_local()
+        with _engine_lock:
+            if ScopedSession is None:
+                ScopedSession = scoped_session(session_factory)
+                logger.debug("새로운 ScopedSession 레지스트리 생성")
+    logger.debug("get_scoped_session 함수 종료")
+    return ScopedSession
+
+def get_pool_status():
+    """커넥션 풀 사용 현황을 헬스 체크용 dict로 반환합니다."""
+    pool = get_engine().pool
+    status = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        capacity = pool.size() + Config.DB_MAX_OVERFLOW
+        checked_out = pool.checkedout()
+        status.update({
+            "pool_size": pool.size(),
+            "max_overflow": Config.DB_MAX_OVERFLOW,
+            "checked_in": pool.checkedin(),
+            "checked_out": checked_out,
+            "overflow": pool.overflow(),
+            "utilisation": round(checked_out / capacity, 3) if capacity else 0.0,
+        })
+    return status
+
 def create_db_and_tables():
     logger.debug("create_db_and_tables 함수 시작")
     engine = get_engine()
     Base.metadata.create_all(engine) # 모든 테이블 생성
+    run_migrations(engine) # 스키마 버전 기록 및 기존 테이블 인덱스 보강
     logger.info("데이터베이스와 테이블이 성공적으로 생성되었습니다.")
     logger.debug("create_db_and_tables 함수 종료")
 
@@ -70,4 +142,4 @@ class MockQuery:
 
     def first(self):
         logger.debug("MockQuery first 함수 호출")
-        return None # Always return None for first to simulate no existing paper 
\ No newline at end of file
+        return None # Always return None for first to simulate no existing paper
@@ -0,0 +1,264 @@
+import time
+import uuid
+import queue
+import threading
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# 크롤링 작업 상태
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+JOB_CANCELLED = 'cancelled'
+FINISHED_STATES = (JOB_DONE, JOB_FAILED, JOB_CANCELLED)
+
+# /crawl 요청은 작업을 등록하고 ID 만 반환하며, 실제 크롤링은 이 모듈의 워커 스레드가 수행합니다.
+# 진행 상황(플랫폼별 수집 수, 속도, 남은 시간)은 작업 객체에 기록되고 상태 조회/SSE 엔드포인트가 읽어 갑니다.
+# 크롤링 작업은 사용자가 지켜보는 짧은 수명의 작업이므로 summary_queue 와 달리 메모리에만 보관합니다.
+
+class CrawlCancelled(Exception):
+    """작업 취소 요청으로 크롤링을 중단할 때 발생"""
+
+class SharedExclusiveLock:
+    """여러 작업이 함께 잡는 shared 모드와 혼자만 잡는 exclusive 모드를 가진 잠금.
+
+    exclusive 를 기다리는 작업이 있으면 새 shared 작업도 기다리므로 exclusive 작업이 굶지 않습니다.
+    wait_check 는 기다리는 동안 주기적으로 호출되며, 예외(CrawlCancelled 등)를 던지면 잠금 없이 빠져나갑니다.
+    """
+    def __init__(self, poll_interval: float = 0.1):
+        self.poll_interval = poll_interval
+        self._cond = threading.Condition()
+        self._shared = 0
+        self._exclusive = False
+        self._exclusive_waiting = 0
+
+    def acquire(self, exclusive: bool, wait_check=None):
+        with self._cond:
+            if exclusive:
+                self._exclusive_waiting += 1
+            try:
+                while self._exclusive or (self._shared if exclusive else self._exclusive_waiting):
+                    if wait_check:
+                        wait_check()
+                    self._cond.wait(self.poll_interval)
+                if exclusive:
+                    self._exclusive = True
+                else:
+                    self._shared += 1
+            finally:
+                if exclusive:
+                    self._exclusive_waiting -= 1
+                    self._cond.notify_all()
+
+    def release(self, exclusive: bool):
+        with self._cond:
+            if exclusive:
+                self._exclusive = False
+            else:
+                self._shared -= 1
+            self._cond.notify_all()
+
+class CrawlJob:
+    def __init__(self, kind: str, params: dict, exclusive: bool = False):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.params = params
+        self.exclusive = exclusive # True 이면 다른 작업과 동시에 실행하지 않음 (전체 초기화 크롤링)
+        self.status = JOB_QUEUED
+        self.created_at = datetime.now()
+        self.started_at = None
+        self.finished_at = None
+        self.platforms = {} # platform -> 진행 상황
+        self.fetched = 0
+        self.saved = None
+        self.message = None
+        self.error = None
+        self.cancel_event = threading.Event()
+        self.version = 0 # 상태가 바뀔 때마다 증가 (SSE 변경 감지용)
+        self._changed = threading.Condition()
+
+    def _touch(self):
+        with self._changed:
+            self.version += 1
+            self._changed.notify_all()
+
+    def wait_for_change(self, version: int, timeout: float) -> int:
+        """version 이후 변경이 생기거나 timeout 이 지날 때까지 대기하고 현재 version 을 반환합니다."""
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+    def check_cancelled(self):
+        if self.cancel_event.is_set():
+            raise CrawlCancelled(f"크롤링 작업 {self.id} 취소됨")
+
+    def report_progress(self, platform: str, event: str, fetched: int = 0, limit: int = None, error: str = None):
+        """multi_platform_crawl 의 progress_callback. event 는 start / paper / done / error."""
+        now = time.time()
+        progress = self.platforms.setdefault(platform, {"status": "pending", "fetched": 0, "limit": limit,
+                                                        "rate": 0.0, "eta_seconds": None, "_started": now})
+        if event == "start":
+            progress.update(status="running", _started=now, limit=limit)
+        elif event in ("paper", "done"):
+            elapsed = max(now - progress["_started"], 1e-6)
+            progress["fetched"] = fetched
+            progress["rate"] = round(fetched / elapsed, 2) # 초당 논문 수
+            remaining = (progress["limit"] - fetched) if progress["limit"] else None
+            progress["eta_seconds"] = round(remaining / progress["rate"], 1) if remaining and progress["rate"] > 0 else None
+            if event == "done":
+                progress.update(status="done", eta_seconds=0)
+        elif event == "error":
+            progress.update(status="error", error=error)
+        self.fetched = sum(item["fetched"] for item in self.platforms.values())
+        self._touch()
+
+    def set_status(self, status: str, message: str = None, error: str = None):
+        self.status = status
+        if status == JOB_RUNNING:
+            self.started_at = datetime.now()
+        elif status in FINISHED_STATES:
+            self.finished_at = datetime.now()
+        if message is not None:
+            self.message = message
+        if error is not None:
+            self.error = error
+        self._touch()
+
+    def to_dict(self) -> dict:
+        elapsed_end = self.finished_at or datetime.now()
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "exclusive": self.exclusive,
+            "params": self.params,
+            "status": self.status,
+            "created_at": self.created_at.isoformat(timespec="seconds"),
+            "started_at": self.started_at.isoformat(timespec="seconds") if self.started_at else None,
+            "finished_at": self.finished_at.isoformat(timespec="seconds") if self.finished_at else None,
+            "elapsed_seconds": round((elapsed_end - self.started_at).total_seconds(), 1) if self.started_at else None,
+            "fetched": self.fetched,
+            "saved": self.saved,
+            "platforms": {platform: {key: value for key, value in progress.items() if not key.startswith("_")}
+                          for platform, progress in self.platforms.items()},
+            "message": self.message,
+            "error": self.error,
+            "version": self.version,
+        }
+
+class CrawlJobManager:
+    """크롤링 작업 대기열과 워커 스레드.
+
+    runner 는 CrawlJob 을 받아 크롤링을 수행하는 함수로, job.report_progress 로 진행 상황을 기록하고
+    job.check_cancelled() (또는 CrawlCancelled) 로 취소에 응답해야 합니다. 반환한 문자열은 완료 메시지가 됩니다.
+    """
+    def __init__(self, runner, workers: int = None, history: int = None):
+        self.runner = runner
+        self.workers = workers if workers is not None else Config.CRAWL_JOB_WORKERS
+        self.history = history if history is not None else Config.CRAWL_JOB_HISTORY
+        self._queue = queue.Queue()
+        self._jobs = OrderedDict() # job_id -> CrawlJob (등록 순서)
+        self._jobs_lock = threading.Lock()
+        self._threads = []
+        self._stop_event = threading.Event()
+        self._gate = SharedExclusiveLock() # exclusive 작업과 다른 작업이 겹치지 않도록
+
+    def start(self):
+        if self._threads:
+            return self
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"crawl-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"크롤링 워커 {self.workers}개 시작")
+        return self
+
+    def stop(self, timeout: float = None):
+        self._stop_event.set()
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def is_alive(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def submit(self, kind: str, params: dict, exclusive: bool = False) -> CrawlJob:
+        """exclusive 작업은 실행 중인 다른 작업이 모두 끝난 뒤 혼자 실행되고, 그동안 다른 작업은 기다립니다."""
+        job = CrawlJob(kind, params, exclusive)
+        with self._jobs_lock:
+            self._jobs[job.id] = job
+            self._trim_history()
+        self._queue.put(job)
+        logger.debug(f"크롤링 작업 등록 - job_id: {job.id}, kind: {kind}, params: {params}")
+        return job
+
+    def get(self, job_id: str):
+        with self._jobs_lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self) -> list:
+        with self._jobs_lock:
+            return list(reversed(self._jobs.values())) # 최신 작업 먼저
+
+    def cancel(self, job_id: str) -> bool:
+        """대기 중인 작업은 바로 취소되고, 실행 중인 작업은 다음 논문/플랫폼 경계에서 중단됩니다."""
+        job = self.get(job_id)
+        if job is None or job.status in FINISHED_STATES:
+            return False
+        job.cancel_event.set()
+        if job.status == JOB_QUEUED:
+            job.set_status(JOB_CANCELLED, message="실행 전에 취소되었습니다.")
+        else:
+            job._touch()
+        logger.info(f"크롤링 작업 취소 요청 - job_id: {job_id}")
+        return True
+
+    def _trim_history(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in FINISHED_STATES]
+        for job_id in finished[:max(0, len(finished) - self.history)]:
+            del self._jobs[job_id]
+
+    def _run(self):
+        logger.debug(f"{threading.current_thread().name} 시작")
+        while not self._stop_event.is_set():
+            job = self._queue.get()
+            if job is None:
+                break
+            if job.status != JOB_QUEUED: # 대기 중 취소된 작업
+                continue
+            self.run_job(job)
+        logger.debug(f"{threading.current_thread().name} 종료")
+
+    def run_job(self, job: CrawlJob):
+        job.set_status(JOB_RUNNING)
+        logger.info(f"크롤링 작업 시작 - job_id: {job.id}")
+        try:
+            job.check_cancelled()
+            self._gate.acquire(job.exclusive, wait_check=job.check_cancelled)
+            try:
+                message = self.runner(job)
+            finally:
+                self._gate.release(job.exclusive)
+            job.set_status(JOB_DONE, message=message)
+        except CrawlCancelled:
+            job.set_status(JOB_CANCELLED, message="사용자 요청으로 취소되었습니다.")
+        except Exception as e:
+            logger.error(f"크롤링 작업 실패 - job_id: {job.id}: {e}", exc_info=True)
+            job.set_status(JOB_FAILED, error=str(e))
+        logger.info(f"크롤링 작업 종료 - job_id: {job.id}, 상태: {job.status}")
+
+_manager = None
+_manager_lock = threading.Lock()
+
+def get_crawl_job_manager(runner):
+    """프로세스당 하나의 크롤링 작업 관리자를 시작합니다 (이미 실행 중이면 기존 관리자를 반환)."""
+    global _manager
+    with _manager_lock:
+        if _manager is None or not _manager.is_alive():
+            _manager = CrawlJobManager(runner).start()
+    return _manager
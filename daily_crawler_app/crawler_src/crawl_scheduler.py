@@ -0,0 +1,340 @@
+import argparse
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+from sqlalchemy import or_, cast, String
+from .config import Config
+from .connection import get_session_local
+from .models import Paper, CrawlRun
+from .embedding_manager import EmbeddingManager
+from .multi_platform_crawler import multi_platform_crawl, save_papers_to_db
+from .summary_queue import wake_summary_workers
+
+logger = logging.getLogger(__name__)
+
+# 플랫폼별 cron 식(Config.CRAWL_SCHEDULES)에 따라 증분 크롤링을 실행하는 스케줄러.
+# 각 실행은 crawl_runs 테이블에 기록되며, 다음 실행은 마지막 성공 실행의 window_end 부터 크롤링합니다.
+# 같은 플랫폼의 이전 실행이 끝나지 않았으면 (같은 프로세스든 다른 프로세스든) 이번 실행은 skipped 로 기록하고 건너뜁니다.
+# 크롤링 직후 새 논문의 임베딩을 채우고 요약 워커를 깨워, 보고서 생성 시점에 LLM/임베딩을 기다리지 않게 합니다.
+
+RUN_RUNNING = 'running'
+RUN_DONE = 'done'
+RUN_FAILED = 'failed'
+RUN_SKIPPED = 'skipped'
+
+# 플랫폼 -> 요청하는 호스트 (같은 호스트를 쓰는 플랫폼은 시작 시각을 벌려 동시에 요청하지 않음)
+PLATFORM_BASE_URLS = {
+    "arxiv": Config.ARXIV_BASE_URL,
+    "arxiv_rss": Config.ARXIV_RSS_BASE_URL,
+    "arxiv_oai": Config.ARXIV_OAI_BASE_URL,
+    "biorxiv": Config.BIORXIV_API_BASE_URL,
+    "pmc": Config.PMC_ESEARCH_BASE_URL,
+    "plos": Config.PLOS_API_BASE_URL,
+    "doaj": Config.DOAJ_API_BASE_URL,
+}
+
+def platform_host(platform: str) -> str:
+    url = PLATFORM_BASE_URLS.get(platform)
+    return urlparse(url).hostname if url else platform
+
+class CronSchedule:
+    """분 시 일 월 요일 의 5필드 cron 식. 각 필드는 *, 숫자, a-b, */n, a-b/n 및 쉼표 목록을 지원합니다 (요일 0 = 일요일)."""
+    FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 6))
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 식은 5개 필드여야 합니다: {expression!r}")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays = (
+            self._parse_field(field, low, high) for field, (low, high) in zip(fields, self.FIELD_RANGES))
+        # 일/요일 중 하나만 지정되면 그 필드만, 둘 다 지정되면 둘 중 하나만 맞아도 실행 (표준 cron 동작)
+        self._days_restricted = fields[2] != "*"
+        self._weekdays_restricted = fields[4] != "*"
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> list:
+        values = set()
+        for part in field.split(","):
+            value_range, _, step = part.partition("/")
+            if value_range == "*":
+                start, end = low, high
+            elif "-" in value_range:
+                start, end = (int(value) for value in value_range.split("-", 1))
+            else:
+                start = end = int(value_range)
+                if step:
+                    end = high
+            if not (low <= start <= end <= high):
+                raise ValueError(f"cron 필드 범위 오류: {field!r} ({low}-{high})")
+            values.update(range(start, end + 1, int(step) if step else 1))
+        return sorted(values)
+
+    def _day_matches(self, day: datetime) -> bool:
+        day_ok = day.day in self.days
+        weekday_ok = (day.weekday() + 1) % 7 in self.weekdays # datetime 은 월요일 = 0
+        if self._days_restricted and self._weekdays_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, after: datetime) -> datetime:
+        """after 보다 늦은 첫 실행 시각 (분 단위)."""
+        start = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = start.replace(hour=0, minute=0)
+        for _ in range(366 * 5): # 2월 29일만 지정한 경우도 찾을 수 있도록 최대 5년
+            if day.month in self.months and self._day_matches(day):
+                for hour in self.hours:
+                    for minute in self.minutes:
+                        candidate = day.replace(hour=hour, minute=minute)
+                        if candidate >= start:
+                            return candidate
+            day += timedelta(days=1)
+        raise ValueError(f"실행 시각을 찾을 수 없는 cron 식: {self.expression!r}")
+
+def host_offsets(platforms, stagger: float = None) -> dict:
+    """같은 호스트를 쓰는 플랫폼마다 stagger 초씩 시작을 늦추는 {platform: 초}."""
+    stagger = stagger if stagger is not None else Config.CRAWL_SCHEDULE_HOST_STAGGER
+    seen = {}
+    offsets = {}
+    for platform in platforms:
+        host = platform_host(platform)
+        offsets[platform] = seen.get(host, 0) * stagger
+        seen[host] = seen.get(host, 0) + 1
+    return offsets
+
+def _active_run(session, platform: str, now: datetime):
+    stale_before = now - timedelta(seconds=Config.CRAWL_SCHEDULE_STALE_AFTER)
+    return session.query(CrawlRun.id).filter(CrawlRun.platform == platform, CrawlRun.status == RUN_RUNNING,
+                                             CrawlRun.started_at >= stale_before).first()
+
+def _last_window_end(session, platform: str):
+    return session.query(CrawlRun.window_end).filter(CrawlRun.platform == platform, CrawlRun.status == RUN_DONE) \
+                  .order_by(CrawlRun.started_at.desc()).limit(1).scalar()
+
+def begin_crawl_run(session, platform: str, scheduled_for: datetime = None, now: datetime = None):
+    """실행 기록을 running 으로 만들고 반환합니다. 같은 플랫폼이 이미 실행 중이면 skipped 기록을 남기고 None 을 반환합니다."""
+    now = now or datetime.now()
+    if _active_run(session, platform, now) is not None:
+        session.add(CrawlRun(platform=platform, status=RUN_SKIPPED, scheduled_for=scheduled_for, started_at=now,
+                             finished_at=now, duration_seconds=0.0, error="이전 실행이 아직 진행 중"))
+        session.commit()
+        return None
+    window_start = _last_window_end(session, platform) or now - timedelta(days=Config.CRAWL_SCHEDULE_INITIAL_LOOKBACK_DAYS)
+    run = CrawlRun(platform=platform, status=RUN_RUNNING, scheduled_for=scheduled_for, started_at=now,
+                   window_start=window_start, window_end=now)
+    session.add(run)
+    session.commit()
+    return run
+
+def finish_crawl_run(session, run: CrawlRun, status: str, error: str = None):
+    run.status = status
+    run.finished_at = datetime.now()
+    run.duration_seconds = round((run.finished_at - run.started_at).total_seconds(), 3)
+    if error is not None:
+        run.error = error[:1000]
+    session.commit()
+
+def embed_new_papers(session, since: datetime, embed) -> int:
+    """since 이후 크롤링되었지만 임베딩이 없는 대표 논문의 임베딩을 채웁니다 (커밋은 호출자가 수행)."""
+    missing = or_(Paper.embedding.is_(None), cast(Paper.embedding, String) == "null") # JSON null 로 저장된 경우 포함
+    papers = session.query(Paper).filter(Paper.crawled_date >= since, Paper.canonical_id.is_(None), missing).all() # 중복 논문은 건너뜀
+    for paper in papers:
+        paper.embedding = embed(f"{paper.title or ''} {paper.abstract or ''}".strip())
+    return len(papers)
+
+def recent_crawl_runs(session, platform: str = None, limit: int = 20) -> list:
+    query = session.query(CrawlRun)
+    if platform:
+        query = query.filter(CrawlRun.platform == platform)
+    return [run.to_dict() for run in query.order_by(CrawlRun.started_at.desc(), CrawlRun.id.desc()).limit(limit)]
+
+def run_scheduled_crawl(platform: str, scheduled_for: datetime = None, session_factory=None, crawl=None, save=None, embed=None) -> dict:
+    """플랫폼 하나의 증분 크롤링 -> 저장 -> 임베딩 -> 요약 워커 깨우기 를 실행하고 실행 기록(dict)을 반환합니다."""
+    crawl = crawl or multi_platform_crawl
+    save = save or save_papers_to_db
+    session = (session_factory or get_session_local())()
+    try:
+        run = begin_crawl_run(session, platform, scheduled_for)
+        if run is None:
+            logger.info(f"[{platform}] 이전 예약 크롤링이 진행 중이라 이번 실행을 건너뜁니다.")
+            return {"platform": platform, "status": RUN_SKIPPED}
+        logger.info(f"[{platform}] 예약 크롤링 시작 - 범위: {run.window_start} ~ {run.window_end}")
+        try:
+            papers = crawl(query="research", platforms=[platform], start_date=run.window_start, end_date=run.window_end,
+                           max_results=Config.CRAWL_SCHEDULE_MAX_RESULTS)
+            run.fetched = len(papers)
+            run.saved = save(papers)
+            run.embedded = embed_new_papers(session, run.started_at, embed or _default_embedder().get_embedding)
+            session.commit()
+            if run.saved:
+                wake_summary_workers() # 같은 프로세스의 워커는 즉시, 다른 프로세스의 워커는 다음 폴링 때 처리
+            finish_crawl_run(session, run, RUN_DONE)
+        except Exception as e:
+            session.rollback()
+            logger.error(f"[{platform}] 예약 크롤링 실패: {e}", exc_info=True)
+            finish_crawl_run(session, run, RUN_FAILED, error=str(e))
+        result = run.to_dict()
+        logger.info(f"[{platform}] 예약 크롤링 종료 - 상태: {result['status']}, 소요: {result['duration_seconds']}초, "
+                    f"수집: {result['fetched']}, 신규: {result['saved']}, 수율: {result['yield']}")
+        return result
+    finally:
+        session.close()
+
+_embedder = None
+
+def _default_embedder():
+    global _embedder
+    if _embedder is None:
+        _embedder = EmbeddingManager()
+    return _embedder
+
+class CrawlScheduler:
+    """Config.CRAWL_SCHEDULES 의 cron 식에 맞춰 run_scheduled_crawl 을 실행하는 스케줄러 스레드.
+
+    runner(platform, scheduled_for) 는 예약 시각이 된 플랫폼마다 실행 풀에서 호출됩니다.
+    같은 프로세스에서 같은 플랫폼이 아직 실행 중이면 runner 를 부르지 않고 건너뜁니다.
+    """
+    def __init__(self, schedules: dict = None, runner=None, stagger: float = None, workers: int = None, clock=datetime.now):
+        schedules = schedules if schedules is not None else Config.CRAWL_SCHEDULES
+        self.runner = runner or run_scheduled_crawl
+        self.clock = clock
+        self.crons = {platform: CronSchedule(expression) for platform, expression in schedules.items()}
+        self.offsets = host_offsets(self.crons, stagger)
+        self.workers = workers if workers is not None else Config.CRAWL_SCHEDULER_WORKERS
+        self.next_runs = {}
+        self.stats = {"triggered": 0, "skipped": 0}
+        self._running = set()
+        self._lock = threading.Lock()
+        self._executor = None
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._plan(self.clock())
+
+    def _next_run(self, platform: str, after: datetime) -> datetime:
+        offset = timedelta(seconds=self.offsets[platform])
+        return self.crons[platform].next_after(after - offset) + offset
+
+    def _plan(self, now: datetime):
+        for platform in self.crons:
+            self.next_runs[platform] = self._next_run(platform, now)
+
+    def start(self):
+        if self._thread is not None:
+            return self
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="crawl-scheduled")
+        self._thread = threading.Thread(target=self._loop, name="crawl-scheduler", daemon=True)
+        self._thread.start()
+        logger.info(f"크롤링 스케줄러 시작 - 다음 실행: {self.status()['next_runs']}")
+        return self
+
+    def stop(self, timeout: float = None):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _loop(self):
+        while not self._stop_event.is_set():
+            self.run_pending()
+            wait = (min(self.next_runs.values()) - self.clock()).total_seconds() if self.next_runs else 60
+            self._stop_event.wait(min(max(wait, 1), 60)) # 시계 변경에 대비해 최대 1분마다 다시 확인
+
+    def run_pending(self, now: datetime = None) -> list:
+        """예약 시각이 지난 플랫폼을 실행(또는 건너뜀)하고 다음 실행 시각을 잡습니다. 실행한 플랫폼 목록을 반환합니다."""
+        now = now or self.clock()
+        triggered = []
+        for platform, due in list(self.next_runs.items()):
+            if due > now:
+                continue
+            self.next_runs[platform] = self._next_run(platform, now)
+            if self._trigger(platform, due):
+                triggered.append(platform)
+        return triggered
+
+    def _trigger(self, platform: str, scheduled_for: datetime) -> bool:
+        with self._lock:
+            if platform in self._running:
+                self.stats["skipped"] += 1
+                logger.info(f"[{platform}] 이전 예약 크롤링이 진행 중이라 {scheduled_for} 실행을 건너뜁니다.")
+                return False
+            self._running.add(platform)
+            self.stats["triggered"] += 1
+        if self._executor is None: # start() 없이 run_pending 을 직접 부르는 경우 (CLI --once) 바로 실행
+            self._run(platform, scheduled_for)
+        else:
+            self._executor.submit(self._run, platform, scheduled_for)
+        return True
+
+    def _run(self, platform: str, scheduled_for: datetime):
+        try:
+            self.runner(platform, scheduled_for)
+        except Exception as e:
+            logger.error(f"[{platform}] 예약 크롤링 실행 오류: {e}", exc_info=True)
+        finally:
+            with self._lock:
+                self._running.discard(platform)
+
+    def status(self) -> dict:
+        with self._lock:
+            running = sorted(self._running)
+            stats = dict(self.stats)
+        return {
+            "schedules": {platform: cron.expression for platform, cron in self.crons.items()},
+            "next_runs": {platform: due.isoformat(timespec="seconds") for platform, due in sorted(self.next_runs.items(), key=lambda item: item[1])},
+            "running": running,
+            "stats": stats,
+        }
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+def get_crawl_scheduler():
+    """실행 중인 스케줄러 (없으면 None)"""
+    return _scheduler
+
+def start_crawl_scheduler(schedules: dict = None):
+    """프로세스당 하나의 크롤링 스케줄러를 시작합니다 (이미 실행 중이면 기존 스케줄러를 반환)."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None or not _scheduler.is_alive():
+            _scheduler = CrawlScheduler(schedules).start()
+    return _scheduler
+
+def main():
+    """독립 실행: python -m crawler_src.crawl_scheduler [--once] [--platforms arxiv pmc] [--summarize]"""
+    parser = argparse.ArgumentParser(description="플랫폼별 예약 증분 크롤링 스케줄러")
+    parser.add_argument("--platforms", nargs="+", help="예약할 플랫폼 (기본값: Config.CRAWL_SCHEDULES 전체)")
+    parser.add_argument("--once", action="store_true", help="예약 시각과 무관하게 지금 한 번씩 실행하고 종료")
+    parser.add_argument("--summarize", action="store_true", help="이 프로세스에서 요약 워커도 실행 (논문 관리 앱이 꺼져 있을 때, --once 와 함께 쓰면 종료 시 남은 작업은 다음 실행으로 넘어감)")
+    args = parser.parse_args()
+
+    from .connection import create_db_and_tables
+    create_db_and_tables()
+    schedules = {platform: expression for platform, expression in Config.CRAWL_SCHEDULES.items()
+                 if not args.platforms or platform in args.platforms}
+    if args.summarize:
+        from .llm_client import summarize_abstract
+        from .summary_queue import start_summary_workers
+        start_summary_workers(summarize_abstract)
+
+    if args.once:
+        for platform in schedules:
+            run_scheduled_crawl(platform, datetime.now())
+        return
+    scheduler = CrawlScheduler(schedules).start()
+    try:
+        while scheduler.is_alive():
+            scheduler._thread.join(60)
+    except KeyboardInterrupt:
+        logger.info("크롤링 스케줄러 종료 요청")
+        scheduler.stop(timeout=5)
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    main()
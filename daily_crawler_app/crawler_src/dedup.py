@@ -0,0 +1,192 @@
+import re
+import argparse
+import hashlib
+import logging
+import numpy as np
+from sqlalchemy import tuple_
+from .config import Config
+from .models import Paper, PaperSignature, PaperLSHBucket
+
+logger = logging.getLogger(__name__)
+
+# 플랫폼 간 중복 논문 탐지. 같은 논문이 arXiv ID, biorxiv_10.1101_..., PMC..., DOAJ 레코드로 각각 저장되면
+# 요약/임베딩/보고서 작업이 여러 번 일어나므로, 저장 시점에 대표 논문(canonical)을 찾아 papers.canonical_id 로 연결합니다.
+# 1) DOI 가 같으면 같은 논문 2) 아니면 제목+초록의 MinHash 서명을 LSH 밴드로 나눠 같은 버킷의 논문만 후보로 조회하고,
+#    추정 Jaccard 유사도가 Config.DEDUP_SIMILARITY_THRESHOLD 이상인 후보를 같은 논문으로 봅니다.
+# 대표 논문은 먼저 저장된 논문이며, canonical_id 는 항상 대표 논문(자신의 canonical_id 가 NULL)을 가리킵니다.
+
+DOI_RE = re.compile(r'(10\.\d{4,9}/[^\s"<>]+)', re.IGNORECASE)
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+NON_WORD_RE = re.compile(r'[\W_]+', re.UNICODE)
+MAX_HASH = (1 << 32) - 1
+
+def normalize_doi(value):
+    """'https://doi.org/10.1101/ABC.' -> '10.1101/abc'. DOI 가 없으면 None."""
+    if not value:
+        return None
+    match = DOI_RE.search(str(value))
+    return match.group(1).rstrip('.,;)').lower() if match else None
+
+def extract_doi(paper: dict):
+    """크롤러 결과에서 DOI 를 찾습니다 (doi 필드, 없으면 external_id - biorxiv/PLOS 는 external_id 가 DOI)."""
+    return normalize_doi(paper.get("doi")) or normalize_doi(paper.get("external_id"))
+
+def normalize_text(text: str) -> str:
+    """HTML 태그/구두점을 제거하고 소문자 단어만 공백으로 이어 붙입니다."""
+    text = HTML_TAG_RE.sub(" ", text or "")
+    return NON_WORD_RE.sub(" ", text.lower()).strip()
+
+def shingles(text: str, size: int = None) -> set:
+    """정규화된 텍스트의 단어 size-gram 집합 (단어가 size 개보다 적으면 전체를 하나로)."""
+    size = size or Config.DEDUP_SHINGLE_SIZE
+    words = normalize_text(text).split()
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+def _stable_hash(value: str, digest_size: int = 8) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=digest_size).digest(), "little")
+
+def _mix64(values: np.ndarray) -> np.ndarray:
+    """splitmix64 마무리 함수. uint64 곱셈은 2^64 로 감싸지며(wrap) 비트를 고르게 섞습니다."""
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+class MinHasher:
+    """shingle 의 64비트 해시를 해시 함수별 시드와 XOR 한 뒤 splitmix64 로 섞어 num_perm 개의 최솟값을 취합니다.
+
+    시드는 해시로부터 결정적으로 만들어 프로세스/NumPy 버전이 달라도 같은 서명이 나오게 합니다 (DB 에 저장된 서명과 비교하므로).
+    """
+    def __init__(self, num_perm: int = None, bands: int = None):
+        self.num_perm = num_perm or Config.DEDUP_NUM_PERM
+        self.bands = bands or Config.DEDUP_LSH_BANDS
+        if self.num_perm % self.bands:
+            raise ValueError(f"num_perm({self.num_perm}) 은 bands({self.bands}) 로 나누어떨어져야 합니다.")
+        self.rows = self.num_perm // self.bands
+        self._seeds = np.array([_stable_hash(f"minhash-seed-{i}") for i in range(self.num_perm)], dtype=np.uint64)
+
+    def signature(self, tokens) -> np.ndarray:
+        """shingle 집합의 서명 (uint32 배열). 빈 집합이면 모두 최댓값이라 다른 어떤 논문과도 같은 버킷이 되지 않습니다."""
+        if not tokens:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint32)
+        hashes = np.fromiter((_stable_hash(token) for token in tokens), dtype=np.uint64, count=len(tokens))
+        mixed = _mix64(self._seeds[:, None] ^ hashes[None, :]) >> np.uint64(32) # 상위 32비트 사용
+        return mixed.min(axis=1).astype(np.uint32)
+
+    def band_keys(self, signature: np.ndarray) -> list:
+        """[(band, bucket)] - 밴드별 행들을 해시한 버킷 키."""
+        return [(band, hashlib.blake2b(signature[band * self.rows:(band + 1) * self.rows].tobytes(), digest_size=8).hexdigest())
+                for band in range(self.bands)]
+
+def estimate_similarity(signature_a: np.ndarray, signature_b: np.ndarray) -> float:
+    """같은 위치의 최솟값이 일치하는 비율 = Jaccard 유사도 추정값"""
+    return float(np.mean(signature_a == signature_b))
+
+def paper_text(paper) -> str:
+    get = paper.get if isinstance(paper, dict) else lambda name: getattr(paper, name, None)
+    return f"{get('title') or ''} {get('abstract') or ''}"
+
+_hasher = None
+
+def get_min_hasher() -> MinHasher:
+    global _hasher
+    if _hasher is None:
+        _hasher = MinHasher()
+    return _hasher
+
+def find_canonical(session, paper_id: str, doi, signature: np.ndarray, hasher: MinHasher = None, threshold: float = None):
+    """같은 논문으로 보이는 기존 논문의 대표 paper_id 를 반환합니다. 없으면 None."""
+    hasher = hasher or get_min_hasher()
+    threshold = threshold if threshold is not None else Config.DEDUP_SIMILARITY_THRESHOLD
+    if doi:
+        match = session.query(Paper.paper_id, Paper.canonical_id).filter(Paper.doi == doi, Paper.paper_id != paper_id).first()
+        if match is not None:
+            return match.canonical_id or match.paper_id
+    candidate_ids = {candidate_id for (candidate_id,) in session.query(PaperLSHBucket.paper_id).filter(
+        tuple_(PaperLSHBucket.band, PaperLSHBucket.bucket).in_(hasher.band_keys(signature)),
+        PaperLSHBucket.paper_id != paper_id)}
+    if not candidate_ids:
+        return None
+    best_id, best_score = None, threshold
+    for candidate_id, candidate_signature in session.query(PaperSignature.paper_id, PaperSignature.signature) \
+                                                    .filter(PaperSignature.paper_id.in_(candidate_ids)):
+        score = estimate_similarity(signature, np.frombuffer(candidate_signature, dtype=np.uint32))
+        if score >= best_score:
+            best_id, best_score = candidate_id, score
+    if best_id is None:
+        return None
+    canonical_id = session.query(Paper.canonical_id).filter(Paper.paper_id == best_id).scalar()
+    logger.debug(f"중복 후보 발견 - paper_id: {paper_id}, 유사 논문: {best_id} (유사도 {best_score:.2f})")
+    return canonical_id or best_id
+
+def index_paper(session, paper: dict, link: bool = True, hasher: MinHasher = None):
+    """논문의 MinHash 서명/LSH 버킷을 (교체) 저장하고, link 이면 대표 논문 paper_id (없으면 None) 를 반환합니다.
+
+    paper 는 save_papers_to_db 의 processed_data 처럼 paper_id, title, abstract, doi 를 가진 dict 입니다 (커밋은 호출자가 수행).
+    """
+    hasher = hasher or get_min_hasher()
+    paper_id = paper["paper_id"]
+    signature = hasher.signature(shingles(paper_text(paper)))
+    canonical_id = find_canonical(session, paper_id, paper.get("doi"), signature, hasher) if link else None
+    session.query(PaperLSHBucket).filter(PaperLSHBucket.paper_id == paper_id).delete(synchronize_session=False)
+    session.merge(PaperSignature(paper_id=paper_id, signature=signature.tobytes()))
+    session.add_all(PaperLSHBucket(band=band, bucket=bucket, paper_id=paper_id) for band, bucket in hasher.band_keys(signature))
+    session.flush() # 같은 배치의 다음 논문이 이 논문을 후보로 찾을 수 있도록 반영
+    if canonical_id == paper_id:
+        return None
+    return canonical_id
+
+def delete_all_dedup_keys(session):
+    """papers 를 일괄 삭제할 때 서명/버킷도 함께 비웁니다."""
+    session.query(PaperLSHBucket).delete(synchronize_session=False)
+    session.query(PaperSignature).delete(synchronize_session=False)
+
+def rebuild_dedup_index(session, batch_size: int = 500) -> dict:
+    """모든 논문의 DOI/서명/버킷을 다시 만들고 대표 논문을 다시 연결합니다 (먼저 크롤링된 논문이 대표).
+
+    기존 DB 에 처음 적용하거나 DEDUP_NUM_PERM 등 서명 설정을 바꾼 뒤 실행합니다.
+    """
+    rows = session.query(Paper.paper_id, Paper.title, Paper.abstract, Paper.external_id, Paper.doi) \
+                  .order_by(Paper.crawled_date, Paper.paper_id).all()
+    # 처리 순서대로 다시 채워, 아직 처리하지 않은 (나중에 크롤링된) 논문이 DOI 로 대표가 되지 않게 합니다.
+    delete_all_dedup_keys(session)
+    session.query(Paper).update({Paper.canonical_id: None, Paper.doi: None}, synchronize_session=False)
+    stats = {"papers": 0, "linked": 0}
+    for row in rows:
+        paper = {"paper_id": row.paper_id, "title": row.title, "abstract": row.abstract, "external_id": row.external_id, "doi": row.doi}
+        paper["doi"] = extract_doi(paper) # 저장된 doi 가 있으면 유지, 없으면 external_id 에서 추출
+        session.query(Paper).filter(Paper.paper_id == row.paper_id).update({Paper.doi: paper["doi"]}, synchronize_session=False)
+        canonical_id = index_paper(session, paper)
+        if canonical_id:
+            session.query(Paper).filter(Paper.paper_id == row.paper_id).update({Paper.canonical_id: canonical_id}, synchronize_session=False)
+            stats["linked"] += 1
+        stats["papers"] += 1
+        if stats["papers"] % batch_size == 0:
+            session.commit()
+            logger.info(f"중복 탐지 인덱스 재구성 중: {stats['papers']}/{len(rows)}")
+    session.commit()
+    return stats
+
+def main():
+    """python -m crawler_src.dedup --rebuild"""
+    parser = argparse.ArgumentParser(description="중복 논문 탐지 인덱스 관리")
+    parser.add_argument("--rebuild", action="store_true", help="모든 논문의 DOI/MinHash 서명을 다시 만들고 대표 논문을 다시 연결")
+    args = parser.parse_args()
+    if not args.rebuild:
+        parser.print_help()
+        return
+    from .connection import create_db_and_tables, get_session_local
+    create_db_and_tables()
+    session = get_session_local()()
+    try:
+        stats = rebuild_dedup_index(session)
+        logger.info(f"중복 탐지 인덱스 재구성 완료 - 논문 {stats['papers']}편 중 {stats['linked']}편이 중복으로 연결됨")
+    finally:
+        session.close()
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    main()
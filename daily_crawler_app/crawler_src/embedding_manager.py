@@ -1,6 +1,10 @@
 import numpy as np
 
 class EmbeddingManager:
+    # 더미(랜덤) 임베딩이므로 유사도에 의미가 없음. 실제 모델로 바꾸면 False 로 설정해
+    # 페르소나 1차 필터/관련도 점수의 페르소나 항목이 임베딩 유사도를 사용하도록 합니다.
+    is_placeholder = True
+
     def __init__(self):
         pass
 
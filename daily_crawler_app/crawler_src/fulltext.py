@@ -0,0 +1,352 @@
+import os
+import re
+import shutil
+import argparse
+import subprocess
+import threading
+import logging
+import multiprocessing
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from datetime import datetime
+from urllib.parse import urlparse
+import requests
+from sqlalchemy import text, or_, and_
+from .config import Config
+from .connection import get_session_local
+from .models import Paper, PdfBlob, PaperFullText
+from .blob_store import BlobStore
+from .http_retry import get_resilient_http
+from .http_sessions import get_http_session
+from .async_crawler import get_rate_limiter
+
+try:
+    import pypdf
+except ImportError: # pypdf 가 없으면 poppler 의 pdftotext 명령을 사용
+    pypdf = None
+
+logger = logging.getLogger(__name__)
+
+# 선택한 논문의 PDF 를 받아 본문을 추출하고 전문 검색(FTS5) 색인에 넣는 파이프라인.
+# - 다운로드: 공용 세션/재시도 계층을 쓰고, 호스트별 동시 다운로드 수(Config.PDF_HOST_CONCURRENCY)와 요청 간격을 지킵니다.
+#   전송이 끊기면 partial 파일에서 Range 요청으로 이어 받습니다.
+# - 저장: blob_store 에 SHA-256 으로 저장하므로 같은 PDF 는 한 번만 보관하고, 이미 받은 pdf_url 은 다시 받지 않습니다.
+# - 추출: CPU 를 많이 쓰므로 프로세스 풀에서 실행하고, DB 쓰기는 모두 호출 스레드에서 합니다.
+
+STATUS_PENDING = 'pending'
+STATUS_DOWNLOADED = 'downloaded' # PDF 는 있고 본문 추출 전 (추출기가 없거나 추출 실패)
+STATUS_INDEXED = 'indexed'
+STATUS_FAILED = 'failed'
+
+# 전송 도중 끊김 (이어 받기 대상). 요청 자체의 연결 오류/5xx 는 재시도 계층이 처리
+RESUMABLE_ERRORS = (requests.exceptions.ChunkedEncodingError, requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+class PdfDownloadError(Exception):
+    """PDF 를 받을 수 없음 (PDF 가 아닌 응답, 크기 초과, 이어 받기 실패)"""
+
+class PdfExtractionUnavailable(Exception):
+    """pypdf 도 pdftotext 도 없음"""
+
+def extraction_available() -> bool:
+    return pypdf is not None or shutil.which("pdftotext") is not None
+
+def extract_pdf_text(path: str, max_chars: int = None) -> dict:
+    """PDF 본문 -> {text, page_count}. 프로세스 풀에서 실행되는 모듈 수준 함수입니다."""
+    max_chars = max_chars or Config.PDF_EXTRACT_MAX_CHARS
+    if pypdf is not None:
+        reader = pypdf.PdfReader(path)
+        pages, length = [], 0
+        for page in reader.pages:
+            page_text = page.extract_text() or ""
+            pages.append(page_text)
+            length += len(page_text)
+            if length >= max_chars:
+                break
+        body, page_count = "\n".join(pages), len(reader.pages)
+    elif shutil.which("pdftotext"):
+        result = subprocess.run(["pdftotext", "-enc", "UTF-8", path, "-"], capture_output=True, check=True, timeout=300)
+        body = result.stdout.decode("utf-8", errors="replace")
+        page_count = body.count("\f") + 1 if body else 0
+    else:
+        raise PdfExtractionUnavailable("PDF 본문 추출기가 없습니다 (pip install pypdf 또는 poppler-utils 설치).")
+    body = re.sub(r"[ \t\r\f\x00]+", " ", body)
+    body = re.sub(r"\n\s*\n+", "\n\n", body).strip()
+    return {"text": body[:max_chars], "page_count": page_count}
+
+class PdfDownloader:
+    """pdf_url -> blob sha256. 여러 스레드에서 동시에 호출할 수 있습니다."""
+    def __init__(self, store: BlobStore, session: requests.Session = None, rate_limiter=None, resilience=None,
+                 max_bytes: int = None, resume_attempts: int = None, chunk_size: int = 64 * 1024):
+        self.store = store
+        self.session = session or get_http_session("pdf")
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.resilience = resilience or get_resilient_http()
+        self.max_bytes = max_bytes or Config.PDF_MAX_BYTES
+        self.resume_attempts = Config.PDF_RESUME_ATTEMPTS if resume_attempts is None else resume_attempts
+        self.chunk_size = chunk_size
+        self._host_slots = {}
+        self._lock = threading.Lock()
+        self.stats = {"bytes": 0, "resumed": 0}
+
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(Config.PDF_HOST_CONCURRENCY.get(host, Config.PDF_MAX_PER_HOST))
+            return self._host_slots[host]
+
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def download(self, url: str) -> str:
+        host = urlparse(url).hostname
+        partial_path = self.store.partial_path(url)
+        with self._host_slot(host):
+            for attempt in range(self.resume_attempts + 1):
+                try:
+                    self._fetch(url, host, partial_path)
+                    break
+                except RESUMABLE_ERRORS as e:
+                    if attempt >= self.resume_attempts:
+                        raise PdfDownloadError(f"전송이 {attempt + 1}회 끊김: {e}") from e
+                    logger.info(f"PDF 전송 끊김, 이어 받기 ({attempt + 1}/{self.resume_attempts}) - {url}: {e}")
+        with open(partial_path, "rb") as f:
+            if f.read(5) != b"%PDF-":
+                os.remove(partial_path)
+                raise PdfDownloadError(f"PDF 가 아닌 응답: {url}")
+        return self.store.put_file(partial_path)
+
+    def _fetch(self, url: str, host: str, partial_path: str):
+        offset = os.path.getsize(partial_path) if os.path.exists(partial_path) else 0
+        # Range 는 전송 바이트 기준이므로 압축 전송을 끔
+        headers = {"Accept": "application/pdf", "Accept-Encoding": "identity"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+
+        def send():
+            self.rate_limiter.wait(host)
+            return self.session.get(url, headers=headers, stream=True, timeout=Config.HTTP_TIMEOUT)
+
+        response = self.resilience.call(host, send, retry_exceptions=(requests.RequestException,))
+        try:
+            if response.status_code == 416 and offset:
+                return # 이미 끝까지 받은 partial 파일
+            response.raise_for_status()
+            resumed = bool(offset) and response.status_code == 206
+            if offset and not resumed:
+                logger.info(f"서버가 Range 요청을 지원하지 않아 처음부터 다시 받습니다 - {url}")
+            elif resumed:
+                self._count("resumed")
+            written = offset if resumed else 0
+            with open(partial_path, "ab" if resumed else "wb") as f:
+                for chunk in response.iter_content(self.chunk_size):
+                    written += len(chunk)
+                    if written > self.max_bytes:
+                        f.close()
+                        os.remove(partial_path)
+                        raise PdfDownloadError(f"PDF 크기가 {self.max_bytes} bytes 를 넘음: {url}")
+                    f.write(chunk)
+                    self._count("bytes", len(chunk))
+        finally:
+            response.close()
+
+def index_fulltext(session, paper_id: str, title: str, body: str):
+    """paper_fulltext_fts 에 논문 본문을 넣거나 바꿉니다 (rowid 는 paper_fulltext 행의 rowid)."""
+    rowid = session.execute(text("SELECT rowid FROM paper_fulltext WHERE paper_id = :paper_id"), {"paper_id": paper_id}).scalar()
+    session.execute(text("INSERT OR REPLACE INTO paper_fulltext_fts (rowid, paper_id, title, body) VALUES (:rowid, :paper_id, :title, :body)"),
+                    {"rowid": rowid, "paper_id": paper_id, "title": title or "", "body": body or ""})
+
+def fts_query(query: str) -> str:
+    """사용자 입력을 FTS5 MATCH 식으로 변환 (단어마다 따옴표로 감싸 AND 검색, 문법 오류 방지)"""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in re.findall(r"\w+", query or ""))
+
+def search_fulltext(session, query: str, limit: int = 20) -> list:
+    """본문/제목 전문 검색. 관련도(bm25, 제목 가중치 5) 순으로 [{paper_id, title, snippet, score}] 를 반환합니다."""
+    match = fts_query(query)
+    if not match:
+        return []
+    rows = session.execute(text(
+        "SELECT paper_id, title, snippet(paper_fulltext_fts, 2, '[', ']', ' … ', 16) AS snippet, "
+        "bm25(paper_fulltext_fts, 0.0, 5.0, 1.0) AS score "
+        "FROM paper_fulltext_fts WHERE paper_fulltext_fts MATCH :match ORDER BY score LIMIT :limit"
+    ), {"match": match, "limit": limit})
+    return [{"paper_id": row.paper_id, "title": row.title, "snippet": row.snippet, "score": round(-row.score, 4)} for row in rows]
+
+def delete_all_fulltext(session):
+    """papers 를 일괄 삭제할 때 논문별 수집 상태와 색인도 비웁니다 (PDF blob 은 내용 주소이므로 다시 크롤링하면 재사용)."""
+    session.execute(text("DELETE FROM paper_fulltext_fts"))
+    session.query(PaperFullText).delete(synchronize_session=False)
+
+def select_fulltext_candidates(session, paper_ids=None, limit: int = None) -> list:
+    """본문을 아직 색인하지 않은 (paper_id, pdf_url, title). 실패가 Config.PDF_MAX_ATTEMPTS 번 쌓인 논문은 제외합니다."""
+    query = session.query(Paper.paper_id, Paper.pdf_url, Paper.title) \
+                   .outerjoin(PaperFullText, PaperFullText.paper_id == Paper.paper_id) \
+                   .filter(Paper.pdf_url.isnot(None), Paper.pdf_url != '',
+                           or_(PaperFullText.paper_id.is_(None),
+                               and_(PaperFullText.status != STATUS_INDEXED, PaperFullText.attempts < Config.PDF_MAX_ATTEMPTS)))
+    if paper_ids is not None:
+        query = query.filter(Paper.paper_id.in_(list(paper_ids)))
+    query = query.order_by(Paper.published_date.desc())
+    if limit:
+        query = query.limit(limit)
+    return query.all()
+
+class FullTextPipeline:
+    """select -> download (스레드, 호스트별 제한) -> blob 저장 -> 본문 추출 (프로세스) -> 색인.
+
+    extract_executor 를 주지 않으면 실행마다 spawn 프로세스 풀을 만들고 끝나면 닫습니다.
+    """
+    def __init__(self, session_factory=None, store: BlobStore = None, downloader: PdfDownloader = None, download_workers: int = None,
+                 extract_workers: int = None, extract=extract_pdf_text, extract_executor=None):
+        self.session_factory = session_factory or get_session_local()
+        self.store = store or BlobStore()
+        self.downloader = downloader or PdfDownloader(self.store)
+        self.download_workers = download_workers or Config.PDF_DOWNLOAD_WORKERS
+        self.extract_workers = extract_workers or Config.PDF_EXTRACT_WORKERS or os.cpu_count() or 1
+        self.extract = extract
+        self.extract_executor = extract_executor
+
+    def _known_blobs(self, session, urls) -> dict:
+        """이미 받은 pdf_url -> sha256 (blob 파일이 남아 있는 것만)"""
+        rows = session.query(PaperFullText.pdf_url, PaperFullText.sha256) \
+                      .filter(PaperFullText.pdf_url.in_(urls), PaperFullText.sha256.isnot(None)).distinct()
+        return {url: sha256 for url, sha256 in rows if self.store.exists(sha256)}
+
+    def _set_status(self, session, paper_ids, status: str, sha256: str = None, error: str = None, failed: bool = False):
+        values = {PaperFullText.status: status, PaperFullText.error: error[:1000] if error else None, PaperFullText.updated_at: datetime.now()}
+        if sha256:
+            values[PaperFullText.sha256] = sha256
+        if failed:
+            values[PaperFullText.attempts] = PaperFullText.attempts + 1
+        session.query(PaperFullText).filter(PaperFullText.paper_id.in_(list(paper_ids))).update(values, synchronize_session=False)
+
+    def _index_blob(self, session, blob: PdfBlob, paper_ids=None) -> int:
+        """blob 본문으로 논문들을 색인합니다 (paper_ids 가 없으면 이 blob 을 가리키는 모든 논문)."""
+        query = session.query(PaperFullText.paper_id, Paper.title).join(Paper, Paper.paper_id == PaperFullText.paper_id) \
+                       .filter(PaperFullText.sha256 == blob.sha256)
+        if paper_ids is not None:
+            query = query.filter(PaperFullText.paper_id.in_(list(paper_ids)))
+        rows = query.all()
+        for paper_id, title in rows:
+            index_fulltext(session, paper_id, title, blob.text)
+        self._set_status(session, [paper_id for paper_id, _ in rows], STATUS_INDEXED)
+        return len(rows)
+
+    def run(self, paper_ids=None, limit: int = None) -> dict:
+        logger.debug(f"FullTextPipeline.run 함수 시작 - paper_ids: {paper_ids}, limit: {limit}")
+        stats = dict.fromkeys(("selected", "downloaded", "reused", "extracted", "indexed", "failed"), 0)
+        can_extract = self.extract is not extract_pdf_text or extraction_available()
+        if not can_extract:
+            logger.warning("PDF 본문 추출기가 없어 다운로드만 합니다 (pip install pypdf). 다음 실행에서 받은 PDF 로 추출합니다.")
+        session = self.session_factory()
+        try:
+            candidates = select_fulltext_candidates(session, paper_ids, limit)
+            stats["selected"] = len(candidates)
+            papers_by_url = defaultdict(list)
+            for paper_id, pdf_url, _ in candidates:
+                papers_by_url[pdf_url].append(paper_id)
+            existing = {row.paper_id: row for row in
+                        session.query(PaperFullText).filter(PaperFullText.paper_id.in_([c.paper_id for c in candidates]))}
+            for paper_id, pdf_url, _ in candidates:
+                if paper_id not in existing:
+                    session.add(PaperFullText(paper_id=paper_id, pdf_url=pdf_url, status=STATUS_PENDING))
+                elif existing[paper_id].pdf_url != pdf_url:
+                    existing[paper_id].pdf_url, existing[paper_id].sha256 = pdf_url, None
+            session.commit()
+            if not candidates:
+                return stats
+
+            known = self._known_blobs(session, list(papers_by_url))
+            extract_jobs = {} # future -> sha256
+            submitted = set()
+            extractor = self.extract_executor or (ProcessPoolExecutor(self.extract_workers, mp_context=multiprocessing.get_context("spawn"))
+                                                  if can_extract else None)
+
+            def on_blob(url: str, sha256: str):
+                blob = session.get(PdfBlob, sha256)
+                if blob is None:
+                    blob = PdfBlob(sha256=sha256, size=self.store.size(sha256))
+                    session.add(blob)
+                self._set_status(session, papers_by_url[url], STATUS_DOWNLOADED, sha256=sha256)
+                session.flush()
+                if blob.text is not None:
+                    stats["indexed"] += self._index_blob(session, blob, papers_by_url[url]) # 같은 PDF 를 이미 추출함
+                elif extractor is not None and sha256 not in submitted:
+                    submitted.add(sha256)
+                    extract_jobs[extractor.submit(self.extract, self.store.path_for(sha256), Config.PDF_EXTRACT_MAX_CHARS)] = sha256
+                session.commit()
+
+            try:
+                for url, sha256 in known.items():
+                    stats["reused"] += 1
+                    on_blob(url, sha256)
+                with ThreadPoolExecutor(max_workers=self.download_workers, thread_name_prefix="pdf-download") as pool:
+                    downloads = {pool.submit(self.downloader.download, url): url for url in papers_by_url if url not in known}
+                    for future in as_completed(downloads):
+                        url = downloads[future]
+                        try:
+                            sha256 = future.result()
+                        except Exception as e:
+                            logger.warning(f"PDF 다운로드 실패 - {url}: {e}")
+                            self._set_status(session, papers_by_url[url], STATUS_FAILED, error=f"다운로드 실패: {e}", failed=True)
+                            session.commit()
+                            stats["failed"] += len(papers_by_url[url])
+                            continue
+                        stats["downloaded"] += 1
+                        on_blob(url, sha256)
+                for future in as_completed(extract_jobs):
+                    blob = session.get(PdfBlob, extract_jobs[future])
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.warning(f"PDF 본문 추출 실패 - sha256: {blob.sha256}: {e}")
+                        blob.error = str(e)[:1000]
+                        paper_ids_for_blob = [paper_id for (paper_id,) in
+                                              session.query(PaperFullText.paper_id).filter(PaperFullText.sha256 == blob.sha256)]
+                        self._set_status(session, paper_ids_for_blob, STATUS_DOWNLOADED, error=f"추출 실패: {e}", failed=True)
+                        session.commit()
+                        stats["failed"] += len(paper_ids_for_blob)
+                        continue
+                    blob.text, blob.page_count, blob.error, blob.extracted_at = result["text"], result["page_count"], None, datetime.now()
+                    session.flush()
+                    stats["extracted"] += 1
+                    stats["indexed"] += self._index_blob(session, blob)
+                    session.commit()
+            finally:
+                if extractor is not None and self.extract_executor is None:
+                    extractor.shutdown(cancel_futures=True)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+        stats.update(self.downloader.stats)
+        logger.debug(f"FullTextPipeline.run 함수 종료 - {stats}")
+        return stats
+
+_fetch_executor = None
+_fetch_executor_lock = threading.Lock()
+
+def submit_fulltext_fetch(paper_ids=None, limit: int = None):
+    """백그라운드 스레드 하나에서 순서대로 파이프라인을 실행합니다 (웹 요청에서 호출). Future 를 반환합니다."""
+    global _fetch_executor
+    with _fetch_executor_lock:
+        if _fetch_executor is None:
+            _fetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fulltext")
+    return _fetch_executor.submit(lambda: FullTextPipeline().run(paper_ids=paper_ids, limit=limit))
+
+def main():
+    """python -m crawler_src.fulltext --limit 100"""
+    parser = argparse.ArgumentParser(description="논문 PDF 다운로드, 본문 추출 및 전문 검색 색인")
+    parser.add_argument("--paper-id", dest="paper_ids", action="append", help="대상 논문 (여러 번 지정 가능, 없으면 색인되지 않은 최신 논문)")
+    parser.add_argument("--limit", type=int, help="최대 논문 수")
+    args = parser.parse_args()
+
+    from .connection import create_db_and_tables
+    create_db_and_tables()
+    stats = FullTextPipeline().run(paper_ids=args.paper_ids, limit=args.limit)
+    logger.info(f"PDF 본문 수집 완료 - {stats}")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    main()
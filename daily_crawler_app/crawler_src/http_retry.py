@@ -0,0 +1,244 @@
+import time
+import random
+import asyncio
+import threading
+import logging
+from collections import defaultdict
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# 크롤러 HTTP 공용 재시도 계층. 429/5xx 나 연결 오류 한 번에 플랫폼 전체를 포기하지 않도록
+# Retry-After 를 따르거나 지터를 준 지수 백오프로 다시 요청하고, 계속 실패하는 호스트는 서킷 브레이커로 잠시 차단합니다.
+# 비동기 클라이언트(async_crawler)와 동기 requests 호출(OAI 수확, citation_graph)이 같은 정책/브레이커/지표를 공유합니다.
+
+BREAKER_CLOSED = 'closed'
+BREAKER_OPEN = 'open'
+BREAKER_HALF_OPEN = 'half_open'
+
+class CircuitOpenError(Exception):
+    """호스트의 서킷이 열려 있어 요청을 보내지 않음"""
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"{host} 서킷 열림 - {retry_in:.0f}초 후 다시 시도")
+        self.host = host
+        self.retry_in = retry_in
+
+class RetriesExhausted(Exception):
+    """재시도할 수 있는 오류가 끝까지 반복됨 (마지막 예외를 __cause__ 로 가짐)"""
+
+class CircuitBreaker:
+    """연속 실패가 failure_threshold 번이면 열리고, reset_timeout 뒤 요청 하나(half-open)로 회복을 확인합니다."""
+    def __init__(self, failure_threshold: int = None, reset_timeout: float = None, clock=time.monotonic):
+        self.failure_threshold = failure_threshold or Config.HTTP_BREAKER_FAILURE_THRESHOLD
+        self.reset_timeout = reset_timeout if reset_timeout is not None else Config.HTTP_BREAKER_RESET_TIMEOUT
+        self.clock = clock
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._probe_started = None # half-open 상태에서 회복 확인 요청을 보낸 시각
+        self._lock = threading.Lock()
+
+    def before_request(self, host: str):
+        """요청을 보내도 되면 반환하고, 아니면 CircuitOpenError 를 발생시킵니다."""
+        with self._lock:
+            if self.state == BREAKER_OPEN:
+                retry_in = self.opened_at + self.reset_timeout - self.clock()
+                if retry_in > 0:
+                    raise CircuitOpenError(host, retry_in)
+                self.state = BREAKER_HALF_OPEN
+                self._probe_started = None
+            if self.state == BREAKER_HALF_OPEN:
+                now = self.clock()
+                # 회복 확인 요청은 하나만 (취소 등으로 결과가 기록되지 않으면 reset_timeout 뒤 다시 허용)
+                if self._probe_started is not None and now - self._probe_started < self.reset_timeout:
+                    raise CircuitOpenError(host, self._probe_started + self.reset_timeout - now)
+                self._probe_started = now
+
+    def record_success(self):
+        with self._lock:
+            self.state = BREAKER_CLOSED
+            self.failures = 0
+            self._probe_started = None
+
+    def record_failure(self) -> bool:
+        """실패를 기록하고 이번 실패로 서킷이 열렸으면 True."""
+        with self._lock:
+            self.failures += 1
+            self._probe_started = None
+            if self.state == BREAKER_HALF_OPEN or self.failures >= self.failure_threshold:
+                opened = self.state != BREAKER_OPEN
+                self.state = BREAKER_OPEN
+                self.opened_at = self.clock()
+                return opened
+            return False
+
+class RetryPolicy:
+    def __init__(self, max_retries: int = None, base_delay: float = None, max_delay: float = None, max_retry_after: float = None,
+                 retry_statuses=None):
+        self.max_retries = Config.HTTP_MAX_RETRIES if max_retries is None else max_retries
+        self.base_delay = Config.HTTP_BACKOFF_BASE if base_delay is None else base_delay
+        self.max_delay = Config.HTTP_BACKOFF_MAX if max_delay is None else max_delay
+        self.max_retry_after = Config.HTTP_MAX_RETRY_AFTER if max_retry_after is None else max_retry_after
+        self.retry_statuses = frozenset(retry_statuses or Config.HTTP_RETRY_STATUSES)
+
+    def delay_for(self, attempt: int, retry_after: str = None) -> float:
+        """attempt 번째 재시도 전 대기 시간. Retry-After (초 또는 HTTP 날짜) 가 있으면 따르고, 없으면 full jitter 지수 백오프."""
+        seconds = parse_retry_after(retry_after)
+        if seconds is not None:
+            return min(seconds, self.max_retry_after)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+def parse_retry_after(value) -> float:
+    if not value:
+        return None
+    value = str(value).strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+class RetryMetrics:
+    """호스트별 요청/재시도/실패/차단 횟수 (GET /crawl/http 에서 조회)"""
+    FIELDS = ("requests", "attempts", "retries", "retry_after_honoured", "successes", "failures", "circuit_rejections", "circuit_opened")
+
+    def __init__(self):
+        self._hosts = defaultdict(lambda: dict.fromkeys(self.FIELDS, 0) | {"statuses": defaultdict(int), "backoff_seconds": 0.0})
+        self._lock = threading.Lock()
+
+    def incr(self, host: str, field: str, amount=1):
+        with self._lock:
+            self._hosts[host][field] += amount
+
+    def record_status(self, host: str, status: int):
+        with self._lock:
+            self._hosts[host]["statuses"][str(status)] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {host: {**values, "statuses": dict(values["statuses"]), "backoff_seconds": round(values["backoff_seconds"], 2)}
+                    for host, values in self._hosts.items()}
+
+    def reset(self):
+        with self._lock:
+            self._hosts.clear()
+
+class ResilientHttp:
+    """send() (응답 객체를 반환하는 호출) 를 재시도/서킷 브레이커로 감쌉니다.
+
+    재시도 대상은 연결 오류/타임아웃과 policy.retry_statuses 응답입니다. 재시도가 끝나도 재시도 대상 응답이면
+    그 응답을 그대로 반환하므로 호출자는 지금처럼 raise_for_status() 로 처리합니다.
+    """
+    def __init__(self, policy: RetryPolicy = None, metrics: RetryMetrics = None, breaker_factory=CircuitBreaker, sleep=time.sleep):
+        self.policy = policy or RetryPolicy()
+        self.metrics = metrics or RetryMetrics()
+        self.breaker_factory = breaker_factory
+        self.sleep = sleep
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = self.breaker_factory()
+            return self._breakers[host]
+
+    def breaker_states(self) -> dict:
+        with self._lock:
+            return {host: breaker.state for host, breaker in self._breakers.items()}
+
+    def _before_attempt(self, host: str, attempt: int):
+        try:
+            self.breaker(host).before_request(host)
+        except CircuitOpenError:
+            self.metrics.incr(host, "circuit_rejections")
+            raise
+        self.metrics.incr(host, "attempts")
+        if attempt:
+            self.metrics.incr(host, "retries")
+
+    def _after_attempt(self, host: str, attempt: int, response=None, error: Exception = None):
+        """재시도해야 하면 대기 시간(초), 아니면 None 을 반환합니다."""
+        breaker = self.breaker(host)
+        retry_after = None
+        if error is None:
+            self.metrics.record_status(host, response.status_code)
+            if response.status_code not in self.policy.retry_statuses:
+                breaker.record_success() # 4xx 는 요청 문제이므로 호스트 상태와 무관
+                self.metrics.incr(host, "successes" if response.status_code < 400 else "failures")
+                return None
+            retry_after = response.headers.get("Retry-After")
+        if breaker.record_failure():
+            self.metrics.incr(host, "circuit_opened")
+            logger.warning(f"{host} 연속 실패 {breaker.failures}회 - 서킷을 {breaker.reset_timeout:.0f}초 동안 엽니다.")
+        if attempt >= self.policy.max_retries:
+            self.metrics.incr(host, "failures")
+            return None
+        delay = self.policy.delay_for(attempt, retry_after)
+        if retry_after is not None:
+            self.metrics.incr(host, "retry_after_honoured")
+        self.metrics.incr(host, "backoff_seconds", delay)
+        logger.info(f"{host} 요청 실패 ({error or response.status_code}) - {delay:.1f}초 후 재시도 ({attempt + 1}/{self.policy.max_retries})")
+        return delay
+
+    @staticmethod
+    def _discard(response):
+        close = getattr(response, "close", None)
+        if close:
+            close() # 스트리밍 응답의 커넥션 반환
+
+    def call(self, host: str, send, retry_exceptions=(Exception,)):
+        """동기 호출 (requests 등)"""
+        self.metrics.incr(host, "requests")
+        for attempt in range(self.policy.max_retries + 1):
+            self._before_attempt(host, attempt)
+            try:
+                response = send()
+            except retry_exceptions as e:
+                delay = self._after_attempt(host, attempt, error=e)
+                if delay is None:
+                    raise RetriesExhausted(f"{host} 요청 {attempt + 1}회 실패") from e
+                self.sleep(delay)
+                continue
+            delay = self._after_attempt(host, attempt, response=response)
+            if delay is None:
+                return response
+            self._discard(response)
+            self.sleep(delay)
+
+    async def call_async(self, host: str, send, retry_exceptions=(Exception,)):
+        """비동기 호출. send 는 코루틴을 반환하는 함수입니다."""
+        self.metrics.incr(host, "requests")
+        for attempt in range(self.policy.max_retries + 1):
+            self._before_attempt(host, attempt)
+            try:
+                response = await send()
+            except retry_exceptions as e:
+                delay = self._after_attempt(host, attempt, error=e)
+                if delay is None:
+                    raise RetriesExhausted(f"{host} 요청 {attempt + 1}회 실패") from e
+                await asyncio.sleep(delay)
+                continue
+            delay = self._after_attempt(host, attempt, response=response)
+            if delay is None:
+                return response
+            self._discard(response)
+            await asyncio.sleep(delay)
+
+_resilient_http = None
+_resilient_http_lock = threading.Lock()
+
+def get_resilient_http() -> ResilientHttp:
+    """프로세스당 하나의 재시도 정책/서킷 브레이커/지표"""
+    global _resilient_http
+    with _resilient_http_lock:
+        if _resilient_http is None:
+            _resilient_http = ResilientHttp()
+    return _resilient_http
+
+def http_metrics() -> dict:
+    resilient = get_resilient_http()
+    return {"hosts": resilient.metrics.snapshot(), "breakers": resilient.breaker_states()}
@@ -0,0 +1,47 @@
+import threading
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# 크롤러용 동기 HTTP 세션 레지스트리. 크롤러 인스턴스마다 requests.Session 을 새로 만들거나 bare requests.get 을 쓰면
+# 페이지마다 TCP/TLS 연결을 다시 맺으므로, 프로세스당 하나의 세션을 공유해 keep-alive 커넥션을 재사용합니다.
+# 호스트별 풀 크기는 Config.HTTP_POOL_SIZES 로 정하고, 압축 전송(gzip/deflate, 설치되어 있으면 br/zstd)을 요청합니다.
+# ACCEPT_ENCODING 은 urllib3 가 실제로 해제할 수 있는 인코딩만 담고 있으므로 해제하지 못하는 응답을 받을 일이 없습니다.
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+def pool_size_for(host: str) -> int:
+    return Config.HTTP_POOL_SIZES.get(host, Config.HTTP_MAX_CONNECTIONS_PER_HOST)
+
+def create_http_session(pool_sizes: dict = None) -> requests.Session:
+    """압축 전송과 호스트별 커넥션 풀을 설정한 새 세션"""
+    pool_sizes = Config.HTTP_POOL_SIZES if pool_sizes is None else pool_sizes
+    session = requests.Session()
+    session.headers.update({"User-Agent": Config.HTTP_USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING})
+    default_adapter = HTTPAdapter(pool_connections=Config.HTTP_POOL_HOSTS, pool_maxsize=Config.HTTP_MAX_CONNECTIONS_PER_HOST)
+    session.mount("https://", default_adapter)
+    session.mount("http://", default_adapter)
+    for host, size in pool_sizes.items():
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size) # requests 는 가장 긴 접두사의 어댑터를 사용
+        session.mount(f"https://{host}", adapter)
+        session.mount(f"http://{host}", adapter)
+    return session
+
+def get_http_session(name: str = "crawler") -> requests.Session:
+    """이름별로 프로세스 전체에서 공유하는 세션 (크롤러 인스턴스가 바뀌어도 커넥션 유지)"""
+    with _sessions_lock:
+        if name not in _sessions:
+            _sessions[name] = create_http_session()
+            logger.debug(f"공용 HTTP 세션 생성 - name: {name}, Accept-Encoding: {ACCEPT_ENCODING}")
+        return _sessions[name]
+
+def close_http_sessions():
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
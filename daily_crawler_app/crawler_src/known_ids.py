@@ -0,0 +1,171 @@
+import os
+import math
+import struct
+import hashlib
+import tempfile
+import threading
+import logging
+from datetime import datetime
+from sqlalchemy import func
+from .config import Config
+from .connection import get_session_local
+from .models import Paper
+
+logger = logging.getLogger(__name__)
+
+# 이미 papers.db 에 있는 paper_id 의 Bloom 필터. 크롤러는 항목에서 ID 만 꺼낸 뒤 이 필터를 먼저 확인하고,
+# 이미 있는 논문이면 나머지 파싱, 임베딩 계산, save_papers_to_db 의 DB 조회를 모두 건너뜁니다.
+# Bloom 필터는 없는 ID 를 있다고 잘못 답할 수 있으므로(오탐) 오탐률을 Config.KNOWN_IDS_ERROR_RATE 로 아주 낮게 둡니다.
+# 필터는 파일로 저장해 다음 실행에서 DB 전체를 다시 읽지 않고, 크롤링 시작 시 sync() 로 그 사이 저장된 논문만 추가합니다.
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+KNOWN_IDS_PATH = os.getenv("KNOWN_IDS_PATH", os.path.join(_APP_DIR, 'known_paper_ids.bloom'))
+
+class BloomFilter:
+    _HEADER = struct.Struct("<4sQdQQ") # magic, capacity, error_rate, num_bits, count
+    _MAGIC = b"PBF1"
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = max(int(capacity), 1)
+        self.error_rate = error_rate
+        self.num_bits = max(int(math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2))), 8)
+        self.num_hashes = max(int(round(self.num_bits / self.capacity * math.log(2))), 1)
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0 # add() 로 새로 추가된 항목 수 (근사값)
+
+    def _positions(self, key: str):
+        # 128비트 해시 하나를 두 개의 64비트 해시로 나눠 num_hashes 개의 위치를 만드는 double hashing
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: str) -> bool:
+        """key 를 추가하고, 이전에 없던 항목이면 True 를 반환합니다."""
+        added = False
+        for position in self._positions(key):
+            mask = 1 << (position & 7)
+            if not self.bits[position >> 3] & mask:
+                self.bits[position >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def to_bytes(self) -> bytes:
+        return self._HEADER.pack(self._MAGIC, self.capacity, self.error_rate, self.num_bits, self.count) + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        magic, capacity, error_rate, num_bits, count = cls._HEADER.unpack_from(data)
+        bloom = cls(capacity, error_rate)
+        if magic != cls._MAGIC or num_bits != bloom.num_bits or len(data) - cls._HEADER.size != len(bloom.bits):
+            raise ValueError("손상되었거나 호환되지 않는 Bloom 필터 파일")
+        bloom.bits = bytearray(data[cls._HEADER.size:])
+        bloom.count = count
+        return bloom
+
+class KnownPaperIds:
+    """papers.db 의 paper_id 집합에 대한 Bloom 필터 (파일로 저장, 크롤링 시작 시 증분 동기화)."""
+    _SYNC_HEADER = struct.Struct("<d") # 마지막으로 반영한 crawled_date (timestamp)
+
+    def __init__(self, path: str = None, session_factory=None, capacity: int = None, error_rate: float = None):
+        self.path = path or KNOWN_IDS_PATH
+        self.session_factory = session_factory
+        self.capacity = capacity or Config.KNOWN_IDS_CAPACITY
+        self.error_rate = error_rate or Config.KNOWN_IDS_ERROR_RATE
+        self.bloom = None
+        self.synced_until = None # 이 시각까지 crawled_date 가 기록된 논문은 필터에 반영됨
+        self._lock = threading.Lock()
+
+    def __contains__(self, paper_id: str) -> bool:
+        bloom = self.bloom
+        return bloom is not None and paper_id in bloom
+
+    def _load(self) -> bool:
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+            synced_until, = self._SYNC_HEADER.unpack_from(data)
+            self.bloom = BloomFilter.from_bytes(data[self._SYNC_HEADER.size:])
+            self.synced_until = datetime.fromtimestamp(synced_until) if synced_until else None
+            return True
+        except FileNotFoundError:
+            return False
+        except (ValueError, struct.error) as e:
+            logger.warning(f"Bloom 필터 파일을 읽을 수 없어 다시 만듭니다 ({self.path}): {e}")
+            return False
+
+    def save(self):
+        directory = os.path.dirname(self.path) or "."
+        fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._SYNC_HEADER.pack(self.synced_until.timestamp() if self.synced_until else 0.0))
+                f.write(self.bloom.to_bytes())
+            os.replace(temp_path, self.path) # 다른 프로세스가 읽는 중에도 온전한 파일만 보이도록 원자적 교체
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _rebuild(self, session, paper_count: int):
+        capacity = max(self.capacity, paper_count * 2)
+        logger.info(f"Bloom 필터 재구성 - 논문 {paper_count}편, 용량 {capacity}")
+        self.bloom = BloomFilter(capacity, self.error_rate)
+        self.synced_until = None
+        self._add_since(session, None)
+
+    def _add_since(self, session, since):
+        query = session.query(Paper.paper_id, Paper.crawled_date)
+        if since is not None:
+            query = query.filter(Paper.crawled_date > since) # ix_papers_crawled_date 범위 조회
+        added = 0
+        for paper_id, crawled_date in query.yield_per(5000):
+            added += self.bloom.add(paper_id)
+            if crawled_date and (self.synced_until is None or crawled_date > self.synced_until):
+                self.synced_until = crawled_date
+        return added
+
+    def sync(self) -> "KnownPaperIds":
+        """필터를 DB 와 맞춥니다. 그 사이 저장된 논문만 추가하고, 논문이 삭제되었거나 용량을 넘었으면 다시 만듭니다."""
+        with self._lock:
+            session = (self.session_factory or get_session_local())()
+            try:
+                paper_count = session.query(func.count(Paper.paper_id)).scalar() or 0
+                if self.bloom is None and not self._load():
+                    self._rebuild(session, paper_count)
+                elif paper_count < len(self.bloom) or len(self.bloom) > self.bloom.capacity:
+                    self._rebuild(session, paper_count) # 삭제된 논문은 Bloom 필터에서 뺄 수 없으므로 다시 만듦
+                else:
+                    added = self._add_since(session, self.synced_until)
+                    logger.debug(f"Bloom 필터 동기화 - 새로 추가된 ID {added}개 (총 {len(self.bloom)}개)")
+                    if len(self.bloom) > self.bloom.capacity:
+                        self._rebuild(session, paper_count)
+            finally:
+                session.close()
+            self.save()
+        return self
+
+    def reset(self):
+        """papers 를 일괄 삭제했을 때 필터도 비웁니다."""
+        with self._lock:
+            self.bloom = BloomFilter(self.capacity, self.error_rate)
+            self.synced_until = None
+            self.save()
+
+_known_ids = None
+_known_ids_lock = threading.Lock()
+
+def get_known_paper_ids() -> KnownPaperIds:
+    """프로세스당 하나의 KnownPaperIds (sync() 는 호출자가 크롤링 시작 시 실행)"""
+    global _known_ids
+    with _known_ids_lock:
+        if _known_ids is None:
+            _known_ids = KnownPaperIds()
+    return _known_ids
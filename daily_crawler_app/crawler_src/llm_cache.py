@@ -0,0 +1,140 @@
+import os
+import json
+import time
+import hashlib
+import threading
+import logging
+from sqlalchemy import MetaData, Table, Column, String, Text, Float, Integer, Index, select, update, delete, func
+from .config import Config
+from .connection import create_papers_engine
+
+logger = logging.getLogger(__name__)
+
+# LLM 응답 캐시는 (모델, 프롬프트 템플릿 이름/버전, 입력 해시) 를 키로 하는 내용 주소 방식입니다.
+# 같은 초록/페르소나 조합은 보고서, top_n, 앱이 달라도 한 번만 추론합니다.
+# deepsearch 처럼 papers.db 를 쓰지 않는 앱도 공유할 수 있도록 별도 SQLite 파일에 저장합니다.
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LLM_CACHE_DATABASE_URL = os.getenv("LLM_CACHE_DATABASE_URL", f"sqlite:///{os.path.join(_APP_DIR, 'llm_cache.db')}")
+
+metadata = MetaData()
+
+llm_cache_table = Table(
+    'llm_cache', metadata,
+    Column('cache_key', String, primary_key=True), # sha256(model, template, version, input)
+    Column('model', String, nullable=False),
+    Column('template', String, nullable=False),
+    Column('value', Text, nullable=False), # JSON 직렬화된 응답
+    Column('created_at', Float, nullable=False), # TTL 기준 (epoch 초)
+    Column('accessed_at', Float, nullable=False), # LRU 기준 (epoch 초)
+    Column('hits', Integer, nullable=False, default=0),
+    Index('ix_llm_cache_accessed_at', 'accessed_at'),
+)
+
+class LLMCache:
+    def __init__(self, database_url: str = None, ttl: float = None, max_entries: int = None, evict_every: int = None):
+        self.engine = create_papers_engine(database_url or LLM_CACHE_DATABASE_URL)
+        metadata.create_all(self.engine)
+        self.ttl = ttl if ttl is not None else Config.LLM_CACHE_TTL
+        self.max_entries = max_entries if max_entries is not None else Config.LLM_CACHE_MAX_ENTRIES
+        self.evict_every = evict_every if evict_every is not None else Config.LLM_CACHE_EVICT_EVERY
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "evicted": 0}
+
+    @staticmethod
+    def make_key(model: str, template: tuple, input_text: str) -> str:
+        """template 은 (이름, 버전) 튜플. 프롬프트를 바꾸면 버전을 올려 이전 응답을 무효화합니다."""
+        name, version = template
+        digest = hashlib.sha256()
+        for part in (model, name, str(version), input_text or ""):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def get_many(self, keys) -> dict:
+        """{cache_key: value} 를 반환합니다. 없거나 TTL 이 지난 키는 포함되지 않습니다."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        now = time.time()
+        with self.engine.begin() as conn:
+            query = select(llm_cache_table.c.cache_key, llm_cache_table.c.value).where(llm_cache_table.c.cache_key.in_(keys))
+            if self.ttl > 0:
+                query = query.where(llm_cache_table.c.created_at >= now - self.ttl)
+            found = {row.cache_key: json.loads(row.value) for row in conn.execute(query)}
+            if found:
+                conn.execute(update(llm_cache_table).where(llm_cache_table.c.cache_key.in_(list(found)))
+                             .values(accessed_at=now, hits=llm_cache_table.c.hits + 1))
+        self._count("hits", len(found))
+        self._count("misses", len(keys) - len(found))
+        return found
+
+    def get(self, key: str):
+        return self.get_many([key]).get(key)
+
+    def set_many(self, entries: dict, model: str, template: tuple):
+        """{cache_key: value} 를 저장합니다. value 는 JSON 직렬화 가능해야 합니다."""
+        if not entries:
+            return
+        now = time.time()
+        rows = [{"cache_key": key, "model": model, "template": f"{template[0]}:v{template[1]}",
+                 "value": json.dumps(value, ensure_ascii=False), "created_at": now, "accessed_at": now, "hits": 0}
+                for key, value in entries.items()]
+        with self.engine.begin() as conn:
+            conn.execute(delete(llm_cache_table).where(llm_cache_table.c.cache_key.in_(list(entries))))
+            conn.execute(llm_cache_table.insert(), rows)
+        self._count("writes", len(rows))
+        with self._lock:
+            self._writes_since_evict += len(rows)
+            run_evict = self._writes_since_evict >= self.evict_every
+            if run_evict:
+                self._writes_since_evict = 0
+        if run_evict:
+            self.evict()
+
+    def set(self, key: str, value, model: str, template: tuple):
+        self.set_many({key: value}, model, template)
+
+    def evict(self) -> int:
+        """TTL 이 지난 항목을 지우고, max_entries 를 넘는 만큼 가장 오래 사용되지 않은(LRU) 항목을 지웁니다."""
+        removed = 0
+        with self.engine.begin() as conn:
+            if self.ttl > 0:
+                removed += conn.execute(delete(llm_cache_table)
+                                        .where(llm_cache_table.c.created_at < time.time() - self.ttl)).rowcount
+            if self.max_entries > 0:
+                overflow = conn.execute(select(func.count()).select_from(llm_cache_table)).scalar() - self.max_entries
+                if overflow > 0:
+                    oldest = select(llm_cache_table.c.cache_key).order_by(llm_cache_table.c.accessed_at).limit(overflow)
+                    removed += conn.execute(delete(llm_cache_table)
+                                            .where(llm_cache_table.c.cache_key.in_(oldest.scalar_subquery()))).rowcount
+        if removed:
+            self._count("evicted", removed)
+            logger.debug(f"LLM 캐시 항목 {removed}개 제거")
+        return removed
+
+    def metrics(self) -> dict:
+        with self.engine.connect() as conn:
+            entries = conn.execute(select(func.count()).select_from(llm_cache_table)).scalar()
+        with self._lock:
+            lookups = self.stats["hits"] + self.stats["misses"]
+            return {**self.stats, "entries": entries, "hit_rate": round(self.stats["hits"] / lookups, 3) if lookups else 0.0}
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_llm_cache():
+    """프로세스당 하나의 LLMCache 를 반환합니다. Config.LLM_CACHE_ENABLED 가 False 이면 None."""
+    global _cache
+    if not Config.LLM_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMCache()
+                logger.debug(f"LLM 캐시 생성: {LLM_CACHE_DATABASE_URL}")
+    return _cache
@@ -0,0 +1,299 @@
+import json
+import re
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from .config import Config
+from .llm_cache import LLMCache, get_llm_cache
+
+logger = logging.getLogger(__name__)
+
+# 보고서 생성기, 논문 관리 앱, deepsearch 가 공유하는 LM Studio(OpenAI 호환) 클라이언트.
+# 요청마다 새 커넥션을 여는 requests.post 대신 keep-alive 커넥션 풀을 재사용하고,
+# 동시에 보내는 요청 수를 제한해 로컬 추론 서버가 쉬지 않되 과부하되지 않도록 합니다.
+
+class LLMError(Exception):
+    """LLM 요청 실패 또는 응답 형식 오류."""
+
+_JSON_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.IGNORECASE)
+
+def parse_json_object(content: str) -> dict:
+    """LLM 응답에서 JSON 객체를 추출합니다 (```json 코드 블록 및 앞뒤 설명 허용)."""
+    text = _JSON_FENCE_RE.sub("", content.strip())
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end <= start:
+        raise LLMError(f"응답에서 JSON 객체를 찾을 수 없습니다: {content[:200]}")
+    try:
+        parsed = json.loads(text[start:end + 1])
+    except json.JSONDecodeError as e:
+        raise LLMError(f"응답 JSON 파싱 오류: {e}") from e
+    if not isinstance(parsed, dict):
+        raise LLMError("응답 JSON 이 객체 형식이 아닙니다.")
+    return parsed
+
+class LLMClient:
+    """cache 가 주어지면 cached()/cached_many() 를 통한 호출은 (model, 템플릿, 입력) 단위로 응답을 재사용합니다."""
+    def __init__(self, api_url: str = None, model: str = None, max_concurrency: int = None,
+                 timeout: float = None, batch_size: int = None, cache: LLMCache = None):
+        self.cache = cache
+        self.api_url = api_url or Config.LLM_API_URL
+        self.model = model or Config.LLM_MODEL
+        self.max_concurrency = max_concurrency or Config.LLM_MAX_CONCURRENCY
+        self.timeout = timeout or Config.LLM_TIMEOUT
+        self.batch_size = batch_size or Config.LLM_BATCH_SIZE
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+
+        self._slots = threading.BoundedSemaphore(self.max_concurrency) # 동시 진행 요청 수 제한
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="llm")
+        self._stats_lock = threading.Lock()
+        self.stats = {"requests": 0, "errors": 0, "batches": 0, "batched_items": 0}
+
+    def _count(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def chat(self, messages: list, temperature: float = 0.3, max_tokens: int = 150, response_format: dict = None) -> str:
+        """chat/completions 요청을 보내고 응답 텍스트를 반환합니다. 실패 시 LLMError."""
+        payload = {"model": self.model, "messages": messages, "temperature": temperature, "max_tokens": max_tokens}
+        if response_format:
+            payload["response_format"] = response_format
+        self._count("requests")
+        with self._slots:
+            try:
+                response = self.session.post(self.api_url, json=payload, timeout=self.timeout)
+                response.raise_for_status()
+                completion = response.json()
+            except (requests.exceptions.RequestException, ValueError) as e:
+                self._count("errors")
+                raise LLMError(f"LM Studio API 요청 중 오류 발생: {e}") from e
+        choices = completion.get("choices") if isinstance(completion, dict) else None
+        if not choices:
+            self._count("errors")
+            raise LLMError("LM Studio API 응답에 choices 가 없습니다.")
+        return (choices[0].get("message", {}).get("content") or "").strip()
+
+    @staticmethod
+    def _cacheable(value) -> bool:
+        """빈 응답(None, 공백뿐인 문자열)은 캐시하지 않습니다 - 다음 호출에서 다시 추론합니다."""
+        return value is not None and not (isinstance(value, str) and not value.strip())
+
+    def cached(self, template: tuple, input_text: str, compute):
+        """캐시에 있으면 저장된 응답을, 없으면 compute() 결과를 저장 후 반환합니다 (예외와 빈 응답은 캐시하지 않음)."""
+        if self.cache is None:
+            return compute()
+        key = self.cache.make_key(self.model, template, input_text)
+        value = self.cache.get(key)
+        if not self._cacheable(value):
+            value = compute()
+            if self._cacheable(value):
+                self.cache.set(key, value, self.model, template)
+        return value
+
+    def lookup_many(self, template: tuple, inputs: dict) -> dict:
+        """{id: 입력} 중 template 으로 캐시된 응답만 {id: 응답} 으로 반환합니다 (계산하지 않음)."""
+        if self.cache is None:
+            return {}
+        keys = {item_id: self.cache.make_key(self.model, template, input_text) for item_id, input_text in inputs.items()}
+        found = self.cache.get_many(keys.values())
+        return {item_id: found[key] for item_id, key in keys.items() if key in found and self._cacheable(found[key])}
+
+    def cached_many(self, template: tuple, inputs: dict, compute_many) -> dict:
+        """{id: 입력} 중 캐시에 없는 것만 compute_many({id: 입력}) -> {id: 결과} 로 계산해 합칩니다."""
+        if self.cache is None:
+            return compute_many(inputs)
+        results = self.lookup_many(template, inputs)
+        missing = {item_id: input_text for item_id, input_text in inputs.items() if item_id not in results}
+        if missing:
+            computed = compute_many(missing)
+            self.cache.set_many({self.cache.make_key(self.model, template, missing[item_id]): value
+                                 for item_id, value in computed.items() if item_id in missing and self._cacheable(value)},
+                                self.model, template)
+            results.update(computed)
+        return results
+
+    def map(self, fn, items) -> list:
+        """fn 을 items 각각에 대해 LLM 동시 요청 한도 내에서 병렬 실행하고 입력 순서대로 결과를 반환합니다."""
+        return list(self._executor.map(fn, items))
+
+    def complete_json_batch(self, items: dict, system_prompt: str, instruction: str,
+                            temperature: float = 0.3, max_tokens_per_item: int = 150) -> dict:
+        """여러 입력을 하나의 프롬프트로 묶어 {paper_id: 결과} JSON 으로 받습니다.
+
+        items 는 {paper_id: 입력 텍스트}. batch_size 개씩 묶은 요청들을 동시에 보내며,
+        실패한 배치나 응답에서 빠진 paper_id 는 결과에 포함되지 않으므로 호출자가 개별 요청으로 보완합니다.
+        """
+        entries = [(str(key), value) for key, value in items.items()]
+        batches = [entries[i:i + self.batch_size] for i in range(0, len(entries), self.batch_size)]
+        logger.debug(f"complete_json_batch 함수 시작 - 입력 수: {len(entries)}, 배치 수: {len(batches)}")
+
+        def run_batch(batch):
+            prompt = (
+                f"{instruction}\n\n"
+                f"입력은 paper_id 를 키로 하는 JSON 객체입니다. 각 paper_id 에 대한 결과를 값으로 하는 "
+                f"JSON 객체 하나만 응답하세요. 다른 설명은 쓰지 마세요.\n\n"
+                f"{json.dumps(dict(batch), ensure_ascii=False)}"
+            )
+            content = self.chat([{"role": "system", "content": system_prompt}, {"role": "user", "content": prompt}],
+                                temperature=temperature, max_tokens=max_tokens_per_item * len(batch) + 50)
+            parsed = parse_json_object(content)
+            self._count("batches")
+            self._count("batched_items", len(batch))
+            return {paper_id: parsed[paper_id] for paper_id, _ in batch if paper_id in parsed}
+
+        results = {}
+        for future in [self._executor.submit(run_batch, batch) for batch in batches]:
+            try:
+                results.update(future.result())
+            except LLMError as e:
+                logger.warning(f"배치 요청 실패, 개별 요청으로 보완 필요: {e}")
+        logger.debug(f"complete_json_batch 함수 종료 - 결과 수: {len(results)}/{len(entries)}")
+        return results
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+def get_llm_client(api_url: str = None, model: str = None) -> LLMClient:
+    """(api_url, model) 별로 프로세스당 하나의 LLMClient 를 공유합니다."""
+    key = (api_url or Config.LLM_API_URL, model or Config.LLM_MODEL)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = LLMClient(api_url=key[0], model=key[1], cache=get_llm_cache())
+            _clients[key] = client
+            logger.debug(f"새로운 LLMClient 생성 - url: {key[0]}, model: {key[1]}")
+    return client
+
+# --- 논문 요약 / 페르소나 중요도 판단 (보고서 생성기, 논문 관리 앱 공용) ---
+
+EMPTY_ABSTRACT_SUMMARY = "요약할 초록 내용이 없습니다."
+SUMMARY_SYSTEM_PROMPT = "You are a helpful assistant that summarizes academic paper abstracts concisely."
+IMPORTANCE_SYSTEM_PROMPT = ("You are an AI assistant that evaluates the importance of academic papers for a specific persona. "
+                            "Respond with 'YES' if the paper is highly relevant and important to the persona, and 'NO' otherwise. "
+                            "Provide a brief reason.")
+
+# 캐시 키에 쓰이는 프롬프트 템플릿 (이름, 버전) - 프롬프트를 바꾸면 버전을 올립니다.
+# 배치(JSON) 프롬프트는 응답 품질과 형식이 개별 프롬프트와 다르므로 따로 저장하고 따로 무효화합니다.
+SUMMARY_TEMPLATE = ("abstract_summary_ko", 1)
+SUMMARY_BATCH_TEMPLATE = ("abstract_summary_ko_batch", 1)
+IMPORTANCE_TEMPLATE = ("persona_importance", 1)
+IMPORTANCE_BATCH_TEMPLATE = ("persona_importance_batch", 1)
+
+def _summarize_uncached(abstract: str, client: LLMClient) -> str:
+    return client.chat([
+        {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+        {"role": "user", "content": f"Summarize the following abstract concisely in Korean: {abstract}"}
+    ], temperature=0.3, max_tokens=150)
+
+def summarize_abstract(abstract: str, client: LLMClient = None) -> str:
+    """초록 하나를 한국어로 요약합니다 (캐시 사용). 실패 시 LLMError."""
+    if not abstract:
+        return EMPTY_ABSTRACT_SUMMARY
+    client = client or get_llm_client()
+    return client.cached(SUMMARY_TEMPLATE, abstract, lambda: _summarize_uncached(abstract, client))
+
+def summarize_abstracts(abstracts: dict, client: LLMClient = None) -> dict:
+    """{paper_id: abstract} 를 요약해 {paper_id: 요약} 을 반환합니다.
+
+    개별 프롬프트 캐시에 없는 초록은 배치 프롬프트(SUMMARY_BATCH_TEMPLATE 캐시)로 요약하고,
+    배치 응답에서 빠진 논문은 개별 요청으로 다시 시도합니다. 그래도 실패한 논문은 결과에서 제외됩니다.
+    """
+    client = client or get_llm_client()
+    results = {paper_id: EMPTY_ABSTRACT_SUMMARY for paper_id, abstract in abstracts.items() if not abstract}
+    inputs = {paper_id: abstract for paper_id, abstract in abstracts.items() if abstract}
+    results.update(client.lookup_many(SUMMARY_TEMPLATE, inputs))
+    pending = {paper_id: abstract for paper_id, abstract in inputs.items() if paper_id not in results}
+
+    def summarize_batch(missing: dict) -> dict:
+        if len(missing) <= 1:
+            return {}
+        batched = client.complete_json_batch(missing, SUMMARY_SYSTEM_PROMPT,
+                                             "Summarize each of the following abstracts concisely in Korean.",
+                                             temperature=0.3, max_tokens_per_item=150)
+        return {paper_id: summary.strip() for paper_id, summary in batched.items()
+                if isinstance(summary, str) and summary.strip()}
+
+    if pending: # 배치 캐시는 항상 확인하고, 새로 배치 요청하는 것은 2개 이상일 때만
+        results.update(client.cached_many(SUMMARY_BATCH_TEMPLATE, pending, summarize_batch))
+
+    def summarize_one(paper_id):
+        try:
+            return paper_id, summarize_abstract(inputs[paper_id], client)
+        except LLMError as e:
+            logger.error(f"초록 요약 실패 - paper_id: {paper_id}, 오류: {e}")
+            return paper_id, None
+
+    for paper_id, summary in client.map(summarize_one, [paper_id for paper_id in pending if paper_id not in results]):
+        if summary:
+            results[paper_id] = summary
+    return results
+
+def _is_yes(answer) -> bool:
+    if isinstance(answer, bool):
+        return answer
+    if isinstance(answer, dict): # {"answer": "YES", "reason": ...} 형태 허용
+        answer = answer.get("answer") or answer.get("important") or ""
+        if isinstance(answer, bool):
+            return answer
+    return str(answer).strip().lstrip("*").strip().upper().startswith("YES")
+
+def _paper_description(paper: dict) -> str:
+    return (f"Paper Title: '{paper.get('title')}', Abstract: '{paper.get('abstract')}', "
+            f"Categories: '{', '.join(paper.get('categories') or [])}'")
+
+def _judge_uncached(description: str, persona: str, client: LLMClient) -> bool:
+    answer = client.chat([
+        {"role": "system", "content": IMPORTANCE_SYSTEM_PROMPT},
+        {"role": "user", "content": f"Persona: '{persona}'. {description}. Is this paper important to the persona? (YES/NO)"}
+    ], temperature=0.2, max_tokens=50)
+    return _is_yes(answer)
+
+def judge_paper_importance(paper: dict, persona: str, client: LLMClient = None) -> bool:
+    """논문이 페르소나에게 중요한지 YES/NO 로 판단합니다 (캐시 사용). 실패 시 LLMError."""
+    client = client or get_llm_client()
+    description = _paper_description(paper)
+    return client.cached(IMPORTANCE_TEMPLATE, f"{persona}\n{description}",
+                         lambda: _judge_uncached(description, persona, client))
+
+def judge_papers_importance(papers: list, persona: str, client: LLMClient = None) -> dict:
+    """여러 논문(paper_id 를 포함한 dict)의 페르소나 중요도를 배치로 판단해 {paper_id: bool} 을 반환합니다.
+
+    캐시에 없는 논문만 LLM 에 묻고, 판단에 실패한 논문은 결과에서 제외됩니다.
+    """
+    client = client or get_llm_client()
+    descriptions = {str(paper["paper_id"]): _paper_description(paper) for paper in papers}
+    inputs = {paper_id: f"{persona}\n{description}" for paper_id, description in descriptions.items()}
+    judgments = client.lookup_many(IMPORTANCE_TEMPLATE, inputs)
+    pending = {paper_id: input_text for paper_id, input_text in inputs.items() if paper_id not in judgments}
+
+    def judge_batch(missing: dict) -> dict:
+        if len(missing) <= 1:
+            return {}
+        batched = client.complete_json_batch(
+            {paper_id: descriptions[paper_id] for paper_id in missing},
+            IMPORTANCE_SYSTEM_PROMPT,
+            f"Persona: '{persona}'. For each paper, answer 'YES' if it is important to the persona, otherwise 'NO'.",
+            temperature=0.2, max_tokens_per_item=10)
+        return {paper_id: _is_yes(answer) for paper_id, answer in batched.items()}
+
+    if pending:
+        judgments.update(client.cached_many(IMPORTANCE_BATCH_TEMPLATE, pending, judge_batch))
+
+    def judge_one(paper_id):
+        try:
+            return paper_id, client.cached(IMPORTANCE_TEMPLATE, inputs[paper_id],
+                                           lambda: _judge_uncached(descriptions[paper_id], persona, client))
+        except LLMError as e:
+            logger.error(f"중요도 판단 실패 - paper_id: {paper_id}, 오류: {e}")
+            return paper_id, None
+
+    for paper_id, important in client.map(judge_one, [paper_id for paper_id in pending if paper_id not in judgments]):
+        if important is not None:
+            judgments[paper_id] = important
+    return judgments
@@ -0,0 +1,128 @@
+import json
+import logging
+from sqlalchemy import insert, inspect, text
+from .models import Paper, PaperCategory, PaperAuthor, SummaryJob, CrawlRun, PaperSignature, PaperLSHBucket, PdfBlob, PaperFullText, PAPER_FULLTEXT_FTS_DDL
+from .queries import unique_terms
+
+logger = logging.getLogger(__name__)
+
+# 스키마 버전은 SQLite 의 PRAGMA user_version 에 기록합니다.
+# 각 마이그레이션은 멱등(idempotent)이어야 하며, 새 DB 에서는 create_all 이 이미 최신 스키마를 만들므로 no-op 이 됩니다.
+
+def _add_summarized_abstract_column(conn):
+    columns = {column['name'] for column in inspect(conn).get_columns('papers')}
+    if 'summarized_abstract' not in columns:
+        conn.execute(text("ALTER TABLE papers ADD COLUMN summarized_abstract TEXT"))
+        logger.info("papers.summarized_abstract 컬럼 추가")
+
+def _create_paper_indexes(conn):
+    columns = {column['name'] for column in inspect(conn).get_columns('papers')}
+    for index in Paper.__table__.indexes:
+        if not all(column.name in columns for column in index.columns):
+            continue # 이후 마이그레이션에서 추가되는 컬럼의 인덱스는 그 마이그레이션에서 생성
+        index.create(conn, checkfirst=True)
+        logger.info(f"인덱스 확인/생성: {index.name}")
+    conn.execute(text("ANALYZE papers")) # 쿼리 플래너가 새 인덱스 통계를 사용하도록 갱신
+
+TERM_BACKFILL_BATCH_SIZE = 1000
+
+def _json_array(value):
+    """JSON 컬럼 값 -> 리스트 (배열이 아니거나 손상된 JSON 이면 None)"""
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return None
+    return value if isinstance(value, list) else None
+
+def _create_paper_term_tables(conn):
+    for table in (PaperCategory.__table__, PaperAuthor.__table__):
+        table.create(conn, checkfirst=True)
+        logger.info(f"테이블 확인/생성: {table.name}")
+    # 기존 JSON 컬럼에서 조인 테이블을 채웁니다. 배열이 아닌/손상된 JSON 은 건너뜁니다.
+    # 저장 시와 같은 unique_terms 로 정리하므로 (공백/중복 제거, position 0 부터) 다음 저장에서 행이 바뀌지 않습니다.
+    columns = {column['name'] for column in inspect(conn).get_columns('papers')}
+    term_columns = [name for name in ('categories', 'authors') if name in columns]
+    if not term_columns:
+        return
+    category_rows, author_rows = [], []
+
+    def flush():
+        if category_rows:
+            conn.execute(insert(PaperCategory.__table__).prefix_with("OR IGNORE"), category_rows)
+        if author_rows:
+            conn.execute(insert(PaperAuthor.__table__).prefix_with("OR IGNORE"), author_rows)
+        category_rows.clear()
+        author_rows.clear()
+
+    for row in conn.execute(text(f"SELECT paper_id, {', '.join(term_columns)} FROM papers")).mappings():
+        categories, authors = _json_array(row.get('categories')), _json_array(row.get('authors'))
+        category_rows.extend({"paper_id": row['paper_id'], "category": category} for category in unique_terms(categories))
+        author_rows.extend({"paper_id": row['paper_id'], "position": position, "name": name}
+                           for position, name in enumerate(unique_terms(authors)))
+        if len(category_rows) + len(author_rows) >= TERM_BACKFILL_BATCH_SIZE:
+            flush()
+    flush()
+    conn.execute(text("ANALYZE paper_categories"))
+    conn.execute(text("ANALYZE paper_authors"))
+
+def _create_summary_jobs_table(conn):
+    SummaryJob.__table__.create(conn, checkfirst=True)
+    logger.info("테이블 확인/생성: summary_jobs")
+
+def _create_crawl_runs_table(conn):
+    CrawlRun.__table__.create(conn, checkfirst=True)
+    logger.info("테이블 확인/생성: crawl_runs")
+
+def _add_dedup_columns_and_tables(conn):
+    columns = {column['name'] for column in inspect(conn).get_columns('papers')}
+    for name in ('doi', 'canonical_id'):
+        if name not in columns:
+            conn.execute(text(f"ALTER TABLE papers ADD COLUMN {name} VARCHAR"))
+            logger.info(f"papers.{name} 컬럼 추가")
+    _create_paper_indexes(conn)
+    for table in (PaperSignature.__table__, PaperLSHBucket.__table__):
+        table.create(conn, checkfirst=True)
+        logger.info(f"테이블 확인/생성: {table.name}")
+    # 기존 논문의 MinHash 서명은 시작 시간이 길어지지 않도록 여기서 만들지 않습니다 (python -m crawler_src.dedup --rebuild)
+
+def _create_fulltext_tables(conn):
+    for table in (PdfBlob.__table__, PaperFullText.__table__):
+        table.create(conn, checkfirst=True)
+        logger.info(f"테이블 확인/생성: {table.name}")
+    if conn.dialect.name == 'sqlite':
+        conn.execute(text(PAPER_FULLTEXT_FTS_DDL))
+        logger.info("테이블 확인/생성: paper_fulltext_fts")
+
+MIGRATIONS = [
+    (1, "papers.summarized_abstract 컬럼 추가", _add_summarized_abstract_column),
+    (2, "날짜/플랫폼 조회용 보조 인덱스 생성", _create_paper_indexes),
+    (3, "paper_categories / paper_authors 조인 테이블 생성 및 백필", _create_paper_term_tables),
+    (4, "백그라운드 요약 작업 큐 테이블 생성", _create_summary_jobs_table),
+    (5, "예약 크롤링 실행 기록 테이블 생성", _create_crawl_runs_table),
+    (6, "중복 논문 탐지용 doi / canonical_id 컬럼 및 MinHash/LSH 테이블 생성", _add_dedup_columns_and_tables),
+    (7, "PDF 본문 저장/전문 검색 테이블 생성", _create_fulltext_tables),
+]
+
+LATEST_SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+def get_schema_version(conn) -> int:
+    return conn.execute(text("PRAGMA user_version")).scalar() or 0
+
+def run_migrations(engine):
+    """적용되지 않은 마이그레이션을 순서대로 실행하고 적용된 마지막 버전을 반환합니다."""
+    logger.debug("run_migrations 함수 시작")
+    with engine.begin() as conn:
+        if not inspect(conn).has_table('papers'):
+            logger.debug("papers 테이블이 아직 없어 마이그레이션을 건너뜁니다 (create_all 이 최신 스키마로 생성).")
+            return 0
+        current_version = get_schema_version(conn)
+        for version, description, migrate in MIGRATIONS:
+            if version <= current_version:
+                continue
+            logger.info(f"마이그레이션 {version} 적용 중: {description}")
+            migrate(conn)
+            conn.execute(text(f"PRAGMA user_version = {version}"))
+            current_version = version
+    logger.debug(f"run_migrations 함수 종료 - schema version: {current_version}")
+    return current_version
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, String, Text, DateTime, JSON, Integer, ForeignKey
+from datetime import datetime
+from sqlalchemy import Column, String, Text, DateTime, JSON, Integer, Float, LargeBinary, ForeignKey, Index, DDL, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship # Added for relationships
 import logging # logging 임포트 추가
@@ -9,12 +10,24 @@ Base = declarative_base()
 
 class Paper(Base):
     __tablename__ = 'papers'
+    __table_args__ = (
+        # 최신순 목록 (index(), /api/papers, deepsearch 최근 논문) 및 (published_date, paper_id) 커서 페이지네이션
+        Index('ix_papers_published_date_paper_id', 'published_date', 'paper_id'),
+        # 날짜별 보고서 조회 (get_papers_by_date_and_category) 및 최근 크롤링 날짜 조회
+        Index('ix_papers_crawled_date', 'crawled_date'),
+        # 플랫폼별 최신순 조회
+        Index('ix_papers_platform_published_date', 'platform', 'published_date'),
+        # 중복 논문 탐지 (dedup.py): DOI 일치 조회 및 대표 논문 -> 중복 논문 조회
+        Index('ix_papers_doi', 'doi'),
+        Index('ix_papers_canonical_id', 'canonical_id'),
+    )
 
     paper_id = Column(String, primary_key=True)
     external_id = Column(String)
     platform = Column(String)
     title = Column(Text)
     abstract = Column(Text)
+    summarized_abstract = Column(Text, nullable=True) # LLM 요약 (paper_management_app, 보고서 생성기에서 사용)
     authors = Column(JSON)
     categories = Column(JSON)
     pdf_url = Column(String)
@@ -25,6 +38,8 @@ class Paper(Base):
     year = Column(Integer) # Added year column
     references_ids = Column(JSON, nullable=True) # New field for IDs of papers this paper cites
     cited_by_ids = Column(JSON, nullable=True) # New field for IDs of papers that cite this paper
+    doi = Column(String, nullable=True) # 정규화된 DOI (소문자), 플랫폼 간 같은 논문 판별용
+    canonical_id = Column(String, nullable=True) # 다른 플랫폼의 같은 논문이면 대표 논문의 paper_id, 대표 논문 자신은 NULL
 
     # Define relationships for citations
     citing_papers = relationship("Citation", foreign_keys="Citation.cited_paper_id", backref="cited_paper", primaryjoin="Paper.paper_id == Citation.cited_paper_id")
@@ -46,6 +61,7 @@ class Paper(Base):
             "platform": self.platform,
             "title": self.title,
             "abstract": self.abstract,
+            "summarized_abstract": self.summarized_abstract,
             "authors": self.authors,
             "categories": self.categories,
             "pdf_url": self.pdf_url,
@@ -56,6 +72,8 @@ class Paper(Base):
             "year": self.year, # Added year to dict
             "references_ids": self.references_ids, # Added to dict
             "cited_by_ids": self.cited_by_ids, # Added to dict
+            "doi": self.doi,
+            "canonical_id": self.canonical_id,
         }
         logger.debug(f"Paper 모델 to_dict 함수 종료 - paper_id: {self.paper_id}")
         return result
@@ -72,4 +90,158 @@ class Citation(Base):
         logger.debug(f"Citation 모델 __init__ 함수 종료 - citing_paper_id: {self.citing_paper_id}, cited_paper_id: {self.cited_paper_id}")
 
     def __repr__(self):
-        return f"<Citation(citing_paper_id='{self.citing_paper_id}', cited_paper_id='{self.cited_paper_id}')>" 
\ No newline at end of file
+        return f"<Citation(citing_paper_id='{self.citing_paper_id}', cited_paper_id='{self.cited_paper_id}')>" 
+
+class PaperCategory(Base):
+    """papers.categories(JSON) 를 정규화한 논문-카테고리 조인 테이블.
+
+    JSON LIKE/contains 필터는 인덱스를 쓸 수 없어 전체 스캔이 되므로, 카테고리 필터는 이 테이블을 통해 조회합니다.
+    """
+    __tablename__ = 'paper_categories'
+    __table_args__ = (
+        # 카테고리 -> 논문 조회 (category = ? 로 paper_id 목록을 인덱스만으로 얻음)
+        Index('ix_paper_categories_category_paper_id', 'category', 'paper_id'),
+    )
+
+    paper_id = Column(String, ForeignKey('papers.paper_id', ondelete='CASCADE'), primary_key=True)
+    category = Column(String, primary_key=True)
+
+    def __repr__(self):
+        return f"<PaperCategory(paper_id='{self.paper_id}', category='{self.category}')>"
+
+class PaperAuthor(Base):
+    """papers.authors(JSON) 를 정규화한 논문-저자 조인 테이블 (position 은 저자 순서)."""
+    __tablename__ = 'paper_authors'
+    __table_args__ = (
+        Index('ix_paper_authors_name_paper_id', 'name', 'paper_id'),
+    )
+
+    paper_id = Column(String, ForeignKey('papers.paper_id', ondelete='CASCADE'), primary_key=True)
+    position = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False)
+
+    def __repr__(self):
+        return f"<PaperAuthor(paper_id='{self.paper_id}', position={self.position}, name='{self.name}')>"
+
+class SummaryJob(Base):
+    """백그라운드 LLM 요약 작업 큐 (summary_queue.py). 논문당 하나의 작업 행을 가집니다."""
+    __tablename__ = 'summary_jobs'
+    __table_args__ = (
+        # 워커가 가장 오래된 대기 작업을 찾는 조회
+        Index('ix_summary_jobs_status_enqueued_at', 'status', 'enqueued_at'),
+    )
+
+    paper_id = Column(String, ForeignKey('papers.paper_id', ondelete='CASCADE'), primary_key=True)
+    status = Column(String, nullable=False, default='pending') # pending / running / done / failed
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    enqueued_at = Column(DateTime, nullable=False, default=datetime.now)
+    updated_at = Column(DateTime, nullable=False, default=datetime.now)
+
+    def __repr__(self):
+        return f"<SummaryJob(paper_id='{self.paper_id}', status='{self.status}', attempts={self.attempts})>"
+
+class PaperSignature(Base):
+    """제목+초록 MinHash 서명 (dedup.py). LSH 후보의 유사도를 확인할 때 사용합니다."""
+    __tablename__ = 'paper_signatures'
+
+    paper_id = Column(String, ForeignKey('papers.paper_id', ondelete='CASCADE'), primary_key=True)
+    signature = Column(LargeBinary, nullable=False) # uint32 배열 (Config.DEDUP_NUM_PERM 개)
+
+class PaperLSHBucket(Base):
+    """MinHash 서명의 LSH 밴드 버킷. 같은 (band, bucket) 을 가진 논문만 중복 후보로 비교합니다."""
+    __tablename__ = 'paper_lsh_buckets'
+
+    band = Column(Integer, primary_key=True)
+    bucket = Column(String, primary_key=True)
+    paper_id = Column(String, ForeignKey('papers.paper_id', ondelete='CASCADE'), primary_key=True)
+
+class CrawlRun(Base):
+    """예약 크롤링 실행 기록 (crawl_scheduler.py). 다음 증분 크롤링의 시작 시점과 실행 시간/수율 통계에 사용합니다."""
+    __tablename__ = 'crawl_runs'
+    __table_args__ = (
+        # 플랫폼별 마지막 성공 실행 / 실행 중 여부 조회
+        Index('ix_crawl_runs_platform_started_at', 'platform', 'started_at'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    platform = Column(String, nullable=False)
+    status = Column(String, nullable=False, default='running') # running / done / failed / skipped
+    scheduled_for = Column(DateTime, nullable=True)
+    started_at = Column(DateTime, nullable=False, default=datetime.now)
+    finished_at = Column(DateTime, nullable=True)
+    duration_seconds = Column(Float, nullable=True)
+    window_start = Column(DateTime, nullable=True) # 크롤링한 날짜 범위
+    window_end = Column(DateTime, nullable=True)
+    fetched = Column(Integer, nullable=False, default=0) # 수집한 논문 수
+    saved = Column(Integer, nullable=False, default=0) # 새로 저장된 논문 수
+    embedded = Column(Integer, nullable=False, default=0) # 크롤링 직후 임베딩을 채운 논문 수
+    error = Column(Text, nullable=True)
+
+    def __repr__(self):
+        return f"<CrawlRun(platform='{self.platform}', status='{self.status}', started_at={self.started_at})>"
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "platform": self.platform,
+            "status": self.status,
+            "scheduled_for": self.scheduled_for.isoformat() if self.scheduled_for else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "duration_seconds": self.duration_seconds,
+            "window_start": self.window_start.isoformat() if self.window_start else None,
+            "window_end": self.window_end.isoformat() if self.window_end else None,
+            "fetched": self.fetched,
+            "saved": self.saved,
+            "embedded": self.embedded,
+            "yield": round(self.saved / self.fetched, 3) if self.fetched else None, # 수집 대비 신규 논문 비율
+            "error": self.error,
+        }
+
+class PdfBlob(Base):
+    """내용 주소(SHA-256) 로 저장된 PDF 파일 (blob_store.py) 과 추출한 본문. 같은 PDF 는 논문이 여러 개여도 한 번만 저장/추출합니다."""
+    __tablename__ = 'pdf_blobs'
+
+    sha256 = Column(String, primary_key=True)
+    size = Column(Integer, nullable=False)
+    text = Column(Text, nullable=True) # 추출한 본문 (추출 전/실패 시 NULL)
+    page_count = Column(Integer, nullable=True)
+    error = Column(Text, nullable=True) # 마지막 추출 오류
+    created_at = Column(DateTime, nullable=False, default=datetime.now)
+    extracted_at = Column(DateTime, nullable=True)
+
+class PaperFullText(Base):
+    """논문별 PDF 수집 상태 (fulltext.py). 본문은 sha256 으로 pdf_blobs 를 참조하고, 검색용 FTS5 색인은 paper_fulltext_fts 에 있습니다."""
+    __tablename__ = 'paper_fulltext'
+    __table_args__ = (
+        # 같은 pdf_url 을 이미 받은 논문이 있는지 조회 (다시 다운로드하지 않음)
+        Index('ix_paper_fulltext_pdf_url', 'pdf_url'),
+        Index('ix_paper_fulltext_sha256', 'sha256'),
+    )
+
+    paper_id = Column(String, ForeignKey('papers.paper_id', ondelete='CASCADE'), primary_key=True)
+    pdf_url = Column(String, nullable=False)
+    sha256 = Column(String, ForeignKey('pdf_blobs.sha256'), nullable=True)
+    status = Column(String, nullable=False, default='pending') # pending / downloaded / indexed / failed
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    updated_at = Column(DateTime, nullable=False, default=datetime.now)
+
+    def to_dict(self):
+        return {
+            "paper_id": self.paper_id,
+            "pdf_url": self.pdf_url,
+            "sha256": self.sha256,
+            "status": self.status,
+            "attempts": self.attempts,
+            "error": self.error,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+# 본문 전문 검색 색인 (SQLite FTS5). create_all 이 paper_fulltext 를 만들 때 함께 생성합니다 (기존 DB 는 마이그레이션 7).
+PAPER_FULLTEXT_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS paper_fulltext_fts "
+    "USING fts5(paper_id UNINDEXED, title, body, tokenize='unicode61 remove_diacritics 2')"
+)
+event.listen(PaperFullText.__table__, 'after_create', DDL(PAPER_FULLTEXT_FTS_DDL).execute_if(dialect='sqlite'))
@@ -4,14 +4,26 @@ import json
 import xml.etree.ElementTree as ET
 import time
 import re
-import feedparser
 from datetime import datetime, timedelta, timezone
-from typing import List, Generator
-from urllib.parse import quote, urlencode
+from email.utils import parsedate_to_datetime
+from typing import List, Generator, AsyncGenerator
+from contextlib import aclosing
+from urllib.parse import quote, urlencode, urlparse
 
 # Deepsearch backend imports
 from .models import Paper, Citation
 from .connection import get_engine, get_session_local
+from .queries import set_paper_terms, delete_all_paper_terms
+from .summary_queue import enqueue_summary_jobs, delete_all_summary_jobs
+from .crawl_jobs import CrawlCancelled
+from .dedup import extract_doi, index_paper, delete_all_dedup_keys
+from .fulltext import delete_all_fulltext
+from .known_ids import get_known_paper_ids
+from .async_crawler import AsyncCrawler, SyncCrawler, ordered_map, run_blocking
+from .parse_pool import get_parse_pool
+from .parsers import parse_arxiv_feed, parse_pmc_article, parse_rss_feed
+from .http_retry import get_resilient_http
+from .http_sessions import get_http_session
 from sqlalchemy.orm import Session
 from .config import Config
 from .embedding_manager import EmbeddingManager
@@ -22,31 +34,29 @@ logger = logging.getLogger(__name__)
 config = Config()
 embedding_manager = EmbeddingManager()
 
+def is_known_paper(crawler, paper_id: str) -> bool:
+    """crawler.known_ids (multi_platform_crawl 이 설정하는 Bloom 필터) 에 있는 논문이면 건너뛴 수를 세고 True."""
+    if crawler.known_ids is None or not paper_id or paper_id not in crawler.known_ids:
+        return False
+    crawler.skipped_known += 1
+    logger.debug(f"이미 저장된 논문 건너뜀: {paper_id}")
+    return True
+
 # --- ArxivCrawler Class ---
-class ArxivCrawler:
+class ArxivCrawler(AsyncCrawler):
     def __init__(self, delay=None):
         logger.debug("ArxivCrawler __init__ 함수 시작")
         logger.setLevel(logging.DEBUG)
+        super().__init__() # 공용 HTTP 클라이언트, known_ids
         self.config = config # 전역 config를 인스턴스 변수로 할당
         self.embedding_manager = embedding_manager # 전역 embedding_manager를 인스턴스 변수로 할당
         self.base_url = self.config.ARXIV_BASE_URL
         self.delay = delay if delay is not None else self.config.ARXIV_DELAY
-        self.last_request_time = 0
         logger.debug(f"ArxivCrawler initialized with {self.delay}s delay")
         logger.debug("ArxivCrawler __init__ 함수 종료")
     
-    def _wait_for_rate_limit(self):
-        logger.debug("_wait_for_rate_limit 함수 시작")
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.delay:
-            sleep_time = self.delay - elapsed
-            logger.debug(f"Rate limiting - sleeping {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-        logger.debug("_wait_for_rate_limit 함수 종료")
-    
-    def _make_request(self, query: str, start: int = 0, max_results: int = config.ARXIV_MAX_RESULTS, start_date: datetime = None, end_date: datetime = None) -> str:
+    async def _make_request(self, query: str, start: int = 0, max_results: int = config.ARXIV_MAX_RESULTS, start_date: datetime = None, end_date: datetime = None) -> str:
         logger.debug(f"_make_request 함수 시작 - query: {query}, start: {start}, max_results: {max_results}, start_date: {start_date}, end_date: {end_date}")
-        self._wait_for_rate_limit()
         
         # 기본 search_query
         arxiv_search_query = query
@@ -89,45 +99,29 @@ class ArxivCrawler:
         full_url = f"{self.base_url}?{urlencode(params)}"; logger.debug(f"[Debug] Final URL: {full_url}")
         logger.debug(f"Requesting arXiv API - query: {arxiv_search_query}, start={start}, max={max_results}")
         
-        response = requests.get(full_url)
-        self.last_request_time = time.time()
+        response = await self.http.get(full_url, min_interval=self.delay) # 요청 간격은 공유 rate limiter 가 지킴
         
         logger.debug(f"API response status: {response.status_code}, length={len(response.text)}")
         logger.debug("XML Response preview: %s...", response.text[:500].replace('\n', ' '))
         logger.debug("_make_request 함수 종료")
         return response.text
     
-    def _parse_entry(self, entry) -> Paper:
+    @staticmethod
+    def _entry_id(entry: dict) -> str:
+        return entry["arxiv_id"]
+
+    def _parse_entry(self, entry: dict) -> Paper:
+        """parsers.parse_arxiv_feed 레코드 -> Paper (임베딩 계산)"""
         logger.debug("_parse_entry 함수 시작")
-        ns = {'atom': 'http://www.w3.org/2005/Atom'}
-        
-        arxiv_id = entry.find('atom:id', ns).text.split('/')[-1]
-        title = entry.find('atom:title', ns).text.strip()
-        abstract = entry.find('atom:summary', ns).text.strip()
-        
-        authors = []
-        for author in entry.findall('atom:author', ns):
-            name = author.find('atom:name', ns).text
-            authors.append(name)
-        
-        categories = []
-        for category in entry.findall('atom:category', ns):
-            categories.append(category.get('term'))
-        
-        pdf_link = None
-        for link in entry.findall('atom:link', ns):
-            if link.get('type') == 'application/pdf':
-                pdf_link = link.get('href')
-                break
-        
-        # published와 updated 날짜를 ISO 형식에서 파싱 (Z는 UTC 의미)
-        # .replace('Z', '+00:00')를 사용하여 timezone 인식 가능하도록 변경
-        published = datetime.fromisoformat(entry.find('atom:published', ns).text.replace('Z', '+00:00'))
-        updated = datetime.fromisoformat(entry.find('atom:updated', ns).text.replace('Z', '+00:00'))
-        
-        raw_published = entry.find('atom:published', ns).text
-        raw_updated = entry.find('atom:updated', ns).text
-        logger.debug(f"XML: {arxiv_id} - 원본 published='{raw_published}', updated='{raw_updated}'")
+        arxiv_id = self._entry_id(entry)
+        title = entry["title"]
+        abstract = entry["abstract"]
+        authors = entry["authors"]
+        categories = entry["categories"]
+        pdf_link = entry["pdf_url"]
+        published = entry["published"]
+        updated = entry["updated"]
+        logger.debug(f"XML: {arxiv_id} - published='{published}', updated='{updated}'")
         
         text_to_embed = f"{title}. {abstract}"
         embedding = self.embedding_manager.get_embedding(text_to_embed)
@@ -155,7 +149,7 @@ class ArxivCrawler:
         logger.debug(f"_parse_entry 함수 종료 - paper_id: {paper.paper_id}")
         return paper
     
-    def crawl_papers(self, query: str, start_date: datetime, end_date: datetime, batch_size: int = None, limit: int = config.ARXIV_DEFAULT_LIMIT) -> Generator[Paper, None, None]:
+    async def crawl_papers(self, query: str, start_date: datetime, end_date: datetime, batch_size: int = None, limit: int = config.ARXIV_DEFAULT_LIMIT) -> AsyncGenerator[Paper, None]:
         logger.debug(f"crawl_papers 함수 시작 - query: {query}, start_date: {start_date}, end_date: {end_date}, limit: {limit}")
         logger.debug(f"Original query='{query}'")
         logger.debug(f"Getting papers with date filter {start_date} to {end_date}")
@@ -170,22 +164,20 @@ class ArxivCrawler:
         while papers_yielded < limit:
             api_batch_size = min(batch_size, limit * 2)
             # _make_request 호출 시 start_date와 end_date 전달
-            xml_response = self._make_request(query, start_index, api_batch_size, start_date=start_date, end_date=end_date)
+            xml_response = await self._make_request(query, start_index, api_batch_size, start_date=start_date, end_date=end_date)
             
             logger.debug(f"XML Response preview: {xml_response[:500]}...")
             
-            root = ET.fromstring(xml_response)
+            feed = await get_parse_pool().parse(parse_arxiv_feed, xml_response) # PARSE_POOL_ENABLED 이면 워커 프로세스에서 파싱
             
-            ns = {'atom': 'http://www.w3.org/2005/Atom', 'opensearch': 'http://a9.com/-/spec/opensearch/1.1/'}
-            
-            total_results = int(root.find('opensearch:totalResults', ns).text)
-            start_result = int(root.find('opensearch:startIndex', ns).text)
-            items_per_page = int(root.find('opensearch:itemsPerPage', ns).text)
+            total_results = feed["total_results"]
+            start_result = feed["start_index"]
+            items_per_page = feed["items_per_page"]
             
             logger.debug(f"PAGING: Batch {start_index//batch_size + 1} - start_index={start_index}, batch_size={batch_size}")
             logger.debug(f"Batch {start_index//batch_size + 1} - Total: {total_results}, Items: {items_per_page}")
             
-            entries = root.findall('atom:entry', ns)
+            entries = feed["entries"]
             if not entries:
                 logger.debug("No more entries found")
                 break
@@ -194,8 +186,10 @@ class ArxivCrawler:
                 if papers_yielded >= limit:
                     logger.debug(f"Reached limit ({limit}) papers")
                     break
+                if is_known_paper(self, self._entry_id(entry)): # 파싱/임베딩 전에 이미 저장된 논문 건너뜀
+                    continue
                     
-                paper = self._parse_entry(entry)
+                paper = await run_blocking(self._parse_entry, entry) # 임베딩 계산이 공용 이벤트 루프를 막지 않도록
                 total_found += 1
                 
                 # API 쿼리에서 이미 날짜 필터링을 수행했으므로, 이 로직은 제거합니다.
@@ -221,21 +215,18 @@ class ArxivCrawler:
         logger.debug("crawl_papers 함수 종료")
 
 # --- BioRxivCrawler Class ---
-class BioRxivCrawler:
+class BioRxivCrawler(AsyncCrawler):
     def __init__(self):
         logger.debug("BioRxivCrawler __init__ 함수 시작")
         logger.setLevel(logging.DEBUG)
+        super().__init__() # 공용 HTTP 클라이언트, known_ids
         self.config = config # 전역 config를 인스턴스 변수로 할당
         self.embedding_manager = embedding_manager # 전역 embedding_manager를 인스턴스 변수로 할당
         self.base_url = self.config.BIORXIV_API_BASE_URL
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
         logging.info("BioRxiv crawler initialized")
         logger.debug("BioRxivCrawler __init__ 함수 종료")
 
-    def crawl_papers(self, query: str, start_date=None, end_date=None, limit=20):
+    async def crawl_papers(self, query: str, start_date=None, end_date=None, limit=20):
         logger.debug(f"BioRxiv: crawl_papers 함수 시작 - query: {query}, limit: {limit}")
         try:
             logging.info(f"BioRxiv: Starting crawl - query='{query}', limit={limit}")
@@ -256,46 +247,50 @@ class BioRxivCrawler:
 
             interval = f"{start_date_str}/{end_date_str}"
             cursor = 0 # 페이지네이션 커서
-            
-            for server in servers:
-                if len(papers) >= limit:
-                    break
-                    
-                logging.info(f"BioRxiv: Crawling {server}: latest {limit} papers (date range: {interval})")
-                
+
+            # 쿼리 매개변수로 검색어 추가 (BioRxiv API가 검색어를 지원하는 경우)
+            params = {}
+            if query: # 쿼리가 있는 경우에만 category 파라미터 추가 시도
+                # BioRxiv API는 category 파라미터를 지원합니다.
+                # 실제 API 문서에 따르면 query가 아닌 category 파라미터로 사용
+                params['category'] = query.replace(' ', '_') # 공백은 언더스코어로 대체
+
+            async def fetch_server(server):
                 # API URL을 날짜 범위 형식으로 변경
                 url = f"{self.base_url}/details/{server}/{interval}/{cursor}"
-                
-                # 쿼리 매개변수로 검색어 추가 (BioRxiv API가 검색어를 지원하는 경우)
-                params = {}
-                if query: # 쿼리가 있는 경우에만 category 파라미터 추가 시도
-                    # BioRxiv API는 category 파라미터를 지원합니다.
-                    # 실제 API 문서에 따르면 query가 아닌 category 파라미터로 사용
-                    params['category'] = query.replace(' ', '_') # 공백은 언더스코어로 대체
-
                 logging.info(f"BioRxiv: API URL: {url}, Params: {params}")
-                
-                response = self.session.get(url, params=params, timeout=60)
-                response.raise_for_status()
-                
-                data = response.json()
-                logging.info(f"BioRxiv: API response - status={response.status_code}, data_keys={list(data.keys())}")
-                
-                if 'collection' in data and data['collection']:
-                    logging.info(f"BioRxiv: Found {len(data['collection'])} papers from {server}")
-                    for item in data['collection']:
-                        if len(papers) >= limit:
-                            break
-                            
-                        paper = self._parse_paper(item, server)
-                        if paper:
-                            papers.append(paper)
-                            logging.info(f"BioRxiv: Yielding paper: {paper.title[:50]}...")
-                            yield paper
-                else:
-                    logging.warning(f"BioRxiv: No 'collection' key in response from {server} or collection is empty.")
-                            
-                time.sleep(1)
+                try:
+                    response = await self.http.get(url, params=params)
+                    response.raise_for_status()
+                    return server, response.json()
+                except Exception as e: # 한 서버가 실패해도 다른 서버 결과는 사용
+                    logging.error(f"BioRxiv: {server} 요청 실패: {e}")
+                    return server, {}
+
+            # 두 서버를 동시에 요청하고 서버 순서대로 처리 (요청 간격은 공유 rate limiter 가 지킴)
+            async with aclosing(ordered_map(fetch_server, servers)) as responses:
+                async for server, data in responses:
+                    if len(papers) >= limit:
+                        break
+
+                    logging.info(f"BioRxiv: Crawling {server}: latest {limit} papers (date range: {interval})")
+                    logging.info(f"BioRxiv: API response - data_keys={list(data.keys())}")
+
+                    if 'collection' in data and data['collection']:
+                        logging.info(f"BioRxiv: Found {len(data['collection'])} papers from {server}")
+                        for item in data['collection']:
+                            if len(papers) >= limit:
+                                break
+
+                            if is_known_paper(self, self._paper_id(item, server)):
+                                continue
+                            paper = await run_blocking(self._parse_paper, item, server)
+                            if paper:
+                                papers.append(paper)
+                                logging.info(f"BioRxiv: Yielding paper: {paper.title[:50]}...")
+                                yield paper
+                    else:
+                        logging.warning(f"BioRxiv: No 'collection' key in response from {server} or collection is empty.")
                 
         except Exception as e:
             logging.error(f"BioRxiv crawl error: {e}")
@@ -303,10 +298,14 @@ class BioRxivCrawler:
             traceback.print_exc()
         logger.debug("BioRxiv: crawl_papers 함수 종료")
 
+    @staticmethod
+    def _paper_id(item, server) -> str:
+        return f"{server}_{item.get('doi', '').replace('/', '_')}"
+
     def _parse_paper(self, item, server):
         logger.debug(f"BioRxiv: _parse_paper 함수 시작 - server: {server}")
         try:
-            paper_id = f"{server}_{item.get('doi', '').replace('/', '_')}"
+            paper_id = self._paper_id(item, server)
             title = item.get('title', '')
             abstract = item.get('abstract', '')
             authors_str = item.get('authors', '')
@@ -341,22 +340,19 @@ class BioRxivCrawler:
             return None
 
 # --- PMCCrawler Class ---
-class PMCCrawler:
+class PMCCrawler(AsyncCrawler):
     def __init__(self):
         logger.debug("PMCCrawler __init__ 함수 시작")
         logger.setLevel(logging.DEBUG)
+        super().__init__() # 공용 HTTP 클라이언트, known_ids
         self.config = config # 전역 config를 인스턴스 변수로 할당
         self.embedding_manager = embedding_manager # 전역 embedding_manager를 인스턴스 변수로 할당
         self.esearch_base_url = self.config.PMC_ESEARCH_BASE_URL
         self.efetch_base_url = self.config.PMC_EFETCH_BASE_URL
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
         logging.info("PMC crawler initialized")
         logger.debug("PMCCrawler __init__ 함수 종료")
 
-    def crawl_papers(self, query: str, start_date=None, end_date=None, limit=20):
+    async def crawl_papers(self, query: str, start_date=None, end_date=None, limit=20):
         logger.debug(f"PMC: crawl_papers 함수 시작 - query: {query}, limit: {limit}")
         try:
             logging.info(f"PMC: Starting crawl - query='{query}', limit={limit}")
@@ -390,7 +386,7 @@ class PMCCrawler:
             }
             
             logging.info(f"PMC: API URL: {search_url}")
-            response = self.session.get(search_url, params=search_params, timeout=60)
+            response = await self.http.get(search_url, params=search_params)
             response.raise_for_status()
             
             try:
@@ -398,20 +394,16 @@ class PMCCrawler:
                 id_list = root.findall('.//Id')
                 ids = [id_elem.text for id_elem in id_list]
                 logging.info(f"PMC: Found {len(ids)} paper IDs")
+                ids = [paper_id for paper_id in ids if not is_known_paper(self, f"PMC{paper_id}")] # efetch 요청 전에 제외
                 
                 if ids:
-                    for paper_id in ids[:limit]:
-                        try:
-                            paper = self._fetch_paper_details(paper_id)
+                    # efetch 요청을 한꺼번에 시작하고 검색 순서대로 내보냄 (동시 요청 수/간격은 공용 클라이언트가 제한)
+                    async with aclosing(ordered_map(self._fetch_paper_details, ids[:limit])) as details:
+                        async for paper in details:
                             if paper:
                                 papers.append(paper)
                                 logger.debug(f"PMC: Yielding paper: {paper.title[:50]}...")
                                 yield paper
-                        except Exception as e:
-                            logging.error(f"PMC: Error processing paper {paper_id}: {e}")
-                            continue
-                            
-                        time.sleep(0.5)
                 else:
                     logging.warning("PMC: No paper IDs found")
                         
@@ -426,7 +418,7 @@ class PMCCrawler:
             traceback.print_exc()
         logger.debug("PMC: crawl_papers 함수 종료")
 
-    def _fetch_paper_details(self, paper_id):
+    async def _fetch_paper_details(self, paper_id):
         logger.debug(f"PMC: _fetch_paper_details 함수 시작 - paper_id: {paper_id}")
         try:
             fetch_url = f"{self.efetch_base_url}"
@@ -438,57 +430,18 @@ class PMCCrawler:
                 'email': self.config.PMC_API_EMAIL # self.config 사용
             }
             
-            response = self.session.get(fetch_url, params=fetch_params, timeout=60)
+            response = await self.http.get(fetch_url, params=fetch_params)
             response.raise_for_status()
             
-            root = ET.fromstring(response.content)
-            
-            title = ''
-            title_elem = root.find('.//article-title')
-            if title_elem is not None:
-                title = title_elem.text or ''
-            
-            abstract = ''
-            abstract_elem = root.find('.//abstract/p')
-            if abstract_elem is None:
-                abstract_elem = root.find('.//abstract')
-            if abstract_elem is not None:
-                abstract = abstract_elem.text or ''
-            
-            authors = []
-            for contrib in root.findall('.//contrib[@contrib-type="author"]'):
-                given_names = contrib.find('.//given-names')
-                surname = contrib.find('.//surname')
-                if given_names is not None and surname is not None:
-                    authors.append(f"{given_names.text} {surname.text}")
-            
-            subjects = []
-            for subj in root.findall('.//subject'):
-                if subj.text:
-                    subjects.append(subj.text)
-            
-            pub_date = root.find('.//pub-date[@pub-type="epub"]')
-            if pub_date is None:
-                pub_date = root.find('.//pub-date')
-                
-            published_date = datetime.now()
-            if pub_date is not None:
-                year = pub_date.find('year')
-                month = pub_date.find('month')
-                day = pub_date.find('day')
-                
-                if year is not None:
-                    try:
-                        published_date = datetime(
-                            int(year.text),
-                            int(month.text) if month is not None else 1,
-                            int(day.text) if day is not None else 1
-                        )
-                    except:
-                        published_date = datetime.now()
+            record = await get_parse_pool().parse(parse_pmc_article, response.content) # JATS 파싱 (PARSE_POOL_ENABLED 이면 워커 프로세스)
+            title = record["title"]
+            abstract = record["abstract"]
+            authors = record["authors"]
+            subjects = record["subjects"]
+            published_date = record["published_date"] or datetime.now()
             
             text_to_embed = f"{title}. {abstract}"
-            embedding = self.embedding_manager.get_embedding(text_to_embed) # self.embedding_manager 사용
+            embedding = await run_blocking(self.embedding_manager.get_embedding, text_to_embed) # 공용 이벤트 루프 밖에서 계산
 
             paper = Paper(
                 paper_id=f"PMC{paper_id}",
@@ -513,21 +466,18 @@ class PMCCrawler:
             return None
 
 # --- PLOSCrawler Class ---
-class PLOSCrawler:
+class PLOSCrawler(AsyncCrawler):
     def __init__(self):
         logger.debug("PLOSCrawler __init__ 함수 시작")
         logger.setLevel(logging.DEBUG)
+        super().__init__() # 공용 HTTP 클라이언트, known_ids
         self.config = config # 전역 config를 인스턴스 변수로 할당
         self.embedding_manager = embedding_manager # 전역 embedding_manager를 인스턴스 변수로 할당
         self.base_url = self.config.PLOS_API_BASE_URL
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
         logging.info("PLOS crawler initialized")
         logger.debug("PLOSCrawler __init__ 함수 종료")
 
-    def crawl_papers(self, query: str, start_date=None, end_date=None, limit=20):
+    async def crawl_papers(self, query: str, start_date=None, end_date=None, limit=20):
         logger.debug(f"PLOS: crawl_papers 함수 시작 - query: {query}, limit: {limit}")
         try:
             logging.info(f"PLOS: Starting crawl - query='{query}', limit={limit}")
@@ -559,7 +509,7 @@ class PLOSCrawler:
             }
             
             logging.info(f"PLOS: API URL: {self.base_url}")
-            response = self.session.get(self.base_url, params=params, timeout=60)
+            response = await self.http.get(self.base_url, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -569,7 +519,9 @@ class PLOSCrawler:
                 docs = data['response']['docs']
                 logging.info(f"PLOS: Found {len(docs)} papers")
                 for doc in docs:
-                    paper = self._parse_paper(doc)
+                    if is_known_paper(self, self._paper_id(doc)):
+                        continue
+                    paper = await run_blocking(self._parse_paper, doc)
                     if paper:
                         papers.append(paper)
                         logger.debug(f"PLOS: Yielding paper: {paper.title[:50]}...")
@@ -586,10 +538,14 @@ class PLOSCrawler:
             traceback.print_exc()
         logger.debug("PLOS: crawl_papers 함수 종료")
 
+    @staticmethod
+    def _paper_id(doc) -> str:
+        return f"PLOS_{doc.get('id', '').replace('/', '_')}"
+
     def _parse_paper(self, doc):
         logger.debug("PLOS: _parse_paper 함수 시작")
         try:
-            paper_id = f"PLOS_{doc.get('id', '').replace('/', '_')}"
+            paper_id = self._paper_id(doc)
             title = doc.get('title_display', [''])[0] if isinstance(doc.get('title_display'), list) else doc.get('title_display', '')
             
             abstract_list = doc.get('abstract', [])
@@ -651,21 +607,18 @@ class PLOSCrawler:
             return None
 
 # --- DOAJCrawler Class ---
-class DOAJCrawler:
+class DOAJCrawler(AsyncCrawler):
     def __init__(self):
         logger.debug("DOAJCrawler __init__ 함수 시작")
         logger.setLevel(logging.DEBUG)
+        super().__init__() # 공용 HTTP 클라이언트, known_ids
         self.config = config # 전역 config를 인스턴스 변수로 할당
         self.embedding_manager = embedding_manager # 전역 embedding_manager를 인스턴스 변수로 할당
         self.base_url = self.config.DOAJ_API_BASE_URL
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
         logging.info("DOAJ crawler initialized")
         logger.debug("DOAJCrawler __init__ 함수 종료")
 
-    def crawl_papers(self, query: str, start_date=None, end_date=None, limit=20):
+    async def crawl_papers(self, query: str, start_date=None, end_date=None, limit=20):
         logger.debug(f"DOAJ: crawl_papers 함수 시작 - query: {query}, limit: {limit}")
         try:
             logging.info(f"DOAJ: Starting crawl - query='{query}', limit={limit}")
@@ -697,7 +650,7 @@ class DOAJCrawler:
             }
             
             logging.info(f"DOAJ: API URL: {url}")
-            response = self.session.get(url, params=params, timeout=60)
+            response = await self.http.get(url, params=params)
             response.raise_for_status()
             
             data = response.json()
@@ -707,7 +660,9 @@ class DOAJCrawler:
                 results = data['results']
                 logging.info(f"DOAJ: Found {len(results)} papers")
                 for item in results:
-                    paper = self._parse_paper(item)
+                    if is_known_paper(self, self._paper_id(item)):
+                        continue
+                    paper = await run_blocking(self._parse_paper, item)
                     if paper:
                         papers.append(paper)
                         logger.debug(f"DOAJ: Yielding paper: {paper.title[:50]}...")
@@ -724,12 +679,16 @@ class DOAJCrawler:
             traceback.print_exc()
         logger.debug("DOAJ: crawl_papers 함수 종료")
 
+    @staticmethod
+    def _paper_id(item) -> str:
+        return f"DOAJ_{item.get('id', '').replace('/', '_')}"
+
     def _parse_paper(self, item):
         logger.debug("DOAJ: _parse_paper 함수 시작")
         try:
             bibjson = item.get('bibjson', {})
             
-            paper_id = f"DOAJ_{item.get('id', '').replace('/', '_')}"
+            paper_id = self._paper_id(item)
             title = bibjson.get('title', '')
             abstract = bibjson.get('abstract', '')
             
@@ -799,32 +758,34 @@ class DOAJCrawler:
             return None
 
 # --- ArxivRSSCrawler Class ---
-class ArxivRSSCrawler:
+class ArxivRSSCrawler(AsyncCrawler):
     def __init__(self):
         logger.debug("ArxivRSSCrawler __init__ 함수 시작")
         logger.setLevel(logging.DEBUG)
+        super().__init__() # 공용 HTTP 클라이언트, known_ids
         self.config = config # 전역 config를 인스턴스 변수로 할당
         self.embedding_manager = embedding_manager # 전역 embedding_manager를 인스턴스 변수로 할당
         self.base_rss_url = self.config.ARXIV_RSS_BASE_URL
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
         logging.info("ArxivRSSCrawler initialized")
         logger.debug("ArxivRSSCrawler __init__ 함수 종료")
     
-    def _parse_rss_entry(self, entry) -> Paper:
-        logger.debug(f"_parse_rss_entry 함수 시작 - entry: {getattr(entry, 'title', 'No Title')}")
+    @staticmethod
+    def _entry_id(entry: dict):
+        return entry.get('link', '').split('/')[-1] if entry.get('link') else None
+
+    def _parse_rss_entry(self, entry: dict) -> Paper:
+        """parsers.parse_rss_feed 레코드 -> Paper (임베딩 계산)"""
+        logger.debug(f"_parse_rss_entry 함수 시작 - entry: {entry.get('title', 'No Title')}")
         try:
-            arxiv_id = getattr(entry, 'link', '').split('/')[-1] if getattr(entry, 'link', '') else None
+            arxiv_id = self._entry_id(entry)
             if not arxiv_id:
                 raise ValueError("Missing arxiv_id in RSS entry.")
 
-            title = getattr(entry, 'title', '').strip()
+            title = entry.get('title', '').strip()
             if not title:
                 raise ValueError("Missing title in RSS entry.")
             
-            summary = getattr(entry, 'summary', '')
+            summary = entry.get('summary', '')
             abstract = ""
             if "Abstract: " in summary:
                 try:
@@ -846,11 +807,11 @@ class ArxivRSSCrawler:
             else:
                 authors = ['Unknown']
             
-            categories = [getattr(entry, 'category', 'cs.AI').strip()]
+            categories = [entry.get('category', 'cs.AI').strip()]
             
-            if hasattr(entry, 'published_parsed') and entry.published_parsed:
+            if entry.get('published_parsed'):
                 try:
-                    published_date = datetime(*entry.published_parsed[:6])
+                    published_date = datetime(*entry['published_parsed'][:6])
                 except (TypeError, ValueError, IndexError) as e:
                     logging.warning(f"Failed to parse published_date for entry {arxiv_id}: {e}. Using current time.")
                     published_date = datetime.now()
@@ -881,11 +842,11 @@ class ArxivRSSCrawler:
             return paper
             
         except Exception as e:
-            entry_id = getattr(entry, 'link', 'N/A').split('/')[-1] if hasattr(entry, 'link') else 'N/A'
+            entry_id = entry.get('link', 'N/A').split('/')[-1]
             logging.error(f"RSS parsing error for entry {entry_id}: {str(e)}", exc_info=True)
             return None
     
-    def crawl_papers(self, query: str = None, start_date=None, end_date=None, limit: int = 50) -> Generator[Paper, None, None]:
+    async def crawl_papers(self, query: str = None, start_date=None, end_date=None, limit: int = 50) -> AsyncGenerator[Paper, None]:
         logger.debug(f"ArxivRSSCrawler: crawl_papers 함수 시작 - query: {query}, limit: {limit}")
         papers_count = 0
         
@@ -903,27 +864,30 @@ class ArxivRSSCrawler:
             logging.info(f"Fetching RSS: {rss_url}")
             
             try:
-                response = self.session.get(rss_url, timeout=15)
+                response = await self.http.get(rss_url, timeout=15)
                 response.raise_for_status()
                 
                 logger.debug(f"HTTP 상태: {response.status_code}, 응답 길이: {len(response.text)}")
                 
-                feed = feedparser.parse(response.text)
+                feed = await get_parse_pool().parse(parse_rss_feed, response.text) # PARSE_POOL_ENABLED 이면 워커 프로세스에서 파싱
+                entries = feed["entries"]
                 
-                logger.debug(f"Feed version: {feed.version}, Encoding: {feed.encoding}")
-                logger.debug(f"Feed title: {feed.feed.get('title', 'No title')}")
-                logger.debug(f"Entries found: {len(feed.entries)}")
+                logger.debug(f"Feed version: {feed['version']}")
+                logger.debug(f"Feed title: {feed['title']}")
+                logger.debug(f"Entries found: {len(entries)}")
                 
-                if not feed.entries:
+                if not entries:
                     logging.warning(f"No entries for {category}")
                     continue
                 
-                for i, entry in enumerate(feed.entries):
+                for i, entry in enumerate(entries):
                     if papers_count >= limit:
                         break
                     
-                    logger.debug(f"Processing entry {i+1}/{len(feed.entries)}: keys={entry.keys()}, published_parsed={getattr(entry, 'published_parsed', 'N/A')}")
-                    paper = self._parse_rss_entry(entry)
+                    logger.debug(f"Processing entry {i+1}/{len(entries)}: published_parsed={entry['published_parsed']}")
+                    if is_known_paper(self, self._entry_id(entry)):
+                        continue
+                    paper = await run_blocking(self._parse_rss_entry, entry)
                     if paper: # paper가 None이 아닌 경우에만 처리
                         logger.debug(f"Parsed paper from entry {i+1}: {paper.paper_id}")
                         if start_date and paper.published_date.date() < start_date.date():
@@ -947,10 +911,209 @@ class ArxivRSSCrawler:
         logging.info(f"RSS crawling completed: {papers_count} papers total")
         logger.debug("ArxivRSSCrawler: crawl_papers 함수 종료")
 
+# --- ArxivOAICrawler Class ---
+OAI_NS = 'http://www.openarchives.org/OAI/2.0/'
+ARXIV_OAI_METADATA_NS = {
+    'arXiv': 'http://arxiv.org/OAI/arXiv/',
+    'arXivRaw': 'http://arxiv.org/OAI/arXivRaw/',
+}
+ARXIV_OAI_GROUP_SETS = ('cs', 'econ', 'eess', 'math', 'q-bio', 'q-fin', 'stat') # 그 외 아카이브는 physics:<archive> 집합
+WHITESPACE_RE = re.compile(r'\s+')
+
+class OAIError(Exception):
+    """OAI-PMH 응답의 <error> (noRecordsMatch 제외)"""
+
+class ArxivOAICrawler:
+    """arXiv OAI-PMH ListRecords 수확기.
+
+    검색 API 의 start/max_results 페이지 방식은 깊은 오프셋에서 제한되므로, 집합(set)과 datestamp 범위로
+    레코드를 요청하고 resumptionToken 으로 끝까지 이어 받습니다. 응답은 iterparse 로 레코드 단위로 읽고 바로 버립니다.
+    query 는 arXiv 카테고리(cs.AI -> 집합 cs 에서 cs.AI 포함 레코드만), 아카이브(cs, hep-th) 또는 OAI 집합(physics:hep-th) 입니다.
+    """
+    def __init__(self, metadata_prefix: str = None, delay: float = None, embed: bool = True):
+        logger.debug("ArxivOAICrawler __init__ 함수 시작")
+        self.config = config # 전역 config를 인스턴스 변수로 할당
+        self.embedding_manager = embedding_manager # 전역 embedding_manager를 인스턴스 변수로 할당
+        self.known_ids = None # 이미 저장된 paper_id 필터 (None 이면 모두 파싱)
+        self.skipped_known = 0
+        self.base_url = self.config.ARXIV_OAI_BASE_URL
+        self.metadata_prefix = metadata_prefix or self.config.ARXIV_OAI_METADATA_PREFIX
+        if self.metadata_prefix not in ARXIV_OAI_METADATA_NS:
+            raise ValueError(f"지원하지 않는 OAI metadataPrefix: {self.metadata_prefix}")
+        self.delay = delay if delay is not None else self.config.ARXIV_OAI_DELAY
+        self.embed = embed # 대량 백필은 False 로 두고 임베딩을 나중에 채움
+        self.last_request_time = 0
+        self.resumption_token = None # 다음 페이지 토큰 (끝까지 수확했으면 None, limit 으로 멈췄으면 현재 페이지 토큰)
+        self.page_token = None # 지금 읽고 있는 페이지를 요청한 토큰 (첫 페이지는 None)
+        self.complete_list_size = None
+        self.pages = 0
+        self.session = get_http_session() # 프로세스 공용 세션 (keep-alive, 압축 전송)
+        logger.debug("ArxivOAICrawler __init__ 함수 종료")
+
+    @staticmethod
+    def set_spec_for_query(query: str):
+        """query -> (OAI 집합, 추가로 걸러낼 카테고리). 알 수 없는 query 면 (None, None) 으로 전체를 수확합니다."""
+        query = (query or '').strip()
+        if ':' in query:
+            return query, None
+        archive, _, subject = query.partition('.')
+        if not re.fullmatch(r'[a-z][a-z\-]*', archive):
+            return None, None
+        set_spec = archive if archive in ARXIV_OAI_GROUP_SETS else f"physics:{archive}"
+        return set_spec, (query if subject else None)
+
+    def _wait_for_rate_limit(self):
+        elapsed = time.time() - self.last_request_time
+        if elapsed < self.delay:
+            time.sleep(self.delay - elapsed)
+
+    def _open_page(self, params: dict):
+        """ListRecords 한 페이지의 응답 스트림을 엽니다. 503 Retry-After 는 arXiv 의 흐름 제어이므로 공용 재시도 계층이 기다린 뒤 다시 요청합니다."""
+        def send():
+            self._wait_for_rate_limit()
+            logger.debug(f"OAI-PMH 요청 - params: {params}")
+            response = self.session.get(self.base_url, params=params, stream=True, timeout=self.config.ARXIV_OAI_TIMEOUT)
+            self.last_request_time = time.time()
+            return response
+
+        response = get_resilient_http().call(urlparse(self.base_url).hostname, send, retry_exceptions=(requests.RequestException,))
+        response.raise_for_status()
+        response.raw.decode_content = True # gzip 응답도 스트림으로 해제
+        return response
+
+    def _iter_records(self, stream):
+        """응답 스트림에서 (header, metadata) 를 하나씩 내보내고, 끝에서 resumptionToken 을 기록합니다."""
+        self.resumption_token = None
+        parent = None
+        for event, elem in ET.iterparse(stream, events=('start', 'end')):
+            if event == 'start':
+                if elem.tag == f'{{{OAI_NS}}}ListRecords':
+                    parent = elem
+                continue
+            if elem.tag == f'{{{OAI_NS}}}record':
+                yield elem.find(f'{{{OAI_NS}}}header'), elem.find(f'{{{OAI_NS}}}metadata')
+                if parent is not None:
+                    parent.remove(elem) # 처리한 레코드는 메모리에서 해제
+            elif elem.tag == f'{{{OAI_NS}}}resumptionToken':
+                self.resumption_token = (elem.text or '').strip() or None # 빈 토큰 = 마지막 페이지
+                if elem.get('completeListSize'):
+                    self.complete_list_size = int(elem.get('completeListSize'))
+            elif elem.tag == f'{{{OAI_NS}}}error':
+                if elem.get('code') == 'noRecordsMatch':
+                    return
+                raise OAIError(f"{elem.get('code')}: {(elem.text or '').strip()}")
+
+    @staticmethod
+    def _record_id(header) -> str:
+        if header is None or header.get('status') == 'deleted':
+            return None
+        return header.findtext(f'{{{OAI_NS}}}identifier', '').rsplit(':', 1)[-1] or None # oai:arXiv.org:2101.00001
+
+    def _parse_record(self, arxiv_id: str, metadata) -> Paper:
+        ns = ARXIV_OAI_METADATA_NS[self.metadata_prefix]
+        record = metadata.find(f'{{{ns}}}{self.metadata_prefix}') if metadata is not None else None
+        if record is None:
+            return None
+        text = lambda name: WHITESPACE_RE.sub(' ', record.findtext(f'{{{ns}}}{name}') or '').strip()
+
+        if self.metadata_prefix == 'arXiv':
+            authors = []
+            for author in record.iterfind(f'{{{ns}}}authors/{{{ns}}}author'):
+                name = ' '.join(part for part in (author.findtext(f'{{{ns}}}forenames'), author.findtext(f'{{{ns}}}keyname'),
+                                                  author.findtext(f'{{{ns}}}suffix')) if part)
+                authors.append(name)
+            published = datetime.strptime(text('created'), '%Y-%m-%d') if text('created') else None
+            updated = datetime.strptime(text('updated'), '%Y-%m-%d') if text('updated') else published
+        else: # arXivRaw: 저자는 문자열, 날짜는 버전별 제출일 (RFC 2822)
+            authors = [name.strip() for name in re.split(r',|\band\b', text('authors')) if name.strip()]
+            version_dates = [parsedate_to_datetime(version.findtext(f'{{{ns}}}date')).replace(tzinfo=None)
+                             for version in record.iterfind(f'{{{ns}}}version') if version.findtext(f'{{{ns}}}date')]
+            published = version_dates[0] if version_dates else None
+            updated = version_dates[-1] if version_dates else None
+
+        title, abstract = text('title'), text('abstract')
+        embedding = self.embedding_manager.get_embedding(f"{title}. {abstract}") if self.embed else None
+        return Paper(
+            paper_id=arxiv_id,
+            external_id=arxiv_id,
+            platform='arxiv',
+            title=title,
+            abstract=abstract,
+            authors=authors,
+            categories=text('categories').split(),
+            pdf_url=f"https://arxiv.org/pdf/{arxiv_id}",
+            published_date=published,
+            updated_date=updated,
+            year=published.year if published else None,
+            doi=text('doi') or None,
+            embedding=embedding,
+            references_ids=[],
+            cited_by_ids=[],
+        )
+
+    def crawl_papers(self, query: str = None, start_date=None, end_date=None, limit: int = None,
+                     resumption_token: str = None) -> Generator[Paper, None, None]:
+        """start_date ~ end_date 에 추가/수정된 (OAI datestamp) 레코드를 limit 개까지 (None 이면 끝까지) 수확합니다."""
+        logger.debug(f"ArxivOAICrawler: crawl_papers 함수 시작 - query: {query}, start_date: {start_date}, end_date: {end_date}, limit: {limit}")
+        set_spec, category = self.set_spec_for_query(query)
+        if resumption_token:
+            params = {'verb': 'ListRecords', 'resumptionToken': resumption_token} # 토큰 요청에는 다른 인자를 붙이지 않음
+        else:
+            params = {'verb': 'ListRecords', 'metadataPrefix': self.metadata_prefix}
+            if set_spec:
+                params['set'] = set_spec
+            if start_date:
+                params['from'] = start_date.strftime('%Y-%m-%d') if isinstance(start_date, datetime) else start_date
+            if end_date:
+                params['until'] = end_date.strftime('%Y-%m-%d') if isinstance(end_date, datetime) else end_date
+        logging.info(f"ArxivOAICrawler: 수확 시작 - set={set_spec}, category={category}, params={params}")
+
+        papers_count = 0
+        self.page_token = resumption_token
+        while True:
+            response = self._open_page(params)
+            try:
+                for header, metadata in self._iter_records(response.raw):
+                    arxiv_id = self._record_id(header)
+                    if not arxiv_id or is_known_paper(self, arxiv_id):
+                        continue
+                    paper = self._parse_record(arxiv_id, metadata)
+                    if paper is None or (category and category not in paper.categories):
+                        continue
+                    yield paper
+                    papers_count += 1
+                    if limit and papers_count >= limit:
+                        # 페이지 중간에서 멈추면 다음 페이지 토큰으로는 남은 레코드를 건너뛰므로, 현재 페이지 토큰을 남김
+                        # (이어 받으면 이 페이지를 다시 받지만 이미 저장된 논문은 저장 시 건너뜀)
+                        self.resumption_token = self.page_token
+                        logger.debug(f"Reached limit ({limit}) papers")
+                        return
+            finally:
+                response.close()
+            self.pages += 1
+            logger.info(f"ArxivOAICrawler: {self.pages}페이지 완료 - 수확 {papers_count}편 (전체 {self.complete_list_size}), 다음 토큰: {self.resumption_token}")
+            if not self.resumption_token:
+                break
+            self.page_token = self.resumption_token
+            params = {'verb': 'ListRecords', 'resumptionToken': self.resumption_token}
+        logger.debug("ArxivOAICrawler: crawl_papers 함수 종료")
+
 
 # --- Original multi_platform_crawler functions ---
 
-def save_papers_to_db(papers_data: list):
+def delete_all_papers(session):
+    """논문과 논문에 딸린 조인 테이블/요약 작업/중복 키/본문을 모두 지웁니다 (커밋은 호출자가 수행)."""
+    delete_all_paper_terms(session)
+    delete_all_summary_jobs(session)
+    delete_all_dedup_keys(session)
+    delete_all_fulltext(session)
+    session.query(Paper).delete(synchronize_session=False)
+
+def save_papers_to_db(papers_data: list, replace_all: bool = False, raise_errors: bool = False):
+    """
+    replace_all 이면 같은 트랜잭션 안에서 기존 논문을 모두 지운 뒤 저장하므로 (초기화 크롤링),
+    저장에 실패하면 기존 데이터가 그대로 남습니다. raise_errors 이면 롤백 후 예외를 다시 발생시킵니다 (기본은 0 반환).
+    """
     logger.debug("save_papers_to_db 함수 시작")
     engine = get_engine()
     SessionLocal = get_session_local()
@@ -958,8 +1121,13 @@ def save_papers_to_db(papers_data: list):
     
     new_papers_count = 0
     existing_papers_skipped = 0
+    duplicate_papers_linked = 0
+    unsummarized_paper_ids = [] # 백그라운드 요약 대기열에 등록할 논문
 
     try:
+        if replace_all:
+            logger.info("기존 논문을 모두 지우고 새로 저장합니다 (초기화 크롤링).")
+            delete_all_papers(session)
         logger.debug(f"Processing {len(papers_data)} papers for database save.")
         for data in papers_data:
             logger.debug(f"Checking paper with ID: {data['paper_id']}")
@@ -983,6 +1151,9 @@ def save_papers_to_db(papers_data: list):
                     if isinstance(processed_data[date_field], datetime) and processed_data[date_field].tzinfo is not None:
                         processed_data[date_field] = processed_data[date_field].replace(tzinfo=None)
 
+            processed_data.pop('canonical_id', None) # 대표 논문 연결은 아래 중복 탐지에서만 정함
+            processed_data['doi'] = extract_doi(processed_data)
+
             if existing_paper:
                 # 논문이 이미 존재하면 업데이트합니다.
                 logger.debug(f"Updating existing paper: {processed_data['paper_id']}")
@@ -997,19 +1168,38 @@ def save_papers_to_db(papers_data: list):
                 session.add(new_paper)
                 new_papers_count += 1
 
+            # 카테고리/저자 조인 테이블 동기화 (카테고리 필터는 JSON 대신 이 테이블을 사용)
+            set_paper_terms(session, processed_data['paper_id'], processed_data.get('categories'), processed_data.get('authors'))
+            if config.DEDUP_ENABLED:
+                # 다른 플랫폼에서 이미 저장된 같은 논문이면 대표 논문에 연결 (기존 논문은 서명만 갱신)
+                canonical_id = index_paper(session, processed_data, link=not existing_paper)
+                if canonical_id:
+                    new_paper.canonical_id = canonical_id
+                    duplicate_papers_linked += 1
+            paper_row = existing_paper or new_paper
+            if not (paper_row.summarized_abstract or paper_row.canonical_id): # 중복 논문은 대표 논문만 요약
+                unsummarized_paper_ids.append(processed_data['paper_id'])
+
             # Reference 및 Citation 관계 저장 (여기서는 ID만 저장)
             # 실제 관계 객체 생성 및 저장은 필요에 따라 추가
             # 예시: references_ids와 cited_by_ids는 Paper 모델에 JSON으로 저장되므로 별도 Citation 테이블에 추가할 필요 없음
             logger.debug(f"Processing citations for paper: {processed_data['paper_id']}")
 
+        enqueue_summary_jobs(session, unsummarized_paper_ids)
         session.commit()
-        logger.info(f"Successfully processed {len(papers_data)} papers. Saved {new_papers_count} new papers, Skipped {existing_papers_skipped} existing papers to the database.")
+        if replace_all:
+            get_known_paper_ids().reset() # 삭제된 논문은 Bloom 필터에서 뺄 수 없으므로 비우고 다음 sync 에서 다시 채움
+        logger.info(f"Successfully processed {len(papers_data)} papers. Saved {new_papers_count} new papers ({duplicate_papers_linked} linked as duplicates), Skipped {existing_papers_skipped} existing papers to the database.")
     except Exception as e:
         session.rollback()
         logger.error(f"Error saving papers to database: {e}", exc_info=True)
+        if raise_errors:
+            raise
+        new_papers_count = 0
     finally:
         session.close()
     logger.debug("save_papers_to_db 함수 종료")
+    return new_papers_count # 새로 저장된 논문 수 (오류 시 0)
 
 def get_crawler(platform: str):
     logger.debug(f"get_crawler 함수 시작 - platform: {platform}")
@@ -1026,27 +1216,55 @@ def get_crawler(platform: str):
         crawler = DOAJCrawler()
     elif platform.lower() == "arxiv_rss":
         crawler = ArxivRSSCrawler()
+    elif platform.lower() == "arxiv_oai":
+        crawler = ArxivOAICrawler()
     else:
         logger.error(f"지원하지 않는 크롤러 플랫폼: {platform}")
         raise ValueError(f"Unsupported crawler platform: {platform}")
+    if isinstance(crawler, AsyncCrawler):
+        crawler = SyncCrawler(crawler) # 기존 호출자는 동기 제너레이터로 사용 (비동기 호출자는 get_async_crawler)
     logger.debug(f"get_crawler 함수 종료 - crawler: {crawler.__class__.__name__}")
     return crawler
 
-def multi_platform_crawl(query: str, platforms: list = None, max_results: int = config.DEFAULT_CRAWLER_MAX_RESULTS, start_date=None, end_date=None):
+def get_async_crawler(platform: str) -> AsyncCrawler:
+    """async for paper in get_async_crawler("pmc").crawl_papers(...) 로 쓰는 비동기 크롤러 (arxiv_oai 는 동기 전용)."""
+    crawler = get_crawler(platform)
+    if not isinstance(crawler, SyncCrawler):
+        raise ValueError(f"비동기 크롤러가 없는 플랫폼: {platform}")
+    return crawler.crawler
+
+def multi_platform_crawl(query: str, platforms: list = None, max_results: int = config.DEFAULT_CRAWLER_MAX_RESULTS, start_date=None, end_date=None,
+                         progress_callback=None, cancel_check=None, skip_known: bool = None):
+    """
+    progress_callback(platform, event, fetched, limit, error=None) 로 플랫폼별 진행 상황(start/paper/done/error)을 알리고,
+    cancel_check() 가 CrawlCancelled 를 발생시키면 즉시 중단합니다 (crawl_jobs 작업에서 사용).
+    skip_known 이면 (기본값: Config.KNOWN_IDS_FILTER_ENABLED) 이미 저장된 논문은 파싱하지 않고 건너뛰므로
+    반환 목록과 max_results 에는 새 논문만 포함됩니다.
+    """
     logger.debug(f"multi_platform_crawl 함수 시작 - query: {query}, platforms: {platforms}, max_results: {max_results}, start_date: {start_date}, end_date: {end_date}")
     all_papers = []
     if not platforms:
         platforms = config.SUPPORTED_CRAWLER_PLATFORMS
+    report = progress_callback or (lambda *args, **kwargs: None)
+    check_cancelled = cancel_check or (lambda: None)
+    known_ids = None
+    if config.KNOWN_IDS_FILTER_ENABLED if skip_known is None else skip_known:
+        try:
+            known_ids = get_known_paper_ids().sync() # 지난 크롤링 이후 저장된 논문 반영
+        except Exception as e:
+            logger.warning(f"이미 저장된 논문 필터를 불러오지 못해 모든 항목을 파싱합니다: {e}")
     
     for platform in platforms:
+        check_cancelled()
         if max_results > 0 and len(all_papers) >= max_results:
             logger.debug(f"Total papers collected ({len(all_papers)}) reached max_results ({max_results}). Stopping further platform crawling.")
             break
 
         logger.info(f"[{platform.upper()}] 크롤링 시작...")
+        papers_from_platform = []
         try:
             crawler = get_crawler(platform)
-            papers_from_platform = []
+            crawler.known_ids = known_ids
             # 각 크롤러에서 필요한 만큼만 가져오도록 limit을 조정
             remaining_limit = max_results - len(all_papers) if max_results > 0 else -1
             if remaining_limit == 0:
@@ -1055,17 +1273,24 @@ def multi_platform_crawl(query: str, platforms: list = None, max_results: int =
 
             # individual crawler.crawl_papers 에 남은 한도를 전달
             current_platform_limit = remaining_limit if remaining_limit > 0 else None
+            report(platform, "start", 0, current_platform_limit)
 
             for paper in crawler.crawl_papers(query=query, start_date=start_date, end_date=end_date, limit=current_platform_limit):
                 papers_from_platform.append(paper.to_dict())
+                report(platform, "paper", len(papers_from_platform), current_platform_limit)
+                check_cancelled()
                 if max_results > 0 and len(all_papers) + len(papers_from_platform) >= max_results:
                     logger.debug(f"Collected enough papers from {platform}. Breaking inner loop.")
                     break
             
-            logger.info(f"[{platform.upper()}] {len(papers_from_platform)}개 논문 크롤링 완료.")
+            logger.info(f"[{platform.upper()}] {len(papers_from_platform)}개 논문 크롤링 완료 (이미 저장된 논문 {crawler.skipped_known}개 건너뜀).")
+            report(platform, "done", len(papers_from_platform), current_platform_limit)
             all_papers.extend(papers_from_platform)
+        except CrawlCancelled:
+            raise
         except Exception as e:
             logger.error(f"[{platform.upper()}] 크롤링 중 오류 발생: {e}", exc_info=True)
+            report(platform, "error", len(papers_from_platform), None, error=str(e))
             continue
             
     logger.info(f"모든 플랫폼에서 총 {len(all_papers)}개 논문 크롤링 완료.")
@@ -1073,4 +1298,4 @@ def multi_platform_crawl(query: str, platforms: list = None, max_results: int =
     unique_papers = {paper['paper_id']: paper for paper in all_papers}.values()
     logger.info(f"중복 제거 후 {len(unique_papers)}개 논문 남음.")
 
-    return list(unique_papers)
\ No newline at end of file
+    return list(unique_papers)
@@ -0,0 +1,82 @@
+import argparse
+import functools
+import logging
+from datetime import datetime
+from .config import Config
+from .known_ids import get_known_paper_ids
+from .multi_platform_crawler import ArxivOAICrawler, save_papers_to_db
+
+logger = logging.getLogger(__name__)
+
+# 여러 해에 걸친 arXiv 백필 (예: cs.AI 2018~2024) 을 OAI-PMH 순차 수확 한 번으로 처리합니다.
+# 수확한 논문은 batch_size 개씩 모아 save_papers_to_db 한 번(트랜잭션 하나)으로 저장하고,
+# 페이지마다 resumptionToken 을 로그로 남겨 중단되면 --resume-token 으로 이어서 받을 수 있습니다.
+# 배치 저장이 실패하면 수확을 멈추고, 그 배치의 첫 논문이 들어 있던 페이지의 토큰을 로그로 남깁니다.
+# 이 토큰으로 이어 받으면 해당 페이지를 다시 받지만, 이미 저장된 논문은 저장 시 건너뜁니다.
+
+def harvest_arxiv(query: str, start_date=None, end_date=None, metadata_prefix: str = None, batch_size: int = None,
+                  limit: int = None, embed: bool = False, resumption_token: str = None, skip_known: bool = None,
+                  crawler: ArxivOAICrawler = None, save=None) -> dict:
+    """OAI-PMH 로 수확한 논문을 batch_size 개씩 저장하고 통계 dict 를 반환합니다."""
+    logger.debug(f"harvest_arxiv 함수 시작 - query: {query}, start_date: {start_date}, end_date: {end_date}")
+    batch_size = batch_size or Config.ARXIV_OAI_HARVEST_BATCH_SIZE
+    save = save or functools.partial(save_papers_to_db, raise_errors=True) # 실패한 배치를 0편 저장으로 넘기지 않음
+    crawler = crawler or ArxivOAICrawler(metadata_prefix=metadata_prefix, embed=embed)
+    if Config.KNOWN_IDS_FILTER_ENABLED if skip_known is None else skip_known:
+        crawler.known_ids = get_known_paper_ids().sync()
+
+    stats = {"harvested": 0, "saved": 0, "batches": 0}
+    batch = []
+    batch_token = None # batch 의 첫 논문이 들어 있던 페이지를 요청한 토큰
+
+    def flush():
+        try:
+            saved = save(batch)
+        except Exception:
+            resume = f"--resume-token {batch_token}" if batch_token else "같은 --from/--until 로 처음부터"
+            logger.error(f"OAI 수확 배치 {stats['batches'] + 1} 저장 실패 - 수확 중단, {resume} 다시 실행하세요", exc_info=True)
+            raise
+        stats["saved"] += saved
+        stats["batches"] += 1
+        logger.info(f"OAI 수확 배치 {stats['batches']} 저장 - 누적 수확 {stats['harvested']}편, 신규 {stats['saved']}편")
+        batch.clear()
+
+    for paper in crawler.crawl_papers(query=query, start_date=start_date, end_date=end_date, limit=limit,
+                                      resumption_token=resumption_token):
+        if not batch:
+            batch_token = crawler.page_token
+        batch.append(paper.to_dict())
+        stats["harvested"] += 1
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+
+    # limit 으로 멈춘 경우 resumption_token 은 마지막 페이지 토큰 (첫 페이지에서 멈췄으면 None 이므로 complete 로 구분)
+    stats.update(pages=crawler.pages, skipped_known=crawler.skipped_known, resumption_token=crawler.resumption_token,
+                 complete=not (limit and stats["harvested"] >= limit))
+    logger.debug("harvest_arxiv 함수 종료")
+    return stats
+
+def main():
+    """python -m crawler_src.oai_harvest cs.AI --from 2018-01-01 --until 2024-12-31"""
+    parser = argparse.ArgumentParser(description="arXiv OAI-PMH 대량 수확 (백필)")
+    parser.add_argument("query", help="arXiv 카테고리 (cs.AI), 아카이브 (cs, hep-th) 또는 OAI 집합 (physics:hep-th)")
+    parser.add_argument("--from", dest="start_date", type=datetime.fromisoformat, help="datestamp 시작일 (YYYY-MM-DD)")
+    parser.add_argument("--until", dest="end_date", type=datetime.fromisoformat, help="datestamp 종료일 (YYYY-MM-DD)")
+    parser.add_argument("--metadata-prefix", choices=["arXiv", "arXivRaw"], help="기본값: Config.ARXIV_OAI_METADATA_PREFIX")
+    parser.add_argument("--batch-size", type=int, help="한 번에 저장할 논문 수 (기본값: Config.ARXIV_OAI_HARVEST_BATCH_SIZE)")
+    parser.add_argument("--limit", type=int, help="최대 수확 논문 수 (멈춘 페이지의 토큰을 남기므로 이어 받으면 그 페이지부터 다시 받음)")
+    parser.add_argument("--embed", action="store_true", help="수확하면서 임베딩도 계산 (느림, 기본값은 나중에 채움)")
+    parser.add_argument("--resume-token", help="중단된 수확의 마지막 resumptionToken 부터 이어서 받기")
+    args = parser.parse_args()
+
+    from .connection import create_db_and_tables
+    create_db_and_tables()
+    stats = harvest_arxiv(args.query, args.start_date, args.end_date, metadata_prefix=args.metadata_prefix,
+                          batch_size=args.batch_size, limit=args.limit, embed=args.embed, resumption_token=args.resume_token)
+    logger.info(f"OAI 수확 완료 - {stats}")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    main()
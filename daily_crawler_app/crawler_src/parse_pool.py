@@ -0,0 +1,70 @@
+import os
+import asyncio
+import threading
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# 선택적 파싱 단계. 요청이 동시에 진행되면 ElementTree/feedparser 파싱이 GIL 에 묶여 병목이 되므로,
+# Config.PARSE_POOL_ENABLED 이면 응답 바이트를 워커 프로세스로 보내 parsers 의 함수로 일반 dict 레코드를 만듭니다.
+# 동시에 파싱 중/대기 중인 응답 수는 PARSE_POOL_MAX_PENDING 으로 제한해, 파싱이 밀리면 요청도 더 보내지 않게 합니다.
+# 비활성화 시에도 공용 이벤트 루프를 막지 않도록 기본 스레드 풀에서 파싱합니다.
+# 결과 순서는 호출자(ordered_map / 페이지 순차 처리) 가 유지합니다.
+
+class ParsePool:
+    def __init__(self, enabled: bool = None, workers: int = None, max_pending: int = None):
+        self.enabled = Config.PARSE_POOL_ENABLED if enabled is None else enabled
+        self.workers = workers or Config.PARSE_POOL_WORKERS or os.cpu_count() or 1
+        self.max_pending = max_pending or Config.PARSE_POOL_MAX_PENDING
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._slots = None # asyncio.Semaphore (공용 이벤트 루프에서 생성)
+        self.stats = {"pool": 0, "thread": 0, "pool_failures": 0}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # 이벤트 루프/워커 스레드가 있는 프로세스를 fork 하면 잠금이 복제되어 멈출 수 있으므로 spawn 사용
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+                logger.info(f"파싱 프로세스 풀 시작 - 워커 {self.workers}개")
+            return self._executor
+
+    async def parse(self, func, payload):
+        """func(payload) 를 워커 프로세스에서 실행합니다 (비활성화 시 기본 스레드 풀에서 실행). func 는 모듈 수준 함수여야 합니다."""
+        loop = asyncio.get_running_loop()
+        if not self.enabled:
+            self.stats["thread"] += 1
+            return await loop.run_in_executor(None, func, payload)
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        async with self._slots:
+            try:
+                result = await loop.run_in_executor(self._get_executor(), func, payload)
+                self.stats["pool"] += 1
+                return result
+            except BrokenProcessPool as e:
+                logger.warning(f"파싱 프로세스 풀이 중단되어 기본 스레드 풀에서 파싱합니다: {e}")
+                self.stats["pool_failures"] += 1
+                self.shutdown()
+        self.stats["thread"] += 1
+        return await loop.run_in_executor(None, func, payload)
+
+    def shutdown(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+def get_parse_pool() -> ParsePool:
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ParsePool()
+    return _parse_pool
@@ -0,0 +1,81 @@
+import xml.etree.ElementTree as ET
+from datetime import datetime
+import feedparser
+
+# 크롤러 응답(바이트/문자열) -> 일반 dict 레코드 파서. 모듈 수준 순수 함수라 parse_pool 의 워커 프로세스로 보낼 수 있고,
+# 크롤러는 이 레코드에서 Paper 를 만들고 임베딩을 계산합니다 (임베딩/DB 는 메인 프로세스에 남음).
+# 워커 프로세스가 가볍게 import 하도록 이 모듈은 DB/모델/설정을 import 하지 않습니다.
+
+ATOM_NS = {'atom': 'http://www.w3.org/2005/Atom', 'opensearch': 'http://a9.com/-/spec/opensearch/1.1/'}
+
+def parse_arxiv_feed(content) -> dict:
+    """arXiv API Atom 응답 -> {total_results, start_index, items_per_page, entries: [레코드]}"""
+    root = ET.fromstring(content)
+    entries = []
+    for entry in root.findall('atom:entry', ATOM_NS):
+        pdf_url = next((link.get('href') for link in entry.findall('atom:link', ATOM_NS) if link.get('type') == 'application/pdf'), None)
+        # published와 updated 날짜를 ISO 형식에서 파싱 (Z는 UTC 의미)
+        entries.append({
+            "arxiv_id": entry.find('atom:id', ATOM_NS).text.split('/')[-1],
+            "title": entry.find('atom:title', ATOM_NS).text.strip(),
+            "abstract": entry.find('atom:summary', ATOM_NS).text.strip(),
+            "authors": [author.find('atom:name', ATOM_NS).text for author in entry.findall('atom:author', ATOM_NS)],
+            "categories": [category.get('term') for category in entry.findall('atom:category', ATOM_NS)],
+            "pdf_url": pdf_url,
+            "published": datetime.fromisoformat(entry.find('atom:published', ATOM_NS).text.replace('Z', '+00:00')),
+            "updated": datetime.fromisoformat(entry.find('atom:updated', ATOM_NS).text.replace('Z', '+00:00')),
+        })
+    return {
+        "total_results": int(root.find('opensearch:totalResults', ATOM_NS).text),
+        "start_index": int(root.find('opensearch:startIndex', ATOM_NS).text),
+        "items_per_page": int(root.find('opensearch:itemsPerPage', ATOM_NS).text),
+        "entries": entries,
+    }
+
+def parse_pmc_article(content) -> dict:
+    """PMC efetch JATS XML -> {title, abstract, authors, subjects, published_date (없으면 None)}"""
+    root = ET.fromstring(content)
+
+    title_elem = root.find('.//article-title')
+    title = (title_elem.text or '') if title_elem is not None else ''
+
+    abstract_elem = root.find('.//abstract/p')
+    if abstract_elem is None:
+        abstract_elem = root.find('.//abstract')
+    abstract = (abstract_elem.text or '') if abstract_elem is not None else ''
+
+    authors = []
+    for contrib in root.findall('.//contrib[@contrib-type="author"]'):
+        given_names = contrib.find('.//given-names')
+        surname = contrib.find('.//surname')
+        if given_names is not None and surname is not None:
+            authors.append(f"{given_names.text} {surname.text}")
+
+    subjects = [subj.text for subj in root.findall('.//subject') if subj.text]
+
+    pub_date = root.find('.//pub-date[@pub-type="epub"]')
+    if pub_date is None:
+        pub_date = root.find('.//pub-date')
+    published_date = None
+    if pub_date is not None and pub_date.find('year') is not None:
+        month, day = pub_date.find('month'), pub_date.find('day')
+        try:
+            published_date = datetime(int(pub_date.find('year').text),
+                                      int(month.text) if month is not None else 1,
+                                      int(day.text) if day is not None else 1)
+        except (TypeError, ValueError):
+            published_date = None
+
+    return {"title": title, "abstract": abstract, "authors": authors, "subjects": subjects, "published_date": published_date}
+
+def parse_rss_feed(content) -> dict:
+    """arXiv RSS 응답 -> {version, title, entries: [{link, title, summary, category, published_parsed}]}"""
+    feed = feedparser.parse(content)
+    entries = [{
+        "link": entry.get('link', ''),
+        "title": entry.get('title', ''),
+        "summary": entry.get('summary', ''),
+        "category": entry.get('category', 'cs.AI'),
+        "published_parsed": tuple(entry.published_parsed[:6]) if entry.get('published_parsed') else None,
+    } for entry in feed.entries]
+    return {"version": feed.version, "title": feed.feed.get('title', 'No title'), "entries": entries}
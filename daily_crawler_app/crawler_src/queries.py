@@ -0,0 +1,139 @@
+import base64
+import json
+import logging
+from datetime import datetime
+from sqlalchemy import select, tuple_, and_, or_, exists
+from sqlalchemy.orm import aliased
+from .config import Config
+from .models import Paper, PaperCategory, PaperAuthor, PdfBlob, PaperFullText
+
+logger = logging.getLogger(__name__)
+
+def unique_terms(values) -> list:
+    """None/빈 문자열을 제외하고 순서를 유지한 채 중복을 제거합니다."""
+    if not values:
+        return []
+    if isinstance(values, str):
+        values = [values]
+    return list(dict.fromkeys(str(value).strip() for value in values if value and str(value).strip()))
+
+def set_paper_terms(session, paper_id: str, categories=None, authors=None):
+    """논문의 paper_categories / paper_authors 행을 주어진 목록으로 교체합니다.
+
+    papers.categories / papers.authors JSON 컬럼을 저장할 때마다 함께 호출해 두 표현을 동기화합니다.
+    """
+    logger.debug(f"set_paper_terms 함수 시작 - paper_id: {paper_id}")
+    session.flush() # 같은 세션에서 앞서 추가된 행과 기본키가 충돌하지 않도록 먼저 반영
+    session.query(PaperCategory).filter(PaperCategory.paper_id == paper_id).delete(synchronize_session=False)
+    session.query(PaperAuthor).filter(PaperAuthor.paper_id == paper_id).delete(synchronize_session=False)
+    session.add_all(PaperCategory(paper_id=paper_id, category=category) for category in unique_terms(categories))
+    session.add_all(PaperAuthor(paper_id=paper_id, position=position, name=name)
+                    for position, name in enumerate(unique_terms(authors)))
+    logger.debug("set_paper_terms 함수 종료")
+
+def delete_all_paper_terms(session):
+    """papers 를 일괄 삭제할 때 조인 테이블도 함께 비웁니다 (벌크 delete 는 ORM cascade 를 거치지 않음)."""
+    session.query(PaperCategory).delete(synchronize_session=False)
+    session.query(PaperAuthor).delete(synchronize_session=False)
+
+def category_condition(paper, category: str):
+    """paper (Paper 또는 aliased(Paper)) 가 category 에 속하는 조건"""
+    return paper.paper_id.in_(select(PaperCategory.paper_id).where(PaperCategory.category == category))
+
+def filter_by_category(query, category: str):
+    """Paper 쿼리를 카테고리로 필터링합니다.
+
+    ix_paper_categories_category_paper_id 인덱스만으로 paper_id 목록을 구한 뒤 papers 기본키로 조회하므로
+    JSON 컬럼 LIKE 검색과 달리 papers 전체 스캔이 일어나지 않습니다.
+    """
+    return query.filter(category_condition(Paper, category))
+
+def one_per_duplicate_group(window):
+    """
+    중복 묶음(대표 논문 + canonical_id 로 연결된 논문)마다 window 안의 논문 하나만 남기는 조건.
+    window 는 Paper 또는 aliased(Paper) 를 받아 결과 집합(날짜 범위, 카테고리 등) 조건을 반환하는 함수입니다.
+    대표 논문은 먼저 크롤링된 논문일 뿐이라 window 밖에 있을 수 있으므로, 그때는 window 안의 연결 논문 중
+    paper_id 가 가장 작은 논문을 대신 남깁니다 (ix_papers_canonical_id 로 조회).
+    """
+    canonical = aliased(Paper)
+    sibling = aliased(Paper)
+    return or_(
+        Paper.canonical_id.is_(None),
+        and_(~exists().where(canonical.paper_id == Paper.canonical_id, window(canonical)),
+             ~exists().where(sibling.canonical_id == Paper.canonical_id, sibling.paper_id < Paper.paper_id, window(sibling))),
+    )
+
+# 목록 화면/API 에서는 용량이 큰 컬럼(임베딩 벡터, 인용 ID 목록)을 기본적으로 읽지 않습니다.
+LIST_EXCLUDED_COLUMNS = ('embedding', 'references_ids', 'cited_by_ids')
+
+def paper_list_columns(include=()):
+    """목록 조회용 컬럼 프로젝션을 반환합니다. include 로 제외된 컬럼을 다시 포함할 수 있습니다."""
+    return [column for column in Paper.__table__.columns
+            if column.name not in LIST_EXCLUDED_COLUMNS or column.name in include]
+
+def resolve_page_size(page_size=None) -> int:
+    """요청된 page_size 를 1 ~ Config.PAPER_MAX_PAGE_SIZE 범위로 보정합니다."""
+    if not page_size or page_size < 1:
+        return Config.PAPER_PAGE_SIZE
+    return min(page_size, Config.PAPER_MAX_PAGE_SIZE)
+
+def encode_cursor(published_date, paper_id: str) -> str:
+    payload = json.dumps([published_date.isoformat() if published_date else None, paper_id])
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: str):
+    """encode_cursor 로 만든 커서를 (published_date, paper_id) 로 되돌립니다. 형식이 잘못되면 ValueError."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        published_date, paper_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return (datetime.fromisoformat(published_date) if published_date else None), str(paper_id)
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+def paginate_papers(query, page_size=None, cursor=None):
+    """(published_date DESC, paper_id DESC) 순서의 키셋(커서) 페이지네이션.
+
+    OFFSET 대신 마지막 행의 (published_date, paper_id) 이후를 ix_papers_published_date_paper_id 인덱스로
+    바로 탐색하므로 테이블 크기와 페이지 위치에 관계없이 페이지당 비용이 일정합니다.
+    published_date 가 NULL 인 논문은 날짜가 있는 논문 뒤에 paper_id 역순으로 이어집니다.
+
+    query 는 Paper 엔티티 또는 paper_list_columns() 프로젝션 쿼리여야 합니다.
+    반환값: (rows, next_cursor) - 마지막 페이지면 next_cursor 는 None
+    """
+    logger.debug(f"paginate_papers 함수 시작 - page_size: {page_size}, cursor: {cursor}")
+    page_size = resolve_page_size(page_size)
+    limit = page_size + 1 # 다음 페이지 존재 여부 확인용으로 한 행 더 읽음
+    order = (Paper.published_date.desc(), Paper.paper_id.desc())
+    null_date_query = query.filter(Paper.published_date.is_(None)).order_by(Paper.paper_id.desc())
+
+    if cursor is None:
+        rows = query.order_by(*order).limit(limit).all()
+    else:
+        last_date, last_id = decode_cursor(cursor)
+        if last_date is None:
+            rows = null_date_query.filter(Paper.paper_id < last_id).limit(limit).all()
+        else:
+            rows = query.filter(tuple_(Paper.published_date, Paper.paper_id) < (last_date, last_id)) \
+                        .order_by(*order).limit(limit).all()
+            if len(rows) < limit: # 날짜가 있는 논문을 모두 넘겼으면 날짜 없는 논문으로 이어서 채움
+                rows += null_date_query.limit(limit - len(rows)).all()
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = encode_cursor(rows[-1].published_date, rows[-1].paper_id)
+    logger.debug(f"paginate_papers 함수 종료 - 반환 수: {len(rows)}, next_cursor: {next_cursor}")
+    return rows, next_cursor
+
+def paper_row_to_dict(row) -> dict:
+    """paper_list_columns() 프로젝션 행을 Paper.to_dict() 와 같은 형식의 dict 로 변환합니다."""
+    result = dict(row._mapping)
+    for key in ('published_date', 'updated_date', 'crawled_date'):
+        if result.get(key) is not None:
+            result[key] = result[key].isoformat()
+    return result
+
+def paper_fulltext_text(session, paper_id: str):
+    """색인된 PDF 본문 (fulltext.py) 또는 None. 같은 PDF 를 공유하는 논문은 같은 본문을 돌려받습니다."""
+    return session.query(PdfBlob.text).join(PaperFullText, PaperFullText.sha256 == PdfBlob.sha256) \
+                  .filter(PaperFullText.paper_id == paper_id, PdfBlob.text.isnot(None)).scalar()
@@ -0,0 +1,92 @@
+import heapq
+import logging
+from datetime import datetime
+import numpy as np
+from sqlalchemy import func
+from .config import Config
+from .models import Paper
+from .similarity import embedding_matrix, cosine_similarities
+
+logger = logging.getLogger(__name__)
+
+# 보고서 top_n 선택용 관련도 점수.
+# 점수 = 가중치 합으로 정규화한 (임베딩 중심성, 페르소나 유사도, 피인용 수, 최신성) 의 가중 평균 (각 항목은 0~1).
+# 후보 전체에 대해 NumPy 로 한 번에 계산하고, 점수 계산에 필요한 컬럼만 읽은 뒤 선택된 논문만 전체 로딩합니다.
+
+def default_weights() -> dict:
+    return {
+        "centrality": Config.RANKING_WEIGHT_CENTRALITY,
+        "persona": Config.RANKING_WEIGHT_PERSONA,
+        "citations": Config.RANKING_WEIGHT_CITATIONS,
+        "recency": Config.RANKING_WEIGHT_RECENCY,
+    }
+
+def centrality_scores(embeddings) -> np.ndarray:
+    """후보 집합 임베딩 중심(centroid)과의 코사인 유사도를 0~1 로 변환. 그날 논문들의 주요 주제에 가까울수록 높음."""
+    matrix, valid = embedding_matrix(embeddings)
+    scores = np.zeros(len(valid), dtype=np.float32)
+    if valid.any():
+        centroid = matrix[valid].mean(axis=0)
+        norm = np.linalg.norm(centroid)
+        if norm > 0:
+            scores[valid] = (matrix[valid] @ (centroid / norm) + 1) / 2
+    return scores
+
+def citation_scores(citation_counts) -> np.ndarray:
+    """log1p(피인용 수) 를 후보 중 최댓값으로 나눈 값."""
+    counts = np.log1p(np.asarray(citation_counts, dtype=np.float32))
+    top = counts.max() if len(counts) else 0
+    return counts / top if top > 0 else np.zeros_like(counts)
+
+def recency_scores(published_dates, now: datetime = None, half_life_days: float = None) -> np.ndarray:
+    """출판일 기준 반감기 지수 감쇠. 출판일이 없으면 0."""
+    now = now or datetime.now()
+    half_life_days = half_life_days or Config.RANKING_RECENCY_HALF_LIFE_DAYS
+    ages = np.array([(now - date).total_seconds() / 86400 if date else np.nan for date in published_dates], dtype=np.float64)
+    scores = np.exp2(-np.clip(ages, 0, None) / half_life_days)
+    return np.nan_to_num(scores, nan=0.0).astype(np.float32)
+
+def score_papers(embeddings, citation_counts, published_dates, persona_vector=None, weights: dict = None, now: datetime = None) -> np.ndarray:
+    """후보 논문별 관련도 점수 배열. persona_vector 가 없으면 페르소나 항목은 가중치에서 제외됩니다."""
+    weights = dict(weights or default_weights())
+    embeddings = list(embeddings)
+    components = {
+        "centrality": centrality_scores(embeddings),
+        "citations": citation_scores(citation_counts),
+        "recency": recency_scores(published_dates, now),
+    }
+    if persona_vector is not None:
+        components["persona"] = np.nan_to_num((cosine_similarities(persona_vector, embeddings) + 1) / 2, nan=0.0)
+    total = sum(weights.get(name, 0) for name in components)
+    scores = np.zeros(len(embeddings), dtype=np.float32)
+    if total <= 0:
+        return scores
+    for name, values in components.items():
+        scores += (weights.get(name, 0) / total) * values
+    return scores
+
+def top_n_indices(scores, n: int) -> list:
+    """점수가 높은 순으로 n 개의 인덱스 (힙 기반, 동점이면 원래 순서 유지)."""
+    return heapq.nlargest(n, range(len(scores)), key=scores.__getitem__)
+
+def select_top_papers(session, query, top_n: int, persona_vector=None, weights: dict = None):
+    """
+    query (Paper 조회) 의 후보 중 관련도 상위 top_n 편을 점수 순으로 반환합니다.
+    점수 계산에는 paper_id, embedding, 피인용 수, published_date 만 읽고,
+    선택된 top_n 편만 Paper 전체 컬럼으로 다시 조회합니다.
+    """
+    logger.debug(f"select_top_papers 함수 시작 - top_n: {top_n}, 페르소나 사용: {persona_vector is not None}")
+    if session.get_bind().dialect.name == "sqlite":
+        citation_count = func.coalesce(func.json_array_length(Paper.cited_by_ids), 0) # 목록 대신 길이만 읽음
+    else:
+        citation_count = Paper.cited_by_ids
+    rows = query.with_entities(Paper.paper_id, Paper.embedding, citation_count, Paper.published_date).all()
+    if not rows:
+        logger.debug("select_top_papers 함수 종료 - 후보 없음")
+        return []
+    counts = [count if isinstance(count, int) else len(count or []) for _, _, count, _ in rows]
+    scores = score_papers([row[1] for row in rows], counts, [row[3] for row in rows], persona_vector, weights)
+    selected_ids = [rows[i][0] for i in top_n_indices(scores, top_n)]
+    papers = {paper.paper_id: paper for paper in session.query(Paper).filter(Paper.paper_id.in_(selected_ids))}
+    logger.debug(f"select_top_papers 함수 종료 - 후보 {len(rows)}편 중 {len(selected_ids)}편 선택")
+    return [papers[paper_id] for paper_id in selected_ids if paper_id in papers]
@@ -0,0 +1,125 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+import logging
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# 생성된 PDF 보고서 캐시. 키는 (선택된 논문 ID + updated_date + 요약, 카테고리/페르소나 등 파라미터, 템플릿 버전) 의 해시이므로
+# 같은 날짜/top_n 을 다시 요청하면 ReportLab 렌더링과 LLM 호출 없이 저장된 파일을 바로 돌려줍니다.
+# 키가 내용 주소이므로 그대로 HTTP ETag 로 사용할 수 있습니다.
+# 보고서는 기본적으로 메모리 버퍼에 렌더링해 바로 전송하며, 디스크에는 Config.REPORT_CACHE_ENABLED 일 때만 저장합니다.
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_CACHE_DIR = os.getenv("REPORT_CACHE_DIR", os.path.join(_APP_DIR, 'report_cache'))
+
+def _field(paper, name):
+    return paper.get(name) if isinstance(paper, dict) else getattr(paper, name, None)
+
+def report_cache_key(papers, template: tuple, **params) -> str:
+    """
+    papers 는 보고서에 들어가는 순서대로의 Paper 객체 또는 to_dict() 결과.
+    template 은 (이름, 버전) 튜플로, 보고서 레이아웃을 바꾸면 버전을 올려 이전 파일을 무효화합니다.
+    params 에는 날짜, 카테고리, 페르소나 등 렌더링 결과에 영향을 주는 값을 넘깁니다.
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps({"template": list(template), "params": params}, sort_keys=True, default=str).encode("utf-8"))
+    for paper in papers:
+        updated_date = _field(paper, "updated_date")
+        if hasattr(updated_date, "isoformat"):
+            updated_date = updated_date.isoformat() # Paper 객체와 to_dict() 결과가 같은 키를 갖도록
+        summary = _field(paper, "summarized_abstract") or ""
+        digest.update(b"\x00")
+        digest.update(f"{_field(paper, 'paper_id')}|{updated_date}|".encode("utf-8"))
+        digest.update(hashlib.sha256(summary.encode("utf-8")).digest())
+    return digest.hexdigest()
+
+def get_report_cache(directory: str = None):
+    """Config.REPORT_CACHE_ENABLED 가 False 이면 None (보고서를 디스크에 저장하지 않음)"""
+    return ReportCache(directory) if Config.REPORT_CACHE_ENABLED else None
+
+class ReportCache:
+    def __init__(self, directory: str = None, max_bytes: int = None, suffix: str = ".pdf"):
+        self.directory = directory or REPORT_CACHE_DIR
+        self.max_bytes = max_bytes if max_bytes is not None else Config.REPORT_CACHE_MAX_BYTES
+        self.suffix = suffix
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "evicted": 0}
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}{self.suffix}")
+
+    def get(self, key: str):
+        """캐시된 파일 경로 또는 None. 적중 시 mtime 을 갱신해 LRU 순서를 유지합니다."""
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return path
+
+    def new_temp_path(self) -> str:
+        """캐시 디렉토리 안의 임시 파일 경로 (같은 파일 시스템이므로 put 에서 원자적으로 이동 가능)"""
+        fd, path = tempfile.mkstemp(suffix=self.suffix + ".tmp", dir=self.directory)
+        os.close(fd)
+        return path
+
+    def put(self, key: str, source_path: str) -> str:
+        """source_path 의 파일을 캐시로 옮기고 (os.replace) 캐시 경로를 반환합니다. 용량을 넘으면 오래된 파일부터 제거합니다."""
+        path = self.path_for(key)
+        os.replace(source_path, path)
+        self._count("writes")
+        self.evict(keep=path)
+        return path
+
+    def put_bytes(self, key: str, data: bytes) -> str:
+        """메모리에서 렌더링한 보고서를 임시 파일에 쓴 뒤 원자적으로 캐시에 저장합니다."""
+        temp_path = self.new_temp_path()
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(data)
+        except Exception:
+            self.discard(temp_path)
+            raise
+        return self.put(key, temp_path)
+
+    def discard(self, path: str):
+        """실패한 렌더링의 임시 파일 정리"""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def evict(self, keep: str = None) -> int:
+        """총 크기가 max_bytes 를 넘으면 가장 오래 사용되지 않은(mtime) 파일부터 지웁니다. 0이면 무제한."""
+        if self.max_bytes <= 0:
+            return 0
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(self.suffix):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            self.discard(path)
+            total -= size
+            removed += 1
+        if removed:
+            self._count("evicted", removed)
+            logger.debug(f"보고서 캐시 파일 {removed}개 제거 (남은 크기: {total} bytes)")
+        return removed
+
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.stats[key] += amount
@@ -0,0 +1,62 @@
+import logging
+import numpy as np
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# 저장된 Paper.embedding (JSON 리스트) 을 행렬로 모아 한 번에 코사인 유사도를 계산합니다.
+# 논문마다 파이썬 루프로 계산하지 않으므로 하루치 수천 편도 밀리초 단위로 끝납니다.
+
+def embedding_matrix(embeddings, dim: int = None):
+    """
+    임베딩 목록을 L2 정규화된 (n, dim) 행렬과 유효 여부 마스크로 변환합니다.
+    임베딩이 없거나 차원이 dim 과 다른 행은 0 벡터로 두고 마스크를 False 로 표시합니다.
+    dim 을 주지 않으면 첫 번째 유효한 임베딩의 차원을 사용합니다.
+    """
+    embeddings = list(embeddings)
+    if dim is None:
+        dim = next((len(vector) for vector in embeddings if vector), 0)
+    matrix = np.zeros((len(embeddings), dim), dtype=np.float32)
+    valid = np.zeros(len(embeddings), dtype=bool)
+    for i, vector in enumerate(embeddings):
+        if vector and len(vector) == dim:
+            matrix[i] = vector
+            valid[i] = True
+    norms = np.linalg.norm(matrix, axis=1)
+    valid &= norms > 0
+    matrix[valid] /= norms[valid, None]
+    return matrix, valid
+
+def cosine_similarities(query_vector, embeddings) -> np.ndarray:
+    """query_vector 와 각 임베딩의 코사인 유사도 배열. 비교할 수 없는 행은 NaN."""
+    query = np.asarray(query_vector, dtype=np.float32)
+    query_norm = np.linalg.norm(query)
+    matrix, valid = embedding_matrix(embeddings, dim=query.shape[0])
+    similarities = np.full(len(valid), np.nan, dtype=np.float32)
+    if query_norm > 0:
+        similarities[valid] = matrix[valid] @ (query / query_norm)
+    return similarities
+
+def prefilter_by_persona(papers, persona: str, embed, threshold: float = None, max_candidates: int = None):
+    """
+    LLM 중요도 판단 전 1차 필터. 페르소나를 한 번만 임베딩해 논문 임베딩과의 코사인 유사도로 정렬하고,
+    threshold 이상인 상위 max_candidates 편만 후보로 남깁니다.
+    임베딩이 없는 논문은 유사도로 판단할 수 없으므로 후보에 그대로 포함합니다 (LLM 이 판단).
+    papers 는 .embedding 속성을 가진 객체 목록, embed 는 텍스트 -> 벡터 함수입니다.
+    반환값: (후보 논문 목록, {paper_id: 유사도})
+    """
+    threshold = Config.PERSONA_PREFILTER_THRESHOLD if threshold is None else threshold
+    max_candidates = Config.PERSONA_PREFILTER_MAX_CANDIDATES if max_candidates is None else max_candidates
+    logger.debug(f"prefilter_by_persona 함수 시작 - 논문 수: {len(papers)}, threshold: {threshold}, max_candidates: {max_candidates}")
+    persona_vector = embed(persona)
+    similarities = cosine_similarities(persona_vector, [paper.embedding for paper in papers])
+    ranked = np.flatnonzero(similarities >= threshold)
+    ranked = ranked[np.argsort(-similarities[ranked], kind="stable")]
+    if max_candidates > 0:
+        ranked = ranked[:max_candidates]
+    without_embedding = np.flatnonzero(np.isnan(similarities))
+    selected = np.sort(np.concatenate([ranked, without_embedding])) # 원래 순서 유지
+    candidates = [papers[i] for i in selected]
+    scores = {papers[i].paper_id: float(similarities[i]) for i in ranked}
+    logger.debug(f"prefilter_by_persona 함수 종료 - 후보 수: {len(candidates)} (임베딩 없음: {len(without_embedding)})")
+    return candidates, scores
@@ -0,0 +1,93 @@
+import threading
+import logging
+from sqlalchemy import event, text
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# papers.db 는 크롤러, 보고서 생성기, 논문 관리 앱, deepsearch 가 동시에 엽니다.
+# WAL 모드에서는 쓰기(크롤링) 중에도 읽기(보고서 생성)가 막히지 않습니다.
+SQLITE_PRAGMAS = [
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"), # WAL 모드에서는 NORMAL 로도 커밋 내구성이 보장됨
+    ("cache_size", Config.SQLITE_CACHE_SIZE_KB * -1), # 음수 = KiB 단위
+    ("mmap_size", Config.SQLITE_MMAP_SIZE),
+    ("temp_store", "MEMORY"),
+    ("busy_timeout", Config.DB_BUSY_TIMEOUT_MS),
+]
+
+_maintenance_threads = {}
+_maintenance_lock = threading.Lock()
+
+def _is_file_database(engine) -> bool:
+    database = engine.url.database
+    return engine.dialect.name == "sqlite" and bool(database) and database != ":memory:"
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+def apply_sqlite_profile(engine):
+    """SQLite 엔진에 성능 프로파일(WAL, pragma, busy 처리)을 적용합니다.
+
+    create_engine 을 호출하는 모든 곳에서 엔진 생성 직후 호출합니다. SQLite 가 아닌 엔진은 그대로 반환합니다.
+    """
+    logger.debug(f"apply_sqlite_profile 함수 시작 - url: {engine.url}")
+    if engine.dialect.name != "sqlite":
+        logger.debug("SQLite 엔진이 아니므로 프로파일을 적용하지 않습니다.")
+        return engine
+    if not event.contains(engine, "connect", _apply_sqlite_pragmas):
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+    logger.debug("apply_sqlite_profile 함수 종료")
+    return engine
+
+def run_sqlite_maintenance(engine, optimize: bool = False):
+    """WAL 파일을 체크포인트하고, 필요하면 쿼리 플래너 통계를 갱신합니다."""
+    with engine.connect() as conn:
+        busy, log_frames, checkpointed = conn.execute(text("PRAGMA wal_checkpoint(PASSIVE)")).one()
+        logger.debug(f"wal_checkpoint 완료 - busy: {busy}, log: {log_frames}, checkpointed: {checkpointed}")
+        if optimize:
+            conn.execute(text("PRAGMA optimize"))
+            logger.debug("PRAGMA optimize 완료")
+
+class SQLiteMaintenanceThread(threading.Thread):
+    """주기적으로 wal_checkpoint 와 optimize 를 실행하는 데몬 스레드."""
+    def __init__(self, engine, interval: float = None, optimize_every: int = None):
+        super().__init__(name=f"sqlite-maintenance-{engine.url.database}", daemon=True)
+        self.engine = engine
+        self.interval = interval if interval is not None else Config.SQLITE_CHECKPOINT_INTERVAL
+        self.optimize_every = optimize_every if optimize_every is not None else Config.SQLITE_OPTIMIZE_EVERY
+        self._stop_event = threading.Event()
+        self.runs = 0
+
+    def run(self):
+        logger.debug(f"SQLiteMaintenanceThread 시작 - interval: {self.interval}s")
+        while not self._stop_event.wait(self.interval):
+            self.runs += 1
+            try:
+                optimize = self.optimize_every > 0 and self.runs % self.optimize_every == 0 # 0 이면 optimize 하지 않음
+                run_sqlite_maintenance(self.engine, optimize=optimize)
+            except Exception as e:
+                logger.warning(f"SQLite 유지보수 작업 실패: {e}")
+        logger.debug("SQLiteMaintenanceThread 종료")
+
+    def stop(self):
+        self._stop_event.set()
+
+def start_sqlite_maintenance(engine, interval: float = None):
+    """엔진별로 하나의 유지보수 스레드를 시작합니다 (이미 실행 중이면 기존 스레드를 반환)."""
+    if not _is_file_database(engine):
+        return None
+    key = str(engine.url)
+    with _maintenance_lock:
+        thread = _maintenance_threads.get(key)
+        if thread is None or not thread.is_alive():
+            thread = SQLiteMaintenanceThread(engine, interval=interval)
+            thread.start()
+            _maintenance_threads[key] = thread
+            logger.info(f"SQLite 유지보수 스레드 시작: {key}")
+    return thread
@@ -0,0 +1,226 @@
+import threading
+import logging
+from datetime import datetime, timedelta
+from sqlalchemy import or_, and_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from .config import Config
+from .connection import get_session_local
+from .models import Paper, SummaryJob
+from .queries import paper_fulltext_text
+
+logger = logging.getLogger(__name__)
+
+# 요약 작업 상태
+STATUS_PENDING = 'pending'
+STATUS_RUNNING = 'running'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+# 작업은 papers.db 의 summary_jobs 테이블에 저장되므로 크롤러(작업 등록)와 논문 관리 앱(워커 실행)이
+# 서로 다른 프로세스여도 되고, 프로세스가 재시작되어도 대기 중인 작업이 사라지지 않습니다.
+
+def enqueue_summary_jobs(session, paper_ids) -> int:
+    """요약 작업을 대기열에 등록합니다 (커밋은 호출자가 수행).
+
+    이미 작업이 있는 논문은 건너뛰고, failed 로 끝난 작업은 시도 횟수를 초기화해 다시 pending 으로 돌립니다.
+    """
+    paper_ids = list(dict.fromkeys(paper_id for paper_id in paper_ids if paper_id))
+    if not paper_ids:
+        return 0
+    logger.debug(f"enqueue_summary_jobs 함수 시작 - 논문 수: {len(paper_ids)}")
+    now = datetime.now()
+    rows = [{"paper_id": paper_id, "status": STATUS_PENDING, "attempts": 0, "enqueued_at": now, "updated_at": now}
+            for paper_id in paper_ids]
+    requeue = {"status": STATUS_PENDING, "attempts": 0, "last_error": None, "enqueued_at": now, "updated_at": now}
+    if session.get_bind().dialect.name == "sqlite":
+        result = session.execute(sqlite_insert(SummaryJob).values(rows).on_conflict_do_update(
+            index_elements=['paper_id'], set_=requeue, where=SummaryJob.status == STATUS_FAILED))
+        enqueued = result.rowcount # 새로 등록된 작업 + 다시 대기열에 넣은 실패 작업
+    else:
+        existing = dict(session.query(SummaryJob.paper_id, SummaryJob.status).filter(SummaryJob.paper_id.in_(paper_ids)))
+        new_rows = [row for row in rows if row["paper_id"] not in existing]
+        session.add_all(SummaryJob(**row) for row in new_rows)
+        failed_ids = [paper_id for paper_id, status in existing.items() if status == STATUS_FAILED]
+        if failed_ids:
+            session.query(SummaryJob).filter(SummaryJob.paper_id.in_(failed_ids), SummaryJob.status == STATUS_FAILED) \
+                   .update(requeue, synchronize_session=False)
+        enqueued = len(new_rows) + len(failed_ids)
+    logger.debug(f"enqueue_summary_jobs 함수 종료 - 등록된 작업 수: {enqueued}")
+    return enqueued
+
+def get_summary_statuses(session, paper_ids) -> dict:
+    """{paper_id: status} 를 반환합니다. 작업이 없는 논문은 포함되지 않습니다."""
+    paper_ids = list(paper_ids)
+    if not paper_ids:
+        return {}
+    return dict(session.query(SummaryJob.paper_id, SummaryJob.status).filter(SummaryJob.paper_id.in_(paper_ids)))
+
+def delete_all_summary_jobs(session):
+    """papers 를 일괄 삭제할 때 요약 작업도 함께 비웁니다."""
+    session.query(SummaryJob).delete(synchronize_session=False)
+
+def summary_input(session, paper_id: str, abstract: str) -> str:
+    """요약할 텍스트. PDF 본문이 색인되어 있으면 (Config.SUMMARY_USE_FULLTEXT) 초록 뒤에 본문 앞부분을 붙입니다."""
+    body = paper_fulltext_text(session, paper_id) if Config.SUMMARY_USE_FULLTEXT else None
+    if not body:
+        return abstract
+    return f"{abstract or ''}\n\n{body[:Config.SUMMARY_FULLTEXT_CHARS]}".strip()
+
+def _finish_unclaimed(session, paper_id: str, status: str, error, now):
+    session.query(SummaryJob).filter(SummaryJob.paper_id == paper_id) \
+           .update({SummaryJob.status: status, SummaryJob.last_error: error, SummaryJob.updated_at: now}, synchronize_session=False)
+
+def claim_summary_job(session):
+    """가장 오래된 대기 작업 하나를 running 으로 바꾸고 (paper_id, 요약할 텍스트) 를 반환합니다. 없으면 None.
+
+    UPDATE ... WHERE status = 'pending' 의 영향 행 수로 선점 여부를 판단하므로 여러 워커/프로세스가
+    동시에 같은 작업을 가져가지 않습니다. 오래 running 상태로 남은 작업(워커 종료)도 다시 가져갑니다.
+    """
+    now = datetime.now()
+    claimable = or_(SummaryJob.status == STATUS_PENDING,
+                    and_(SummaryJob.status == STATUS_RUNNING,
+                         SummaryJob.updated_at < now - timedelta(seconds=Config.SUMMARY_STALE_AFTER)))
+    candidates = [paper_id for (paper_id,) in
+                  session.query(SummaryJob.paper_id).filter(claimable).order_by(SummaryJob.enqueued_at).limit(5)]
+    for paper_id in candidates:
+        claimed = session.execute(
+            update(SummaryJob)
+            .where(SummaryJob.paper_id == paper_id, claimable)
+            .values(status=STATUS_RUNNING, attempts=SummaryJob.attempts + 1, updated_at=now)
+        ).rowcount
+        paper = session.query(Paper.abstract, Paper.summarized_abstract).filter(Paper.paper_id == paper_id).first() if claimed else None
+        source_text = None
+        if claimed and paper is not None and paper.summarized_abstract:
+            # 보고서 생성 등 다른 경로에서 이미 요약된 논문은 LLM 호출 없이 완료 처리
+            _finish_unclaimed(session, paper_id, STATUS_DONE, None, now)
+            claimed = False
+        elif claimed:
+            source_text = summary_input(session, paper_id, paper.abstract) if paper is not None else None
+            if not source_text:
+                # 등록 후 논문이 삭제되었거나 요약할 텍스트가 없음 -> 요약기에 None 을 넘기지 않고 실패 처리
+                _finish_unclaimed(session, paper_id, STATUS_FAILED,
+                                  "논문이 삭제됨" if paper is None else "요약할 초록/본문이 없음", now)
+                claimed = False
+        session.commit() # LLM 호출 동안 트랜잭션을 열어 두지 않음
+        if claimed:
+            return paper_id, source_text
+    return None
+
+def complete_summary_job(session, paper_id: str, summarized_text: str):
+    session.query(Paper).filter(Paper.paper_id == paper_id) \
+           .update({Paper.summarized_abstract: summarized_text}, synchronize_session=False)
+    session.query(SummaryJob).filter(SummaryJob.paper_id == paper_id) \
+           .update({SummaryJob.status: STATUS_DONE, SummaryJob.last_error: None, SummaryJob.updated_at: datetime.now()},
+                   synchronize_session=False)
+    session.commit()
+
+def fail_summary_job(session, paper_id: str, error: str):
+    """실패한 작업을 다시 대기열에 넣거나, 최대 시도 횟수를 넘으면 failed 로 표시합니다."""
+    attempts = session.query(SummaryJob.attempts).filter(SummaryJob.paper_id == paper_id).scalar() or 0
+    status = STATUS_FAILED if attempts >= Config.SUMMARY_MAX_ATTEMPTS else STATUS_PENDING
+    session.query(SummaryJob).filter(SummaryJob.paper_id == paper_id) \
+           .update({SummaryJob.status: status, SummaryJob.last_error: error[:1000], SummaryJob.updated_at: datetime.now()},
+                   synchronize_session=False)
+    session.commit()
+    return status
+
+class SummaryWorkerPool:
+    """summary_jobs 대기열을 처리하는 워커 스레드 풀.
+
+    summarize 는 초록 문자열을 받아 요약 문자열을 반환하는 함수이며, 실패 시 예외를 발생시켜야 재시도됩니다.
+    """
+    def __init__(self, summarize, session_factory, workers: int = None, poll_interval: float = None):
+        self.summarize = summarize
+        self.session_factory = session_factory
+        self.workers = workers if workers is not None else Config.SUMMARY_WORKERS
+        self.poll_interval = poll_interval if poll_interval is not None else Config.SUMMARY_POLL_INTERVAL
+        self._threads = []
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._stats_lock = threading.Lock()
+        self.stats = {"done": 0, "retried": 0, "failed": 0}
+
+    def start(self):
+        if self._threads:
+            return self
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"summary-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"요약 워커 {self.workers}개 시작")
+        return self
+
+    def wake(self):
+        """새 작업이 등록되었음을 알려 대기 중인 워커를 즉시 깨웁니다."""
+        self._wake_event.set()
+
+    def stop(self, timeout: float = None):
+        self._stop_event.set()
+        self._wake_event.set()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def is_alive(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _run(self):
+        logger.debug(f"{threading.current_thread().name} 시작")
+        while not self._stop_event.is_set():
+            try:
+                processed = self.run_once()
+            except Exception as e:
+                logger.warning(f"요약 작업 처리 중 오류: {e}")
+                processed = False
+            if not processed:
+                self._wake_event.wait(self.poll_interval)
+                self._wake_event.clear()
+        logger.debug(f"{threading.current_thread().name} 종료")
+
+    def run_once(self) -> bool:
+        """작업 하나를 처리합니다. 처리할 작업이 없거나 요약에 실패하면 False 를 반환합니다 (워커는 잠시 대기 후 재시도)."""
+        session = self.session_factory()
+        try:
+            job = claim_summary_job(session)
+            if job is None:
+                return False
+            paper_id, abstract = job
+            logger.debug(f"요약 작업 시작 - paper_id: {paper_id}")
+            try:
+                summarized_text = self.summarize(abstract) # DB 트랜잭션 밖에서 LLM 호출
+            except Exception as e:
+                status = fail_summary_job(session, paper_id, str(e))
+                self._count("failed" if status == STATUS_FAILED else "retried")
+                logger.warning(f"요약 실패 - paper_id: {paper_id}, 상태: {status}, 오류: {e}")
+                return False
+            complete_summary_job(session, paper_id, summarized_text)
+            self._count("done")
+            logger.debug(f"요약 작업 완료 - paper_id: {paper_id}")
+            return True
+        finally:
+            session.close()
+
+_worker_pool = None
+_worker_pool_lock = threading.Lock()
+
+def start_summary_workers(summarize, session_factory=None, workers: int = None):
+    """프로세스당 하나의 요약 워커 풀을 시작합니다 (이미 실행 중이면 기존 풀을 반환). workers 가 0이면 None."""
+    global _worker_pool
+    workers = workers if workers is not None else Config.SUMMARY_WORKERS
+    if workers <= 0:
+        return None
+    with _worker_pool_lock:
+        if _worker_pool is None or not _worker_pool.is_alive():
+            _worker_pool = SummaryWorkerPool(summarize, session_factory or get_session_local(), workers=workers).start()
+    return _worker_pool
+
+def wake_summary_workers() -> bool:
+    """이 프로세스에서 요약 워커 풀이 실행 중이면 깨워 새로 등록된 작업을 바로 처리하게 합니다."""
+    pool = _worker_pool
+    if pool is None or not pool.is_alive():
+        return False
+    pool.wake()
+    return True
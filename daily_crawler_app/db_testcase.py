@@ -0,0 +1,41 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from sqlalchemy.orm import sessionmaker
+
+from crawler_src.connection import create_papers_engine
+from crawler_src.models import Base
+
+class PapersDBTestCase(unittest.TestCase):
+    """
+    임시 디렉토리의 papers.db (운영과 같은 create_papers_engine 설정) 를 쓰는 테스트 기반 클래스.
+    setUp 에서 self.tmp_dir / self.engine / self.session_factory 를 만들고, 정리는 addCleanup 으로 등록하므로
+    하위 클래스의 tearDown 에서 엔진/임시 디렉토리를 따로 정리할 필요가 없습니다.
+    """
+    create_tables = True # False 면 빈 DB (마이그레이션 테스트 등)
+    autoflush = True
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.engine = create_papers_engine(f"sqlite:///{os.path.join(self.tmp_dir.name, 'papers.db')}")
+        self.addCleanup(self.engine.dispose)
+        if self.create_tables:
+            Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine, autoflush=self.autoflush)
+
+    def open_session(self):
+        """테스트가 끝나면 (엔진 정리 전에) 닫히는 세션"""
+        session = self.session_factory()
+        self.addCleanup(session.close)
+        return session
+
+    def patch_database(self, module, **extra):
+        """module 의 get_engine / get_session_local (과 extra 의 이름=값) 이 이 테스트 DB 를 돌려주도록 패치합니다."""
+        values = {"get_engine": self.engine, "get_session_local": self.session_factory, **extra}
+        for name, value in values.items():
+            patcher = mock.patch.object(module, name, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
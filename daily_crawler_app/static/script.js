@@ -40,6 +40,49 @@ document.addEventListener('DOMContentLoaded', () => {
         console.debug("Message display set.");
     }
 
+    function formatCrawlProgress(job) {
+        const platforms = Object.entries(job.platforms || {}).map(([platform, progress]) => {
+            const limit = progress.limit ? `/${progress.limit}` : '';
+            const eta = progress.eta_seconds ? `, 약 ${Math.ceil(progress.eta_seconds)}초 남음` : '';
+            return `${platform}: ${progress.fetched}${limit} (${progress.status}, ${progress.rate}편/초${eta})`;
+        });
+        return `크롤링 ${job.status} - 총 ${job.fetched}편 수집` + (platforms.length ? ` | ${platforms.join(' | ')}` : '');
+    }
+
+    // /crawl 은 작업 ID 만 반환하므로 SSE 로 진행 상황을 받아 표시하고, 끝나면 페이지를 새로고침합니다.
+    function followCrawlJob(data) {
+        const cancelButton = document.createElement('button');
+        cancelButton.textContent = '크롤링 취소';
+        cancelButton.addEventListener('click', () => {
+            fetch(`/crawl/jobs/${data.job_id}/cancel`, { method: 'POST' });
+            cancelButton.disabled = true;
+        });
+        const progressText = document.createElement('span');
+        messageDiv.replaceChildren(progressText, cancelButton);
+        progressText.textContent = data.message;
+
+        const source = new EventSource(data.events_url);
+        source.addEventListener('progress', (event) => {
+            const job = JSON.parse(event.data);
+            console.debug("Crawl job progress:", job);
+            progressText.textContent = formatCrawlProgress(job);
+            if (job.status === 'done') {
+                source.close();
+                showMessage(job.message, 'success');
+                setTimeout(() => {
+                    window.location.reload();
+                    console.debug("Page reloaded after successful crawl.");
+                }, 1000);
+            } else if (job.status === 'failed' || job.status === 'cancelled') {
+                source.close();
+                showMessage(job.error ? `데이터 크롤링 중 오류 발생: ${job.error}` : job.message, 'error');
+            }
+        });
+        source.onerror = () => {
+            console.error("Crawl job event stream error");
+        };
+    }
+
     async function sendCrawlRequest(startDate, endDate, isInitialCrawl) {
         if (!startDate || !endDate) {
             showMessage('시작 날짜와 종료 날짜를 모두 선택해주세요.', 'error');
@@ -70,12 +113,8 @@ document.addEventListener('DOMContentLoaded', () => {
             const data = await response.json();
             console.debug("Response received:", data);
 
-            if (data.status === 'success') {
-                showMessage(data.message, 'success');
-                setTimeout(() => {
-                    window.location.reload();
-                    console.debug("Page reloaded after successful crawl.");
-                }, 1000);
+            if (data.status === 'queued') {
+                followCrawlJob(data);
             } else {
                 showMessage(data.message, 'error');
             }
@@ -0,0 +1,102 @@
+import unittest
+import asyncio
+import os
+import sys
+
+# daily_crawler_app 디렉토리를 sys.path에 추가하여 crawler_src 모듈을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from crawler_src.async_crawler import AsyncHttpClient, HostRateLimiter, HttpResponse, SyncCrawler, run_sync
+from crawler_src.multi_platform_crawler import PMCCrawler, get_crawler, get_async_crawler
+
+ESEARCH = "<eSearchResult><IdList>{ids}</IdList></eSearchResult>"
+EFETCH = """<pmc-articleset><article><front><article-meta>
+  <title-group><article-title>Article {paper_id}</article-title></title-group>
+  <abstract><p>Abstract {paper_id}</p></abstract>
+  <pub-date pub-type="epub"><year>2024</year><month>2</month><day>3</day></pub-date>
+</article-meta></front></article></pmc-articleset>"""
+
+class FakeHttp:
+    """efetch 응답을 늦게 돌려주고 동시에 처리 중인 요청 수를 기록하는 가짜 클라이언트 (slow_first 면 앞의 ID 일수록 늦음)"""
+    def __init__(self, ids, slow_first=True):
+        self.ids = ids
+        self.slow_first = slow_first
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = 0
+
+    async def get(self, url, params=None, **kwargs):
+        if "esearch" in url:
+            return HttpResponse(200, {}, ESEARCH.format(ids="".join(f"<Id>{i}</Id>" for i in self.ids)).encode(), url)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            index = self.ids.index(params["id"])
+            await asyncio.sleep(0.02 * ((len(self.ids) - index) if self.slow_first else index + 1))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        return HttpResponse(200, {}, EFETCH.format(paper_id=params["id"]).encode(), url)
+
+class TestAsyncCrawler(unittest.TestCase):
+
+    def test_rate_limiter_spaces_requests_per_host(self):
+        limiter = HostRateLimiter({"slow.example": 1.0})
+        delays = [limiter.reserve("slow.example") for _ in range(3)]
+        self.assertAlmostEqual(delays[0], 0.0, places=2)
+        self.assertAlmostEqual(delays[1], 1.0, places=2)
+        self.assertAlmostEqual(delays[2], 2.0, places=2)
+        self.assertEqual(limiter.reserve("fast.example"), 0.0)
+        self.assertAlmostEqual(limiter.reserve("fast.example", interval=0.5) + limiter.reserve("fast.example"), 0.5, places=2)
+
+    def test_client_limits_concurrency_per_host(self):
+        client = AsyncHttpClient(max_per_host=2, rate_limiter=HostRateLimiter({}))
+        active = {"a.example": 0, "b.example": 0}
+        peak = {"a.example": 0, "b.example": 0}
+
+        async def send(url, params, headers, timeout):
+            host = url.split("/")[2]
+            active[host] += 1
+            peak[host] = max(peak[host], active[host])
+            await asyncio.sleep(0.02)
+            active[host] -= 1
+            return HttpResponse(200, {}, b"{}", url)
+        client._send = send
+
+        async def fetch_all():
+            urls = [f"https://{host}/{i}" for host in active for i in range(5)]
+            return await asyncio.gather(*(client.get(url) for url in urls))
+        responses = run_sync(fetch_all())
+
+        self.assertEqual(len(responses), 10)
+        self.assertEqual(peak, {"a.example": 2, "b.example": 2})
+
+    def test_pmc_fetches_concurrently_and_keeps_search_order(self):
+        """
+        PMC efetch 요청이 동시에 진행되어도 검색 결과 순서대로 논문이 나오는지, 동기 어댑터로 사용할 수 있는지 테스트
+        """
+        crawler = get_crawler("pmc")
+        self.assertIsInstance(crawler, SyncCrawler)
+        crawler.http = FakeHttp(["1", "2", "3", "4"])
+        papers = list(crawler.crawl_papers("cancer", limit=4))
+
+        self.assertEqual([paper.paper_id for paper in papers], ["PMC1", "PMC2", "PMC3", "PMC4"])
+        self.assertEqual(papers[0].title, "Article 1")
+        self.assertGreater(crawler.http.max_in_flight, 1)
+        self.assertIsInstance(get_async_crawler("pmc"), PMCCrawler)
+
+    def test_closing_sync_iterator_cancels_pending_requests(self):
+        crawler = SyncCrawler(PMCCrawler())
+        crawler.http = FakeHttp(["1", "2", "3", "4"], slow_first=False)
+        papers = crawler.crawl_papers("cancer", limit=4)
+        self.assertEqual(next(papers).paper_id, "PMC1")
+        papers.close() # 나머지 efetch 는 아직 진행 중
+        self.assertGreater(crawler.http.cancelled, 0)
+        self.assertEqual(crawler.http.in_flight, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+import unittest
+import os
+import sys
+import threading
+from unittest import mock
+
+# daily_crawler_app 디렉토리를 sys.path에 추가하여 crawler_src 모듈을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from crawler_src import multi_platform_crawler
+from crawler_src.models import Paper
+from crawler_src.crawl_jobs import CrawlJobManager, CrawlCancelled, JOB_DONE, JOB_FAILED, JOB_CANCELLED, JOB_QUEUED
+from db_testcase import PapersDBTestCase
+
+def wait_finished(job, timeout=5):
+    version = -1
+    while job.status not in (JOB_DONE, JOB_FAILED, JOB_CANCELLED):
+        new_version = job.wait_for_change(version, timeout)
+        if new_version == version:
+            raise AssertionError(f"작업이 {timeout}초 안에 끝나지 않음 (상태: {job.status})")
+        version = new_version
+
+class TestCrawlJobManager(unittest.TestCase):
+
+    def tearDown(self):
+        if hasattr(self, "manager"):
+            self.manager.stop(timeout=5)
+
+    def start(self, runner, workers=1):
+        self.manager = CrawlJobManager(runner, workers=workers, history=10).start()
+        return self.manager
+
+    def test_progress_and_result(self):
+        """
+        runner 가 보고한 플랫폼별 진행 상황과 반환 메시지가 작업 상태에 반영되는지 테스트
+        """
+        def runner(job):
+            job.report_progress("arxiv", "start", 0, 3)
+            for count in range(1, 4):
+                job.report_progress("arxiv", "paper", count, 3)
+            job.report_progress("arxiv", "done", 3, 3)
+            job.report_progress("pmc", "error", 0, error="timeout")
+            job.saved = 2
+            return "완료"
+
+        job = self.start(runner).submit("incremental", {"max_papers": 3})
+        wait_finished(job)
+        state = job.to_dict()
+        self.assertEqual(state["status"], JOB_DONE)
+        self.assertEqual(state["message"], "완료")
+        self.assertEqual((state["fetched"], state["saved"]), (3, 2))
+        self.assertEqual(state["platforms"]["arxiv"]["status"], "done")
+        self.assertEqual(state["platforms"]["arxiv"]["eta_seconds"], 0)
+        self.assertGreater(state["platforms"]["arxiv"]["rate"], 0)
+        self.assertEqual(state["platforms"]["pmc"]["error"], "timeout")
+        self.assertEqual(self.manager.list_jobs(), [job])
+
+    def test_runner_error_marks_job_failed(self):
+        def runner(job):
+            raise RuntimeError("boom")
+
+        job = self.start(runner).submit("incremental", {})
+        wait_finished(job)
+        self.assertEqual((job.status, job.error), (JOB_FAILED, "boom"))
+
+    def test_cancel_queued_and_running_jobs(self):
+        """
+        실행 중인 작업은 다음 취소 확인 시점에 중단되고, 대기 중인 작업은 실행되지 않는지 테스트
+        """
+        started = threading.Event()
+        ran = []
+
+        def runner(job):
+            ran.append(job.id)
+            started.set()
+            while True:
+                job.check_cancelled()
+                job.cancel_event.wait(0.01)
+
+        manager = self.start(runner)
+        running = manager.submit("incremental", {})
+        queued = manager.submit("incremental", {})
+        self.assertTrue(started.wait(5))
+        self.assertEqual(queued.status, JOB_QUEUED)
+
+        self.assertTrue(manager.cancel(queued.id))
+        self.assertEqual(queued.status, JOB_CANCELLED)
+        self.assertTrue(manager.cancel(running.id))
+        wait_finished(running)
+        self.assertEqual(running.status, JOB_CANCELLED)
+        self.assertFalse(manager.cancel(running.id)) # 이미 끝난 작업
+        self.assertEqual(ran, [running.id])
+
+    def test_exclusive_job_runs_alone(self):
+        """
+        exclusive 작업(초기화 크롤링)은 실행 중인 작업이 끝난 뒤 혼자 실행되고, 뒤에 등록된 작업은 그동안 기다리는지 테스트
+        """
+        release = {name: threading.Event() for name in ("first", "initial", "after")}
+        started = {name: threading.Event() for name in release}
+        running, overlaps = set(), []
+        lock = threading.Lock()
+
+        def runner(job):
+            name = job.params["name"]
+            with lock:
+                if running and (job.exclusive or "initial" in running):
+                    overlaps.append((name, set(running)))
+                running.add(name)
+            started[name].set()
+            release[name].wait(5)
+            with lock:
+                running.discard(name)
+            return name
+
+        manager = self.start(runner, workers=2)
+        first = manager.submit("incremental", {"name": "first"})
+        self.assertTrue(started["first"].wait(5))
+        initial = manager.submit("initial", {"name": "initial"}, exclusive=True)
+        after = manager.submit("incremental", {"name": "after"})
+        self.assertFalse(started["initial"].wait(0.3)) # first 가 끝날 때까지 대기
+        release["first"].set()
+        self.assertTrue(started["initial"].wait(5))
+        self.assertFalse(started["after"].wait(0.3)) # 초기화 작업이 끝날 때까지 대기
+        release["initial"].set()
+        release["after"].set()
+        for job in (first, initial, after):
+            wait_finished(job)
+        self.assertEqual([job.status for job in (first, initial, after)], [JOB_DONE] * 3)
+        self.assertEqual(overlaps, [])
+
+class TestInitialCrawlSave(PapersDBTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.known_ids = mock.Mock()
+        self.patch_database(multi_platform_crawler, get_known_paper_ids=self.known_ids)
+        multi_platform_crawler.save_papers_to_db([{"paper_id": "old", "platform": "arxiv", "title": "Old paper"}])
+
+    def paper_ids(self):
+        session = self.session_factory()
+        try:
+            return {paper_id for (paper_id,) in session.query(Paper.paper_id)}
+        finally:
+            session.close()
+
+    def test_failed_replace_keeps_existing_papers(self):
+        """
+        초기화 저장이 실패하면 삭제도 함께 롤백되어 기존 논문이 남는지 테스트
+        """
+        with self.assertRaises(Exception):
+            multi_platform_crawler.save_papers_to_db([{"paper_id": "new", "platform": "arxiv", "title": None}],
+                                                     replace_all=True, raise_errors=True)
+        self.assertEqual(self.paper_ids(), {"old"})
+        self.known_ids.reset.assert_not_called()
+
+    def test_replace_all_swaps_papers_in_one_save(self):
+        saved = multi_platform_crawler.save_papers_to_db([{"paper_id": "new", "platform": "arxiv", "title": "New paper"}],
+                                                         replace_all=True, raise_errors=True)
+        self.assertEqual(saved, 1)
+        self.assertEqual(self.paper_ids(), {"new"})
+        self.known_ids.reset.assert_called_once()
+
+class TestMultiPlatformCrawlHooks(unittest.TestCase):
+
+    class FakeCrawler:
+        skipped_known = 0
+
+        def crawl_papers(self, query, start_date=None, end_date=None, limit=None):
+            for i in range(5):
+                yield mock.Mock(to_dict=lambda i=i: {"paper_id": f"p{i}"})
+
+    def test_progress_events_and_cancel(self):
+        events = []
+        with mock.patch.object(multi_platform_crawler, "get_crawler", return_value=self.FakeCrawler()):
+            papers = multi_platform_crawler.multi_platform_crawl("q", platforms=["arxiv"], max_results=3, skip_known=False,
+                                                                 progress_callback=lambda *args, **kwargs: events.append(args[:3]))
+            self.assertEqual(len(papers), 3)
+            self.assertEqual(events[0], ("arxiv", "start", 0))
+            self.assertEqual(events[-1], ("arxiv", "done", 3))
+
+            def cancel_after_two():
+                if len(events) > 2:
+                    raise CrawlCancelled("취소")
+            events.clear()
+            with self.assertRaises(CrawlCancelled):
+                multi_platform_crawler.multi_platform_crawl("q", platforms=["arxiv"], max_results=5, skip_known=False,
+                                                            progress_callback=lambda *args, **kwargs: events.append(args[:3]),
+                                                            cancel_check=cancel_after_two)
+            self.assertNotIn(("arxiv", "done", 5), events)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+# daily_crawler_app 디렉토리를 sys.path에 추가하여 crawler_src 모듈을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from crawler_src.models import Paper, CrawlRun
+from crawler_src.crawl_scheduler import (
+    CronSchedule, CrawlScheduler, host_offsets, begin_crawl_run, run_scheduled_crawl, recent_crawl_runs,
+    RUN_DONE, RUN_FAILED, RUN_SKIPPED,
+)
+from db_testcase import PapersDBTestCase
+
+class TestCronSchedule(unittest.TestCase):
+
+    def test_next_after(self):
+        """
+        매일/단계/요일 cron 식의 다음 실행 시각 계산 테스트
+        """
+        now = datetime(2026, 3, 4, 3, 0, 30) # 수요일
+        self.assertEqual(CronSchedule("0 3 * * *").next_after(now), datetime(2026, 3, 5, 3, 0))
+        self.assertEqual(CronSchedule("*/15 * * * *").next_after(now), datetime(2026, 3, 4, 3, 15))
+        self.assertEqual(CronSchedule("30 6 * * 1-5").next_after(datetime(2026, 3, 6, 7, 0)), datetime(2026, 3, 9, 6, 30)) # 금 -> 월
+        self.assertEqual(CronSchedule("0 0 29 2 *").next_after(now), datetime(2028, 2, 29, 0, 0))
+
+    def test_invalid_expression(self):
+        for expression in ("0 3 * *", "60 * * * *", "0 3 * * 7"):
+            with self.assertRaises(ValueError):
+                CronSchedule(expression)
+
+    def test_same_host_platforms_are_staggered(self):
+        offsets = host_offsets(["arxiv", "pmc", "arxiv_rss"], stagger=300)
+        self.assertEqual(offsets, {"arxiv": 0, "pmc": 0, "arxiv_rss": 300}) # arxiv 와 arxiv_rss 는 같은 호스트
+
+class TestScheduledCrawl(PapersDBTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.windows = []
+
+    def crawl(self, query, platforms, start_date, end_date, max_results):
+        self.windows.append((start_date, end_date))
+        return [{"paper_id": "n1"}, {"paper_id": "n2"}, {"paper_id": "old"}]
+
+    def save(self, papers):
+        session = self.session_factory()
+        session.add_all([Paper(paper_id="n1", title="new", crawled_date=datetime.now()),
+                         Paper(paper_id="n2", title="new", crawled_date=datetime.now(), embedding=[0.5])])
+        session.commit()
+        session.close()
+        return 2
+
+    def test_run_records_stats_and_embeds_new_papers(self):
+        """
+        실행 기록에 수집/신규/수율이 남고, 임베딩이 없는 새 논문만 임베딩되며, 다음 실행은 이전 window_end 부터인지 테스트
+        """
+        result = run_scheduled_crawl("arxiv", session_factory=self.session_factory, crawl=self.crawl, save=self.save, embed=lambda text: [1.0])
+        self.assertEqual(result["status"], RUN_DONE)
+        self.assertEqual((result["fetched"], result["saved"], result["embedded"], result["yield"]), (3, 2, 1, 0.667))
+        self.assertIsNotNone(result["duration_seconds"])
+
+        session = self.session_factory()
+        self.assertEqual(session.get(Paper, "n1").embedding, [1.0])
+        self.assertEqual(session.get(Paper, "n2").embedding, [0.5])
+        session.close()
+
+        run_scheduled_crawl("arxiv", session_factory=self.session_factory, crawl=self.crawl, save=lambda papers: 0, embed=lambda text: [1.0])
+        self.assertEqual(self.windows[1][0], self.windows[0][1]) # 증분: 이전 실행 종료 시점부터
+
+    def test_skip_while_previous_run_in_progress(self):
+        session = self.session_factory()
+        self.assertIsNotNone(begin_crawl_run(session, "pmc"))
+        self.assertIsNone(begin_crawl_run(session, "pmc"))
+        self.assertEqual([run["status"] for run in recent_crawl_runs(session, "pmc")], [RUN_SKIPPED, "running"])
+        # 오래 running 으로 남은 실행 (프로세스 종료) 은 무시
+        session.query(CrawlRun).update({CrawlRun.started_at: datetime.now() - timedelta(days=1)})
+        session.commit()
+        self.assertIsNotNone(begin_crawl_run(session, "pmc"))
+        session.close()
+
+    def test_failed_crawl_is_recorded(self):
+        def crawl(**kwargs):
+            raise RuntimeError("boom")
+        result = run_scheduled_crawl("plos", session_factory=self.session_factory, crawl=crawl, save=self.save, embed=lambda text: [1.0])
+        self.assertEqual((result["status"], result["error"]), (RUN_FAILED, "boom"))
+
+class TestCrawlScheduler(unittest.TestCase):
+
+    def test_due_platforms_run_once_and_overlaps_are_skipped(self):
+        """
+        예약 시각이 지난 플랫폼만 실행하고, 같은 플랫폼이 아직 실행 중이면 다음 예약을 건너뛰는지 테스트
+        """
+        release = threading.Event()
+        calls = []
+
+        def runner(platform, scheduled_for):
+            calls.append((platform, scheduled_for))
+            release.wait(5)
+
+        start = datetime(2026, 3, 4, 2, 59, 30)
+        scheduler = CrawlScheduler({"arxiv": "0 3 * * *", "arxiv_rss": "0 3 * * *", "pmc": "* * * * *"},
+                                   runner=runner, stagger=60, clock=lambda: start)
+        scheduler._executor = ThreadPoolExecutor(max_workers=3)
+        try:
+            self.assertEqual(scheduler.run_pending(datetime(2026, 3, 4, 3, 0)), ["arxiv", "pmc"]) # arxiv_rss 는 같은 호스트라 1분 뒤
+            self.assertEqual(scheduler.run_pending(datetime(2026, 3, 4, 3, 1)), ["arxiv_rss"]) # pmc 는 아직 실행 중이라 건너뜀
+            self.assertEqual(scheduler.stats, {"triggered": 3, "skipped": 1})
+            self.assertEqual(scheduler.status()["running"], ["arxiv", "arxiv_rss", "pmc"])
+        finally:
+            release.set()
+            scheduler._executor.shutdown(wait=True)
+        self.assertEqual(sorted(calls), [("arxiv", datetime(2026, 3, 4, 3, 0)), ("arxiv_rss", datetime(2026, 3, 4, 3, 1)),
+                                         ("pmc", datetime(2026, 3, 4, 3, 0))])
+        self.assertEqual(scheduler.next_runs["arxiv"], datetime(2026, 3, 5, 3, 0))
+        self.assertEqual(scheduler.status()["running"], [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,257 @@
+import unittest
+import os
+import sys
+import time
+from unittest import mock
+from datetime import datetime, timedelta
+
+from sqlalchemy import text, tuple_
+
+# daily_crawler_app 디렉토리를 sys.path에 추가하여 crawler_src 모듈을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from crawler_src.config import Config
+from crawler_src.models import Paper, PaperCategory, PaperAuthor
+from crawler_src.sqlite_profile import run_sqlite_maintenance, SQLiteMaintenanceThread
+from crawler_src.migrations import run_migrations, get_schema_version, LATEST_SCHEMA_VERSION
+from crawler_src.queries import set_paper_terms, filter_by_category, paper_list_columns, paginate_papers, encode_cursor
+from db_testcase import PapersDBTestCase
+
+class TestSQLiteProfile(PapersDBTestCase):
+
+    def test_pragmas_applied_on_connect(self):
+        """
+        공용 엔진으로 연 모든 커넥션에 WAL 및 성능 pragma 가 적용되는지 테스트
+        """
+        with self.engine.connect() as conn:
+            self.assertEqual(conn.execute(text("PRAGMA journal_mode")).scalar(), "wal")
+            self.assertEqual(conn.execute(text("PRAGMA synchronous")).scalar(), 1) # NORMAL
+            self.assertEqual(conn.execute(text("PRAGMA temp_store")).scalar(), 2) # MEMORY
+            self.assertEqual(conn.execute(text("PRAGMA busy_timeout")).scalar(), Config.DB_BUSY_TIMEOUT_MS)
+            self.assertEqual(conn.execute(text("PRAGMA cache_size")).scalar(), -Config.SQLITE_CACHE_SIZE_KB)
+
+    def test_reader_not_blocked_by_open_write_transaction(self):
+        """
+        쓰기 트랜잭션이 열려 있는 동안에도 다른 커넥션에서 읽기가 가능한지 테스트 (WAL)
+        """
+        writer = self.engine.connect()
+        try:
+            writer.begin()
+            writer.execute(text("INSERT INTO papers (paper_id, title) VALUES ('w1', 'writer')"))
+            with self.engine.connect() as reader:
+                self.assertEqual(reader.execute(text("SELECT COUNT(*) FROM papers")).scalar(), 0)
+        finally:
+            writer.rollback()
+            writer.close()
+
+    def test_maintenance_runs_checkpoint_and_optimize(self):
+        """
+        wal_checkpoint 및 optimize 유지보수 작업이 오류 없이 실행되는지 테스트
+        """
+        with self.engine.begin() as conn:
+            conn.execute(text("INSERT INTO papers (paper_id, title) VALUES ('m1', 'maintenance')"))
+        run_sqlite_maintenance(self.engine, optimize=True)
+
+    def test_optimize_every_zero_only_checkpoints(self):
+        """
+        SQLITE_OPTIMIZE_EVERY 가 0 이면 optimize 없이 체크포인트만 실행되는지 테스트
+        """
+        calls = []
+        thread = SQLiteMaintenanceThread(self.engine, interval=0.01, optimize_every=0)
+        with mock.patch("crawler_src.sqlite_profile.run_sqlite_maintenance", side_effect=lambda engine, optimize: calls.append(optimize)):
+            thread.start()
+            while len(calls) < 3 and thread.is_alive():
+                time.sleep(0.01)
+            thread.stop()
+            thread.join()
+        self.assertGreaterEqual(len(calls), 3)
+        self.assertFalse(any(calls))
+
+class TestQueryPlans(PapersDBTestCase):
+    """
+    핫 쿼리들이 테이블 풀 스캔 대신 보조 인덱스를 사용하는지 확인하는 쿼리 플랜 회귀 테스트
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.session = self.open_session()
+        base_date = datetime(2024, 6, 1)
+        self.session.add_all([
+            Paper(paper_id=f"p{i}", platform=["arxiv", "pmc", "plos"][i % 3], title=f"paper {i}",
+                  published_date=base_date + timedelta(hours=i), crawled_date=base_date + timedelta(hours=i))
+            for i in range(200)
+        ])
+        self.session.flush()
+        for i in range(200):
+            set_paper_terms(self.session, f"p{i}", ["cs.AI" if i % 2 else "q-bio.NC", "cs.LG"], [f"author {i}"])
+        self.session.commit()
+        self.session.execute(text("ANALYZE"))
+
+    def _plan(self, query):
+        compiled = query.statement.compile(self.engine, compile_kwargs={"literal_binds": True})
+        rows = self.session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).fetchall()
+        return " | ".join(row[-1] for row in rows)
+
+    def assertUsesIndex(self, query, index_name):
+        plan = self._plan(query)
+        self.assertIn(index_name, plan, f"인덱스 미사용 플랜: {plan}")
+        self.assertNotIn("TEMP B-TREE", plan, f"정렬용 임시 B-tree 사용: {plan}")
+
+    def test_latest_papers_order_by_published_date(self):
+        query = self.session.query(Paper).order_by(Paper.published_date.desc()).limit(20)
+        self.assertUsesIndex(query, "ix_papers_published_date_paper_id")
+
+    def test_published_date_range_filter(self):
+        target = datetime(2024, 6, 3)
+        query = self.session.query(Paper).filter(Paper.published_date >= target,
+                                                 Paper.published_date < target + timedelta(days=1))
+        self.assertUsesIndex(query, "ix_papers_published_date_paper_id")
+
+    def test_crawled_date_range_filter(self):
+        target = datetime(2024, 6, 3)
+        query = self.session.query(Paper).filter(Paper.crawled_date >= target,
+                                                 Paper.crawled_date < target + timedelta(days=1))
+        self.assertUsesIndex(query, "ix_papers_crawled_date")
+
+    def test_latest_crawled_date_lookup(self):
+        query = self.session.query(Paper).order_by(Paper.crawled_date.desc()).limit(1)
+        self.assertUsesIndex(query, "ix_papers_crawled_date")
+
+    def test_platform_filter_ordered_by_date(self):
+        query = self.session.query(Paper).filter(Paper.platform == "pmc").order_by(Paper.published_date.desc())
+        self.assertUsesIndex(query, "ix_papers_platform_published_date")
+
+    def test_category_filter_uses_join_table_index(self):
+        target = datetime(2024, 6, 3)
+        query = filter_by_category(self.session.query(Paper), "cs.AI").filter(
+            Paper.crawled_date >= target, Paper.crawled_date < target + timedelta(days=1))
+        plan = self._plan(query)
+        self.assertIn("ix_paper_categories_category_paper_id", plan, f"인덱스 미사용 플랜: {plan}")
+        self.assertNotIn("SCAN papers", plan, f"papers 전체 스캔 플랜: {plan}")
+        self.assertEqual(query.count(), 12)
+
+    def test_keyset_page_seeks_index(self):
+        query = self.session.query(*paper_list_columns()).filter(
+            tuple_(Paper.published_date, Paper.paper_id) < (datetime(2024, 6, 5), "p50")
+        ).order_by(Paper.published_date.desc(), Paper.paper_id.desc()).limit(21)
+        plan = self._plan(query)
+        self.assertIn("SEARCH papers USING INDEX ix_papers_published_date_paper_id", plan)
+        self.assertNotIn("TEMP B-TREE", plan, f"정렬용 임시 B-tree 사용: {plan}")
+
+class TestPagination(PapersDBTestCase):
+    """
+    (published_date, paper_id) 키셋 페이지네이션이 누락/중복 없이 전체 목록을 순회하는지 테스트
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.session = self.open_session()
+        base_date = datetime(2024, 6, 1)
+        # 같은 날짜를 공유하는 논문과 published_date 가 없는 논문을 섞어 둠
+        self.session.add_all([
+            Paper(paper_id=f"p{i:03d}", title=f"paper {i}", embedding=[0.1] * 8,
+                  published_date=None if i % 10 == 0 else base_date + timedelta(days=i % 7))
+            for i in range(95)
+        ])
+        self.session.commit()
+
+    def test_walks_all_pages_in_order(self):
+        papers = self.session.query(Paper).all()
+        papers.sort(key=lambda p: (p.published_date is not None, p.published_date or datetime.min, p.paper_id), reverse=True)
+        expected = [paper.paper_id for paper in papers]
+
+        seen, cursor, pages = [], None, 0
+        while True:
+            rows, cursor = paginate_papers(self.session.query(*paper_list_columns()), page_size=20, cursor=cursor)
+            seen.extend(row.paper_id for row in rows)
+            pages += 1
+            if cursor is None:
+                break
+        self.assertEqual(seen, expected)
+        self.assertEqual(pages, 5)
+
+    def test_projection_excludes_heavy_columns(self):
+        rows, _ = paginate_papers(self.session.query(*paper_list_columns()), page_size=5)
+        self.assertNotIn("embedding", rows[0]._mapping)
+        rows, _ = paginate_papers(self.session.query(*paper_list_columns(include=("embedding",))), page_size=5)
+        self.assertEqual(rows[0].embedding, [0.1] * 8)
+
+    def test_invalid_cursor_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            paginate_papers(self.session.query(Paper), cursor="not-a-cursor")
+        rows, cursor = paginate_papers(self.session.query(Paper), cursor=encode_cursor(None, "p000"))
+        self.assertEqual((rows, cursor), ([], None))
+
+class TestPaperTerms(PapersDBTestCase):
+    """
+    papers.categories / authors JSON 과 조인 테이블이 동기화되는지 테스트
+    """
+
+    autoflush = False
+
+    def setUp(self):
+        super().setUp()
+        self.session = self.open_session()
+
+    def test_set_paper_terms_replaces_rows(self):
+        self.session.add(Paper(paper_id="t1", title="terms", categories=["cs.AI", "cs.AI", ""], authors=["Kim", "Lee"]))
+        set_paper_terms(self.session, "t1", ["cs.AI", "cs.AI", ""], ["Kim", "Lee"])
+        set_paper_terms(self.session, "t1", ["cs.CL"], ["Park"]) # 같은 세션에서 재저장해도 기본키 충돌 없음
+        self.session.commit()
+        categories = [row.category for row in self.session.query(PaperCategory).filter_by(paper_id="t1")]
+        authors = [(row.position, row.name) for row in self.session.query(PaperAuthor).filter_by(paper_id="t1")]
+        self.assertEqual(categories, ["cs.CL"])
+        self.assertEqual(authors, [(0, "Park")])
+        self.assertEqual(filter_by_category(self.session.query(Paper), "cs.CL").one().paper_id, "t1")
+        self.assertEqual(filter_by_category(self.session.query(Paper), "cs.AI").count(), 0)
+
+class TestMigrations(PapersDBTestCase):
+    create_tables = False
+
+    def test_legacy_schema_is_upgraded(self):
+        """
+        인덱스와 summarized_abstract 컬럼이 없는 기존 papers.db 가 마이그레이션되는지 테스트
+        """
+        with self.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE papers (paper_id VARCHAR PRIMARY KEY, platform VARCHAR, title TEXT, "
+                              "published_date DATETIME, crawled_date DATETIME)"))
+        self.assertEqual(run_migrations(self.engine), LATEST_SCHEMA_VERSION)
+        with self.engine.connect() as conn:
+            indexes = {row[1] for row in conn.execute(text("PRAGMA index_list(papers)"))}
+            columns = {row[1] for row in conn.execute(text("PRAGMA table_info(papers)"))}
+            self.assertEqual(get_schema_version(conn), LATEST_SCHEMA_VERSION)
+        self.assertTrue({index.name for index in Paper.__table__.indexes} <= indexes)
+        self.assertIn("summarized_abstract", columns)
+        # 두 번째 실행은 아무것도 하지 않아야 함
+        self.assertEqual(run_migrations(self.engine), LATEST_SCHEMA_VERSION)
+
+    def test_category_tables_backfilled_from_json(self):
+        """
+        기존 논문의 categories / authors JSON 이 저장 시와 같은 규칙으로 조인 테이블에 백필되는지 테스트
+        """
+        with self.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE papers (paper_id VARCHAR PRIMARY KEY, title TEXT, authors JSON, categories JSON, "
+                              "published_date DATETIME, crawled_date DATETIME)"))
+            conn.execute(text("INSERT INTO papers (paper_id, title, authors, categories) VALUES "
+                              "('a', 'A', '[\"Kim\", \"\", null, \" Lee \", \"Kim\"]', '[\"cs.AI\", \"cs.LG\", \" cs.AI\"]'), "
+                              "('b', 'B', 'not json', '\"cs.AI\"'), "
+                              "('c', 'C', NULL, '[\"cs.LG\"]')"))
+            conn.execute(text("PRAGMA user_version = 2"))
+        self.assertEqual(run_migrations(self.engine), LATEST_SCHEMA_VERSION)
+        with self.engine.connect() as conn:
+            categories = conn.execute(text("SELECT paper_id, category FROM paper_categories ORDER BY paper_id, category")).fetchall()
+            authors = conn.execute(text("SELECT paper_id, position, name FROM paper_authors ORDER BY paper_id, position")).fetchall()
+        self.assertEqual([tuple(row) for row in categories], [("a", "cs.AI"), ("a", "cs.LG"), ("c", "cs.LG")])
+        self.assertEqual([tuple(row) for row in authors], [("a", 0, "Kim"), ("a", 1, "Lee")]) # 빈 값/중복 제거 후 0 부터 번호
+
+        # 다음 저장(set_paper_terms) 과 같은 행이어야 함
+        session = self.open_session()
+        set_paper_terms(session, "a", ["cs.AI", "cs.LG", " cs.AI"], ["Kim", "", None, " Lee ", "Kim"])
+        session.commit()
+        self.assertEqual([(row.position, row.name) for row in session.query(PaperAuthor).filter_by(paper_id="a").order_by(PaperAuthor.position)],
+                         [(0, "Kim"), (1, "Lee")])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+import os
+import sys
+from datetime import datetime
+
+from sqlalchemy import and_
+
+# daily_crawler_app 디렉토리를 sys.path에 추가하여 crawler_src 모듈을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from crawler_src import multi_platform_crawler
+from crawler_src.models import Paper, SummaryJob
+from crawler_src.queries import one_per_duplicate_group
+from crawler_src.dedup import MinHasher, shingles, estimate_similarity, extract_doi, rebuild_dedup_index
+from db_testcase import PapersDBTestCase
+
+ABSTRACT = ("We propose a transformer architecture for protein structure prediction that combines "
+            "evolutionary couplings with geometric attention and outperforms previous methods on CASP benchmarks "
+            "while requiring an order of magnitude less compute during training and inference.")
+
+def paper(paper_id, platform, title="Geometric Attention for Protein Structure Prediction", abstract=ABSTRACT, **fields):
+    return {"paper_id": paper_id, "platform": platform, "title": title, "abstract": abstract, **fields}
+
+class TestMinHash(unittest.TestCase):
+
+    def test_similarity_estimate(self):
+        """
+        조금 다른 표기(대소문자, 구두점, HTML)의 같은 초록은 유사도가 높고, 다른 초록은 낮은지 테스트
+        """
+        hasher = MinHasher(num_perm=128, bands=16)
+        original = hasher.signature(shingles(ABSTRACT))
+        reformatted = hasher.signature(shingles("<p>" + ABSTRACT.upper().replace(",", " ,") + "</p>"))
+        edited_shingles = shingles(ABSTRACT.replace("an order of magnitude", "ten times"))
+        edited = hasher.signature(edited_shingles)
+        jaccard = len(shingles(ABSTRACT) & edited_shingles) / len(shingles(ABSTRACT) | edited_shingles)
+        other = hasher.signature(shingles("Large language models can be steered with sparse autoencoder features "
+                                          "to reduce hallucination in retrieval augmented question answering."))
+        self.assertEqual(estimate_similarity(original, reformatted), 1.0)
+        self.assertAlmostEqual(estimate_similarity(original, edited), jaccard, delta=0.15) # 128개 해시의 표준오차 약 0.04
+        self.assertLess(estimate_similarity(original, other), 0.1)
+        self.assertEqual(len(set(hasher.band_keys(original)) & set(hasher.band_keys(reformatted))), 16)
+        self.assertFalse(set(hasher.band_keys(original)) & set(hasher.band_keys(other)))
+        # 서명은 프로세스와 무관하게 결정적이어야 함 (DB 에 저장된 서명과 비교)
+        self.assertTrue((MinHasher(num_perm=128, bands=16).signature(shingles(ABSTRACT)) == original).all())
+
+    def test_extract_doi(self):
+        self.assertEqual(extract_doi({"external_id": "10.1101/2024.01.02.573913"}), "10.1101/2024.01.02.573913")
+        self.assertEqual(extract_doi({"doi": "https://doi.org/10.1371/JOURNAL.PONE.0301234."}), "10.1371/journal.pone.0301234")
+        self.assertIsNone(extract_doi({"external_id": "2401.01234"}))
+
+class TestSaveLinksDuplicates(PapersDBTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.patch_database(multi_platform_crawler)
+
+    def canonical_ids(self):
+        session = self.session_factory()
+        try:
+            return dict(session.query(Paper.paper_id, Paper.canonical_id))
+        finally:
+            session.close()
+
+    def test_cross_platform_duplicates_link_to_first_paper(self):
+        """
+        같은 논문의 다른 플랫폼 레코드는 먼저 저장된 논문에 연결되고, 대표 논문만 요약 대기열에 등록되는지 테스트
+        """
+        multi_platform_crawler.save_papers_to_db([
+            paper("2401.01234", "arxiv", external_id="2401.01234"),
+            paper("biorxiv_10.1101_2024.01.02.573913", "biorxiv", title="Geometric attention for protein structure prediction.",
+                  external_id="10.1101/2024.01.02.573913"),
+            paper("other", "arxiv", title="Sparse autoencoders", abstract="Steering language models with sparse features."),
+        ])
+        multi_platform_crawler.save_papers_to_db([
+            # 초록이 없는 레코드도 DOI 로 연결
+            paper("PMC123", "pmc", abstract="", doi="https://doi.org/10.1101/2024.01.02.573913"),
+        ])
+        self.assertEqual(self.canonical_ids(), {
+            "2401.01234": None,
+            "biorxiv_10.1101_2024.01.02.573913": "2401.01234",
+            "other": None,
+            "PMC123": "2401.01234", # 대표 논문(체인이 아닌 루트)을 가리킴
+        })
+        session = self.session_factory()
+        self.assertEqual(sorted(paper_id for (paper_id,) in session.query(SummaryJob.paper_id)), ["2401.01234", "other"])
+
+        # 재구성해도 같은 결과
+        self.assertEqual(rebuild_dedup_index(session), {"papers": 4, "linked": 2})
+        session.close()
+        self.assertEqual(self.canonical_ids()["PMC123"], "2401.01234")
+
+    def test_one_per_duplicate_group_picks_representative_in_window(self):
+        """
+        대표 논문이 결과 범위(날짜) 밖에 있으면 범위 안의 연결 논문 하나가 대신 포함되는지 테스트
+        """
+        session = self.session_factory()
+        session.add_all([
+            Paper(paper_id="a", title="a", crawled_date=datetime(2024, 1, 1)),
+            Paper(paper_id="a_pmc", title="a", canonical_id="a", crawled_date=datetime(2024, 1, 2)),
+            Paper(paper_id="a_biorxiv", title="a", canonical_id="a", crawled_date=datetime(2024, 1, 2)),
+            Paper(paper_id="b", title="b", crawled_date=datetime(2024, 1, 2)),
+            Paper(paper_id="b_pmc", title="b", canonical_id="b", crawled_date=datetime(2024, 1, 2)),
+        ])
+        session.commit()
+
+        def ids_on(day):
+            window = lambda paper: and_(paper.crawled_date >= datetime(2024, 1, day), paper.crawled_date < datetime(2024, 1, day + 1))
+            query = session.query(Paper.paper_id).filter(window(Paper), one_per_duplicate_group(window))
+            return sorted(paper_id for (paper_id,) in query)
+
+        self.assertEqual(ids_on(1), ["a"])
+        self.assertEqual(ids_on(2), ["a_biorxiv", "b"])
+        session.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+import unittest
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# daily_crawler_app 디렉토리를 sys.path에 추가하여 crawler_src 모듈을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from crawler_src.blob_store import BlobStore, sha256_file
+from crawler_src.fulltext import FullTextPipeline, PdfDownloader, search_fulltext, STATUS_INDEXED, STATUS_FAILED
+from crawler_src.http_sessions import create_http_session
+from crawler_src.models import Paper, PaperFullText, PdfBlob
+from crawler_src.summary_queue import enqueue_summary_jobs, claim_summary_job
+from db_testcase import PapersDBTestCase
+
+def fake_pdf(words: str) -> bytes:
+    return b"%PDF-1.4\n" + (words + " ") .encode() * 200
+
+def fake_extract(path, max_chars):
+    """pypdf 대신 가짜 PDF 의 본문을 그대로 돌려주는 추출기"""
+    with open(path, "rb") as f:
+        return {"text": f.read()[len(b"%PDF-1.4\n"):].decode()[:max_chars], "page_count": 1}
+
+class PdfHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    files = {}
+    requests_seen = []
+    drop_first = set() # 첫 응답을 절반만 보내고 연결을 끊을 경로
+
+    def do_GET(self):
+        self.requests_seen.append((self.path, self.headers.get("Range")))
+        body = self.files.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+        if self.path in self.drop_first:
+            self.drop_first.discard(self.path)
+            self.wfile.write(body[start:start + (len(body) - start) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body[start:])
+
+    def log_message(self, *args):
+        pass
+
+class TestFullText(PapersDBTestCase):
+    autoflush = False
+
+    def setUp(self):
+        super().setUp()
+        self.store = BlobStore(os.path.join(self.tmp_dir.name, "blobs"))
+
+        PdfHandler.files = {"/a.pdf": fake_pdf("transformer attention"), "/mirror-a.pdf": fake_pdf("transformer attention"),
+                            "/b.pdf": fake_pdf("protein folding"), "/html": b"<html>not a pdf</html>"}
+        PdfHandler.requests_seen = []
+        PdfHandler.drop_first = set()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), PdfHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.http_session = create_http_session()
+
+    def tearDown(self):
+        self.http_session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def add_papers(self, urls: dict):
+        session = self.session_factory()
+        session.add_all(Paper(paper_id=paper_id, title=f"title {paper_id}", abstract=f"abstract {paper_id}", pdf_url=self.base_url + path)
+                        for paper_id, path in urls.items())
+        session.commit()
+        session.close()
+
+    def pipeline(self):
+        downloader = PdfDownloader(self.store, session=self.http_session)
+        return FullTextPipeline(self.session_factory, self.store, downloader, download_workers=4,
+                                extract=fake_extract, extract_executor=ThreadPoolExecutor(max_workers=2))
+
+    def test_resumes_interrupted_download_with_range(self):
+        """
+        전송이 중간에 끊기면 받은 만큼부터 Range 요청으로 이어 받는지 테스트
+        """
+        PdfHandler.drop_first = {"/a.pdf"}
+        downloader = PdfDownloader(self.store, session=self.http_session, chunk_size=256)
+        sha256 = downloader.download(self.base_url + "/a.pdf")
+
+        with open(self.store.path_for(sha256), "rb") as f:
+            self.assertEqual(f.read(), PdfHandler.files["/a.pdf"])
+        self.assertEqual(sha256_file(self.store.path_for(sha256)), sha256)
+        self.assertEqual(downloader.stats["resumed"], 1)
+        self.assertIsNone(PdfHandler.requests_seen[0][1])
+        offset = int(PdfHandler.requests_seen[1][1].split("=")[1].rstrip("-")) # 끊기기 전까지 받은 청크 크기 단위
+        self.assertTrue(0 < offset <= len(PdfHandler.files["/a.pdf"]) // 2)
+
+    def test_pipeline_indexes_and_never_downloads_twice(self):
+        """
+        같은 pdf_url 은 한 번만 받고, 내용이 같은 PDF 는 blob 하나로 저장/추출하며, 다시 실행해도 다운로드하지 않는지 테스트
+        """
+        self.add_papers({"p1": "/a.pdf", "p2": "/a.pdf", "p3": "/mirror-a.pdf", "p4": "/b.pdf"})
+        stats = self.pipeline().run()
+
+        self.assertEqual(stats["downloaded"], 3) # 고유 URL 수
+        self.assertEqual(stats["extracted"], 2) # 고유 내용 수
+        self.assertEqual(stats["indexed"], 4)
+        session = self.session_factory()
+        self.assertEqual(session.query(PdfBlob).count(), 2)
+        self.assertEqual({row.status for row in session.query(PaperFullText)}, {STATUS_INDEXED})
+        self.assertEqual({result["paper_id"] for result in search_fulltext(session, "transformer")}, {"p1", "p2", "p3"})
+        self.assertEqual([result["paper_id"] for result in search_fulltext(session, "protein folding")], ["p4"])
+        self.assertEqual(search_fulltext(session, '"unbalanced (query'), [])
+
+        # 새 논문이 이미 받은 URL 을 가리키면 다시 받지 않고 기존 본문으로 색인
+        session.add(Paper(paper_id="p5", title="title p5", abstract="abstract p5", pdf_url=self.base_url + "/b.pdf"))
+        session.commit()
+        session.close()
+        requests_before = len(PdfHandler.requests_seen)
+        stats = self.pipeline().run()
+        self.assertEqual(len(PdfHandler.requests_seen), requests_before)
+        self.assertEqual((stats["selected"], stats["reused"], stats["downloaded"], stats["indexed"]), (1, 1, 0, 1))
+
+    def test_non_pdf_response_marks_failed(self):
+        """
+        PDF 가 아닌 응답은 저장하지 않고 실패로 기록하는지 테스트
+        """
+        self.add_papers({"bad": "/html", "missing": "/nope.pdf"})
+        stats = self.pipeline().run()
+
+        self.assertEqual(stats["failed"], 2)
+        session = self.session_factory()
+        rows = {row.paper_id: row for row in session.query(PaperFullText)}
+        self.assertEqual({row.status for row in rows.values()}, {STATUS_FAILED})
+        self.assertEqual(rows["bad"].attempts, 1)
+        self.assertEqual(session.query(PdfBlob).count(), 0)
+        session.close()
+
+    def test_summary_uses_fulltext(self):
+        """
+        본문이 색인된 논문은 요약 입력에 본문이 포함되는지 테스트
+        """
+        self.add_papers({"p1": "/a.pdf", "p2": "/b.pdf"})
+        self.pipeline().run(paper_ids=["p1"])
+        session = self.session_factory()
+        enqueue_summary_jobs(session, ["p1", "p2"])
+        session.commit()
+
+        inputs = dict([claim_summary_job(session), claim_summary_job(session)])
+        self.assertTrue(inputs["p1"].startswith("abstract p1"))
+        self.assertIn("transformer attention", inputs["p1"])
+        self.assertEqual(inputs["p2"], "abstract p2")
+        session.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import unittest
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import requests
+
+# daily_crawler_app 디렉토리를 sys.path에 추가하여 crawler_src 모듈을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from crawler_src.async_crawler import HttpResponse, run_sync
+from crawler_src.http_retry import (CircuitBreaker, CircuitOpenError, ResilientHttp, RetriesExhausted, RetryPolicy,
+                                    BREAKER_CLOSED, BREAKER_HALF_OPEN, BREAKER_OPEN)
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def responses(*statuses, retry_after=None):
+    return iter([HttpResponse(status, {"Retry-After": retry_after} if retry_after else {}, b"", "https://h.example") for status in statuses])
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_retry_after_and_jittered_backoff(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=10.0, max_retry_after=30.0)
+        self.assertEqual(policy.delay_for(0, "7"), 7.0)
+        self.assertEqual(policy.delay_for(0, "3600"), 30.0) # 상한
+        http_date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=20), usegmt=True)
+        self.assertAlmostEqual(policy.delay_for(0, http_date), 20.0, delta=2.0)
+        delays = [policy.delay_for(attempt) for attempt in (0, 3, 10) for _ in range(50)]
+        self.assertTrue(all(0 <= delay <= 1.0 for delay in delays[:50]))
+        self.assertTrue(all(0 <= delay <= 8.0 for delay in delays[50:100]))
+        self.assertTrue(all(0 <= delay <= 10.0 for delay in delays[100:]))
+        self.assertGreater(len(set(delays)), 100) # 지터
+
+class TestResilientHttp(unittest.TestCase):
+
+    def setUp(self):
+        self.sleeps = []
+        self.resilient = ResilientHttp(RetryPolicy(max_retries=3, base_delay=0.5), sleep=self.sleeps.append,
+                                       breaker_factory=lambda: CircuitBreaker(failure_threshold=10, reset_timeout=60))
+
+    def test_honours_retry_after_then_succeeds(self):
+        """
+        429 응답의 Retry-After 만큼 기다린 뒤 다시 요청하고, 재시도 지표가 기록되는지 테스트
+        """
+        pending = responses(429, 200, retry_after="4")
+        response = self.resilient.call("h.example", lambda: next(pending))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.sleeps, [4.0])
+        metrics = self.resilient.metrics.snapshot()["h.example"]
+        self.assertEqual((metrics["requests"], metrics["attempts"], metrics["retries"], metrics["retry_after_honoured"], metrics["successes"]),
+                         (1, 2, 1, 1, 1))
+        self.assertEqual(metrics["statuses"], {"429": 1, "200": 1})
+
+    def test_returns_last_response_when_retries_run_out(self):
+        pending = responses(503, 503, 503, 503)
+        response = self.resilient.call("h.example", lambda: next(pending))
+        self.assertEqual(response.status_code, 503) # 호출자가 raise_for_status 로 처리
+        self.assertEqual(len(self.sleeps), 3)
+        self.assertEqual(self.resilient.metrics.snapshot()["h.example"]["failures"], 1)
+
+    def test_client_errors_are_not_retried(self):
+        pending = responses(404)
+        self.assertEqual(self.resilient.call("h.example", lambda: next(pending)).status_code, 404)
+        self.assertEqual(self.sleeps, [])
+
+    def test_connection_errors_are_retried(self):
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise requests.ConnectionError("reset")
+            return HttpResponse(200, {}, b"ok", "https://h.example")
+        self.assertEqual(self.resilient.call("h.example", flaky, retry_exceptions=(requests.RequestException,)).content, b"ok")
+
+        def down():
+            raise requests.ConnectionError("down")
+        with self.assertRaises(RetriesExhausted):
+            self.resilient.call("h.example", down, retry_exceptions=(requests.RequestException,))
+
+    def test_async_call(self):
+        pending = responses(502, 200, retry_after="0")
+
+        async def send():
+            return next(pending)
+        self.assertEqual(run_sync(self.resilient.call_async("h.example", send)).status_code, 200)
+        self.assertEqual(self.resilient.metrics.snapshot()["h.example"]["retries"], 1)
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def test_opens_then_recovers_through_single_probe(self):
+        clock = FakeClock()
+        resilient = ResilientHttp(RetryPolicy(max_retries=0), sleep=lambda delay: None,
+                                  breaker_factory=lambda: CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock))
+        failing = lambda: HttpResponse(503, {}, b"", "https://h.example")
+        resilient.call("h.example", failing)
+        resilient.call("h.example", failing)
+        self.assertEqual(resilient.breaker_states(), {"h.example": BREAKER_OPEN})
+        with self.assertRaises(CircuitOpenError):
+            resilient.call("h.example", failing) # 서킷이 열려 요청을 보내지 않음
+
+        clock.now = 31
+        breaker = resilient.breaker("h.example")
+        breaker.before_request("h.example") # half-open 회복 확인 요청
+        self.assertEqual(breaker.state, BREAKER_HALF_OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request("h.example") # 확인 요청은 하나만
+        breaker.record_success()
+        self.assertEqual(breaker.state, BREAKER_CLOSED)
+
+        metrics = resilient.metrics.snapshot()["h.example"]
+        self.assertEqual((metrics["circuit_opened"], metrics["circuit_rejections"]), (1, 1))
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 11
+        breaker.before_request("h.example")
+        breaker.record_failure()
+        self.assertEqual(breaker.state, BREAKER_OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request("h.example")
+
+if __name__ == '__main__':
+    unittest.main()
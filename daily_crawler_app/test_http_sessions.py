@@ -0,0 +1,69 @@
+import unittest
+import gzip
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# daily_crawler_app 디렉토리를 sys.path에 추가하여 crawler_src 모듈을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from crawler_src.http_sessions import create_http_session, get_http_session
+from crawler_src.multi_platform_crawler import ArxivOAICrawler
+
+class GzipHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # keep-alive
+    client_ports = []
+
+    def do_GET(self):
+        self.client_ports.append(self.client_address[1])
+        body = b"<feed>" + b"paper " * 500 + b"</feed>"
+        compressed = "gzip" in self.headers.get("Accept-Encoding", "")
+        if compressed:
+            body = gzip.compress(body)
+        self.send_response(200)
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class TestHttpSessions(unittest.TestCase):
+
+    def setUp(self):
+        GzipHandler.client_ports = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), GzipHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/page"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_reuses_connection_and_decompresses(self):
+        """
+        여러 페이지 요청이 커넥션 하나를 재사용하고, gzip 응답을 풀어서 돌려주는지 테스트
+        """
+        session = create_http_session()
+        responses = [session.get(self.url, timeout=5) for _ in range(3)]
+
+        self.assertTrue(all(response.content.startswith(b"<feed>paper") for response in responses))
+        self.assertEqual(responses[0].headers["Content-Encoding"], "gzip")
+        self.assertLess(int(responses[0].headers["Content-Length"]), 200) # 전송량은 압축된 크기
+        self.assertEqual(len(set(GzipHandler.client_ports)), 1)
+        session.close()
+
+    def test_registry_shares_session_with_per_host_pools(self):
+        session = create_http_session({"busy.example": 12})
+        self.assertEqual(session.get_adapter("https://busy.example/x")._pool_maxsize, 12)
+        self.assertNotEqual(session.get_adapter("https://other.example/x")._pool_maxsize, 12)
+        self.assertIs(get_http_session(), get_http_session())
+        self.assertIs(ArxivOAICrawler().session, ArxivOAICrawler().session) # 크롤러 인스턴스가 달라도 같은 커넥션 풀
+
+if __name__ == '__main__':
+    unittest.main()
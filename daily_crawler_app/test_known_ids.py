@@ -0,0 +1,103 @@
+import unittest
+import os
+import sys
+from datetime import datetime, timedelta
+from unittest import mock
+
+# daily_crawler_app 디렉토리를 sys.path에 추가하여 crawler_src 모듈을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from crawler_src.models import Paper
+from crawler_src.known_ids import BloomFilter, KnownPaperIds
+from crawler_src.multi_platform_crawler import ArxivCrawler
+from crawler_src.async_crawler import SyncCrawler
+from db_testcase import PapersDBTestCase
+
+ARXIV_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">
+  <opensearch:totalResults>2</opensearch:totalResults>
+  <opensearch:startIndex>0</opensearch:startIndex>
+  <opensearch:itemsPerPage>2</opensearch:itemsPerPage>
+  {entries}
+</feed>"""
+ARXIV_ENTRY = """<entry>
+    <id>http://arxiv.org/abs/{arxiv_id}</id>
+    <title>Paper {arxiv_id}</title>
+    <summary>Abstract of {arxiv_id}</summary>
+    <published>2026-01-02T00:00:00Z</published>
+    <updated>2026-01-02T00:00:00Z</updated>
+    <author><name>Kim</name></author>
+  </entry>"""
+
+class TestBloomFilter(unittest.TestCase):
+
+    def test_no_false_negatives_and_low_false_positive_rate(self):
+        bloom = BloomFilter(capacity=2000, error_rate=0.01)
+        for i in range(2000):
+            bloom.add(f"known-{i}")
+        self.assertTrue(all(f"known-{i}" in bloom for i in range(2000)))
+        false_positives = sum(f"new-{i}" in bloom for i in range(20000))
+        self.assertLess(false_positives / 20000, 0.03)
+        restored = BloomFilter.from_bytes(bloom.to_bytes())
+        self.assertIn("known-7", restored)
+        self.assertEqual(len(restored), len(bloom))
+
+class TestKnownPaperIds(PapersDBTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.tmp_dir.name, "known.bloom")
+        self.add_papers("a", "b")
+
+    def add_papers(self, *paper_ids, crawled_date=None):
+        session = self.session_factory()
+        session.add_all(Paper(paper_id=paper_id, crawled_date=crawled_date or datetime.now()) for paper_id in paper_ids)
+        session.commit()
+        session.close()
+
+    def known(self):
+        return KnownPaperIds(self.path, self.session_factory, capacity=100, error_rate=1e-6)
+
+    def test_persisted_filter_is_synced_incrementally(self):
+        """
+        파일에 저장된 필터를 다시 읽고, 그 사이 저장된 논문만 추가되는지 테스트
+        """
+        known = self.known().sync()
+        self.assertIn("a", known)
+        self.assertNotIn("c", known)
+        self.add_papers("c", crawled_date=datetime.now() + timedelta(seconds=1))
+
+        reloaded = self.known()
+        with mock.patch.object(reloaded, "_rebuild", wraps=reloaded._rebuild) as rebuild:
+            reloaded.sync()
+        rebuild.assert_not_called()
+        self.assertTrue(all(paper_id in reloaded for paper_id in ("a", "b", "c")))
+
+    def test_deleted_papers_trigger_rebuild(self):
+        known = self.known().sync()
+        session = self.session_factory()
+        session.query(Paper).filter(Paper.paper_id == "a").delete()
+        session.commit()
+        session.close()
+        known.sync()
+        self.assertNotIn("a", known)
+        self.assertIn("b", known)
+
+    def test_crawler_skips_known_entries_before_parsing(self):
+        """
+        이미 저장된 arXiv 항목은 _parse_entry (임베딩 포함) 를 거치지 않고 건너뛰는지 테스트
+        """
+        crawler = SyncCrawler(ArxivCrawler(delay=0))
+        crawler.known_ids = self.known().sync()
+        feed = ARXIV_FEED.format(entries="".join(ARXIV_ENTRY.format(arxiv_id=arxiv_id) for arxiv_id in ("a", "new")))
+        with mock.patch.object(crawler.crawler, "_make_request", new=mock.AsyncMock(return_value=feed)), \
+             mock.patch.object(crawler.crawler, "_parse_entry", wraps=crawler.crawler._parse_entry) as parse:
+            papers = list(crawler.crawl_papers("q", None, None, limit=5))
+        self.assertEqual([paper.paper_id for paper in papers], ["new"])
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(crawler.skipped_known, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+import os
+import sys
+import tempfile
+import time
+from unittest.mock import patch, MagicMock
+
+# daily_crawler_app 디렉토리를 sys.path에 추가하여 crawler_src 모듈을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from crawler_src.llm_cache import LLMCache
+from crawler_src.llm_client import LLMClient, summarize_abstract, summarize_abstracts, judge_papers_importance
+
+def completion_response(content: str):
+    response = MagicMock()
+    response.json.return_value = {"choices": [{"message": {"content": content}}]}
+    response.raise_for_status.return_value = None
+    return response
+
+class TestLLMCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.database_url = f"sqlite:///{os.path.join(self.tmp_dir.name, 'llm_cache.db')}"
+        self.cache = LLMCache(self.database_url, ttl=0, max_entries=0)
+
+    def tearDown(self):
+        self.cache.engine.dispose()
+        self.tmp_dir.cleanup()
+
+    def test_key_depends_on_model_template_and_input(self):
+        key = LLMCache.make_key("model-a", ("summary", 1), "abstract")
+        self.assertEqual(key, LLMCache.make_key("model-a", ("summary", 1), "abstract"))
+        self.assertNotEqual(key, LLMCache.make_key("model-b", ("summary", 1), "abstract"))
+        self.assertNotEqual(key, LLMCache.make_key("model-a", ("summary", 2), "abstract"))
+        self.assertNotEqual(key, LLMCache.make_key("model-a", ("summary", 1), "abstract."))
+
+    def test_hit_rate_metrics(self):
+        self.cache.set("k1", {"script": "대본", "scenes": []}, "model", ("video", 1))
+        self.assertEqual(self.cache.get("k1"), {"script": "대본", "scenes": []})
+        self.assertIsNone(self.cache.get("k2"))
+        metrics = self.cache.metrics()
+        self.assertEqual((metrics["hits"], metrics["misses"], metrics["entries"]), (1, 1, 1))
+        self.assertEqual(metrics["hit_rate"], 0.5)
+
+    def test_ttl_expiry(self):
+        cache = LLMCache(self.database_url, ttl=60, max_entries=0)
+        cache.set("old", "값", "model", ("summary", 1))
+        with patch("crawler_src.llm_cache.time.time", return_value=time.time() + 61):
+            self.assertIsNone(cache.get("old"))
+            self.assertEqual(cache.evict(), 1)
+
+    def test_lru_eviction_keeps_recently_used(self):
+        cache = LLMCache(self.database_url, ttl=0, max_entries=2, evict_every=1)
+        now = time.time()
+        for offset, key in enumerate(["a", "b"]):
+            with patch("crawler_src.llm_cache.time.time", return_value=now + offset):
+                cache.set(key, key, "model", ("summary", 1))
+        with patch("crawler_src.llm_cache.time.time", return_value=now + 2):
+            cache.get("a") # a 를 최근 사용으로 갱신
+        with patch("crawler_src.llm_cache.time.time", return_value=now + 3):
+            cache.set("c", "c", "model", ("summary", 1)) # 3번째 항목 -> 가장 오래 사용되지 않은 b 제거
+        self.assertEqual(set(cache.get_many(["a", "b", "c"])), {"a", "c"})
+        self.assertEqual(cache.stats["evicted"], 1)
+
+    def test_repeated_report_costs_zero_inference(self):
+        """
+        같은 초록/페르소나를 다시 요청하면 LLM 을 호출하지 않는지 테스트
+        """
+        client = LLMClient(api_url="http://mock-lm-studio:1234/v1/chat/completions", model="mock-model", cache=self.cache)
+        papers = [{"paper_id": "p1", "title": "A", "abstract": "a", "categories": []},
+                  {"paper_id": "p2", "title": "B", "abstract": "b", "categories": []}]
+        batch_answer = completion_response('{"p1": "YES", "p2": "NO"}')
+        with patch.object(client.session, "post", return_value=batch_answer) as mock_post:
+            self.assertEqual(judge_papers_importance(papers, "AI 연구자", client), {"p1": True, "p2": False})
+            self.assertEqual(judge_papers_importance(papers, "AI 연구자", client), {"p1": True, "p2": False})
+        self.assertEqual(mock_post.call_count, 1)
+
+        with patch.object(client.session, "post", return_value=completion_response('{"p1": "요약 A", "p2": "요약 B"}')) as mock_post:
+            self.assertEqual(summarize_abstracts({"p1": "a", "p2": "b"}, client), {"p1": "요약 A", "p2": "요약 B"})
+            self.assertEqual(summarize_abstracts({"p1": "a", "p2": "b"}, client), {"p1": "요약 A", "p2": "요약 B"})
+        self.assertEqual(mock_post.call_count, 1)
+
+    def test_batch_and_single_prompts_are_cached_separately(self):
+        """
+        배치 프롬프트 요약은 개별 프롬프트 요약과 다른 템플릿으로 저장되는지 테스트
+        """
+        client = LLMClient(api_url="http://mock-lm-studio:1234/v1/chat/completions", model="mock-model", cache=self.cache)
+        with patch.object(client.session, "post", return_value=completion_response('{"p1": "배치 요약 A", "p2": "배치 요약 B"}')):
+            summarize_abstracts({"p1": "a", "p2": "b"}, client)
+        with patch.object(client.session, "post", return_value=completion_response("개별 요약 A")) as mock_post:
+            self.assertEqual(summarize_abstract("a", client), "개별 요약 A")
+            self.assertEqual(summarize_abstract("a", client), "개별 요약 A")
+        self.assertEqual(mock_post.call_count, 1)
+        # 개별 프롬프트로 캐시된 요약이 있으면 배치보다 먼저 사용
+        self.assertEqual(summarize_abstracts({"p1": "a", "p2": "b"}, client), {"p1": "개별 요약 A", "p2": "배치 요약 B"})
+
+    def test_empty_completion_is_not_cached(self):
+        client = LLMClient(api_url="http://mock-lm-studio:1234/v1/chat/completions", model="mock-model", cache=self.cache)
+        with patch.object(client.session, "post", return_value=completion_response("  ")):
+            self.assertEqual(summarize_abstract("a", client), "")
+        with patch.object(client.session, "post", return_value=completion_response("요약 A")) as mock_post:
+            self.assertEqual(summarize_abstract("a", client), "요약 A")
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(self.cache.metrics()["entries"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import os
+import sys
+import json
+import threading
+import time
+from unittest.mock import patch, MagicMock
+
+import requests
+
+# daily_crawler_app 디렉토리를 sys.path에 추가하여 crawler_src 모듈을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from crawler_src.llm_client import (
+    LLMClient, LLMError, parse_json_object, summarize_abstracts, judge_papers_importance, EMPTY_ABSTRACT_SUMMARY,
+)
+
+def completion_response(content: str):
+    response = MagicMock()
+    response.json.return_value = {"choices": [{"message": {"content": content}}]}
+    response.raise_for_status.return_value = None
+    return response
+
+class TestLLMClient(unittest.TestCase):
+
+    def setUp(self):
+        self.client = LLMClient(api_url="http://mock-lm-studio:1234/v1/chat/completions", model="mock-model",
+                                max_concurrency=2, batch_size=2)
+
+    def test_parse_json_object_accepts_code_fence(self):
+        self.assertEqual(parse_json_object('```json\n{"p1": "요약"}\n```'), {"p1": "요약"})
+        self.assertEqual(parse_json_object('결과: {"p1": "YES"} 입니다'), {"p1": "YES"})
+        with self.assertRaises(LLMError):
+            parse_json_object("JSON 아님")
+
+    def test_chat_reuses_pooled_session(self):
+        with patch.object(self.client.session, "post", return_value=completion_response(" 요약 ")) as mock_post:
+            self.assertEqual(self.client.chat([{"role": "user", "content": "hi"}]), "요약")
+            self.client.chat([{"role": "user", "content": "hi"}])
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(mock_post.call_args.kwargs["json"]["model"], "mock-model")
+
+    def test_chat_raises_llm_error_on_connection_failure(self):
+        with patch.object(self.client.session, "post", side_effect=requests.exceptions.ConnectionError("refused")):
+            with self.assertRaises(LLMError):
+                self.client.chat([{"role": "user", "content": "hi"}])
+        self.assertEqual(self.client.stats["errors"], 1)
+
+    def test_concurrency_is_bounded(self):
+        """
+        동시에 진행 중인 요청 수가 max_concurrency 를 넘지 않는지 테스트
+        """
+        in_flight, peak, lock = [0], [0], threading.Lock()
+
+        def slow_post(*args, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+            return completion_response("ok")
+
+        with patch.object(self.client.session, "post", side_effect=slow_post):
+            results = self.client.map(lambda i: self.client.chat([{"role": "user", "content": str(i)}]), range(8))
+        self.assertEqual(results, ["ok"] * 8)
+        self.assertLessEqual(peak[0], 2)
+
+    def test_summarize_abstracts_batches_and_falls_back(self):
+        """
+        배치 응답에 빠진 논문만 개별 요청으로 보완하는지 테스트
+        """
+        def fake_post(url, **kwargs):
+            prompt = kwargs["json"]["messages"][1]["content"]
+            if "JSON 객체" in prompt: # 배치 요청: p2 는 응답에서 누락
+                keys = [key for key in ("p1", "p2", "p3") if f'"{key}"' in prompt]
+                return completion_response(json.dumps({key: f"요약 {key}" for key in keys if key != "p2"}, ensure_ascii=False))
+            return completion_response("개별 요약")
+
+        with patch.object(self.client.session, "post", side_effect=fake_post) as mock_post:
+            summaries = summarize_abstracts({"p1": "abstract 1", "p2": "abstract 2", "p3": "abstract 3", "p4": ""}, self.client)
+        self.assertEqual(summaries, {"p1": "요약 p1", "p2": "개별 요약", "p3": "요약 p3", "p4": EMPTY_ABSTRACT_SUMMARY})
+        self.assertEqual(mock_post.call_count, 3) # 배치 2회 (batch_size=2) + 개별 1회
+        self.assertEqual(self.client.stats["batched_items"], 3)
+
+    def test_judge_papers_importance_parses_batch_answers(self):
+        papers = [{"paper_id": "p1", "title": "A", "abstract": "a", "categories": ["cs.AI"]},
+                  {"paper_id": "p2", "title": "B", "abstract": "b", "categories": []}]
+        with patch.object(self.client.session, "post",
+                          return_value=completion_response('{"p1": "**YES** 관련 있음", "p2": "NO"}')) as mock_post:
+            self.assertEqual(judge_papers_importance(papers, "AI 연구자", self.client), {"p1": True, "p2": False})
+        mock_post.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+import unittest
+import io
+import os
+import sys
+from unittest import mock
+
+# daily_crawler_app 디렉토리를 sys.path에 추가하여 crawler_src 모듈을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from crawler_src.multi_platform_crawler import ArxivOAICrawler, OAIError, get_crawler
+from crawler_src.oai_harvest import harvest_arxiv
+
+OAI_PAGE = """<?xml version="1.0" encoding="UTF-8"?>
+<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">
+  <ListRecords>{records}{token}</ListRecords>
+</OAI-PMH>"""
+ARXIV_RECORD = """<record>
+  <header><identifier>oai:arXiv.org:{arxiv_id}</identifier><datestamp>2024-01-05</datestamp></header>
+  <metadata>
+    <arXiv xmlns="http://arxiv.org/OAI/arXiv/">
+      <id>{arxiv_id}</id><created>2023-12-30</created><updated>2024-01-04</updated>
+      <authors><author><keyname>Kim</keyname><forenames>Min</forenames></author><author><keyname>Lee</keyname></author></authors>
+      <title>Paper
+        {arxiv_id}</title>
+      <categories>{categories}</categories>
+      <doi>10.1000/{arxiv_id}</doi>
+      <abstract>  Abstract of {arxiv_id}.
+      </abstract>
+    </arXiv>
+  </metadata>
+</record>"""
+DELETED_RECORD = """<record><header status="deleted"><identifier>oai:arXiv.org:0000.00000</identifier></header></record>"""
+ARXIV_RAW_RECORD = """<record>
+  <header><identifier>oai:arXiv.org:hep-th/9901001</identifier></header>
+  <metadata>
+    <arXivRaw xmlns="http://arxiv.org/OAI/arXivRaw/">
+      <id>hep-th/9901001</id>
+      <version version="v1"><date>Fri, 1 Jan 1999 10:00:00 GMT</date></version>
+      <version version="v2"><date>Mon, 4 Jan 1999 12:30:00 GMT</date></version>
+      <title>Strings</title><authors>A. Park, B. Choi and C. Han</authors>
+      <categories>hep-th</categories><abstract>Raw abstract</abstract>
+    </arXivRaw>
+  </metadata>
+</record>"""
+
+class FakeResponse:
+    def __init__(self, body: str, status_code: int = 200, headers: dict = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.raw = mock.Mock(wraps=io.BytesIO(body.encode("utf-8")))
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+    def close(self):
+        pass
+
+def page(records, token=""):
+    return OAI_PAGE.format(records="".join(records), token=f"<resumptionToken completeListSize=\"3\">{token}</resumptionToken>")
+
+class TestArxivOAICrawler(unittest.TestCase):
+
+    def make_crawler(self, responses, metadata_prefix="arXiv"):
+        crawler = ArxivOAICrawler(metadata_prefix=metadata_prefix, delay=0, embed=False)
+        crawler.session = mock.Mock()
+        crawler.session.get.side_effect = responses
+        return crawler
+
+    def test_set_spec_for_query(self):
+        self.assertEqual(ArxivOAICrawler.set_spec_for_query("cs.AI"), ("cs", "cs.AI"))
+        self.assertEqual(ArxivOAICrawler.set_spec_for_query("hep-th"), ("physics:hep-th", None))
+        self.assertEqual(ArxivOAICrawler.set_spec_for_query("physics:astro-ph"), ("physics:astro-ph", None))
+        self.assertEqual(ArxivOAICrawler.set_spec_for_query("research papers"), (None, None))
+        self.assertIsInstance(get_crawler("arxiv_oai"), ArxivOAICrawler)
+
+    def test_follows_resumption_tokens_and_filters_category(self):
+        """
+        resumptionToken 으로 다음 페이지를 요청하고, 삭제된 레코드와 다른 카테고리 레코드는 건너뛰는지 테스트
+        """
+        crawler = self.make_crawler([
+            FakeResponse(page([ARXIV_RECORD.format(arxiv_id="2401.00001", categories="cs.AI cs.LG"), DELETED_RECORD], token="tok-1")),
+            FakeResponse(page([ARXIV_RECORD.format(arxiv_id="2401.00002", categories="cs.CL"),
+                               ARXIV_RECORD.format(arxiv_id="2401.00003", categories="cs.AI")])),
+        ])
+        papers = list(crawler.crawl_papers("cs.AI", start_date="2024-01-01", end_date="2024-01-31"))
+
+        self.assertEqual([paper.paper_id for paper in papers], ["2401.00001", "2401.00003"])
+        first_params = crawler.session.get.call_args_list[0].kwargs["params"]
+        self.assertEqual(first_params, {"verb": "ListRecords", "metadataPrefix": "arXiv", "set": "cs", "from": "2024-01-01", "until": "2024-01-31"})
+        self.assertEqual(crawler.session.get.call_args_list[1].kwargs["params"], {"verb": "ListRecords", "resumptionToken": "tok-1"})
+        paper = papers[0]
+        self.assertEqual(paper.title, "Paper 2401.00001")
+        self.assertEqual(paper.abstract, "Abstract of 2401.00001.")
+        self.assertEqual(paper.authors, ["Min Kim", "Lee"])
+        self.assertEqual(paper.categories, ["cs.AI", "cs.LG"])
+        self.assertEqual(paper.doi, "10.1000/2401.00001")
+        self.assertEqual((paper.published_date.day, paper.updated_date.day, paper.year), (30, 4, 2023))
+        self.assertIsNone(paper.embedding)
+        self.assertEqual((crawler.pages, crawler.complete_list_size, crawler.resumption_token), (2, 3, None))
+
+    def test_arxiv_raw_and_retry_after(self):
+        crawler = self.make_crawler([
+            FakeResponse("busy", status_code=503, headers={"Retry-After": "0"}),
+            FakeResponse(page([ARXIV_RAW_RECORD])),
+        ], metadata_prefix="arXivRaw")
+        papers = list(crawler.crawl_papers("hep-th"))
+
+        self.assertEqual(crawler.session.get.call_count, 2)
+        self.assertEqual(papers[0].paper_id, "hep-th/9901001")
+        self.assertEqual(papers[0].authors, ["A. Park", "B. Choi", "C. Han"])
+        self.assertEqual((papers[0].published_date.day, papers[0].updated_date.day), (1, 4))
+
+    def test_oai_errors(self):
+        no_records = '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/"><error code="noRecordsMatch"/></OAI-PMH>'
+        self.assertEqual(list(self.make_crawler([FakeResponse(no_records)]).crawl_papers("cs")), [])
+        bad_token = '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/"><error code="badResumptionToken">expired</error></OAI-PMH>'
+        with self.assertRaises(OAIError):
+            list(self.make_crawler([FakeResponse(bad_token)]).crawl_papers("cs", resumption_token="old"))
+
+    def test_harvest_saves_in_batches(self):
+        records = [ARXIV_RECORD.format(arxiv_id=f"2401.0000{i}", categories="cs.AI") for i in range(5)]
+        crawler = self.make_crawler([FakeResponse(page(records[:3], token="tok-1")), FakeResponse(page(records[3:]))])
+        batches = []
+        save = lambda papers: batches.append([paper["paper_id"] for paper in papers]) or len(papers)
+
+        stats = harvest_arxiv("cs.AI", batch_size=2, skip_known=False, crawler=crawler, save=save)
+
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertEqual(stats, {"harvested": 5, "saved": 5, "batches": 3, "pages": 2, "skipped_known": 0, "resumption_token": None,
+                                 "complete": True})
+
+    def test_harvest_stops_on_failed_batch(self):
+        """
+        배치 저장이 실패하면 수확을 멈추고, 실패한 배치의 첫 논문이 있던 페이지 토큰을 로그로 남기는지 테스트
+        """
+        records = [ARXIV_RECORD.format(arxiv_id=f"2401.0000{i}", categories="cs.AI") for i in range(5)]
+        crawler = self.make_crawler([FakeResponse(page(records[:3], token="tok-1")), FakeResponse(page(records[3:]))])
+        batches = []
+
+        def save(papers):
+            if len(batches) == 1:
+                raise RuntimeError("database is locked")
+            batches.append(len(papers))
+            return len(papers)
+
+        with self.assertLogs("crawler_src.oai_harvest", level="ERROR") as logs, self.assertRaises(RuntimeError):
+            harvest_arxiv("cs.AI", batch_size=3, skip_known=False, crawler=crawler, save=save)
+        self.assertEqual(batches, [3])
+        self.assertIn("--resume-token tok-1", logs.output[0]) # 실패한 배치는 두 번째 페이지 (tok-1 로 요청) 에서 시작
+
+    def test_limit_keeps_current_page_token(self):
+        """
+        limit 으로 페이지 중간에서 멈추면 다음 페이지 토큰이 아니라 현재 페이지 토큰을 남기는지 테스트
+        """
+        records = [ARXIV_RECORD.format(arxiv_id=f"2401.0000{i}", categories="cs.AI") for i in range(6)]
+        crawler = self.make_crawler([FakeResponse(page(records[:2], token="tok-1")), FakeResponse(page(records[2:4], token="tok-2"))])
+
+        stats = harvest_arxiv("cs.AI", limit=3, skip_known=False, crawler=crawler, save=len)
+
+        self.assertEqual((stats["harvested"], stats["resumption_token"], stats["complete"]), (3, "tok-1", False))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+import asyncio
+import os
+import sys
+import threading
+
+# daily_crawler_app 디렉토리를 sys.path에 추가하여 crawler_src 모듈을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from crawler_src.async_crawler import ordered_map
+from crawler_src.parse_pool import ParsePool
+from crawler_src.parsers import parse_arxiv_feed, parse_pmc_article, parse_rss_feed
+
+ARXIV_ENTRY = """<entry>
+  <id>http://arxiv.org/abs/2401.0000{n}v1</id>
+  <updated>2024-01-0{n}T00:00:00Z</updated><published>2024-01-0{n}T00:00:00Z</published>
+  <title>Paper {n}</title><summary> Abstract {n} </summary>
+  <author><name>Author {n}</name></author>
+  <link title="pdf" href="http://arxiv.org/pdf/2401.0000{n}v1" rel="related" type="application/pdf"/>
+  <category term="cs.AI"/>
+</entry>"""
+
+def arxiv_feed(count):
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">
+  <opensearch:totalResults>{count}</opensearch:totalResults>
+  <opensearch:startIndex>0</opensearch:startIndex>
+  <opensearch:itemsPerPage>{count}</opensearch:itemsPerPage>
+  {"".join(ARXIV_ENTRY.format(n=n) for n in range(1, count + 1))}
+</feed>"""
+
+PMC_ARTICLE = b"""<pmc-articleset><article><front><article-meta>
+  <title-group><article-title>PMC Article</article-title></title-group>
+  <contrib-group><contrib contrib-type="author"><name><surname>Kim</surname><given-names>Minji</given-names></name></contrib></contrib-group>
+  <article-categories><subj-group><subject>Biology</subject></subj-group></article-categories>
+  <abstract><p>PMC Abstract</p></abstract>
+  <pub-date pub-type="epub"><year>2024</year><month>2</month><day>3</day></pub-date>
+</article-meta></front></article></pmc-articleset>"""
+
+RSS_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>cs.AI updates</title>
+  <item><title>RSS Paper</title><link>https://arxiv.org/abs/2401.00009</link>
+    <description>Authors: A, B Abstract: RSS abstract</description><category>cs.AI</category>
+    <pubDate>Wed, 03 Jan 2024 00:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+class TestParsers(unittest.TestCase):
+    def test_parse_arxiv_feed(self):
+        feed = parse_arxiv_feed(arxiv_feed(2))
+        self.assertEqual(feed["total_results"], 2)
+        self.assertEqual([entry["arxiv_id"] for entry in feed["entries"]], ["2401.00001v1", "2401.00002v1"])
+        entry = feed["entries"][0]
+        self.assertEqual(entry["abstract"], "Abstract 1")
+        self.assertEqual(entry["authors"], ["Author 1"])
+        self.assertEqual(entry["pdf_url"], "http://arxiv.org/pdf/2401.00001v1")
+        self.assertEqual(entry["published"].year, 2024)
+
+    def test_parse_pmc_article(self):
+        record = parse_pmc_article(PMC_ARTICLE)
+        self.assertEqual(record["title"], "PMC Article")
+        self.assertEqual(record["abstract"], "PMC Abstract")
+        self.assertEqual(record["authors"], ["Minji Kim"])
+        self.assertEqual(record["subjects"], ["Biology"])
+        self.assertEqual(record["published_date"].isoformat(), "2024-02-03T00:00:00")
+
+    def test_parse_rss_feed(self):
+        feed = parse_rss_feed(RSS_FEED)
+        self.assertEqual(feed["title"], "cs.AI updates")
+        entry = feed["entries"][0]
+        self.assertEqual(entry["link"], "https://arxiv.org/abs/2401.00009")
+        self.assertEqual(entry["published_parsed"][:3], (2024, 1, 3))
+
+class TestParsePool(unittest.TestCase):
+    def test_disabled_pool_parses_off_the_loop(self):
+        """비활성화되어도 이벤트 루프 스레드가 아닌 기본 스레드 풀에서 파싱해야 함"""
+        pool = ParsePool(enabled=False)
+
+        def parse_thread(payload):
+            return threading.get_ident(), parse_pmc_article(payload)
+
+        async def run():
+            return threading.get_ident(), await pool.parse(parse_thread, PMC_ARTICLE)
+
+        loop_thread, (parse_thread_id, record) = asyncio.run(run())
+        self.assertEqual(record["title"], "PMC Article")
+        self.assertNotEqual(parse_thread_id, loop_thread)
+        self.assertEqual(pool.stats["thread"], 1)
+        self.assertIsNone(pool._executor)
+
+    def test_worker_processes_keep_input_order(self):
+        """워커 프로세스에서 파싱해도 ordered_map 결과는 입력 순서대로이고, 레코드는 피클 가능한 일반 값이어야 함"""
+        pool = ParsePool(enabled=True, workers=2, max_pending=2)
+        payloads = [arxiv_feed(n) for n in (3, 1, 2, 1)]
+
+        async def collect():
+            return [feed async for feed in ordered_map(lambda payload: pool.parse(parse_arxiv_feed, payload), payloads)]
+
+        try:
+            feeds = asyncio.run(collect())
+        finally:
+            pool.shutdown()
+        self.assertEqual([feed["total_results"] for feed in feeds], [3, 1, 2, 1])
+        self.assertEqual(pool.stats["pool"], 4)
+
+class TestOrderedMapWindow(unittest.TestCase):
+    def test_window_bounds_work_ahead(self):
+        """소비가 멈춰 있으면 window 개까지만 먼저 시작되어야 함"""
+        started = []
+
+        async def work(item):
+            started.append(item)
+            return item
+
+        async def consume():
+            results = []
+            async for item in ordered_map(work, range(10), window=3):
+                await asyncio.sleep(0.01) # 느린 소비자 (임베딩/저장)
+                self.assertLessEqual(len(started) - len(results), 4) # 미리 시작한 작업 window 개 + 방금 받은 항목
+                results.append(item)
+            return results
+
+        self.assertEqual(asyncio.run(consume()), list(range(10)))
+        self.assertEqual(started, list(range(10)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+from sqlalchemy import event
+
+# daily_crawler_app 디렉토리를 sys.path에 추가하여 crawler_src 모듈을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from crawler_src.models import Paper
+from crawler_src.ranking import score_papers, top_n_indices, select_top_papers
+from db_testcase import PapersDBTestCase
+
+NOW = datetime(2026, 1, 31)
+
+class TestRanking(unittest.TestCase):
+
+    def test_score_components(self):
+        """
+        가중치를 하나만 켜면 해당 항목 순서대로 점수가 매겨지는지 테스트
+        """
+        embeddings = [[1.0, 0.0], [0.9, 0.1], [0.0, 1.0]]
+        citations = [0, 100, 10]
+        dates = [NOW, NOW - timedelta(days=60), None]
+
+        only = lambda name: {name: 1.0}
+        self.assertEqual(top_n_indices(score_papers(embeddings, citations, dates, weights=only("citations"), now=NOW), 3), [1, 2, 0])
+        self.assertEqual(top_n_indices(score_papers(embeddings, citations, dates, weights=only("recency"), now=NOW), 3), [0, 1, 2])
+        self.assertEqual(top_n_indices(score_papers(embeddings, citations, dates, [0.0, 1.0], only("persona"), NOW), 3), [2, 1, 0])
+        centrality = score_papers(embeddings, citations, dates, weights=only("centrality"), now=NOW)
+        self.assertGreater(centrality[1], centrality[2]) # 다수 논문과 비슷한 주제가 중심에 가까움
+
+    def test_persona_weight_ignored_without_persona(self):
+        scores = score_papers([[1.0, 0.0]], [0], [NOW], weights={"persona": 1.0, "recency": 1.0}, now=NOW)
+        np.testing.assert_allclose(scores, [1.0], rtol=1e-6)
+
+    def test_top_n_is_stable_on_ties(self):
+        self.assertEqual(top_n_indices([0.5, 0.9, 0.5, 0.1], 3), [1, 0, 2])
+
+class TestSelectTopPapers(PapersDBTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.session = self.open_session()
+        self.session.add_all([
+            Paper(paper_id=f"r{i}", title=f"paper {i}", abstract="x" * 1000, embedding=[1.0, float(i)],
+                  cited_by_ids=[f"c{j}" for j in range(i)], published_date=NOW)
+            for i in range(20)
+        ])
+        self.session.commit()
+        self.session.expunge_all()
+
+    def test_only_selected_papers_are_loaded(self):
+        """
+        점수 계산은 필요한 컬럼만 읽고, 선택된 top_n 편만 전체 로딩하는지 테스트
+        """
+        statements = []
+        event.listen(self.engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+        papers = select_top_papers(self.session, self.session.query(Paper), 3, weights={"citations": 1.0})
+        self.assertEqual([paper.paper_id for paper in papers], ["r19", "r18", "r17"])
+        self.assertEqual(len(statements), 2)
+        self.assertNotIn("papers.abstract", statements[0]) # 점수 계산 단계는 본문 컬럼을 읽지 않음
+        self.assertIn("json_array_length", statements[0])
+        self.assertIn("IN", statements[1])
+
+    def test_empty_query(self):
+        self.assertEqual(select_top_papers(self.session, self.session.query(Paper).filter(Paper.paper_id == "none"), 3), [])
+
+if __name__ == '__main__':
+    unittest.main()
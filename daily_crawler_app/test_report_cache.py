@@ -0,0 +1,73 @@
+import unittest
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# daily_crawler_app 디렉토리를 sys.path에 추가하여 crawler_src 모듈을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from crawler_src.models import Paper
+from crawler_src.report_cache import ReportCache, report_cache_key
+
+TEMPLATE = ("test_report", 1)
+
+class TestReportCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = ReportCache(self.tmp_dir.name, max_bytes=0)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def render(self, cache, key, size):
+        path = cache.new_temp_path()
+        with open(path, "wb") as f:
+            f.write(b"%" * size)
+        return cache.put(key, path)
+
+    def test_key_tracks_papers_and_parameters(self):
+        """
+        논문 집합, updated_date, 요약, 파라미터, 템플릿 버전이 바뀌면 키가 달라지는지 테스트
+        """
+        papers = [Paper(paper_id="a", updated_date=datetime(2026, 1, 1)), Paper(paper_id="b")]
+        key = report_cache_key(papers, TEMPLATE, report_date="2026-01-02", category=None)
+        self.assertEqual(key, report_cache_key([paper.to_dict() for paper in papers], TEMPLATE, category=None, report_date="2026-01-02"))
+        self.assertNotEqual(key, report_cache_key(papers[:1], TEMPLATE, report_date="2026-01-02", category=None))
+        self.assertNotEqual(key, report_cache_key(papers, ("test_report", 2), report_date="2026-01-02", category=None))
+        self.assertNotEqual(key, report_cache_key(papers, TEMPLATE, report_date="2026-01-02", category="cs.AI"))
+        papers[1].summarized_abstract = "요약"
+        self.assertNotEqual(key, report_cache_key(papers, TEMPLATE, report_date="2026-01-02", category=None))
+        papers[1].summarized_abstract = None
+        papers[0].updated_date = datetime(2026, 1, 3)
+        self.assertNotEqual(key, report_cache_key(papers, TEMPLATE, report_date="2026-01-02", category=None))
+
+    def test_get_after_put(self):
+        self.assertIsNone(self.cache.get("k"))
+        path = self.render(self.cache, "k", 10)
+        self.assertEqual(self.cache.get("k"), path)
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["k.pdf"]) # 임시 파일이 남지 않음
+        self.assertEqual(self.cache.stats, {"hits": 1, "misses": 1, "writes": 1, "evicted": 0})
+
+    def test_put_bytes_from_memory_buffer(self):
+        path = self.cache.put_bytes("k", b"%PDF-1.4 in memory")
+        with open(self.cache.get("k"), "rb") as f:
+            self.assertEqual(f.read(), b"%PDF-1.4 in memory")
+        self.assertEqual(os.listdir(self.tmp_dir.name), [os.path.basename(path)])
+
+    def test_quota_evicts_least_recently_used(self):
+        cache = ReportCache(self.tmp_dir.name, max_bytes=250)
+        for i, key in enumerate(["a", "b"]):
+            self.render(cache, key, 100)
+            os.utime(cache.path_for(key), (time.time() - 100 + i, time.time() - 100 + i))
+        cache.get("a") # a 를 최근 사용으로 갱신
+        self.render(cache, "c", 100) # 300 bytes > 250 -> b 제거
+        self.assertEqual(sorted(os.listdir(self.tmp_dir.name)), ["a.pdf", "c.pdf"])
+        self.assertEqual(cache.stats["evicted"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
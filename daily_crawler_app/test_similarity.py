@@ -0,0 +1,49 @@
+import unittest
+import os
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+
+# daily_crawler_app 디렉토리를 sys.path에 추가하여 crawler_src 모듈을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from crawler_src.similarity import embedding_matrix, cosine_similarities, prefilter_by_persona
+
+def paper(paper_id, embedding):
+    return SimpleNamespace(paper_id=paper_id, embedding=embedding)
+
+class TestSimilarity(unittest.TestCase):
+
+    def test_embedding_matrix_masks_missing_and_mismatched(self):
+        matrix, valid = embedding_matrix([[3.0, 4.0], None, [1.0, 2.0, 3.0], [0.0, 0.0]], dim=2)
+        self.assertEqual(valid.tolist(), [True, False, False, False])
+        np.testing.assert_allclose(matrix[0], [0.6, 0.8], rtol=1e-6)
+
+    def test_cosine_similarities(self):
+        similarities = cosine_similarities([1.0, 0.0], [[2.0, 0.0], [0.0, 5.0], [-1.0, 0.0], None])
+        np.testing.assert_allclose(similarities[:3], [1.0, 0.0, -1.0], atol=1e-6)
+        self.assertTrue(np.isnan(similarities[3]))
+
+    def test_prefilter_keeps_top_candidates_above_threshold(self):
+        """
+        임계값 이상인 상위 후보와 임베딩이 없는 논문만 LLM 판단으로 넘기는지 테스트
+        """
+        papers = [paper("far", [0.0, 1.0]), paper("close", [1.0, 0.1]), paper("closest", [1.0, 0.0]),
+                  paper("mid", [1.0, 0.8]), paper("no_embedding", None)]
+        embedded = []
+
+        def embed(text):
+            embedded.append(text)
+            return [1.0, 0.0]
+
+        candidates, scores = prefilter_by_persona(papers, "AI 연구자", embed, threshold=0.5, max_candidates=2)
+        self.assertEqual(embedded, ["AI 연구자"]) # 페르소나는 한 번만 임베딩
+        self.assertEqual([p.paper_id for p in candidates], ["close", "closest", "no_embedding"]) # 원래 순서 유지
+        self.assertEqual(set(scores), {"close", "closest"})
+        self.assertAlmostEqual(scores["closest"], 1.0, places=5)
+
+if __name__ == '__main__':
+    unittest.main()
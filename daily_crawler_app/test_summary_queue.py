@@ -0,0 +1,117 @@
+import unittest
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+# daily_crawler_app 디렉토리를 sys.path에 추가하여 crawler_src 모듈을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+from crawler_src.config import Config
+from crawler_src.models import Paper, SummaryJob
+from crawler_src.summary_queue import (
+    enqueue_summary_jobs, get_summary_statuses, claim_summary_job, SummaryWorkerPool,
+    STATUS_PENDING, STATUS_RUNNING, STATUS_DONE, STATUS_FAILED,
+)
+from db_testcase import PapersDBTestCase
+
+class TestSummaryQueue(PapersDBTestCase):
+    autoflush = False
+
+    def setUp(self):
+        super().setUp()
+        self.session = self.open_session()
+        self.session.add_all([Paper(paper_id=f"s{i}", title=f"paper {i}", abstract=f"abstract {i}") for i in range(5)])
+        self.session.commit()
+
+    def test_enqueue_is_idempotent(self):
+        """
+        같은 논문을 여러 번 등록해도 작업은 하나만 생기는지 테스트
+        """
+        self.assertEqual(enqueue_summary_jobs(self.session, ["s0", "s1", "s1"]), 2)
+        self.session.commit()
+        self.assertEqual(enqueue_summary_jobs(self.session, ["s1", "s2"]), 1)
+        self.session.commit()
+        self.assertEqual(get_summary_statuses(self.session, ["s0", "s1", "s2", "s3"]),
+                         {"s0": STATUS_PENDING, "s1": STATUS_PENDING, "s2": STATUS_PENDING})
+
+    def test_worker_pool_summarises_in_background(self):
+        """
+        워커 풀이 대기 작업을 처리해 summarized_abstract 를 채우는지 테스트
+        """
+        enqueue_summary_jobs(self.session, [f"s{i}" for i in range(5)])
+        self.session.commit()
+        pool = SummaryWorkerPool(lambda abstract: f"요약: {abstract}", self.session_factory, workers=3, poll_interval=0.05).start()
+        try:
+            deadline = time.time() + 10
+            while pool.stats["done"] < 5 and time.time() < deadline:
+                time.sleep(0.05)
+        finally:
+            pool.stop(timeout=5)
+        self.session.expire_all()
+        self.assertEqual(pool.stats["done"], 5)
+        self.assertEqual(self.session.get(Paper, "s3").summarized_abstract, "요약: abstract 3")
+        self.assertEqual(set(get_summary_statuses(self.session, [f"s{i}" for i in range(5)]).values()), {STATUS_DONE})
+
+    def test_failed_job_is_retried_then_marked_failed(self):
+        def failing_summarize(abstract):
+            raise RuntimeError("LM Studio 연결 실패")
+
+        enqueue_summary_jobs(self.session, ["s0"])
+        self.session.commit()
+        pool = SummaryWorkerPool(failing_summarize, self.session_factory, workers=1)
+        for _ in range(Config.SUMMARY_MAX_ATTEMPTS):
+            self.assertFalse(pool.run_once())
+        self.assertIsNone(claim_summary_job(self.session)) # failed 작업은 더 이상 가져가지 않음
+        job = self.session.get(SummaryJob, "s0")
+        self.assertEqual((job.status, job.attempts), (STATUS_FAILED, Config.SUMMARY_MAX_ATTEMPTS))
+        self.assertIn("LM Studio", job.last_error)
+        self.assertEqual(pool.stats, {"done": 0, "retried": Config.SUMMARY_MAX_ATTEMPTS - 1, "failed": 1})
+
+        # 다음 크롤링/조회에서 다시 등록되면 시도 횟수를 초기화해 대기열로 돌아감
+        self.assertEqual(enqueue_summary_jobs(self.session, ["s0", "s1"]), 2)
+        self.session.commit()
+        self.session.expire_all()
+        job = self.session.get(SummaryJob, "s0")
+        self.assertEqual((job.status, job.attempts, job.last_error), (STATUS_PENDING, 0, None))
+        self.assertEqual(claim_summary_job(self.session), ("s0", "abstract 0"))
+
+    def test_job_for_deleted_paper_is_marked_failed(self):
+        """
+        등록 후 논문이 삭제된 작업은 요약기에 None 을 넘기지 않고 failed 로 처리되는지 테스트
+        """
+        enqueue_summary_jobs(self.session, ["s0"])
+        enqueue_summary_jobs(self.session, ["s1"])
+        self.session.commit()
+        self.session.query(Paper).filter(Paper.paper_id == "s0").delete()
+        self.session.commit()
+        self.assertEqual(claim_summary_job(self.session), ("s1", "abstract 1"))
+        self.assertEqual(get_summary_statuses(self.session, ["s0"]), {"s0": STATUS_FAILED})
+
+    def test_already_summarised_job_is_completed_without_llm(self):
+        enqueue_summary_jobs(self.session, ["s0"])
+        enqueue_summary_jobs(self.session, ["s1"]) # s0 이 먼저 선택되도록 순서대로 등록
+        self.session.get(Paper, "s0").summarized_abstract = "보고서 생성 중 요약됨"
+        self.session.commit()
+        self.assertEqual(claim_summary_job(self.session), ("s1", "abstract 1"))
+        self.assertEqual(get_summary_statuses(self.session, ["s0"]), {"s0": STATUS_DONE})
+
+    def test_stale_running_job_is_reclaimed(self):
+        """
+        워커가 중단되어 running 으로 남은 작업을 다른 워커가 다시 가져가는지 테스트
+        """
+        enqueue_summary_jobs(self.session, ["s0"])
+        self.session.commit()
+        self.assertEqual(claim_summary_job(self.session), ("s0", "abstract 0"))
+        self.assertIsNone(claim_summary_job(self.session)) # 방금 가져간 작업은 다시 가져가지 않음
+
+        job = self.session.get(SummaryJob, "s0")
+        self.assertEqual(job.status, STATUS_RUNNING)
+        job.updated_at = datetime.now() - timedelta(seconds=Config.SUMMARY_STALE_AFTER + 1)
+        self.session.commit()
+        self.assertEqual(claim_summary_job(self.session), ("s0", "abstract 0"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,14 @@
+import os
+import sys
 import logging
 from sqlalchemy import create_engine, Column, String, Integer, ForeignKey
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
+# 다른 앱과 같은 SQLite 프로파일(WAL/pragma)을 쓰기 위해 daily_crawler_app 을 sys.path 에 추가
+crawler_app_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), 'daily_crawler_app'))
+if crawler_app_dir not in sys.path:
+    sys.path.append(crawler_app_dir)
+from crawler_src.sqlite_profile import apply_sqlite_profile # WAL/pragma 프로파일 공유
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.DEBUG)
@@ -45,7 +52,7 @@ class Citation(Base):
 
 DATABASE_URL = "sqlite:///./papers.db" # SQLite database file
 
-engine = create_engine(DATABASE_URL)
+engine = apply_sqlite_profile(create_engine(DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def init_db():
@@ -16,6 +16,11 @@ import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 from cawler.multi_platform_crawler import multi_platform_crawl
 from deepsearch.backend.db.connection import create_db_and_tables, SessionLocal
+# 공용 LLM 클라이언트 (crawler_src 로 임포트해야 다른 모듈과 같은 클라이언트/캐시를 씀)
+crawler_app_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'daily_crawler_app'))
+if crawler_app_dir not in sys.path:
+    sys.path.append(crawler_app_dir)
+from crawler_src.llm_client import get_llm_client
 
 # 로깅 설정
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -44,6 +49,11 @@ client = OpenAI(
     api_key=os.getenv("OPENAI_API_KEY", "not-needed")
 )
 LLM_MODEL = os.getenv("OPENAI_MODEL_NAME", "lmstudio-community/qwen2.5-7b-instruct") # LM Studio에서 로드된 모델 이름
+# 쇼츠 생성용 공용 LLM 클라이언트 (keep-alive 커넥션 풀 + 동시 요청 수 제한 + 응답 캐시)
+llm_client = get_llm_client(os.getenv("OPENAI_API_BASE", "http://localhost:1234/v1").rstrip('/') + "/chat/completions", LLM_MODEL)
+# LLM 응답 캐시 키에 쓰이는 프롬프트 템플릿 (이름, 버전) - 프롬프트를 바꾸면 버전을 올립니다.
+SHORTS_TEMPLATE = ("paper_shorts", 1)
+VIDEO_SCRIPT_TEMPLATE = ("video_script_scenes", 1)
 
 # Dependency
 def get_db():
@@ -220,16 +230,14 @@ def generate_paper_shorts(abstract: str) -> str:
             f"초록:\n{abstract}\n\n쇼츠:"
         )
 
-        response = client.chat.completions.create(
-            model=LLM_MODEL,
-            messages=[
+        shorts = llm_client.cached(SHORTS_TEMPLATE, abstract, lambda: llm_client.chat(
+            [
                 {"role": "system", "content": "당신은 논문 초록을 요약하여 간결한 '쇼츠'를 생성하는 전문가입니다."},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.7,
             max_tokens=200,
-        )
-        shorts = response.choices[0].message.content.strip()
+        ))
         logger.debug(f"generate_paper_shorts 함수 종료 - 생성된 쇼츠 길이: {len(shorts)}")
         return shorts
     except Exception as e:
@@ -300,8 +308,10 @@ def generate_shorts():
             logger.info("쇼츠를 생성할 논문이 없습니다.")
             return jsonify({"message": "No papers found to generate shorts for."}), 200
 
-        for paper in papers_to_process:
-            shorts_text = generate_paper_shorts(paper.abstract)
+        # 논문별 쇼츠를 LLM 동시 요청 한도 내에서 병렬로 먼저 생성 (ShortGPT 호출은 순서대로)
+        shorts_texts = llm_client.map(generate_paper_shorts, [paper.abstract for paper in papers_to_process])
+
+        for paper, shorts_text in zip(papers_to_process, shorts_texts):
             
             # ShortGPT 호출을 위한 데이터 준비
             shortgpt_payload = generate_shorts_for_shortgpt(shorts_text)
@@ -365,32 +375,38 @@ def generate_video_script_and_scenes(abstract: str) -> dict:
             f"다음 논문의 초록을 읽고, 이 논문의 내용을 기반으로 1분 이내의 "
             f"동영상 쇼츠 대본과 각 장면에 필요한 시각적 설명을 JSON 형식으로 생성해주세요. "
             f"각 장면은 5초 이내로 구성하며, 주요 내용은 대본(script) 필드에, "
-            f"각 장면은 scenes 배열에 {{{\"text\": \"장면 대사\", \"image_search_term\": \"이미지 검색어\"}}} 형식으로 포함해주세요. "
+            f"각 장면은 scenes 배열에 {{\"text\": \"장면 대사\", \"image_search_term\": \"이미지 검색어\"}} 형식으로 포함해주세요. "
             f"최대 10개 장면을 생성해주세요.\n\n"
             f"초록:\n{abstract}\n\nJSON 형식의 대본 및 장면:"
         )
 
-        # LM Studio 호출 (OpenAI API 호환)
-        response = client.chat.completions.create(
-            model=LLM_MODEL,
-            messages=[
-                {"role": "system", "content": "당신은 논문 초록을 기반으로 동영상 쇼츠 대본과 장면 설명을 생성하는 전문가입니다. 응답은 엄격하게 JSON 형식이어야 합니다."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=1000, # 대본 및 장면 생성을 위해 충분한 토큰 할당
-            response_format={"type": "json_object"} # JSON 형식 응답 요청
-        )
-        
-        # LM Studio 응답 파싱
-        try:
+        def request_video_script():
+            # LM Studio 호출 (OpenAI API 호환)
+            response = client.chat.completions.create(
+                model=LLM_MODEL,
+                messages=[
+                    {"role": "system", "content": "당신은 논문 초록을 기반으로 동영상 쇼츠 대본과 장면 설명을 생성하는 전문가입니다. 응답은 엄격하게 JSON 형식이어야 합니다."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.7,
+                max_tokens=1000, # 대본 및 장면 생성을 위해 충분한 토큰 할당
+                response_format={"type": "json_object"} # JSON 형식 응답 요청
+            )
             generated_content = response.choices[0].message.content.strip()
-            # generated_content가 JSON 문자열임을 가정하고 파싱
-            parsed_json = json.loads(generated_content)
+            try:
+                # generated_content가 JSON 문자열임을 가정하고 파싱
+                return json.loads(generated_content)
+            except json.JSONDecodeError:
+                logger.error(f"LM Studio 응답 JSON 파싱 오류 - 원본 응답: {generated_content[:500]}...")
+                raise
+
+        # LM Studio 응답 파싱 (파싱에 성공한 응답만 캐시)
+        try:
+            parsed_json = llm_client.cached(VIDEO_SCRIPT_TEMPLATE, abstract, request_video_script)
             logger.debug(f"generate_video_script_and_scenes 함수 종료 - JSON 파싱 완료")
             return parsed_json
         except json.JSONDecodeError as e:
-            logger.error(f"LM Studio 응답 JSON 파싱 오류: {e} - 원본 응답: {generated_content[:500]}...")
+            logger.error(f"LM Studio 응답 JSON 파싱 오류: {e}")
             return {"script": "JSON 파싱 오류.", "scenes": []}
 
     except Exception as e:
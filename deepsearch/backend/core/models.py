@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, DateTime, JSON, Integer, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, JSON, Integer, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship # Added for relationships
 import logging # logging 임포트 추가
@@ -9,6 +9,11 @@ Base = declarative_base()
 
 class Paper(Base):
     __tablename__ = 'papers'
+    __table_args__ = (
+        # 최근 논문 조회 (/generate_shorts, /generate_full_video_shorts 기본 경로)
+        Index('ix_papers_published_date_paper_id', 'published_date', 'paper_id'),
+        Index('ix_papers_platform_published_date', 'platform', 'published_date'),
+    )
 
     paper_id = Column(String, primary_key=True)
     external_id = Column(String)
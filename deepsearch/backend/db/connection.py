@@ -1,6 +1,13 @@
+import os
+import sys
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from deepsearch.backend.core.models import Base
+# 다른 앱과 같은 SQLite 프로파일(WAL/pragma)을 쓰기 위해 daily_crawler_app 을 sys.path 에 추가
+crawler_app_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'daily_crawler_app'))
+if crawler_app_dir not in sys.path:
+    sys.path.append(crawler_app_dir)
+from crawler_src.sqlite_profile import apply_sqlite_profile # WAL/pragma 프로파일 공유
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,7 +22,7 @@ def get_engine():
     logger.debug("get_engine 함수 시작")
     global engine
     if engine is None:
-        engine = create_engine(DATABASE_URL)
+        engine = apply_sqlite_profile(create_engine(DATABASE_URL))
         logger.debug(f"새로운 데이터베이스 엔진 생성: {DATABASE_URL}")
     logger.debug("get_engine 함수 종료")
     return engine
@@ -32,35 +32,33 @@ class TestShortsGeneration(unittest.TestCase):
         del os.environ["OPENAI_API_KEY"]
         del os.environ["SHORTGPT_API_BASE"]
 
-    @patch('deepsearch.backend.app.OpenAI')
-    def test_generate_paper_shorts_success(self, MockOpenAI):
+    @patch('deepsearch.backend.app.llm_client')
+    def test_generate_paper_shorts_success(self, mock_llm_client):
         """
         LM Studio를 통해 논문 초록 요약이 성공적으로 생성되는지 테스트
         """
-        mock_client_instance = MockOpenAI.return_value
-        mock_client_instance.chat.completions.create.return_value = MagicMock(
-            choices=[MagicMock(message=MagicMock(content="이것은 논문의 짧은 요약입니다."))]
-        )
+        mock_llm_client.chat.return_value = "이것은 논문의 짧은 요약입니다."
+        mock_llm_client.cached.side_effect = lambda template, input_text, compute: compute() # 캐시 미스
 
         abstract = "이것은 과학 논문에 대한 매우 긴 초록이며 요약이 필요합니다. 방법론, 결과 및 결론에 대한 중요한 세부 정보를 포함합니다."
         shorts = generate_paper_shorts(abstract)
 
         self.assertEqual(shorts, "이것은 논문의 짧은 요약입니다.")
-        mock_client_instance.chat.completions.create.assert_called_once()
-        args, kwargs = mock_client_instance.chat.completions.create.call_args
-        self.assertIn("과학 논문에 대한 매우 긴 초록", kwargs['messages'][1]['content'])
-        self.assertIn("핵심 내용을 담은 간결한 '쇼츠'", kwargs['messages'][1]['content'])
-        self.assertEqual(kwargs['model'], "mock-model")
+        mock_llm_client.chat.assert_called_once()
+        args, kwargs = mock_llm_client.chat.call_args
+        self.assertIn("과학 논문에 대한 매우 긴 초록", args[0][1]['content'])
+        self.assertIn("핵심 내용을 담은 간결한 '쇼츠'", args[0][1]['content'])
+        self.assertEqual(kwargs['max_tokens'], 200)
         print("test_generate_paper_shorts_success 통과")
 
-    @patch('deepsearch.backend.app.OpenAI')
-    def test_generate_paper_shorts_empty_abstract(self, MockOpenAI):
+    @patch('deepsearch.backend.app.llm_client')
+    def test_generate_paper_shorts_empty_abstract(self, mock_llm_client):
         """
         빈 초록이 주어졌을 때 논문 초록 요약이 '초록 없음.'을 반환하는지 테스트
         """
         shorts = generate_paper_shorts("")
         self.assertEqual(shorts, "초록 없음.")
-        MockOpenAI.return_value.chat.completions.create.assert_not_called()
+        mock_llm_client.chat.assert_not_called()
         print("test_generate_paper_shorts_empty_abstract 통과")
 
     def test_generate_shorts_for_shortgpt_format(self):
@@ -1,14 +1,11 @@
+import io
 import os
+import sys
 import argparse
 import datetime
 import logging
 import re
-import requests
-import json
 from flask import Flask, request, jsonify, send_file
-from sqlalchemy import create_engine, Column, String, Text, DateTime, JSON, Integer, ForeignKey
-from sqlalchemy.orm import sessionmaker, relationship
-from sqlalchemy.ext.declarative import declarative_base
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Frame, PageBreak, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -16,7 +13,6 @@ from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
-import tempfile
 
 app = Flask(__name__)
 
@@ -28,8 +24,16 @@ logger = logging.getLogger(__name__)
 LM_STUDIO_API_URL = "http://127.0.0.1:1234/v1/chat/completions"
 LM_STUDIO_MODEL = "lgai-exaone.exaone-3.5-7.8b-instruct"
 
-# 데이터베이스 경로 설정 (daily_crawler_app/papers.db를 참조)
-DATABASE_URL = "sqlite:///../daily_crawler_app/papers.db"
+# 데이터베이스 설정 (daily_crawler_app/papers.db 공용 엔진을 crawler_src.connection 에서 사용)
+crawler_app_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'daily_crawler_app'))
+if crawler_app_dir not in sys.path:
+    sys.path.append(crawler_app_dir)
+from crawler_src.models import Paper, Citation # 공용 모델 (summarized_abstract 포함)
+from crawler_src.connection import DATABASE_URL, get_engine, get_scoped_session, create_db_and_tables
+from crawler_src.queries import filter_by_category, paper_list_columns, paginate_papers, paper_row_to_dict, LIST_EXCLUDED_COLUMNS
+from crawler_src.llm_client import LLMError, get_llm_client, summarize_abstract, summarize_abstracts
+from crawler_src.summary_queue import enqueue_summary_jobs, get_summary_statuses, start_summary_workers, STATUS_DONE, STATUS_PENDING
+from crawler_src.report_cache import get_report_cache, report_cache_key
 
 # 한글 폰트 등록
 try:
@@ -44,58 +48,17 @@ try:
 except Exception as e:
     logger.error(f"MalgunGothic 폰트 등록 실패: {e}. 폰트 파일이 스크립트와 같은 경로에 있는지 확인하세요.")
 
-# SQLAlchemy 모델 정의
-Base = declarative_base()
-
-class Paper(Base):
-    __tablename__ = 'papers'
-
-    paper_id = Column(String, primary_key=True)
-    external_id = Column(String)
-    platform = Column(String)
-    title = Column(Text)
-    abstract = Column(Text)
-    summarized_abstract = Column(Text, nullable=True) # 추가된 필드
-    authors = Column(JSON)
-    categories = Column(JSON)
-    pdf_url = Column(String)
-    embedding = Column(JSON, nullable=True)
-    published_date = Column(DateTime)
-    updated_date = Column(DateTime)
-    crawled_date = Column(DateTime, nullable=True)
-    year = Column(Integer)
-    references_ids = Column(JSON, nullable=True)
-    cited_by_ids = Column(JSON, nullable=True)
-
-    def to_dict(self):
-        return {
-            "paper_id": self.paper_id,
-            "external_id": self.external_id,
-            "platform": self.platform,
-            "title": self.title,
-            "abstract": self.abstract,
-            "summarized_abstract": self.summarized_abstract,
-            "authors": self.authors,
-            "categories": self.categories,
-            "pdf_url": self.pdf_url,
-            "embedding": self.embedding,
-            "published_date": self.published_date.isoformat() if self.published_date else None,
-            "updated_date": self.updated_date.isoformat() if self.updated_date else None,
-            "crawled_date": self.crawled_date.isoformat() if self.crawled_date else None,
-            "year": self.year,
-            "references_ids": self.references_ids,
-            "cited_by_ids": self.cited_by_ids,
-        }
-
-class Citation(Base):
-    __tablename__ = 'citations'
-
-    citing_paper_id = Column(String, ForeignKey('papers.paper_id'), primary_key=True)
-    cited_paper_id = Column(String, ForeignKey('papers.paper_id'), primary_key=True)
-
-# 데이터베이스 세션 설정
-engine = create_engine(DATABASE_URL)
-Session = sessionmaker(bind=engine)
+# 데이터베이스 세션 설정 (요청별 scoped session, 요청 종료 시 커넥션 반환)
+engine = get_engine()
+Session = get_scoped_session()
+
+@app.teardown_appcontext
+def shutdown_session(exception=None):
+    Session.remove()
+
+# 생성된 보고서 캐시 (같은 논문/날짜/카테고리 요청은 다시 렌더링하지 않음). 레이아웃을 바꾸면 버전을 올립니다.
+REPORT_TEMPLATE = ("paper_management_report", 1)
+report_cache = get_report_cache() # REPORT_CACHE_ENABLED 가 False 이면 None
 
 # 텍스트 정리 함수: HTML 태그 제거 및 ReportLab에 안전한 문자열로 변환 (유효하지 않은 XML 문자 제거 포함)
 def sanitize_text_for_pdf(text):
@@ -122,43 +85,24 @@ def sanitize_text_for_pdf(text):
     return text
 
 # LLM을 통한 초록 요약 (LM Studio 연동)
-def summarize_abstract_with_llm(abstract: str) -> str:
+def summarize_abstract_with_llm(abstract: str, strict: bool = False) -> str:
+    """초록을 한국어로 요약합니다. 실패 시 원문 초록을 반환하며, strict=True 이면 예외를 그대로 발생시킵니다 (요약 워커용)."""
     logger.debug("summarize_abstract_with_llm 함수 시작")
-    if not abstract:
-        logger.debug("초록 내용이 없어 요약 건너뛰기")
-        return "요약할 초록 내용이 없습니다."
-
-    headers = {"Content-Type": "application/json"}
-    payload = {
-        "model": LM_STUDIO_MODEL,
-        "messages": [
-            {"role": "system", "content": "You are a helpful assistant that summarizes academic paper abstracts concisely."},
-            {"role": "user", "content": f"Summarize the following abstract concisely in Korean: {abstract}"}
-        ],
-        "temperature": 0.3,
-        "max_tokens": 150
-    }
-
     try:
-        response = requests.post(LM_STUDIO_API_URL, headers=headers, json=payload, timeout=30)
-        response.raise_for_status()
-        completion = response.json()
-        if completion and 'choices' in completion and completion['choices']:
-            summarized_text = completion['choices'][0]['message']['content'].strip()
-            logger.debug(f"LLM 요약 성공: {summarized_text[:50]}...")
-            return summarized_text
-        else:
-            logger.warning("LM Studio API 응답에서 유효한 요약 결과를 찾을 수 없습니다.")
-            return abstract
-    except requests.exceptions.RequestException as e:
+        summarized_text = summarize_abstract(abstract, get_llm_client(LM_STUDIO_API_URL, LM_STUDIO_MODEL))
+        logger.debug(f"LLM 요약 성공: {summarized_text[:50]}...")
+        return summarized_text
+    except LLMError as e:
         logger.error(f"LM Studio API 요청 중 오류 발생: {e}")
-        return abstract
-    except json.JSONDecodeError as e:
-        logger.error(f"LM Studio API 응답 JSON 파싱 오류: {e}")
+        if strict:
+            raise
         return abstract
     finally:
         logger.debug("summarize_abstract_with_llm 함수 종료")
 
+def summarize_abstract_strict(abstract: str) -> str:
+    return summarize_abstract_with_llm(abstract, strict=True)
+
 # ReportLab 스타일 설정
 def get_reportlab_styles():
     styles = getSampleStyleSheet()
@@ -244,6 +188,7 @@ def get_reportlab_styles():
     return styles
 
 def generate_pdf_report(output_filename, papers, report_date, category=None):
+    """output_filename 은 파일 경로 또는 바이너리 버퍼 (io.BytesIO)"""
     logger.debug("generate_pdf_report 함수 시작")
     doc = SimpleDocTemplate(output_filename, pagesize=letter)
     styles = get_reportlab_styles()
@@ -357,7 +302,7 @@ def generate_pdf_report(output_filename, papers, report_date, category=None):
         elements.append(Spacer(1, 0.1 * inch))
 
         elements.append(Paragraph(f"<b>저자:</b> {authors}", styles['CardBody']))
-        elements.append(Paragraph(f"<b>PDF URL:</b> <font color="#3498DB">{pdf_url}</font>", styles['PdfUrl']))
+        elements.append(Paragraph(f"<b>PDF URL:</b> <font color='#3498DB'>{pdf_url}</font>", styles['PdfUrl']))
         
         elements.append(Spacer(1, 0.1 * inch))
         elements.append(Paragraph("<b>초록:</b>", styles['BodyText']))
@@ -465,33 +410,47 @@ def get_papers():
     try:
         date_str = request.args.get('date')
         category = request.args.get('category')
-        top_n = request.args.get('top_n', type=int)
+        # top_n 은 기존 클라이언트 호환용 page_size 별칭
+        page_size = request.args.get('page_size', type=int) or request.args.get('top_n', type=int)
+        cursor = request.args.get('cursor')
+        # 기본 프로젝션에서 제외된 큰 컬럼(embedding 등)은 include=embedding,cited_by_ids 처럼 명시적으로 요청
+        include = [name for name in request.args.get('include', '').split(',') if name in LIST_EXCLUDED_COLUMNS]
 
-        query = session.query(Paper)
+        query = session.query(*paper_list_columns(include))
         if date_str:
             target_date = datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
             query = query.filter(Paper.published_date >= target_date,
                                  Paper.published_date < target_date + datetime.timedelta(days=1))
         if category:
-            query = query.filter(Paper.categories.like(f'%"{category}"%'))
-
-        papers = query.all()
-
-        # LLM 요약 적용 (여기서 LLM 요약을 수행하고 DB에 저장)
-        for paper in papers:
-            if not paper.summarized_abstract: # 요약되지 않은 논문만 요약
-                summarized_text = summarize_abstract_with_llm(paper.abstract)
-                paper.summarized_abstract = summarized_text
-                session.add(paper) # 변경 사항을 세션에 추가
-        session.commit() # 변경 사항 커밋
-
-        # to_dict를 사용하여 JSON 직렬화
-        papers_data = [p.to_dict() for p in papers]
-
-        if top_n:
-            papers_data = papers_data[:top_n]
-
-        return jsonify(papers_data)
+            query = filter_by_category(query, category) # paper_categories 인덱스 조회
+
+        try:
+            rows, next_cursor = paginate_papers(query, page_size=page_size, cursor=cursor)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        papers_data = [paper_row_to_dict(row) for row in rows]
+
+        # LLM 요약은 요청 안에서 하지 않고 백그라운드 요약 큐에 맡김 - 이미 있는 요약만 바로 반환
+        unsummarized_ids = [paper_data['paper_id'] for paper_data in papers_data if not paper_data['summarized_abstract']]
+        if unsummarized_ids:
+            enqueue_summary_jobs(session, unsummarized_ids)
+            session.commit()
+            summary_workers = start_summary_workers(summarize_abstract_strict)
+            if summary_workers:
+                summary_workers.wake()
+        statuses = get_summary_statuses(session, unsummarized_ids)
+        for paper_data in papers_data:
+            if paper_data['summarized_abstract']:
+                paper_data['summary_status'] = STATUS_DONE
+            else:
+                paper_data['summary_status'] = statuses.get(paper_data['paper_id'], STATUS_PENDING)
+
+        # 응답 본문은 기존과 같은 논문 배열, 다음 페이지 커서와 요약 대기 수는 헤더로 전달
+        response = jsonify(papers_data)
+        if next_cursor:
+            response.headers['X-Next-Cursor'] = next_cursor
+        response.headers['X-Summary-Pending'] = str(len(unsummarized_ids))
+        return response
     except Exception as e:
         logger.error(f"논문 조회 중 오류 발생: {e}")
         session.rollback()
@@ -499,6 +458,12 @@ def get_papers():
     finally:
         session.close()
 
+@app.route('/api/llm_stats', methods=['GET'])
+def get_llm_stats():
+    """LLM 클라이언트 요청 통계와 응답 캐시 적중률을 반환합니다."""
+    llm_client = get_llm_client(LM_STUDIO_API_URL, LM_STUDIO_MODEL)
+    return jsonify({"client": llm_client.stats, "cache": llm_client.cache.metrics() if llm_client.cache else None})
+
 @app.route('/api/generate_report', methods=['POST'])
 def generate_report_api():
     data = request.get_json()
@@ -514,13 +479,33 @@ def generate_report_api():
     session = Session()
     try:
         selected_papers = session.query(Paper).filter(Paper.paper_id.in_(paper_ids)).all()
+
+        # 아직 백그라운드 요약이 끝나지 않은 논문은 배치 프롬프트로 한 번에 요약해 저장
+        unsummarized = {paper.paper_id: paper.abstract for paper in selected_papers if not paper.summarized_abstract}
+        if unsummarized:
+            summaries = summarize_abstracts(unsummarized, get_llm_client(LM_STUDIO_API_URL, LM_STUDIO_MODEL))
+            for paper in selected_papers:
+                if paper.paper_id in summaries:
+                    paper.summarized_abstract = summaries[paper.paper_id]
+            session.commit()
         
-        # 임시 파일에 PDF 생성
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-            temp_pdf_path = tmp_file.name
-            generate_pdf_report(temp_pdf_path, [p.to_dict() for p in selected_papers], report_date, category)
-        
-        return send_file(temp_pdf_path, as_attachment=True, download_name=f"report_{report_date_str}.pdf")
+        # 같은 논문 집합(updated_date, 요약 포함)과 파라미터로 이미 생성된 보고서가 있으면 바로 반환
+        cache_key = report_cache_key(selected_papers, REPORT_TEMPLATE, report_date=report_date, category=category)
+        download_name = f"report_{report_date_str}.pdf"
+        pdf_path = report_cache.get(cache_key) if report_cache else None
+        if pdf_path:
+            logger.info(f"캐시된 보고서 사용: {cache_key}")
+            return send_file(pdf_path, mimetype='application/pdf', as_attachment=True, download_name=download_name,
+                             etag=cache_key, conditional=True)
+
+        # 임시 파일 없이 메모리 버퍼에 렌더링해 Content-Length 와 함께 전송 (캐시가 켜져 있을 때만 디스크에 저장)
+        buffer = io.BytesIO()
+        generate_pdf_report(buffer, [p.to_dict() for p in selected_papers], report_date, category)
+        pdf_bytes = buffer.getvalue()
+        if report_cache:
+            report_cache.put_bytes(cache_key, pdf_bytes)
+        return send_file(io.BytesIO(pdf_bytes), mimetype='application/pdf', as_attachment=True, download_name=download_name,
+                         etag=cache_key, conditional=True)
     except Exception as e:
         logger.error(f"리포트 생성 중 오류 발생: {e}")
         session.rollback()
@@ -529,5 +514,6 @@ def generate_report_api():
         session.close()
 
 if __name__ == '__main__':
-    Base.metadata.create_all(engine) # 이 부분은 `papers.db`가 이미 존재하고 스키마가 정의되어 있으므로 실제로는 필요 없을 수 있습니다.
+    create_db_and_tables() # 테이블 생성 및 누락된 컬럼/인덱스 마이그레이션
+    start_summary_workers(summarize_abstract_strict) # 새로 크롤링된 논문의 요약을 백그라운드에서 처리
     app.run(debug=True)
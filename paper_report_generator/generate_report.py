@@ -1,13 +1,16 @@
 import argparse
 import datetime
+import json
+import multiprocessing
 import logging
 import re
 import os
-import requests
-import json
-from sqlalchemy import create_engine, Column, String, Text, DateTime, JSON, Integer, ForeignKey
-from sqlalchemy.orm import sessionmaker, relationship
-from sqlalchemy.ext.declarative import declarative_base
+import sys
+import time
+import jinja2
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from urllib.parse import quote
+from sqlalchemy import and_
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Frame, PageBreak, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -24,6 +27,11 @@ logger = logging.getLogger(__name__)
 LM_STUDIO_API_URL = "http://127.0.0.1:1234/v1/chat/completions"
 LM_STUDIO_MODEL = "lgai-exaone.exaone-3.5-7.8b-instruct"
 
+# sanitize_text_for_pdf 에서 사용하는 정규식/치환 테이블 (논문마다 다시 컴파일하지 않도록 모듈 로드 시 한 번만 생성)
+INVALID_XML_CHARS_RE = re.compile(u'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+HTML_TAG_RE = re.compile('<.*?>')
+PDF_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&apos;'})
+
 # 텍스트 정리 함수: HTML 태그 제거 및 ReportLab에 안전한 문자열로 변환 (유효하지 않은 XML 문자 제거 포함)
 def sanitize_text_for_pdf(text):
     if text is None:
@@ -32,57 +40,24 @@ def sanitize_text_for_pdf(text):
         text = str(text)
 
     # 유효하지 않은 XML 1.0 문자 (제어 문자) 제거
-    invalid_xml_chars = re.compile(u'[\x00-\x08\x0b\x0c\x0e-\x1f]')
-    text = invalid_xml_chars.sub('', text)
+    text = INVALID_XML_CHARS_RE.sub('', text)
 
     # HTML 태그 제거
-    clean_tags = re.compile('<.*?>')
-    text = re.sub(clean_tags, '', text)
-
-    # ReportLab 파서에 민감한 문자들을 HTML 엔티티로 변환
-    text = text.replace('&', '&amp;')
-    text = text.replace('<', '&lt;')
-    text = text.replace('>', '&gt;')
-    text = text.replace('"', '&quot;')
-    text = text.replace("'", '&apos;')
+    text = HTML_TAG_RE.sub('', text)
 
-    return text
+    # ReportLab 파서에 민감한 문자들을 HTML 엔티티로 변환 (한 번의 translate 로 처리하므로 &amp; 가 다시 치환되지 않음)
+    return text.translate(PDF_ESCAPE_TABLE)
 
-# LLM을 통한 초록 요약 (LM Studio 연동)
+# LLM을 통한 초록 요약 (LM Studio 연동, crawler_src.llm_client 공용 커넥션 풀 사용)
 def summarize_abstract_with_llm(abstract: str) -> str:
     logger.debug("summarize_abstract_with_llm 함수 시작")
-    if not abstract:
-        logger.debug("초록 내용이 없어 요약 건너뛰기")
-        return "요약할 초록 내용이 없습니다."
-
-    headers = {"Content-Type": "application/json"}
-    payload = {
-        "model": LM_STUDIO_MODEL,
-        "messages": [
-            {"role": "system", "content": "You are a helpful assistant that summarizes academic paper abstracts concisely."},
-            {"role": "user", "content": f"Summarize the following abstract concisely in Korean: {abstract}"}
-        ],
-        "temperature": 0.3,
-        "max_tokens": 150 # 요약 길이 제한
-    }
-
     try:
-        response = requests.post(LM_STUDIO_API_URL, headers=headers, json=payload, timeout=30)
-        response.raise_for_status() # HTTP 오류 발생 시 예외 발생
-        completion = response.json()
-        if completion and 'choices' in completion and completion['choices']:
-            summarized_text = completion['choices'][0]['message']['content'].strip()
-            logger.debug(f"LLM 요약 성공: {summarized_text[:50]}...")
-            return summarized_text
-        else:
-            logger.warning("LM Studio API 응답에서 유효한 요약 결과를 찾을 수 없습니다.")
-            return abstract # LLM 응답이 없으면 원본 반환
-    except requests.exceptions.RequestException as e:
+        summarized_text = summarize_abstract(abstract, get_llm_client(LM_STUDIO_API_URL, LM_STUDIO_MODEL))
+        logger.debug(f"LLM 요약 성공: {summarized_text[:50]}...")
+        return summarized_text
+    except LLMError as e:
         logger.error(f"LM Studio API 요청 중 오류 발생: {e}")
         return abstract # 오류 발생 시 원본 초록 반환
-    except json.JSONDecodeError as e:
-        logger.error(f"LM Studio API 응답 JSON 파싱 오류: {e}")
-        return abstract # JSON 파싱 오류 발생 시 원본 초록 반환
     finally:
         logger.debug("summarize_abstract_with_llm 함수 종료")
 
@@ -94,39 +69,13 @@ def judge_paper_importance_with_llm(paper: dict, persona: str) -> bool:
         logger.warning("페르소나 정보가 없어 중요도 판단 건너뛰기")
         return True # 페르소나 없으면 일단 중요하다고 가정
 
-    headers = {"Content-Type": "application/json"}
-    payload = {
-        "model": LM_STUDIO_MODEL,
-        "messages": [
-            {"role": "system", "content": f"You are an AI assistant that evaluates the importance of academic papers for a specific persona. Respond with 'YES' if the paper is highly relevant and important to the persona, and 'NO' otherwise. Provide a brief reason."},
-            {"role": "user", "content": f"Persona: '{persona}'. Paper Title: '{paper.get('title')}', Abstract: '{paper.get('abstract')}', Categories: '{', '.join(paper.get('categories', []))}'. Is this paper important to the persona? (YES/NO)"}
-        ],
-        "temperature": 0.2,
-        "max_tokens": 50 # 짧은 답변 (YES/NO + 이유)
-    }
-
     try:
-        response = requests.post(LM_STUDIO_API_URL, headers=headers, json=payload, timeout=30)
-        response.raise_for_status()
-        completion = response.json()
-        if completion and 'choices' in completion and completion['choices']:
-            llm_response = completion['choices'][0]['message']['content'].strip().upper()
-            # LLM 응답 시작 부분의 마크다운 볼드체 제거 (예: **YES** -> YES)
-            if llm_response.startswith('**'):
-                llm_response = llm_response.lstrip('*').strip() # Leading ** 제거 및 공백 정리
-            
-            is_important = llm_response.startswith("YES")
-            logger.debug(f"LLM 중요도 판단 결과: {llm_response} -> 중요도: {is_important}")
-            return is_important
-        else:
-            logger.warning("LM Studio API 응답에서 유효한 중요도 판단 결과를 찾을 수 없습니다.")
-            return True # 응답 없으면 기본적으로 중요하다고 가정
-    except requests.exceptions.RequestException as e:
+        is_important = judge_paper_importance(paper, persona, get_llm_client(LM_STUDIO_API_URL, LM_STUDIO_MODEL))
+        logger.debug(f"LLM 중요도 판단 결과 -> 중요도: {is_important}")
+        return is_important
+    except LLMError as e:
         logger.error(f"LM Studio API 요청 중 오류 발생: {e}")
         return True # 오류 발생 시 기본적으로 중요하다고 가정
-    except json.JSONDecodeError as e:
-        logger.error(f"LM Studio API 응답 JSON 파싱 오류: {e}")
-        return True # JSON 파싱 오류 발생 시 기본적으로 중요하다고 가정
     finally:
         logger.debug("judge_paper_importance_with_llm 함수 종료")
 
@@ -143,85 +92,237 @@ try:
 except Exception as e:
     logger.error(f"MalgunGothic 폰트 등록 실패: {e}. 폰트 파일이 스크립트와 같은 경로에 있는지 확인하세요.")
 
-# SQLAlchemy 모델 정의 (daily_crawler_app/crawler_src/models.py와 동일하게 유지)
-Base = declarative_base()
-
-class Paper(Base):
-    __tablename__ = 'papers'
-
-    paper_id = Column(String, primary_key=True)
-    external_id = Column(String)
-    platform = Column(String)
-    title = Column(Text)
-    abstract = Column(Text)
-    authors = Column(JSON)
-    categories = Column(JSON)
-    pdf_url = Column(String)
-    embedding = Column(JSON, nullable=True)
-    published_date = Column(DateTime)
-    updated_date = Column(DateTime)
-    crawled_date = Column(DateTime, nullable=True)
-    year = Column(Integer)
-    references_ids = Column(JSON, nullable=True)
-    cited_by_ids = Column(JSON, nullable=True)
-
-    citing_papers = relationship("Citation", foreign_keys="Citation.cited_paper_id", backref="cited_paper", primaryjoin="Paper.paper_id == Citation.cited_paper_id")
-    cited_papers = relationship("Citation", foreign_keys="Citation.citing_paper_id", backref="citing_paper", primaryjoin="Paper.paper_id == Citation.citing_paper_id")
-
-    def __repr__(self):
-        return f"<Paper(title=''{self.title[:20]}...'', platform=''{self.platform}'', year={self.year})>"
-
-    def to_dict(self):
-        logger.debug(f"Paper 모델 to_dict 함수 시작 - paper_id: {self.paper_id}")
-        result = {
-            "paper_id": self.paper_id,
-            "external_id": self.external_id,
-            "platform": self.platform,
-            "title": self.title,
-            "abstract": self.abstract,
-            "authors": self.authors,
-            "categories": self.categories,
-            "pdf_url": self.pdf_url,
-            "embedding": self.embedding,
-            "published_date": self.published_date.isoformat() if self.published_date else None,
-            "updated_date": self.updated_date.isoformat() if self.updated_date else None,
-            "crawled_date": self.crawled_date.isoformat() if self.crawled_date else None,
-            "year": self.year,
-            "references_ids": self.references_ids,
-            "cited_by_ids": self.cited_by_ids,
-        }
-        logger.debug(f"Paper 모델 to_dict 함수 종료 - paper_id: {self.paper_id}")
-        return result
-
-class Citation(Base):
-    __tablename__ = 'citations'
-
-    citing_paper_id = Column(String, ForeignKey('papers.paper_id'), primary_key=True)
-    cited_paper_id = Column(String, ForeignKey('papers.paper_id'), primary_key=True)
-
-    def __repr__(self):
-        return f"<Citation(citing_paper_id=''{self.citing_paper_id}'', cited_paper_id=''{self.cited_paper_id}'')>"
-
 # 데이터베이스 설정
-# DATABASE_URL = "sqlite:///../daily_crawler_app/papers.db" # daily_crawler_app 폴더의 papers.db 사용
+# daily_crawler_app/papers.db 와 공용 엔진(커넥션 풀)을 crawler_src.connection 에서 가져옵니다.
 base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # paper_system 디렉토리
-DATABASE_URL = f"sqlite:///{os.path.join(base_dir, 'daily_crawler_app', 'papers.db')}"
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-def get_papers_by_date_and_category(session, target_date, category=None):
-    logger.debug(f"get_papers_by_date_and_category 함수 시작 - target_date: {target_date}, category: {category}")
-    query = session.query(Paper).filter(
-        Paper.crawled_date >= target_date,
-        Paper.crawled_date < target_date + datetime.timedelta(days=1)
-    )
-    if category:
-        query = query.filter(Paper.categories.contains([category])) # JSONB Contains
-    papers = query.all()
+crawler_app_dir = os.path.join(base_dir, 'daily_crawler_app')
+if crawler_app_dir not in sys.path:
+    sys.path.append(crawler_app_dir)
+from crawler_src.models import Paper, Citation # 공용 모델 (인덱스/스키마는 crawler_src 에서 관리)
+from crawler_src.connection import DATABASE_URL, get_engine, get_session_local
+from crawler_src.queries import category_condition, one_per_duplicate_group
+from crawler_src.llm_client import LLMError, get_llm_client, summarize_abstract, summarize_abstracts, judge_paper_importance, judge_papers_importance
+from crawler_src.config import Config
+from crawler_src.embedding_manager import EmbeddingManager
+from crawler_src.similarity import prefilter_by_persona
+from crawler_src.ranking import select_top_papers
+
+engine = get_engine()
+SessionLocal = get_session_local()
+embedding_manager = EmbeddingManager() # 페르소나 임베딩용 (논문 임베딩과 같은 모델이어야 함)
+
+# 보고서 테이블 스타일. 모든 카드/배지 테이블이 같은 TableStyle 객체를 공유합니다 (논문마다 새로 만들지 않음).
+CARD_WIDTH = letter[0] - inch # 페이지 너비 - 좌우 여백
+HEADER_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0,0), (-1,-1), colors.white),
+    ('BOX', (0,0), (-1,-1), 0.5, colors.HexColor('#e5e7eb')), # Tailwind gray-200 border
+    ('ROUNDEDCORNERS', [8,8,8,8]), # 둥근 모서리
+    ('LEFTPADDING', (0,0), (-1,-1), 20),
+    ('RIGHTPADDING', (0,0), (-1,-1), 20),
+    ('TOPPADDING', (0,0), (-1,-1), 20),
+    ('BOTTOMPADDING', (0,0), (-1,-1), 20),
+    ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+    ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+])
+# 플랫폼/발행일/카테고리 배지 중첩 테이블
+META_TABLE_STYLE = TableStyle([
+    ('LEFTPADDING', (0,0), (-1,-1), 0),
+    ('RIGHTPADDING', (0,0), (-1,-1), 0),
+    ('TOPPADDING', (0,0), (-1,-1), 0),
+    ('BOTTOMPADDING', (0,0), (-1,-1), 0),
+    ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+])
+# 컬럼 너비를 유동적으로 설정. 카테고리 배지는 Paragraph 라 width 속성이 없으므로 대략적인 비율로 지정
+META_COL_WIDTHS = [0.25 * (CARD_WIDTH - 40), 0.25 * (CARD_WIDTH - 40), 0.2 * (CARD_WIDTH - 40), 0.3 * (CARD_WIDTH - 40)]
+CARD_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0,0), (-1,-1), colors.white),
+    ('BOX', (0,0), (-1,-1), 0.5, colors.HexColor('#e5e7eb')), # Tailwind gray-200 border
+    ('ROUNDEDCORNERS', [8,8,8,8]), # 둥근 모서리
+    ('LEFTPADDING', (0,0), (-1,-1), 15),
+    ('RIGHTPADDING', (0,0), (-1,-1), 15),
+    ('TOPPADDING', (0,0), (-1,-1), 8),
+    ('BOTTOMPADDING', (0,0), (-1,-1), 8),
+    ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+    ('VALIGN', (0,0), (-1,-1), 'TOP'),
+])
+
+def report_window(target_date, category=None):
+    """보고서에 들어갈 논문 조건 (날짜, 카테고리). Paper 또는 aliased(Paper) 에 적용할 수 있습니다."""
+    def window(paper):
+        conditions = [paper.crawled_date >= target_date, paper.crawled_date < target_date + datetime.timedelta(days=1)]
+        if category:
+            conditions.append(category_condition(paper, category)) # paper_categories 인덱스 조회
+        return and_(*conditions)
+    return window
+
+def papers_by_date_and_category_query(session, target_date, category=None):
+    window = report_window(target_date, category)
+    # 다른 플랫폼의 같은 논문은 하나만 포함. 대표 논문이 이 날짜/카테고리에 없으면 연결된 논문이 대신 들어감
+    return session.query(Paper).filter(window(Paper), one_per_duplicate_group(window))
+
+def get_papers_by_date_and_category(session, target_date, category=None, top_n=None, persona=None):
+    """top_n 이 있으면 관련도 점수 상위 top_n 편만 (점수 순으로) 로딩합니다."""
+    logger.debug(f"get_papers_by_date_and_category 함수 시작 - target_date: {target_date}, category: {category}, top_n: {top_n}")
+    query = papers_by_date_and_category_query(session, target_date, category)
+    if top_n:
+        # 더미 임베딩은 호출마다 달라져 순위와 보고서 캐시 키가 흔들리므로 페르소나 항목은 실제 임베딩일 때만 사용
+        use_persona = persona and not embedding_manager.is_placeholder
+        persona_vector = embedding_manager.get_embedding(persona) if use_persona else None
+        papers = select_top_papers(session, query, top_n, persona_vector)
+    else:
+        papers = query.all()
     logger.debug(f"get_papers_by_date_and_category 함수 종료 - 찾은 논문 수: {len(papers)}")
     return papers
 
+def filter_papers_by_persona(papers, persona, llm_client) -> list:
+    """페르소나에게 중요한 논문만 남깁니다 (임베딩 1차 필터 후 LLM 판단)."""
+    logger.debug(f"페르소나 '{persona}'에 따라 논문 필터링 시작")
+    if Config.PERSONA_PREFILTER_ENABLED and embedding_manager.is_placeholder:
+        logger.warning("더미 임베딩에서는 유사도가 무의미하므로 페르소나 임베딩 1차 필터를 건너뜁니다.")
+    elif Config.PERSONA_PREFILTER_ENABLED:
+        # 1단계: 페르소나 임베딩과의 코사인 유사도로 후보를 추려 LLM 호출 수를 줄임
+        # (차원이 다른/없는 임베딩은 유사도가 NaN 이므로 제외되지 않고 LLM 이 판단)
+        candidates, _ = prefilter_by_persona(papers, persona, embedding_manager.get_embedding)
+        logger.debug(f"임베딩 1차 필터: {len(papers)}편 중 {len(candidates)}편을 LLM 판단 후보로 선택")
+        papers = candidates
+    # 2단계: 후보만 LLM 으로 판단
+    # 여러 논문을 한 프롬프트로 묶어 판단 (판단 실패 시 기본적으로 중요하다고 가정)
+    importance = judge_papers_importance(
+        [{"paper_id": paper.paper_id, "title": paper.title, "abstract": paper.abstract, "categories": paper.categories}
+         for paper in papers],
+        persona, llm_client)
+    filtered_papers = []
+    for paper in papers:
+        if importance.get(paper.paper_id, True):
+            filtered_papers.append(paper)
+        else:
+            logger.debug(f"논문 '{paper.title}'은(는) 페르소나 '{persona}'에게 중요하지 않아 제외됨.")
+    logger.debug(f"페르소나 필터링 후 남은 논문 수: {len(filtered_papers)}")
+    return filtered_papers
+
+def prepare_paper_card(paper, sanitize=sanitize_text_for_pdf) -> dict:
+    """카드 하나에 필요한 정리된 문자열 (초록 요약은 gather_report_inputs 에서 채움)"""
+    return {
+        "paper_id": paper.paper_id,
+        "title": sanitize(paper.title),
+        "pdf_url": sanitize(paper.pdf_url),
+        "authors": sanitize(', '.join(paper.authors) if paper.authors else None),
+        "platform": sanitize(paper.platform),
+        "published_date": paper.published_date.strftime('%Y-%m-%d') if paper.published_date else 'N/A',
+        "categories": sanitize(', '.join(paper.categories) if paper.categories else None),
+    }
+
+def gather_report_inputs(papers, llm_client, sanitize=sanitize_text_for_pdf) -> list:
+    """
+    보고서 카드 입력을 모두 준비합니다 (PDF/HTML/Markdown 렌더러 공용).
+    LLM 요약(배치 프롬프트, 네트워크 대기)은 별도 스레드에서 진행하고 그동안 제목/저자 등 나머지 필드를 정리합니다.
+    이미 저장된 요약은 재사용하고, 요약에 실패하면 원본 초록을 사용합니다.
+    """
+    summaries = {paper.paper_id: paper.summarized_abstract for paper in papers if paper.summarized_abstract}
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-summary") as executor:
+        pending_summaries = executor.submit(
+            summarize_abstracts, {paper.paper_id: paper.abstract for paper in papers if paper.paper_id not in summaries}, llm_client)
+        cards = [prepare_paper_card(paper, sanitize) for paper in papers]
+        summaries.update(pending_summaries.result())
+    if llm_client.cache is not None:
+        logger.info(f"LLM 캐시 현황: {llm_client.cache.metrics()}")
+    for card, paper in zip(cards, papers):
+        card["abstract"] = sanitize(summaries.get(paper.paper_id, paper.abstract))
+    return cards
+
+def store_report_summaries(session, papers, llm_client=None) -> bool:
+    """
+    아직 요약이 없는 논문을 배치 프롬프트로 요약해 DB 에 저장합니다 (paper_management_app /api/generate_report 와 같은 방식).
+    보고서 캐시 키는 저장된 summarized_abstract 로 계산하므로 키를 만들기 전에 호출합니다.
+    모든 논문에 요약이 있으면 True, LLM 실패로 원본 초록을 쓰게 될 논문이 남으면 False (그 렌더링은 캐시하지 않음).
+    """
+    unsummarized = {paper.paper_id: paper.abstract for paper in papers if not paper.summarized_abstract}
+    if not unsummarized:
+        return True
+    summaries = summarize_abstracts(unsummarized, llm_client or get_llm_client(LM_STUDIO_API_URL, LM_STUDIO_MODEL))
+    for paper in papers:
+        if paper.paper_id in summaries:
+            paper.summarized_abstract = summaries[paper.paper_id]
+    session.commit()
+    logger.debug(f"보고서 요약 저장 - {len(summaries)}/{len(unsummarized)}편")
+    return len(summaries) == len(unsummarized)
+
+def clean_text_for_preview(text):
+    """미리보기용 정리: 제어 문자/HTML 태그만 제거 (이스케이프는 템플릿에서 수행)"""
+    if text is None:
+        return "N/A"
+    return HTML_TAG_RE.sub('', INVALID_XML_CHARS_RE.sub('', str(text)))
+
+MARKDOWN_SPECIAL_RE = re.compile(r'([\\`*_\[\]<>#|])')
+
+def escape_markdown(text) -> str:
+    return MARKDOWN_SPECIAL_RE.sub(r'\\\1', str(text))
+
+def markdown_autolink_url(url) -> str:
+    """<url> 자동 링크 안에 들어갈 URL. 공백/꺾쇠를 퍼센트 인코딩해 링크 밖으로 빠져나가지 못하게 합니다."""
+    return quote(str(url), safe=":/?#[]@!$&'()*+,;=%~")
+
+# 미리보기 템플릿 (templates/report_preview.html, report_preview.md). HTML 만 자동 이스케이프
+preview_env = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')),
+    autoescape=jinja2.select_autoescape(['html']),
+    trim_blocks=True, lstrip_blocks=True,
+)
+preview_env.filters['md'] = escape_markdown
+preview_env.filters['md_url'] = markdown_autolink_url
+PREVIEW_FORMATS = {"html": ("report_preview.html", "text/html"), "md": ("report_preview.md", "text/markdown")}
+
+def render_report_preview(papers, report_date, category=None, persona=None, fmt="html"):
+    """
+    ReportLab 없이 HTML/Markdown 미리보기를 생성합니다. generate_pdf_report 와 같은 페르소나 필터/요약 단계를 거친 뒤
+    템플릿을 스트리밍 렌더링하므로 문자열 조각(generator)을 반환합니다.
+    """
+    logger.debug(f"render_report_preview 함수 시작 - 형식: {fmt}, 논문 수: {len(papers)}, 페르소나: {persona}")
+    template_name, _ = PREVIEW_FORMATS[fmt]
+    llm_client = get_llm_client(LM_STUDIO_API_URL, LM_STUDIO_MODEL)
+    if persona:
+        papers = filter_papers_by_persona(papers, persona, llm_client)
+    cards = gather_report_inputs(papers, llm_client, clean_text_for_preview)
+    return preview_env.get_template(template_name).generate(
+        cards=cards, report_date=report_date.strftime('%Y년 %m월 %d일'), category=category, persona=persona)
+
+def build_paper_card(card: dict, styles) -> Table:
+    # 플랫폼, 발행일, 카테고리를 위한 중첩 테이블 데이터
+    # 이미지와 최대한 유사하게 텍스트와 배지를 같은 줄에 표현
+    platform_date_category_data = [[
+        Paragraph(f"<font face='MalgunGothicBd'>플랫폼:</font> {card['platform']}", styles['CardBody']),
+        Paragraph(f"<font face='MalgunGothicBd'>발행일:</font> {card['published_date']}", styles['CardBody']),
+        Paragraph(f"<font face='MalgunGothicBd'>카테고리:</font>", styles['CardBody']),
+        Paragraph(card['categories'], styles['CategoryBadge'])
+    ]]
+    meta_data_table = Table(platform_date_category_data, colWidths=META_COL_WIDTHS, hAlign='LEFT')
+    meta_data_table.setStyle(META_TABLE_STYLE)
+
+    # 카드 내용을 위한 메인 테이블 데이터
+    card_content_data = [
+        [Paragraph(card['title'], styles['CardTitle'])],
+        [Spacer(1, 0.03 * inch)], # 제목 아래 간격
+        [Paragraph(f"👤 저자: {card['authors']}", styles['CardBody'])],
+        [Spacer(1, 0.05 * inch)], # 저자 아래 간격
+        [meta_data_table], # 메타데이터 중첩 테이블
+        [Spacer(1, 0.05 * inch)], # 플랫폼/날짜/카테고리 아래 간격
+        [Paragraph(f"🔗 PDF URL: {card['pdf_url']} ↗️", styles['PdfUrl'])],
+        [Spacer(1, 0.1 * inch)], # URL 아래 간격
+        [Paragraph("<font face='MalgunGothicBd'>초록:</font>", styles['NormalKorean'])], # 초록 레이블 굵게
+        [Paragraph(card['abstract'], styles['AbstractKorean'])]
+    ]
+    card_table = Table(card_content_data, colWidths=[CARD_WIDTH])
+    card_table.setStyle(CARD_TABLE_STYLE)
+    return card_table
+
+# 보고서 레이아웃(카드/헤더/광고 섹션)을 바꾸면 버전을 올려 캐시된 보고서를 무효화합니다 (crawler_src.report_cache)
+REPORT_TEMPLATE = ("daily_paper_report", 1)
+
 def generate_pdf_report(output_filename, papers, report_date, category=None, persona=None):
+    """
+    PDF 를 output_filename (파일 경로 또는 io.BytesIO 같은 바이너리 버퍼) 에 생성합니다.
+    생성에 성공하면 True, 포함할 논문이 없거나 실패하면 False.
+    """
     logger.debug(f"generate_pdf_report 함수 시작 - output_filename: {output_filename}, 논문 수: {len(papers)}, 페르소나: {persona}")
     doc = SimpleDocTemplate(output_filename, pagesize=letter,
                             rightMargin=inch*0.4, leftMargin=inch*0.4,
@@ -338,112 +439,26 @@ def generate_pdf_report(output_filename, papers, report_date, category=None, per
     if category:
         header_content.append([Paragraph(f"카테고리: {sanitize_text_for_pdf(category)}", styles['HeaderDate'])]) # 카테고리도 같은 스타일
 
-    header_table_style = TableStyle([
-        ('BACKGROUND', (0,0), (-1,-1), colors.white),
-        ('BOX', (0,0), (-1,-1), 0.5, colors.HexColor('#e5e7eb')), # Tailwind gray-200 border
-        ('ROUNDEDCORNERS', [8,8,8,8]), # 둥근 모서리
-        ('LEFTPADDING', (0,0), (-1,-1), 20),
-        ('RIGHTPADDING', (0,0), (-1,-1), 20),
-        ('TOPPADDING', (0,0), (-1,-1), 20),
-        ('BOTTOMPADDING', (0,0), (-1,-1), 20),
-        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-    ])
-
-    header_table = Table(header_content, colWidths=[letter[0] - inch]) # 페이지 너비 - 좌우 여백
-    header_table.setStyle(header_table_style)
+    header_table = Table(header_content, colWidths=[CARD_WIDTH])
+    header_table.setStyle(HEADER_TABLE_STYLE)
     story.append(header_table)
     story.append(Spacer(1, 0.15 * inch)) # 간격 줄임
     story.append(PageBreak())
 
     # Papers Content Section (Card Layout)
-    # 페르소나 기반으로 논문 필터링
+    # 페르소나 기반으로 논문 필터링 후, 카드 입력(요약 포함)을 모두 준비 (HTML/Markdown 미리보기와 같은 단계 사용)
+    llm_client = get_llm_client(LM_STUDIO_API_URL, LM_STUDIO_MODEL)
     if persona:
-        logger.debug(f"페르소나 '{persona}'에 따라 논문 필터링 시작")
-        filtered_papers = []
-        for paper in papers:
-            # Paper 객체를 dict로 변환하여 judge_paper_importance_with_llm에 전달
-            paper_dict = {
-                "title": paper.title,
-                "abstract": paper.abstract,
-                "categories": paper.categories
-            }
-            if judge_paper_importance_with_llm(paper_dict, persona):
-                filtered_papers.append(paper)
-            else:
-                logger.debug(f"논문 '{paper.title}'은(는) 페르소나 '{persona}'에게 중요하지 않아 제외됨.")
-        papers = filtered_papers # 필터링된 논문으로 대체
-        logger.debug(f"페르소나 필터링 후 남은 논문 수: {len(papers)}")
+        papers = filter_papers_by_persona(papers, persona, llm_client)
         if not papers:
             logger.warning(f"페르소나 '{persona}'에 해당하는 논문이 없어 PDF 보고서를 생성할 수 없습니다.")
-            return # 논문이 없으면 함수 종료
-
-    for i, paper in enumerate(papers):
-        logger.debug(f"PDF에 논문 추가 중 (카드 형식): {paper.title}")
-
-        sanitized_title = sanitize_text_for_pdf(paper.title)
-        sanitized_abstract = sanitize_text_for_pdf(summarize_abstract_with_llm(paper.abstract))
-        sanitized_pdf_url = sanitize_text_for_pdf(paper.pdf_url)
-        sanitized_authors = sanitize_text_for_pdf(', '.join(paper.authors) if paper.authors else None)
-        sanitized_platform = sanitize_text_for_pdf(paper.platform)
-        sanitized_categories = sanitize_text_for_pdf(', '.join(paper.categories) if paper.categories else None)
-
-        # 플랫폼, 발행일, 카테고리를 위한 중첩 테이블 데이터
-        # 이미지와 최대한 유사하게 텍스트와 배지를 같은 줄에 표현
-        platform_date_category_data = [[
-            Paragraph(f"<font face='MalgunGothicBd'>플랫폼:</font> {sanitized_platform}", styles['CardBody']),
-            Paragraph(f"<font face='MalgunGothicBd'>발행일:</font> {paper.published_date.strftime('%Y-%m-%d') if paper.published_date else 'N/A'}", styles['CardBody']),
-            Paragraph(f"<font face='MalgunGothicBd'>카테고리:</font>", styles['CardBody']),
-            Paragraph(sanitized_categories, styles['CategoryBadge'])
-        ]]
-        
-        # 컬럼 너비를 유동적으로 설정. 카테고리 배지가 고정 너비를 갖도록 조정
-        # colWidths=[None, None, None, styles['CategoryBadge'].width if hasattr(styles['CategoryBadge'], 'width') else 1.5*inch]
-        # 위 방식은 CategoryBadge가 Paragraph로 들어가기 때문에 width 속성이 없을 수 있음
-        # 대신, 상대적인 너비를 사용하고 ReportLab이 자동으로 조절하도록 합니다.
-        platform_date_category_col_widths = [0.25 * (letter[0] - inch - 40), 0.25 * (letter[0] - inch - 40), 0.2 * (letter[0] - inch - 40), 0.3 * (letter[0] - inch - 40)] # 대략적인 비율
-
-        meta_data_table = Table(platform_date_category_data, colWidths=platform_date_category_col_widths, hAlign='LEFT')
-        meta_data_table.setStyle(TableStyle([
-            ('LEFTPADDING', (0,0), (-1,-1), 0),
-            ('RIGHTPADDING', (0,0), (-1,-1), 0),
-            ('TOPPADDING', (0,0), (-1,-1), 0),
-            ('BOTTOMPADDING', (0,0), (-1,-1), 0),
-            ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-        ]))
-
-
-        # 카드 내용을 위한 메인 테이블 데이터
-        card_content_data = [
-            [Paragraph(sanitized_title, styles['CardTitle'])],
-            [Spacer(1, 0.03 * inch)], # 제목 아래 간격
-            [Paragraph(f"👤 저자: {sanitized_authors}", styles['CardBody'])],
-            [Spacer(1, 0.05 * inch)], # 저자 아래 간격
-            [meta_data_table], # 메타데이터 중첩 테이블
-            [Spacer(1, 0.05 * inch)], # 플랫폼/날짜/카테고리 아래 간격
-            [Paragraph(f"🔗 PDF URL: {sanitized_pdf_url} ↗️", styles['PdfUrl'])],
-            [Spacer(1, 0.1 * inch)], # URL 아래 간격
-            [Paragraph("<font face='MalgunGothicBd'>초록:</font>", styles['NormalKorean'])], # 초록 레이블 굵게
-            [Paragraph(sanitized_abstract, styles['AbstractKorean'])]
-        ]
+            return False # 논문이 없으면 함수 종료
+    cards = gather_report_inputs(papers, llm_client, sanitize_text_for_pdf)
 
-        # 카드 테이블 스타일
-        card_table_style = TableStyle([
-            ('BACKGROUND', (0,0), (-1,-1), colors.white),
-            ('BOX', (0,0), (-1,-1), 0.5, colors.HexColor('#e5e7eb')), # Tailwind gray-200 border
-            ('ROUNDEDCORNERS', [8,8,8,8]), # 둥근 모서리
-            ('LEFTPADDING', (0,0), (-1,-1), 15),
-            ('RIGHTPADDING', (0,0), (-1,-1), 15),
-            ('TOPPADDING', (0,0), (-1,-1), 8),
-            ('BOTTOMPADDING', (0,0), (-1,-1), 8),
-            ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-            ('VALIGN', (0,0), (-1,-1), 'TOP'),
-        ])
-
-        card_table = Table(card_content_data, colWidths=[letter[0] - inch])
-        card_table.setStyle(card_table_style)
-
-        story.append(card_table)
+    # 준비된 입력으로 카드 flowable 을 한 번에 조립
+    for card in cards:
+        logger.debug(f"PDF에 논문 추가 중 (카드 형식): {card['title']}")
+        story.append(build_paper_card(card, styles))
         story.append(Spacer(1, 0.15 * inch)) # 카드 간 간격 줄임
 
     # Advertisement Section (at the very end)
@@ -530,53 +545,149 @@ def generate_pdf_report(output_filename, papers, report_date, category=None, per
     try:
         doc.build(story)
         logger.info(f"PDF 보고서 ''{output_filename}'' 생성이 완료되었습니다.")
+        return True
     except Exception as e:
         logger.error(f"PDF 보고서 생성 중 오류 발생: {e}")
+        return False
+
+def generate_report_for(report_date, category=None, persona=None, top_n=None, output_path="paper_report.pdf") -> dict:
+    """날짜/카테고리/페르소나 하나에 대한 보고서를 생성하고 결과(매니페스트 항목)를 반환합니다."""
+    logger.debug(f"generate_report_for 함수 시작 - 날짜: {report_date:%Y-%m-%d}, 카테고리: {category}, 페르소나: {persona}")
+    started = time.perf_counter()
+    result = {"date": report_date.strftime('%Y-%m-%d'), "category": category, "persona": persona, "top_n": top_n,
+              "output": output_path, "papers": 0, "status": "empty", "error": None}
+    session = SessionLocal()
+    try:
+        # top_n 이 있으면 관련도 점수(중심성/페르소나/피인용/최신성) 상위 논문만 로딩하여 요약
+        papers = get_papers_by_date_and_category(session, report_date, category, top_n, persona)
+        result["papers"] = len(papers)
+        preview_format = os.path.splitext(output_path)[1].lstrip('.').lower()
+        if not papers:
+            logger.info(f"지정된 날짜 ({result['date']}) 및 카테고리 ({category if category else '모든 카테고리'})에 해당하는 논문이 없습니다.")
+        elif preview_format in PREVIEW_FORMATS: # .html / .md 출력은 ReportLab 없이 미리보기 렌더러 사용
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.writelines(render_report_preview(papers, report_date, category, persona, preview_format))
+            result["status"] = "ok"
+        elif generate_pdf_report(output_path, papers, report_date, category, persona):
+            result["status"] = "ok"
+        else:
+            result["status"] = "failed"
+    except Exception as e:
+        logger.error(f"보고서 생성 중 예외 발생: {e}")
+        result.update(status="failed", error=str(e))
+    finally:
+        session.close()
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    logger.debug(f"generate_report_for 함수 종료 - 상태: {result['status']}")
+    return result
+
+def _filename_part(value) -> str:
+    return re.sub(r'[^0-9A-Za-z가-힣._-]+', '_', value).strip('_') if value else "all"
+
+def build_batch_jobs(start_date, end_date, categories, personas, top_n, output_dir) -> list:
+    """(날짜 x 카테고리 x 페르소나) 조합별 보고서 작업 목록"""
+    jobs = []
+    report_date = start_date
+    while report_date <= end_date:
+        for category in categories or [None]:
+            for persona in personas or [None]:
+                filename = f"paper_report_{report_date:%Y%m%d}_{_filename_part(category)}"
+                if persona:
+                    filename += f"_{_filename_part(persona)}"
+                jobs.append({"report_date": report_date, "category": category, "persona": persona, "top_n": top_n,
+                             "output_path": os.path.join(output_dir, filename + ".pdf")})
+        report_date += datetime.timedelta(days=1)
+    return jobs
+
+def _init_batch_worker():
+    # 워커 프로세스는 이 모듈을 한 번만 임포트하므로 폰트 등록, DB 엔진(커넥션 풀), LLM 클라이언트를 작업 간에 재사용
+    logger.debug(f"보고서 배치 워커 시작 - pid: {os.getpid()}")
+
+def _run_batch_job(job: dict) -> dict:
+    return generate_report_for(**job)
+
+def run_batch(jobs, workers=None, run_job=_run_batch_job) -> list:
+    """
+    ReportLab 레이아웃은 CPU 작업이라 GIL 에 묶이므로 보고서 단위로 프로세스 풀에 분산합니다.
+    부모 프로세스의 스레드(SQLite 유지보수 등)를 fork 하지 않도록 spawn 컨텍스트를 사용합니다.
+    run_job 은 워커 프로세스로 보내지므로 모듈 수준 함수여야 합니다 (기본값: generate_report_for 실행).
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+    logger.info(f"보고서 배치 생성 시작 - 작업 수: {len(jobs)}, 워커 수: {workers}")
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_batch_worker) as executor:
+        futures = {executor.submit(run_job, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                results.append(future.result())
+            except Exception as e: # 워커 프로세스 비정상 종료 등
+                logger.error(f"보고서 배치 작업 실패 ({job['output_path']}): {e}")
+                results.append({"date": job["report_date"].strftime('%Y-%m-%d'), "category": job["category"],
+                                 "persona": job["persona"], "top_n": job["top_n"], "output": job["output_path"],
+                                 "papers": 0, "status": "failed", "error": str(e), "seconds": None})
+    results.sort(key=lambda item: (item["date"], item["category"] or "", item["persona"] or ""))
+    return results
+
+def write_manifest(path, results, started_at, elapsed):
+    manifest = {
+        "generated_at": started_at.isoformat(timespec="seconds"),
+        "elapsed_seconds": round(elapsed, 3),
+        "summary": {status: sum(1 for item in results if item["status"] == status) for status in ("ok", "empty", "failed")},
+        "reports": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    logger.info(f"매니페스트 저장: {path} - {manifest['summary']}")
+    return manifest
 
 def main():
     logger.debug("main 함수 시작")
     parser = argparse.ArgumentParser(description="Generate a PDF report of papers for a specific date and category.")
-    parser.add_argument("--date", type=str, required=True, help="Date in YYYY-MM-DD format (e.g., 2023-01-01)")
+    parser.add_argument("--date", type=str, help="Date in YYYY-MM-DD format (e.g., 2023-01-01)")
+    parser.add_argument("--from", dest="from_date", type=str, help="Batch mode: first date in YYYY-MM-DD format (inclusive, use with --to)")
+    parser.add_argument("--to", dest="to_date", type=str, help="Batch mode: last date in YYYY-MM-DD format (inclusive)")
     parser.add_argument("--category", type=str, help="Optional: Specific category to filter papers by (e.g., 'Computer Science')")
-    parser.add_argument("--output", type=str, default="paper_report.pdf", help="Output PDF filename. Default is paper_report.pdf")
-    parser.add_argument("--top_n", type=int, help="Optional: Number of top papers to include in the report (e.g., 10). If not specified, all papers for the date/category will be included. Currently, this selects the first N papers from the query results.")
+    parser.add_argument("--categories", type=str, nargs="+", help="Batch mode: one report per category ('all' for no category filter)")
+    parser.add_argument("--output", type=str, default="paper_report.pdf", help="Output filename. Default is paper_report.pdf. A .html or .md extension renders a quick preview instead of a PDF")
+    parser.add_argument("--output_dir", type=str, default="reports", help="Batch mode: directory for PDFs and manifest.json. Default is reports")
+    parser.add_argument("--top_n", type=int, help="Optional: Number of top papers to include in the report (e.g., 10). If not specified, all papers for the date/category will be included. Papers are ranked by a blend of embedding centrality, persona similarity, citation count and recency (see RANKING_WEIGHT_* in crawler_src.config).")
     parser.add_argument("--persona", type=str, help="Optional: Specific persona to filter papers by")
+    parser.add_argument("--personas", type=str, nargs="+", help="Batch mode: one report per persona")
+    parser.add_argument("--workers", type=int, help="Batch mode: number of worker processes. Default is the number of CPU cores")
 
     args = parser.parse_args()
 
+    if args.from_date or args.to_date:
+        try:
+            start_date = datetime.datetime.strptime(args.from_date or args.to_date, '%Y-%m-%d')
+            end_date = datetime.datetime.strptime(args.to_date or args.from_date, '%Y-%m-%d')
+        except ValueError:
+            logger.error("잘못된 날짜 형식입니다. YYYY-MM-DD 형식을 사용하세요.")
+            return
+        categories = [None if category == 'all' else category for category in (args.categories or [args.category])]
+        personas = args.personas or [args.persona]
+        os.makedirs(args.output_dir, exist_ok=True)
+        started_at, started = datetime.datetime.now(), time.perf_counter()
+        jobs = build_batch_jobs(start_date, end_date, categories, personas, args.top_n, args.output_dir)
+        results = run_batch(jobs, args.workers)
+        write_manifest(os.path.join(args.output_dir, "manifest.json"), results, started_at, time.perf_counter() - started)
+        logger.debug("main 함수 종료")
+        return
+
+    if not args.date:
+        parser.error("--date 또는 --from/--to 중 하나는 필요합니다.")
     try:
         report_date = datetime.datetime.strptime(args.date, '%Y-%m-%d')
-        category = args.category if args.category != 'all' else None
-        output_path = args.output
-        top_n = args.top_n
-        persona = args.persona
     except ValueError:
         logger.error("잘못된 날짜 형식입니다. YYYY-MM-DD 형식을 사용하세요.")
         return
-
-    session = SessionLocal()
-    try:
-        logger.debug("데이터베이스 세션 시작")
-        papers = get_papers_by_date_and_category(session, report_date, category)
-
-        # LLM 기반 중요도 정렬 또는 랜덤 선택 (추후 구현)
-        if top_n:
-            logger.debug(f"상위 {top_n}개 논문 선택 (현재는 조회 순서대로).")
-            papers = papers[:top_n]
-
-        if not papers:
-            logger.info(f"지정된 날짜 ({args.date}) 및 카테고리 ({args.category if args.category else '모든 카테고리'})에 해당하는 논문이 없습니다.")
-            return
-
-        generate_pdf_report(output_path, papers, report_date, category, persona)
-    except Exception as e:
-        logger.error(f"보고서 생성 중 예외 발생: {e}")
-    finally:
-        session.close()
-        logger.debug("데이터베이스 세션 종료")
+    category = args.category if args.category != 'all' else None
+    generate_report_for(report_date, category, args.persona, args.top_n, args.output)
     logger.debug("main 함수 종료")
 
 if __name__ == "__main__":
     logger.debug("__main__ 진입")
     main()
-    logger.debug("__main__ 종료") 
\ No newline at end of file
+    logger.debug("__main__ 종료")
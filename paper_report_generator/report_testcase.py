@@ -0,0 +1,43 @@
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# generate_report / web_app 은 임포트할 때 공용 papers.db 엔진(마이그레이션 포함), LLM 캐시, 보고서 캐시를 만들므로
+# 테스트 모듈은 이 모듈을 먼저 임포트해 모두 프로세스별 임시 디렉토리를 쓰도록 합니다.
+# (spawn 워커 프로세스도 테스트 모듈을 다시 임포트하므로 같은 환경 변수를 물려받습니다)
+TEST_DATA_DIR = os.environ.get("REPORT_TEST_DATA_DIR")
+if not TEST_DATA_DIR:
+    TEST_DATA_DIR = os.environ["REPORT_TEST_DATA_DIR"] = tempfile.mkdtemp(prefix="paper_report_test_")
+    atexit.register(shutil.rmtree, TEST_DATA_DIR, ignore_errors=True)
+os.environ["PAPERS_DATABASE_URL"] = f"sqlite:///{os.path.join(TEST_DATA_DIR, 'papers.db')}"
+os.environ["LLM_CACHE_DATABASE_URL"] = f"sqlite:///{os.path.join(TEST_DATA_DIR, 'llm_cache.db')}"
+os.environ["REPORT_CACHE_DIR"] = os.path.join(TEST_DATA_DIR, "report_cache")
+
+# paper_report_generator 디렉토리를 sys.path에 추가하여 generate_report / web_app 을 찾을 수 있도록 함
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+
+import generate_report
+from crawler_src.connection import create_db_and_tables # generate_report 임포트 시 sys.path에 추가됨
+from crawler_src.models import Base
+
+create_db_and_tables()
+
+class ReportDBTestCase(unittest.TestCase):
+    """공용 엔진(임시 papers.db) 을 쓰는 테스트 기반 클래스. 테스트마다 모든 테이블을 비웁니다."""
+
+    def setUp(self):
+        self.session = generate_report.SessionLocal()
+        self.addCleanup(self.session.close)
+        for table in reversed(Base.metadata.sorted_tables):
+            self.session.execute(table.delete())
+        self.session.commit()
+
+    def add_papers(self, *papers):
+        self.session.add_all(papers)
+        self.session.commit()
+        self.session.expunge_all()
@@ -22,8 +22,15 @@ document.addEventListener('DOMContentLoaded', function() {
 
             if (response.ok) {
                 if (result.pdf_url) {
-                    messageDiv.textContent = '보고서가 성공적으로 생성되었습니다.';
+                    messageDiv.textContent = '보고서가 성공적으로 생성되었습니다. ';
                     messageDiv.style.color = 'green';
+                    if (result.preview_url) {
+                        const previewLink = document.createElement('a');
+                        previewLink.href = result.preview_url;
+                        previewLink.target = '_blank';
+                        previewLink.textContent = 'HTML 미리보기';
+                        messageDiv.appendChild(previewLink);
+                    }
                     pdfViewerDiv.innerHTML = `<iframe src="${result.pdf_url}" width="100%" height="600px"></iframe>`;
                 } else {
                     messageDiv.textContent = result.message || 'PDF URL을 찾을 수 없습니다.';
@@ -0,0 +1,78 @@
+import unittest
+import datetime
+import json
+import os
+import tempfile
+
+import report_testcase # 임시 DB/캐시 환경 변수 설정 (generate_report 임포트 전에)
+from generate_report import build_batch_jobs, run_batch, write_manifest
+
+def fake_report_job(job: dict) -> dict:
+    """generate_report_for 대신 워커 프로세스에서 실행되는 작업 (모듈 수준 함수여야 피클 가능)"""
+    if job["persona"] == "crash":
+        raise RuntimeError("worker crashed")
+    status = "empty" if job["category"] is None else "ok"
+    with open(job["output_path"], "w", encoding="utf-8") as f:
+        f.write(str(os.getpid()))
+    return {"date": job["report_date"].strftime('%Y-%m-%d'), "category": job["category"], "persona": job["persona"],
+            "top_n": job["top_n"], "output": job["output_path"], "papers": 0 if status == "empty" else 3,
+            "status": status, "error": None, "seconds": 0.0}
+
+class TestBatchReport(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def test_build_batch_jobs_expands_dates_categories_personas(self):
+        """
+        날짜 x 카테고리 x 페르소나 조합마다 작업 하나가 만들어지고, 파일 이름에 안전한 문자만 쓰이는지 테스트
+        """
+        jobs = build_batch_jobs(datetime.datetime(2024, 1, 30), datetime.datetime(2024, 2, 1), [None, "cs.AI"],
+                                ["AI 연구자/교수", None], 5, "out")
+
+        self.assertEqual(len(jobs), 3 * 2 * 2)
+        self.assertEqual({job["top_n"] for job in jobs}, {5})
+        self.assertEqual([job["report_date"].day for job in jobs[::4]], [30, 31, 1])
+        self.assertEqual([os.path.basename(job["output_path"]) for job in jobs[:4]], [
+            "paper_report_20240130_all_AI_연구자_교수.pdf",
+            "paper_report_20240130_all.pdf",
+            "paper_report_20240130_cs.AI_AI_연구자_교수.pdf",
+            "paper_report_20240130_cs.AI.pdf",
+        ])
+        self.assertEqual(build_batch_jobs(datetime.datetime(2024, 1, 2), datetime.datetime(2024, 1, 1), None, None, None, "out"), [])
+
+    def test_run_batch_records_failures_in_manifest(self):
+        """
+        spawn 프로세스 풀에서 작업을 실행하고, 워커에서 예외가 난 작업도 failed 항목으로 매니페스트에 남는지 테스트
+        """
+        jobs = build_batch_jobs(datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 2), ["cs.AI", None],
+                                [None, "crash"], None, self.tmp_dir.name)
+        results = run_batch(jobs, workers=1, run_job=fake_report_job)
+
+        self.assertEqual(len(results), len(jobs))
+        # 날짜, 카테고리, 페르소나 순으로 정렬
+        self.assertEqual([(item["date"], item["category"], item["persona"]) for item in results[:4]], [
+            ("2024-01-01", None, None), ("2024-01-01", None, "crash"),
+            ("2024-01-01", "cs.AI", None), ("2024-01-01", "cs.AI", "crash"),
+        ])
+        failed = [item for item in results if item["status"] == "failed"]
+        self.assertEqual(len(failed), 4)
+        self.assertEqual({item["error"] for item in failed}, {"worker crashed"})
+        self.assertEqual({item["seconds"] for item in failed}, {None})
+        with open(results[2]["output"], encoding="utf-8") as f:
+            self.assertNotEqual(f.read(), str(os.getpid())) # 부모가 아닌 워커 프로세스에서 실행
+
+        manifest_path = os.path.join(self.tmp_dir.name, "manifest.json")
+        started_at = datetime.datetime(2024, 1, 3, 9, 0, 0)
+        write_manifest(manifest_path, results, started_at, 1.23456)
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest["generated_at"], "2024-01-03T09:00:00")
+        self.assertEqual(manifest["elapsed_seconds"], 1.235)
+        self.assertEqual(manifest["summary"], {"ok": 2, "empty": 2, "failed": 4})
+        self.assertEqual(manifest["reports"], results)
+        self.assertEqual(manifest["reports"][3]["output"], os.path.join(self.tmp_dir.name, "paper_report_20240101_cs.AI_crash.pdf"))
+
+if __name__ == '__main__':
+    unittest.main()
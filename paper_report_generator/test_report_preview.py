@@ -0,0 +1,94 @@
+import unittest
+import datetime
+from unittest import mock
+
+from report_testcase import ReportDBTestCase # 임시 DB/캐시 환경 변수 설정 (generate_report 임포트 전에)
+import generate_report
+import web_app
+from generate_report import render_report_preview, escape_markdown
+from crawler_src.models import Paper
+
+REPORT_DATE = datetime.datetime(2024, 1, 2)
+
+def paper(paper_id, title, pdf_url="https://arxiv.org/pdf/2401.00001", abstract="Abstract"):
+    return Paper(paper_id=paper_id, platform="arxiv", title=title, abstract=abstract, authors=["Kim_Min", "Lee"],
+                 categories=["cs.AI"], pdf_url=pdf_url, published_date=REPORT_DATE, crawled_date=REPORT_DATE)
+
+def fake_summaries(abstracts, client):
+    """LLM 대신 초록 앞에 표시만 붙이는 요약 (HTML/Markdown 특수 문자 포함)"""
+    return {paper_id: f"요약 *{abstract}* <img src=x onerror=alert(1)" for paper_id, abstract in abstracts.items()}
+
+class TestRenderReportPreview(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(generate_report, "summarize_abstracts", side_effect=fake_summaries)
+        self.summarize = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.papers = [
+            paper("p1", "<script>alert(1)</script>Attention & x < y", abstract="a_b"),
+            paper("p2", "**Bold** [link](http://evil) # `code` | pipe", pdf_url="javascript:alert(1)"),
+            paper("p3", "Spaces", pdf_url="https://example.org/a b>[x](javascript:alert(1))"),
+        ]
+
+    def render(self, fmt):
+        chunks = render_report_preview(self.papers, REPORT_DATE, category="cs.AI", fmt=fmt)
+        self.assertNotIsInstance(chunks, str) # 템플릿을 한 번에 문자열로 만들지 않고 조각으로 스트리밍
+        return "".join(chunks)
+
+    def test_html_is_autoescaped(self):
+        html = self.render("html")
+
+        self.assertNotIn("<script>", html)
+        self.assertNotIn("<img", html)
+        self.assertIn("alert(1)Attention &amp; x &lt; y", html) # 태그는 제거, 남은 특수 문자는 이스케이프
+        self.assertIn("요약 *a_b* &lt;img src=x onerror=alert(1)", html)
+        self.assertIn('<a href="https://arxiv.org/pdf/2401.00001"', html)
+        self.assertNotIn('href="javascript:', html) # http(s) 가 아닌 pdf_url 은 링크로 만들지 않음
+        self.assertIn('href="https://example.org/a b&gt;[x](javascript:alert(1))"', html) # 속성 값도 이스케이프
+        self.assertIn("2024년 01월 02일", html)
+        self.summarize.assert_called_once()
+
+    def test_markdown_is_escaped(self):
+        markdown = self.render("md")
+
+        self.assertIn(r"## 2. \*\*Bold\*\* \[link\](http://evil) \# \`code\` \| pipe", markdown)
+        self.assertIn(r"- 👤 저자: Kim\_Min, Lee", markdown)
+        self.assertIn(r"> 요약 \*a\_b\* \<img src=x onerror=alert(1)", markdown)
+        self.assertIn("- 🔗 PDF: <https://arxiv.org/pdf/2401.00001>", markdown)
+        self.assertNotIn("<javascript:", markdown)
+        self.assertIn("- 🔗 PDF: <https://example.org/a%20b%3E[x](javascript:alert(1))>", markdown) # 자동 링크 밖으로 나가지 않음
+        self.assertEqual(escape_markdown("a\\b"), "a\\\\b")
+
+    def test_empty_report(self):
+        self.papers = []
+        self.assertIn("보고서에 포함할 논문이 없습니다.", self.render("md"))
+
+class TestReportPreviewRoute(ReportDBTestCase):
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(generate_report, "summarize_abstracts", side_effect=fake_summaries)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = web_app.app.test_client()
+        self.add_papers(paper("p1", "<b>Attention</b> & more"))
+
+    def test_streams_html_and_markdown(self):
+        response = self.client.get("/report_preview?report_date=2024-01-02")
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(response.mimetype, "text/html")
+        self.assertIn("Attention &amp; more", response.get_data(as_text=True))
+
+        response = self.client.get("/report_preview?report_date=2024-01-02&format=md")
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(response.content_type, "text/markdown; charset=utf-8")
+        self.assertIn("## 1. Attention & more", response.get_data(as_text=True))
+
+    def test_unknown_format_is_rejected(self):
+        response = self.client.get("/report_preview?report_date=2024-01-02&format=pdf")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("pdf", response.get_json()["error"])
+        self.assertEqual(self.client.get("/report_preview?report_date=2024-13-01").status_code, 400)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+import datetime
+import os
+import tempfile
+from unittest import mock
+
+from report_testcase import ReportDBTestCase # 임시 DB/캐시 환경 변수 설정 (web_app 임포트 전에)
+import generate_report
+import web_app
+from crawler_src.models import Paper
+from crawler_src.report_cache import ReportCache
+
+def paper(paper_id, day=2, summarized=True):
+    return Paper(paper_id=paper_id, platform="arxiv", title=f"Paper {paper_id}", abstract=f"Abstract {paper_id}",
+                 summarized_abstract=f"요약 {paper_id}" if summarized else None, authors=["Kim"], categories=["cs.AI"],
+                 pdf_url=f"https://arxiv.org/pdf/{paper_id}", crawled_date=datetime.datetime(2024, 1, day, 9))
+
+class TestReportPdf(ReportDBTestCase):
+
+    def setUp(self):
+        super().setUp()
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache = ReportCache(os.path.join(tmp_dir.name, "cache"), max_bytes=0)
+        self.rendered = [] # 렌더링한 논문 ID 목록 (렌더링 횟수 확인용)
+        self.summaries = lambda abstracts, client: {paper_id: f"요약 {paper_id}" for paper_id in abstracts}
+        for target, name, value in ((web_app, "report_cache", self.cache), (web_app, "generate_pdf_report", self.render_pdf),
+                                    (generate_report, "summarize_abstracts", lambda *args: self.summaries(*args))):
+            patcher = mock.patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = web_app.app.test_client()
+
+    def render_pdf(self, buffer, papers, report_date):
+        """폰트 없이 논문 ID 로 가짜 PDF 를 만드는 렌더러"""
+        paper_ids = sorted(paper.paper_id for paper in papers)
+        self.rendered.append(paper_ids)
+        buffer.write(b"%PDF-1.4 " + " ".join(paper_ids).encode())
+        return True
+
+    def get_pdf(self, query, etag=None):
+        headers = {"If-None-Match": f'"{etag}"'} if etag else {}
+        return self.client.get(f"/report_pdf?{query}", headers=headers)
+
+    def test_etag_304_and_cache_hit(self):
+        """
+        같은 논문 집합이면 If-None-Match 에 304, 캐시에 있으면 다시 렌더링하지 않는지 테스트
+        """
+        self.add_papers(paper("a"), paper("b"))
+        first = self.get_pdf("report_date=2024-01-02")
+        etag, _ = first.get_etag()
+        self.assertEqual((first.status_code, first.data), (200, b"%PDF-1.4 a b"))
+        self.assertIn("paper_report_20240102.pdf", first.headers["Content-Disposition"])
+
+        self.assertEqual(self.get_pdf("report_date=2024-01-02", etag).status_code, 304)
+        cached = self.get_pdf("report_date=2024-01-02")
+        self.assertEqual((cached.status_code, cached.get_etag()[0], cached.data), (200, etag, b"%PDF-1.4 a b"))
+        cached.close()
+        self.assertEqual(self.rendered, [["a", "b"]])
+
+    def test_new_papers_invalidate_old_etag(self):
+        """
+        같은 날짜에 논문이 추가되면 이전 ETag/주소로 요청해도 새 보고서를 렌더링하는지 테스트
+        """
+        self.add_papers(paper("a"))
+        pdf_url = self.client.post("/generate_report", data={"report_date": "2024-01-02"}).get_json()["pdf_url"]
+        self.assertEqual(pdf_url, "/report_pdf?report_date=2024-01-02")
+        old_etag, _ = self.get_pdf("report_date=2024-01-02").get_etag()
+
+        self.add_papers(paper("b")) # 스케줄러가 그날 논문을 더 수집
+        response = self.get_pdf("report_date=2024-01-02", old_etag)
+        self.assertEqual((response.status_code, response.data), (200, b"%PDF-1.4 a b"))
+        self.assertNotEqual(response.get_etag()[0], old_etag)
+
+    def test_key_from_other_report_is_ignored(self):
+        """
+        다른 날짜 보고서의 키/ETag 를 붙여 요청해도 요청한 날짜의 보고서를 해당 파일 이름으로 반환하는지 테스트
+        """
+        self.add_papers(paper("a", day=1), paper("b", day=2))
+        other_etag, _ = self.get_pdf("report_date=2024-01-01").get_etag()
+
+        response = self.get_pdf(f"report_date=2024-01-02&top_n=5&key={other_etag}", other_etag)
+        self.assertEqual((response.status_code, response.data), (200, b"%PDF-1.4 b"))
+        self.assertNotEqual(response.get_etag()[0], other_etag)
+        self.assertIn("paper_report_20240102_top5.pdf", response.headers["Content-Disposition"])
+
+    def test_fallback_render_is_not_cached(self):
+        """
+        요약에 실패해 원본 초록이 들어간 보고서는 ETag 없이 no-store 로 보내고 캐시에 저장하지 않는지 테스트
+        """
+        self.add_papers(paper("a", summarized=False))
+        self.summaries = lambda abstracts, client: {} # LLM 장애
+
+        response = self.get_pdf("report_date=2024-01-02")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Cache-Control"], "no-store")
+        self.assertIsNone(response.get_etag()[0])
+        self.assertEqual(self.cache.stats["writes"], 0)
+
+        # LLM 이 복구되면 요약을 저장하고 캐시/ETag 를 사용
+        self.summaries = lambda abstracts, client: {paper_id: f"요약 {paper_id}" for paper_id in abstracts}
+        response = self.get_pdf("report_date=2024-01-02")
+        self.assertIsNotNone(response.get_etag()[0])
+        self.assertNotIn("no-store", response.headers.get("Cache-Control", ""))
+        self.assertEqual(self.cache.stats["writes"], 1)
+        self.assertEqual(len(self.rendered), 2)
+
+    def test_missing_report(self):
+        self.assertEqual(self.get_pdf("report_date=2024-01-02").status_code, 404)
+        self.assertEqual(self.get_pdf("report_date=not-a-date").status_code, 400)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,13 @@
-from flask import Flask, render_template, request, send_from_directory, jsonify
+from flask import Flask, Response, render_template, request, send_from_directory, send_file, jsonify, stream_with_context
+import io
 import os
+from urllib.parse import urlencode
 import datetime
 import logging
 
-from generate_report import get_papers_by_date_and_category, generate_pdf_report, SessionLocal
+from generate_report import get_papers_by_date_and_category, store_report_summaries, generate_pdf_report, render_report_preview, REPORT_TEMPLATE, PREVIEW_FORMATS
+from crawler_src.connection import get_scoped_session # generate_report 임포트 시 sys.path에 추가됨
+from crawler_src.report_cache import get_report_cache, report_cache_key
 
 # 로깅 설정
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -11,59 +15,117 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__, template_folder='templates', static_folder='static')
 
-# PDF 파일이 저장될 디렉토리 (웹 서버에서 접근 가능해야 함)
+# 공용 엔진을 공유하는 요청별 세션
+db_session = get_scoped_session()
+
+@app.teardown_appcontext
+def shutdown_session(exception=None):
+    db_session.remove()
+
+# 이전에 생성되어 저장된 PDF 파일 디렉토리 (/view_pdf)
 PDF_REPORTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'reports')
 os.makedirs(PDF_REPORTS_DIR, exist_ok=True)
+# 같은 논문 집합/파라미터의 보고서는 다시 렌더링하지 않고 캐시된 파일을 반환 (용량 초과 시 오래된 파일부터 제거)
+# REPORT_CACHE_ENABLED 가 False 이면 None 이며 보고서는 디스크에 저장되지 않습니다.
+report_cache = get_report_cache(os.getenv("REPORT_CACHE_DIR", os.path.join(PDF_REPORTS_DIR, 'cache')))
 
 @app.route('/')
 def index():
     logger.debug("Serving index.html")
     return render_template('index.html')
 
-@app.route('/generate_report', methods=['POST'])
-def generate_report_web():
-    logger.debug("generate_report_web 함수 시작")
-    report_date_str = request.form.get('report_date')
-    top_n_str = request.form.get('top_n')
-
+def parse_report_request(values):
+    """폼/쿼리 파라미터에서 (report_date, top_n) 을 읽습니다. 잘못된 입력이면 ValueError (메시지는 사용자에게 표시)."""
+    report_date_str = values.get('report_date')
+    top_n_str = values.get('top_n')
     if not report_date_str:
-        logger.error("날짜가 제공되지 않았습니다.")
-        return jsonify({"error": "날짜를 입력해주세요."}), 400
-
+        raise ValueError("날짜를 입력해주세요.")
     try:
         report_date = datetime.datetime.strptime(report_date_str, "%Y-%m-%d").date()
     except ValueError:
-        logger.error(f"잘못된 날짜 형식입니다: {report_date_str}")
-        return jsonify({"error": "날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)."}), 400
-
+        raise ValueError("날짜 형식이 올바르지 않습니다 (YYYY-MM-DD).")
     top_n = int(top_n_str) if top_n_str and top_n_str.isdigit() else None
+    return report_date, top_n
 
-    output_filename = f"paper_report_{report_date.strftime('%Y%m%d')}"
-    if top_n:
-        output_filename += f"_top{top_n}"
-    output_filename += ".pdf"
-
-    pdf_filepath = os.path.join(PDF_REPORTS_DIR, output_filename)
-
-    # TODO: generate_report.py에서 함수 임포트 및 사용
-    session = SessionLocal()
+@app.route('/generate_report', methods=['POST'])
+def generate_report_web():
+    """보고서에 들어갈 논문이 있는지 확인하고 PDF 주소를 반환합니다. 렌더링은 /report_pdf 요청 시 수행."""
+    logger.debug("generate_report_web 함수 시작")
     try:
-        papers = get_papers_by_date_and_category(session, report_date)
-        if top_n:
-            papers = papers[:top_n]
+        report_date, top_n = parse_report_request(request.form)
+    except ValueError as e:
+        logger.error(f"잘못된 보고서 요청: {e}")
+        return jsonify({"error": str(e)}), 400
 
+    try:
+        papers = get_papers_by_date_and_category(db_session, report_date, top_n=top_n) # 관련도 상위 top_n 편만 로딩
         if not papers:
-            logger.info(f"지정된 날짜에 논문이 없습니다: {report_date_str}")
-            return jsonify({"message": f"지정된 날짜 ({report_date_str})에 해당하는 논문이 없습니다."})
-
-        generate_pdf_report(pdf_filepath, papers, report_date)
-        logger.info(f"PDF 보고서 생성 완료: {pdf_filepath}")
-        return jsonify({"pdf_url": f"/view_pdf/{output_filename}"})
+            logger.info(f"지정된 날짜에 논문이 없습니다: {report_date}")
+            return jsonify({"message": f"지정된 날짜 ({report_date})에 해당하는 논문이 없습니다."})
+        query = urlencode({"report_date": report_date.isoformat(), **({"top_n": top_n} if top_n else {})})
+        return jsonify({"pdf_url": f"/report_pdf?{query}", "preview_url": f"/report_preview?{query}"})
     except Exception as e:
         logger.error(f"보고서 생성 중 오류 발생: {e}")
         return jsonify({"error": f"보고서 생성 중 오류 발생: {e}"}), 500
-    finally:
-        session.close()
+
+@app.route('/report_pdf')
+def report_pdf():
+    """
+    보고서 PDF 를 반환합니다. ETag 는 요청할 때마다 현재 논문 집합/파라미터로 다시 계산한 해시이므로
+    그날 논문이 추가되면 바뀌고, If-None-Match 가 일치하면 렌더링 없이 304.
+    캐시가 꺼져 있거나 없으면 메모리 버퍼에 렌더링해 Content-Length 와 함께 전송하고, 캐시가 켜져 있을 때만 디스크에 저장합니다.
+    """
+    logger.debug("report_pdf 함수 시작")
+    try:
+        report_date, top_n = parse_report_request(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    download_name = f"paper_report_{report_date.strftime('%Y%m%d')}{f'_top{top_n}' if top_n else ''}.pdf"
+    papers = get_papers_by_date_and_category(db_session, report_date, top_n=top_n)
+    if not papers:
+        return jsonify({"error": "PDF 파일을 찾을 수 없습니다."}), 404
+    # 캐시 키는 저장된 요약으로 계산하므로 렌더링 중에 요약하지 않도록 먼저 요약을 저장
+    summaries_complete = store_report_summaries(db_session, papers)
+    cache_key = report_cache_key(papers, REPORT_TEMPLATE, report_date=report_date)
+    if request.if_none_match.contains(cache_key):
+        return Response(status=304, headers={"ETag": f'"{cache_key}"'})
+
+    pdf_path = report_cache.get(cache_key) if report_cache else None
+    if pdf_path:
+        logger.info(f"캐시된 PDF 보고서 사용: {cache_key}")
+        return send_file(pdf_path, mimetype='application/pdf', etag=cache_key, conditional=True, download_name=download_name)
+
+    buffer = io.BytesIO()
+    if not generate_pdf_report(buffer, papers, report_date):
+        return jsonify({"error": "PDF 보고서 생성에 실패했습니다."}), 500
+    pdf_bytes = buffer.getvalue()
+    logger.info(f"PDF 보고서 생성 완료: {len(pdf_bytes)} bytes")
+    if not summaries_complete:
+        # LLM 실패로 원본 초록이 들어간 보고서는 캐시/ETag 없이 보내 다음 요청에서 다시 요약을 시도
+        logger.warning("요약하지 못한 논문이 있어 PDF 보고서를 캐시하지 않습니다.")
+        response = send_file(io.BytesIO(pdf_bytes), mimetype='application/pdf', etag=False, download_name=download_name)
+        response.headers["Cache-Control"] = "no-store"
+        return response
+    if report_cache:
+        report_cache.put_bytes(cache_key, pdf_bytes)
+    return send_file(io.BytesIO(pdf_bytes), mimetype='application/pdf', etag=cache_key, conditional=True, download_name=download_name)
+
+@app.route('/report_preview')
+def report_preview():
+    """ReportLab 없이 HTML(format=html, 기본) 또는 Markdown(format=md) 미리보기를 스트리밍합니다. PDF 는 /report_pdf 에서 필요할 때만 생성."""
+    logger.debug("report_preview 함수 시작")
+    try:
+        report_date, top_n = parse_report_request(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    fmt = request.args.get('format', 'html')
+    if fmt not in PREVIEW_FORMATS:
+        return jsonify({"error": f"지원하지 않는 형식입니다: {fmt} (html, md)"}), 400
+
+    papers = get_papers_by_date_and_category(db_session, report_date, top_n=top_n)
+    _, mimetype = PREVIEW_FORMATS[fmt]
+    return Response(stream_with_context(render_report_preview(papers, report_date, fmt=fmt)), mimetype=mimetype) # text/* 에는 Flask 가 charset=utf-8 을 붙임
 
 @app.route('/view_pdf/<filename>')
 def view_pdf(filename):